@@ -0,0 +1,197 @@
+"""
+Benchmarks of the Tk interface. They require a display, e.g. a virtual frame
+buffer started with `xvfb-run`.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import time
+
+# Import internal dependencies
+from benchmark_utility import _create_Result, _create_Templates, _measure
+
+# Size of the window of the live feed benchmark
+LIVE_FEED_WIDTH = 1200
+LIVE_FEED_HEIGHT = 800
+
+def _create_Interface():
+    """
+    Description
+    -----------
+    Create the main window of the interface without entering the Tk main loop.
+    Pending events are processed once, so that the window is drawn.
+
+    Return
+    ------
+    `interface` : FreiStatInterface
+        Interface with a drawn window
+
+    """
+    from FreiStat_GUI.Main_Window import FreiStatInterface
+
+    class BenchmarkInterface(FreiStatInterface):
+        def Main(self) -> None:
+            # Draw the window instead of entering the main loop
+            self._Root.update()
+
+    return BenchmarkInterface()
+
+def _run_InterfaceBenchmarks(iRepeat : int, listLibrarySizes : list) -> list:
+    """
+    Description
+    -----------
+    Measure the build time of the central frame of every method, with and
+    without the form cache, and the time until the template management is
+    shown for every library size.
+
+    Parameters
+    ----------
+    `iRepeat` : int
+        Amount of measurements per benchmark
+
+    `listLibrarySizes` : list
+        List containing the amount of templates of every library
+
+    Return
+    ------
+    `listResults` : list
+        List containing the results of the benchmarks
+
+    """
+    from FreiStat_GUI.Data_Storage.constants import IMPORT_TEMPLATE
+
+    listResults : list = []
+    interface = _create_Interface()
+    root = interface._Root
+
+    try:
+        for strMethod in ("CA", "LSV", "CV", "NPV", "DPV", "SWV"):
+            def _build(strMethod : str = strMethod) -> None:
+                interface._update_CentralFrame_Method(interface._fCentralFrame,
+                                                      strMethod)
+                root.update()
+
+            # Build the form from scratch and show the cached form
+            listResults.append(_create_Result("interface.central_frame",
+                {"method" : strMethod, "cached" : False}, "s", 
+                _measure(_build, iRepeat, 
+                    funcSetup= interface._formCache.clear)))
+
+            listResults.append(_create_Result("interface.central_frame",
+                {"method" : strMethod, "cached" : True}, "s", 
+                _measure(_build, iRepeat)))
+
+        def _buildSequence() -> None:
+            interface._update_CentralFrame_Sequence(interface._fCentralFrame)
+            root.update()
+
+        listResults.append(_create_Result("interface.central_frame",
+            {"method" : "Sequence"}, "s", _measure(_buildSequence, iRepeat)))
+
+        popUpWindow = interface._PopUpWindow
+
+        for iTemplates in listLibrarySizes:
+            listDataStorage : list = _create_Templates(iTemplates)
+
+            def _open() -> None:
+                popUpWindow.PopUp_TemplateHandler(IMPORT_TEMPLATE, 
+                    interface._dataHandling, listDataStorage, "")
+                root.update()
+
+            listResults.append(_create_Result("interface.template_handler",
+                {"templates" : iTemplates}, "s", _measure(_open, iRepeat,
+                    funcSetup= popUpWindow._on_Closing)))
+
+            popUpWindow._on_Closing()
+    finally:
+        root.destroy()
+
+    return listResults
+
+def _run_LiveFeedBenchmarks(iRepeat : int, listSampleRates : list,
+                            fDuration : float) -> list:
+    """
+    Description
+    -----------
+    Measure the frame rate of the live feed canvas, while the lines grow with
+    the given sample rate. Frames are rendered as fast as possible.
+
+    Parameters
+    ----------
+    `iRepeat` : int
+        Amount of measurements per sample rate
+
+    `listSampleRates` : list
+        List containing the sample rates in samples per s
+
+    `fDuration` : float
+        Duration of one measurement in s
+
+    Return
+    ------
+    `listResults` : list
+        List containing the results of the benchmarks
+
+    """
+    import numpy as np
+    from tkinter import Tk
+    from FreiStat_GUI.Utility.live_plot import LivePlotCanvas
+    from matplotlib.figure import Figure
+
+    listResults : list = []
+    root = Tk()
+    root.geometry("{}x{}".format(LIVE_FEED_WIDTH, LIVE_FEED_HEIGHT))
+
+    try:
+        for iSampleRate in listSampleRates:
+            iSamples : int = int(iSampleRate * fDuration) + 1
+            fTime = np.arange(iSamples) / iSampleRate
+            fCurrent = np.sin(2 * np.pi * fTime) + 0.05 * np.random.default_rng(
+                0).standard_normal(iSamples)
+
+            listFPS : list = []
+
+            for iIndex in range(iRepeat):
+                figure = Figure()
+                axes = figure.add_subplot()
+                line, = axes.plot([], [])
+
+                canvas = LivePlotCanvas(figure, master= root)
+                canvas.get_tk_widget().pack(fill= "both", expand= True)
+                canvas.draw()
+                root.update()
+
+                iFrames : int = 0
+                fStart : float = time.perf_counter()
+                fElapsed : float = 0.0
+
+                while (fElapsed < fDuration):
+                    # Samples, which arrived until now
+                    iArrived : int = min(int(fElapsed * iSampleRate) + 1, 
+                                         iSamples)
+                    line.set_data(fTime[:iArrived], fCurrent[:iArrived])
+
+                    canvas.draw_idle()
+                    root.update()
+
+                    iFrames += 1
+                    fElapsed = time.perf_counter() - fStart
+
+                listFPS.append(iFrames / fElapsed)
+                canvas.get_tk_widget().destroy()
+
+            listResults.append(_create_Result("live_feed.frame_rate",
+                {"sample_rate" : iSampleRate, "duration" : fDuration}, "fps", 
+                listFPS))
+    finally:
+        root.destroy()
+
+    return listResults
@@ -0,0 +1,63 @@
+"""
+Benchmark of the time until the first window of the interface is shown. It is
+run in a new process for every measurement, so that the imports are included.
+The result is printed as JSON.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import time
+fStart : float = time.perf_counter()
+
+import json
+import os
+import subprocess
+import sys
+
+def _run_StartupBenchmark(strWorkPath : str) -> dict:
+    """
+    Description
+    -----------
+    Start this module in a new process and read its result.
+
+    Parameters
+    ----------
+    `strWorkPath` : string
+        Working directory of the process (settings and log file)
+
+    Return
+    ------
+    `dicTimes` : dict
+        Dictionary containing the time of the imports and the time until the
+        first window is shown in s
+
+    """
+    process = subprocess.run([sys.executable, os.path.abspath(__file__)],
+        cwd= strWorkPath, capture_output= True, text= True, check= True)
+
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    from benchmark_utility import _setup_Path
+    _setup_Path()
+
+    from bench_interface import _create_Interface
+    import FreiStat_GUI.Main_Window
+    fImports : float = time.perf_counter() - fStart
+
+    interface = _create_Interface()
+    fFirstWindow : float = time.perf_counter() - fStart
+
+    interface._Root.destroy()
+
+    print(json.dumps({"imports" : fImports, "first_window" : fFirstWindow}))
@@ -0,0 +1,79 @@
+"""
+Benchmarks of saving and loading template libraries of different sizes. These
+benchmarks do not require a display.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+
+# Import internal dependencies
+from benchmark_utility import _create_Result, _create_Templates, _measure
+
+def _run_TemplateBenchmarks(strWorkPath : str, iRepeat : int,
+                            listLibrarySizes : list) -> list:
+    """
+    Description
+    -----------
+    Measure the latency of saving a template library, loading its index and
+    loading all parameters for every library size.
+
+    Parameters
+    ----------
+    `strWorkPath` : string
+        Folder in which the template files are written
+
+    `iRepeat` : int
+        Amount of measurements per benchmark
+
+    `listLibrarySizes` : list
+        List containing the amount of templates of every library
+
+    Return
+    ------
+    `listResults` : list
+        List containing the results of the benchmarks
+
+    """
+    from FreiStat_GUI.Data_Storage.data_handling import DataHandling
+
+    listResults : list = []
+
+    for iTemplates in listLibrarySizes:
+        dicParameters : dict = {"templates" : iTemplates}
+        strFilePath : str = os.path.join(strWorkPath, 
+                                         "library_{}.fst".format(iTemplates))
+
+        dataHandling = DataHandling(strWorkPath)
+        dataHandling.set_DataStorages(_create_Templates(iTemplates))
+
+        listResults.append(_create_Result("templates.save", dicParameters, "s",
+            _measure(lambda: dataHandling.export_Configuration(strFilePath),
+                     iRepeat)))
+
+        listResults.append(_create_Result("templates.load_index", 
+            dicParameters, "s", _measure(
+                lambda: dataHandling.import_Configuration(strFilePath),
+                iRepeat)))
+
+        listResults.append(_create_Result("templates.load_parameters",
+            dicParameters, "s", _measure(lambda: [
+                dataStorage.get_ExperimentParameters() for dataStorage in 
+                dataHandling.import_Configuration(strFilePath)], iRepeat)))
+
+        listResults.append(_create_Result("templates.index_rebuild",
+            dicParameters, "s", _measure(
+                lambda: dataHandling.set_DataStorages(
+                    dataHandling.get_DataStorages()), iRepeat)))
+
+        os.remove(strFilePath)
+
+    return listResults
@@ -0,0 +1,174 @@
+"""
+Module implementing helpers shared by the benchmarks of the FreiStat interface.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import statistics
+import sys
+import time
+
+# Folders of the stub of the FreiStat framework and of the interface package
+STUB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub")
+PACKAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "Python")
+
+def _setup_Path() -> None:
+    """
+    Description
+    -----------
+    Put the stub of the FreiStat framework and the interface package in front
+    of the module search path, so that an installed framework is not used.
+
+    """
+    for strPath in (PACKAGE_PATH, STUB_PATH):
+        if (strPath in sys.path):
+            sys.path.remove(strPath)
+        sys.path.insert(0, strPath)
+
+def _measure(funcBenchmark, iRepeat : int, funcSetup = None) -> list:
+    """
+    Description
+    -----------
+    Measure the duration of a function several times.
+
+    Parameters
+    ----------
+    `funcBenchmark` : function
+        Function which is measured
+
+    `iRepeat` : int
+        Amount of measurements
+
+    `funcSetup` : function
+        Optional function called before every measurement, which is not measured
+
+    Return
+    ------
+    `listSamples` : list
+        List containing the durations in s
+
+    """
+    listSamples : list = []
+
+    for iIndex in range(iRepeat):
+        if (funcSetup is not None):
+            funcSetup()
+
+        fStart : float = time.perf_counter()
+        funcBenchmark()
+        listSamples.append(time.perf_counter() - fStart)
+
+    return listSamples
+
+def _create_Result(strBenchmark : str, dicParameters : dict, strUnit : str,
+                   listSamples : list) -> dict:
+    """
+    Description
+    -----------
+    Create the machine-readable result of one benchmark.
+
+    Parameters
+    ----------
+    `strBenchmark` : string
+        Name of the benchmark (e.g. "templates.save")
+
+    `dicParameters` : dict
+        Parameters of the benchmark (e.g. size of the template library)
+
+    `strUnit` : string
+        Unit of the samples
+
+    `listSamples` : list
+        List containing the measured samples
+
+    Return
+    ------
+    `dicResult` : dict
+        Dictionary containing the samples and their statistics
+
+    """
+    return {
+        "benchmark" : strBenchmark,
+        "parameters" : dicParameters,
+        "unit" : strUnit,
+        "samples" : listSamples,
+        "min" : min(listSamples),
+        "max" : max(listSamples),
+        "mean" : statistics.mean(listSamples),
+        "median" : statistics.median(listSamples)
+    }
+
+def _create_Skipped(strBenchmark : str, strReason : str) -> dict:
+    """
+    Description
+    -----------
+    Create the result of a benchmark, which could not be run.
+
+    Parameters
+    ----------
+    `strBenchmark` : string
+        Name of the benchmark
+
+    `strReason` : string
+        Reason why the benchmark was skipped
+
+    Return
+    ------
+    `dicResult` : dict
+        Dictionary containing the reason
+
+    """
+    return {"benchmark" : strBenchmark, "skipped" : strReason}
+
+def _create_Templates(iTemplates : int) -> list:
+    """
+    Description
+    -----------
+    Create a library of templates with the parameters of a cyclic
+    voltammetry.
+
+    Parameters
+    ----------
+    `iTemplates` : int
+        Amount of templates
+
+    Return
+    ------
+    `listDataStorage` : list
+        List containing the DataStorage objects of the templates
+
+    """
+    from FreiStat.Data_storage.constants import CV, START_POTENTIAL, \
+        LOWER_POTENTIAL, UPPER_POTENTIAL, STEP_SIZE, SCAN_RATE, CYCLE, \
+        LPTIA_RTIA_SIZE, FIXED_WE_POTENTIAL, MAINS_FILTER, \
+        SINC2_OVERSAMPLING, SINC3_OVERSAMPLING
+    from FreiStat_GUI.Data_Storage.constants import ENABLE_OPTIMIZER, \
+        LOW_PERFORMANCE_MODE
+    from FreiStat_GUI.Data_Storage.data_storage import DataStorage
+
+    listDataStorage : list = []
+
+    for iIndex in range(iTemplates):
+        dataStorage = DataStorage()
+        dataStorage.save_TemplateName("Template " + str(iIndex))
+        dataStorage.save_ExperimentType(CV)
+        dataStorage.save_ExperimentParameters([
+            [START_POTENTIAL, 0.0], [LOWER_POTENTIAL, -0.5],
+            [UPPER_POTENTIAL, 0.5 + iIndex * 0.001], [STEP_SIZE, 0.01],
+            [SCAN_RATE, 0.1], [CYCLE, 3], [LPTIA_RTIA_SIZE, 4],
+            [FIXED_WE_POTENTIAL, True], [MAINS_FILTER, False],
+            [SINC2_OVERSAMPLING, 10], [SINC3_OVERSAMPLING, 2],
+            [ENABLE_OPTIMIZER, True], [LOW_PERFORMANCE_MODE, False]])
+        listDataStorage.append(dataStorage)
+
+    return listDataStorage
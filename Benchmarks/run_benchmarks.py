@@ -0,0 +1,251 @@
+"""
+Benchmark suite of the FreiStat interface. The benchmarks run against the stub
+of the FreiStat framework in `stub`, therefore no potentiostat is required.
+
+Benchmarks                      Display required
+startup.*                       yes     time until the first window is shown
+interface.central_frame         yes     build time of the central frame per method
+interface.template_handler      yes     time until the template management is shown
+live_feed.frame_rate            yes     frame rate of the live feed per sample rate
+templates.*                     no      save and load latency per library size
+
+On a machine without display the suite is run in a virtual frame buffer:
+
+    xvfb-run -a -s "-screen 0 1920x1080x24" python Benchmarks/run_benchmarks.py
+
+The results are written as JSON (see `--output`), benchmarks which can not be
+run are listed with the reason why they were skipped.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+# Import internal dependencies
+from benchmark_utility import _create_Result, _create_Skipped, _setup_Path
+
+# Version of the layout of the result file
+RESULT_FORMAT_VERSION = 1
+
+# Groups of benchmarks, which can be selected
+BENCHMARK_GROUPS = ("startup", "interface", "live_feed", "templates")
+
+def _parse_Arguments() -> argparse.Namespace:
+    """
+    Description
+    -----------
+    Parse the command line options of the benchmark suite.
+
+    Return
+    ------
+    `arguments` : Namespace
+        Parsed command line options
+
+    """
+    parser = argparse.ArgumentParser(description= 
+        "Benchmark suite of the FreiStat interface")
+    parser.add_argument("-o", "--output", default= "benchmark_results.json",
+        help= "File in which the results are written (JSON), - for stdout")
+    parser.add_argument("-r", "--repeat", type= int, default= 5,
+        help= "Amount of measurements per benchmark")
+    parser.add_argument("--only", nargs= "+", choices= BENCHMARK_GROUPS,
+        default= list(BENCHMARK_GROUPS), help= "Groups of benchmarks to run")
+    parser.add_argument("--library-sizes", nargs= "+", type= int,
+        default= [10, 100, 1000, 10000], 
+        help= "Amount of templates of the template libraries")
+    parser.add_argument("--sample-rates", nargs= "+", type= int,
+        default= [10, 100, 1000, 10000], 
+        help= "Sample rates of the live feed in samples per s")
+    parser.add_argument("--duration", type= float, default= 3.0,
+        help= "Duration of one live feed measurement in s")
+
+    return parser.parse_args()
+
+def _get_Environment() -> dict:
+    """
+    Description
+    -----------
+    Collect the environment of the run, so that results of different machines
+    and versions can be told apart.
+
+    Return
+    ------
+    `dicEnvironment` : dict
+        Dictionary describing the environment
+
+    """
+    dicEnvironment : dict = {
+        "python" : platform.python_version(),
+        "platform" : platform.platform(),
+        "display" : os.environ.get("DISPLAY", "")
+    }
+
+    try:
+        import matplotlib
+        dicEnvironment["matplotlib"] = matplotlib.__version__
+    except ImportError:
+        pass
+
+    try:
+        import tkinter
+        dicEnvironment["tk"] = str(tkinter.TkVersion)
+    except ImportError:
+        pass
+
+    try:
+        dicEnvironment["commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output= True, text= True,
+            check= True, cwd= os.path.dirname(os.path.abspath(__file__))
+            ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    return dicEnvironment
+
+def _run_Group(strGroup : str, arguments : argparse.Namespace, 
+               strWorkPath : str) -> list:
+    """
+    Description
+    -----------
+    Run one group of benchmarks.
+
+    Parameters
+    ----------
+    `strGroup` : string
+        Name of the group (see `BENCHMARK_GROUPS`)
+
+    `arguments` : Namespace
+        Parsed command line options
+
+    `strWorkPath` : string
+        Temporary folder used as working directory of the interface
+
+    Return
+    ------
+    `listResults` : list
+        List containing the results of the benchmarks
+
+    """
+    if (strGroup == "startup"):
+        from bench_startup import _run_StartupBenchmark
+
+        listTimes : list = [_run_StartupBenchmark(strWorkPath) 
+                            for iIndex in range(arguments.repeat)]
+
+        return [_create_Result("startup." + strKey, {}, "s", 
+                               [dicTimes[strKey] for dicTimes in listTimes])
+                for strKey in ("imports", "first_window")]
+
+    elif (strGroup == "interface"):
+        from bench_interface import _run_InterfaceBenchmarks
+
+        return _run_InterfaceBenchmarks(arguments.repeat, 
+                                        arguments.library_sizes)
+
+    elif (strGroup == "live_feed"):
+        from bench_interface import _run_LiveFeedBenchmarks
+
+        return _run_LiveFeedBenchmarks(arguments.repeat, 
+            arguments.sample_rates, arguments.duration)
+
+    elif (strGroup == "templates"):
+        from bench_templates import _run_TemplateBenchmarks
+
+        return _run_TemplateBenchmarks(strWorkPath, arguments.repeat,
+                                       arguments.library_sizes)
+
+    return []
+
+def _describe_Exception(exception : Exception) -> str:
+    """
+    Description
+    -----------
+    Describe why a group of benchmarks failed in one line. For failed
+    processes the last line of their error output is used.
+
+    Parameters
+    ----------
+    `exception` : Exception
+        Exception raised by the group
+
+    Return
+    ------
+    `strReason` : string
+        Description of the exception
+
+    """
+    strMessage : str = str(getattr(exception, "stderr", None) or exception)
+    listLines : list = strMessage.strip().splitlines()
+
+    if (len(listLines) == 0):
+        return type(exception).__name__
+
+    return type(exception).__name__ + ": " + listLines[-1]
+
+def Main() -> None:
+    """
+    Description
+    -----------
+    Run the selected benchmarks and write the results.
+
+    """
+    arguments = _parse_Arguments()
+    _setup_Path()
+
+    dicResults : dict = {
+        "format_version" : RESULT_FORMAT_VERSION,
+        "created" : time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment" : _get_Environment(),
+        "results" : []
+    }
+
+    strCurrentPath : str = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as strWorkPath:
+        # The interface writes its settings and log into the working directory
+        os.chdir(strWorkPath)
+
+        try:
+            for strGroup in BENCHMARK_GROUPS:
+                if (strGroup not in arguments.only):
+                    continue
+
+                print("Running " + strGroup + " benchmarks", file= sys.stderr)
+
+                try:
+                    dicResults["results"].extend(
+                        _run_Group(strGroup, arguments, strWorkPath))
+                except Exception as exception:
+                    # E.g. no display available for the Tk benchmarks
+                    dicResults["results"].append(_create_Skipped(
+                        strGroup, _describe_Exception(exception)))
+        finally:
+            os.chdir(strCurrentPath)
+
+    strResults : str = json.dumps(dicResults, indent= 2)
+
+    if (arguments.output == "-"):
+        print(strResults)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(strResults + "\n")
+
+        print("Results written to " + arguments.output, file= sys.stderr)
+
+if __name__ == '__main__':
+    Main()
@@ -0,0 +1,69 @@
+"""
+Constants of the FreiStat framework, which are used by the interface.
+
+"""
+
+"""-----------------------------------------------------------------------------
+| Electrochemical methods
+-----------------------------------------------------------------------------"""
+CA                      = "CA"
+LSV                     = "LSV"
+CV                      = "CV"
+NPV                     = "NPV"
+DPV                     = "DPV"
+SWV                     = "SWV"
+OCP                     = "OCP"
+SEQUENCE                = "SEQ"
+UNDEFIEND               = "UNDEF"
+
+"""-----------------------------------------------------------------------------
+| Experiment parameters
+-----------------------------------------------------------------------------"""
+SEQUENCE_LENGTH         = "SeqL"
+BASE_POTENTIAL          = "BaseP"
+START_POTENTIAL         = "StartP"
+STOP_POTENTIAL          = "StopP"
+LOWER_POTENTIAL         = "LowerP"
+UPPER_POTENTIAL         = "UpperP"
+POTENTIAL_STEPS         = "PSteps"
+PULSE_LENGTH            = "PLength"
+SAMPLING_RATE           = "SRate"
+SAMPLING_DURATION       = "SDuration"
+STEP_SIZE               = "SSize"
+SCAN_RATE               = "ScanR"
+DELTA_V_STAIRCASE       = "DVStair"
+DELTA_V_PEAK            = "DVPeak"
+CYCLE                   = "Cycle"
+LPTIA_RTIA_SIZE         = "RTIA"
+FIXED_WE_POTENTIAL      = "FWEP"
+MAINS_FILTER            = "MFilter"
+SINC2_OVERSAMPLING      = "Sinc2"
+SINC3_OVERSAMPLING      = "Sinc3"
+
+"""-----------------------------------------------------------------------------
+| Default values of the experiment parameters
+-----------------------------------------------------------------------------"""
+BASE_POTENTIAL_F        = 0.0
+START_POTENTIAL_F       = 0.0
+LOWER_POTENTIAL_F       = -0.5
+UPPER_POTENTIAL_F       = 0.5
+PULSE_LENGTH_F          = 1.0
+SAMPLING_RATE_F         = 0.1
+SAMPLING_DURATION_F     = 0.05
+STEP_SIZE_F             = 0.01
+SCAN_RATE_F             = 0.1
+DELTA_V_STAIRCASE_F     = 0.005
+DELTA_V_PEAK_F          = 0.05
+CURRENT_RANGE_F         = 0.000045
+CYCLE_I                 = 1
+SINC2_OVERSAMPLING_I    = 667
+SINC3_OVERSAMPLING_I    = 4
+
+"""-----------------------------------------------------------------------------
+| Communication and plotting
+-----------------------------------------------------------------------------"""
+FREISTAT_BACKEND        = 1
+FREISTAT_SERIAL         = 1
+FREISTAT_WLAN           = 2
+FREISTAT_SEQUENCE_LENGTH = 10
+PLOT_LEGEND_NAME        = "Cycle"
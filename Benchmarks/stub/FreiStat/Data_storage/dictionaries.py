@@ -0,0 +1,30 @@
+"""
+Dictionaries of the FreiStat framework, which are used by the interface.
+
+"""
+
+from .constants import *
+
+# Parameter : [name, label in .csv templates]
+dic_configParameters : dict = {
+    SEQUENCE_LENGTH     : ["Sequence length", "SequenceLength"],
+    BASE_POTENTIAL      : ["Base potential", "BasePotential"],
+    START_POTENTIAL     : ["Start potential", "StartPotential"],
+    STOP_POTENTIAL      : ["Stop potential", "StopPotential"],
+    LOWER_POTENTIAL     : ["Lower potential", "LowerPotential"],
+    UPPER_POTENTIAL     : ["Upper potential", "UpperPotential"],
+    POTENTIAL_STEPS     : ["Potential steps", "PotentialSteps"],
+    PULSE_LENGTH        : ["Pulse length", "PulseLength"],
+    SAMPLING_RATE       : ["Sampling rate", "SamplingRate"],
+    SAMPLING_DURATION   : ["Sampling duration", "SamplingDuration"],
+    STEP_SIZE           : ["Step size", "StepSize"],
+    SCAN_RATE           : ["Scan rate", "ScanRate"],
+    DELTA_V_STAIRCASE   : ["Delta V staircase", "DeltaVStaircase"],
+    DELTA_V_PEAK        : ["Delta V peak", "DeltaVPeak"],
+    CYCLE               : ["Cycle", "Cycle"],
+    LPTIA_RTIA_SIZE     : ["Current range", "CurrentRange"],
+    FIXED_WE_POTENTIAL  : ["Fixed WE potential", "FixedWEPotential"],
+    MAINS_FILTER        : ["Mains filter", "MainsFilter"],
+    SINC2_OVERSAMPLING  : ["Sinc2 oversampling", "Sinc2Oversampling"],
+    SINC3_OVERSAMPLING  : ["Sinc3 oversampling", "Sinc3Oversampling"]
+}
@@ -0,0 +1,9 @@
+"""
+Facade of the FreiStat framework. The stub can not run experiments.
+
+"""
+
+from .run_electrochemical_method import Run_Electrochemical_Method
+
+class Run_DPV(Run_Electrochemical_Method):
+    pass
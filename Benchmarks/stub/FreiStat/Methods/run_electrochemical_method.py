@@ -0,0 +1,10 @@
+"""
+Facade of the FreiStat framework. The stub can not run experiments.
+
+"""
+
+class Run_Electrochemical_Method:
+
+    def __init__(self, *args, **kwargs) -> None:
+        raise NotImplementedError("Experiments can not be run with the "
+                                  "benchmark stub of the FreiStat framework")
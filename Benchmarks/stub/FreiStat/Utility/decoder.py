@@ -0,0 +1,16 @@
+"""
+Decoders of the FreiStat framework, which are used by the interface.
+
+"""
+
+from ..Data_storage.constants import *
+
+def _decode_LPTIA_Resistor_Size(iRegister : int) -> int:
+    # Resistor of the transimpedance amplifier in Ohm
+    return 200 * 2 ** int(iRegister)
+
+def _decode_SincXOSR(iRegister : int, strFilter : str) -> int:
+    # Oversampling rate of the sinc filters
+    if (strFilter == SINC2_OVERSAMPLING):
+        return 22 * (int(iRegister) + 1)
+    return 2 * (int(iRegister) + 1)
@@ -0,0 +1,9 @@
+"""
+Stub of the FreiStat framework used by the benchmarks of the interface. It only
+provides the constants, dictionaries and decoders imported by the interface and
+facades, which can not run experiments.
+
+"""
+
+__name__ = "FreiStat (benchmark stub)"
+__version__ = "0.0.0"
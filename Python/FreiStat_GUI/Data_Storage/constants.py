@@ -47,6 +47,161 @@ NI_SM_DPV               = 105
 NI_SM_SWV               = 106
 NI_SEQ_MODE             = 200
 
+"""-----------------------------------------------------------------------------
+| Interface: Scheduler
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+SCHEDULER_IDLE_FACTOR   = 2             # Factor the tick interval grows per idle tick
+SCHEDULER_IDLE_MAX      = 500           # Maximum tick interval in ms while idle
+
+"""-----------------------------------------------------------------------------
+| Interface: Terminal log
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+LOG_BUFFER_SIZE         = 10000         # Max. amount of records buffered between two flushes
+LOG_FLUSH_INTERVAL      = 100           # Time interval in ms for flushing records into the terminal
+LOG_FILE_NAME           = "FreiStat_Interface.log"  # Name of the log file for spilled lines
+LOG_FILE_SIZE           = 1048576       # Max. size of one log file in byte
+LOG_FILE_COUNT          = 5             # Amount of rotated log files kept
+
+"""-----------------------------------------------------------------------------
+| Interface: Live plot
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+LIVE_PLOT_MARGIN        = 0.1           # Relative headroom added when the axes are rescaled
+LIVE_PLOT_FPS_INTERVAL  = 1.0           # Time interval in s for updating the frame rate
+DECIMATION_POINTS_PER_PIXEL = 4         # Samples per pixel column kept by the decimation
+DECIMATION_MAX_SAMPLES  = 1000000       # Max. amount of samples decimated exactly, larger ranges are strided
+DECIMATION_OVERVIEW_FACTOR = 8          # Samples per pixel column taken for strided ranges
+
+"""-----------------------------------------------------------------------------
+| Interface: Plot band thumbnails
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+THUMBNAIL_ASPECT        = 1.2           # Ratio of width to height of the thumbnails
+THUMBNAIL_PADDING       = 5             # Space in px between two thumbnails
+THUMBNAIL_MARGIN        = 30            # Height in px of the plot band used by padding and scrollbar
+THUMBNAIL_CACHE_SIZE    = 32            # Max. amount of rendered thumbnails kept in memory
+THUMBNAIL_REFRESH_INTERVAL = 1.0        # Min. time interval in s between two refreshs while running
+THUMBNAIL_RUN_SAMPLES   = 1000          # Max. amount of records of one cycle read for the thumbnail of a recording
+
+"""-----------------------------------------------------------------------------
+| Utility: Unit conversion
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+CONVERSION_CACHE_SIZE   = 4096          # Max. amount of cached conversions per converter
+RTIA_REGISTERS          = 27            # Amount of values of the LPTIA RTIA register
+SINC2_REGISTERS         = 12            # Amount of values of the sinc2 OSR register
+SINC3_REGISTERS         = 3             # Amount of values of the sinc3 OSR register
+
+"""-----------------------------------------------------------------------------
+| Data storage: Template import
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+IMPORT_WORKERS          = 4             # Amount of threads reading template files
+IMPORT_POLL_INTERVAL    = 50            # Interval in ms in which the import progress is polled
+IMPORT_FILE_PATTERNS    = ("*.fst", "*.csv") # Files imported from a folder
+
+"""-----------------------------------------------------------------------------
+| Utility: Startup
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+DEFERRED_IMPORT_DELAY   = 500           # Delay in ms after the window is shown until the deferred imports start
+PROFILE_STARTUP_FLAG    = "--profile-startup" # Command line option printing the import times
+PROFILE_TOP_MODULES     = 25            # Amount of modules listed in the startup profile
+
+"""-----------------------------------------------------------------------------
+| Utility: Assets
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+ASSET_HIDPI_THRESHOLD   = 1.5           # Min. ratio of the screen resolution to 96 DPI using the pre-scaled images
+ASSET_HIDPI_SCALE       = 2             # Scale of the pre-scaled images
+ASSET_HIDPI_SUFFIX      = "@2x"         # Suffix of the file name of the pre-scaled images
+LOGO_ICON_FILE          = "logo/FreiStat.gif" # Icon of the windows
+LOGO_TEXT_FILE          = "logo/FreiStat.png" # Logo containing the name
+LOGO_TEXT_SUBSAMPLE     = 4             # Reduction of the logo in the about window
+
+"""-----------------------------------------------------------------------------
+| Utility: Simulated device
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+SIM_SEND_INTERVAL       = 0.005         # Interval in s in which the device sends the due samples
+SIM_STOP_TIMEOUT        = 1.0           # Time in s waiting for the device process to stop
+SIM_MAX_SAMPLES         = 10000000      # Max. amount of samples of one simulated experiment
+SIM_PLOT_INTERVAL       = 50            # Interval in ms in which the plotter draws a frame
+SIM_PLOT_BATCH          = 100000        # Max. amount of records taken from the queue per frame
+SIM_FORMAL_POTENTIAL    = 100.0         # Formal potential of the simulated redox couple in mV
+SIM_PEAK_WIDTH          = 40.0          # Width of the simulated current peaks in mV
+SIM_PEAK_SEPARATION     = 60.0          # Separation of the anodic and cathodic peak in mV
+SIM_PEAK_CURRENT        = 10.0          # Peak current in uA
+SIM_CAPACITIVE_CURRENT  = 0.5           # Capacitive current of a sweep in uA
+SIM_DECAY_TIME          = 0.05          # Time constant in s of the decay after a potential step
+
+"""-----------------------------------------------------------------------------
+| Utility: Headless mode
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+HEADLESS_POLL_INTERVAL  = 0.5           # Time in s between two checks of the experiment process
+HEADLESS_REPORT_INTERVAL = 10.0         # Time in s between two progress reports
+HEADLESS_LOG_FORMAT     = "%(asctime)s;%(levelname)s;%(message)s" # Format of the log printed to stderr
+
+"""-----------------------------------------------------------------------------
+| Data storage: Measurement columns
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+MS_TIME                 = "Time"        # Column containing the time stamps in s
+MS_POTENTIAL            = "Potential"   # Column containing the applied potential
+MS_CURRENT              = "Current"     # Column containing the measured current
+MS_CYCLE                = "Cycle"       # Column containing the cycle number
+MS_METHOD_INDEX         = "Method"      # Column containing the index of the method in a sequence
+MS_INITIAL_SIZE         = 1024          # Initial amount of preallocated rows
+MS_GROWTH_FACTOR        = 2             # Factor the capacity grows, if the store is full
+
+"""-----------------------------------------------------------------------------
+| Data storage: Data queue drain
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+DRAIN_BATCH_SIZE        = 1000          # Max. amount of records taken from the queue at once
+DRAIN_TIMEOUT           = 0.05          # Time in s waiting for new records before checking for a stop
+DRAIN_LOG_LENGTH        = 200           # Max. amount of characters of a skipped record, which are logged
+DRAIN_FORWARD_SIZE      = 100000        # Max. amount of records waiting for the plotter, older ones are dropped
+DQ_TIME                 = 0             # Index of the time stamp in a record of the data queue
+DQ_POTENTIAL            = 1             # Index of the applied potential in a record of the data queue
+DQ_CURRENT              = 2             # Index of the measured current in a record of the data queue
+DQ_CYCLE                = 3             # Index of the cycle in a record of the data queue
+DQ_METHOD_INDEX         = 4             # Index of the method index in a record of the data queue (sequence)
+
+"""-----------------------------------------------------------------------------
+| Data storage: Run recording
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+RR_MAGIC                = b"FSRUN001"   # Magic bytes at the start of a recording
+RR_TRAILER_MAGIC        = b"FSRUNEND"   # Magic bytes at the end of a completed recording
+RR_FILE_EXTENSION       = ".fsr"        # File extension of recordings
+RR_LOCK_EXTENSION       = ".lock"       # Extension of the lock file held while a recording is written
+RR_FSYNC_INTERVAL       = 1.0           # Time interval in s between two fsyncs
+RR_TIMEOUT              = 0.1           # Time in s waiting for new batches before checking for a stop
+
+"""-----------------------------------------------------------------------------
+| Data storage: Template container
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+TC_MAGIC                = b"SQLite format 3\x00"  # Magic bytes of a template container (SQLite)
+TC_FORMAT_VERSION       = 2             # Version of the template container format
 
 """-----------------------------------------------------------------------------
 | Main Window: Geometry
@@ -99,6 +254,8 @@ BUTTON_SAVEAS           = 17            # Command for saving a config externally
 BUTTON_PREFERENCES      = 18            # Command for opening the option menu
 BUTTON_HELP             = 19            # Command for opening the help window
 BUTTON_ABOUT            = 20            # Command for opening the about window
+BUTTON_OPEN_RUN         = 21            # Command for opening a recorded run
+BUTTON_LOAD_FOLDER      = 22            # Command for importing all template files of a folder
 
 BUTTON_TERMINAL         = 30            # Command for switching to the terminal window
 BUTTON_PLOTS            = 31            # Command for switching to the plot window
@@ -132,6 +289,22 @@ BUTTON_SM_PARA_EC_SWV   = 215           # Command for square wave voltammetry
 -----------------------------------------------------------------------------"""
 CHECKBUTTON_ADV_SETTING = 1             # Command for enabling/ disabling advanced settings
 
+"""-----------------------------------------------------------------------------
+| Main Window: Entry validation of the method parameters
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+VALIDATE_ARRAY          = 0             # Comma separated list of values
+VALIDATE_VALUE          = 1             # Single value
+VALIDATE_POSITIVE       = 2             # Single positive integer
+
+"""-----------------------------------------------------------------------------
+| Main Window: Form cache
+|   
+|   Constant              Value                     Meaning
+-----------------------------------------------------------------------------"""
+FORM_CACHE_SIZE         = 6             # Max. amount of parameter forms kept hidden in the central frame
+
 """-----------------------------------------------------------------------------
 | PopUp Window: Geometry
 |   
@@ -140,6 +313,10 @@ CHECKBUTTON_ADV_SETTING = 1             # Command for enabling/ disabling advanc
 PW_X_POSITION           = 250           # Size of the popup window in X direction
 PW_Y_POSITION           = 300           # Size of the popup window in Y direction
 PW_Y_POSITION_SMALL     = 60            # Size of the popup window in Y direction
+PW_TEMPLATE_X           = 1000          # Size of the template management in X direction
+PW_TEMPLATE_Y           = 600           # Size of the template management in Y direction
+PW_TEMPLATE_ROW_HEIGHT  = 40            # Height of one template row in pixel
+PW_TEMPLATE_DETAILS     = 250           # Height of the template details in pixel
 
 """-----------------------------------------------------------------------------
 | Configuration parameters: Settings/ Preferences
@@ -148,7 +325,12 @@ PW_Y_POSITION_SMALL     = 60            # Size of the popup window in Y directio
 -----------------------------------------------------------------------------"""
 SET_GLPM                = "pGLPM"       # Parameter for the global low performance mode
 SET_GLPM_LATENCY        = "pGLPML"      # Parameter for the g.LPM latency in ms
+SET_TICK_RATE           = "pTR"         # Parameter for the scheduler tick interval in ms
+SET_TERMINAL_LINES      = "pTL"         # Parameter for the max. amount of lines in the terminal
 SET_WLAN_MODE           = "pWM"         # Parameter for the wlan mode
+SET_SIMULATION          = "pSIM"        # Parameter for the simulated device
+SET_SIMULATION_RATE     = "pSIMR"       # Parameter for the sample rate factor of the simulated device
+SET_SIMULATION_NOISE    = "pSIMN"       # Parameter for the noise of the simulated device in %
 SET_SERVER_IP           = "pSIP"        # Parameter for the server ip
 SET_SERVER_PORT         = "pSPO"        # Parameter for the server port
 SET_CLIENT_IP           = "pCIP"        # Parameter for the client ip
@@ -161,7 +343,12 @@ SET_CLIENT_PORT         = "pCPO"        # Parameter for the client port
 -----------------------------------------------------------------------------"""
 SET_GLPM_VALUE          = 0             # Default value for the global low performance mode
 SET_GLPM_LATENCY_VALUE  = "1"           # Default value for the g.LPM latency in ms
+SET_TICK_RATE_VALUE     = "50"          # Default value for the scheduler tick interval in ms
+SET_TERMINAL_LINES_VALUE= "5000"        # Default value for the max. amount of lines in the terminal
 SET_WLAN_MODE_VALUE     = 0             # Default value for the wlan mode
+SET_SIMULATION_VALUE    = 0             # Default value for the simulated device
+SET_SIMULATION_RATE_VALUE = "1"         # Default value for the sample rate factor of the simulated device
+SET_SIMULATION_NOISE_VALUE = "1"        # Default value for the noise of the simulated device in %
 SET_SERVER_IP_VALUE     = "192.168.1.2" # Default value for the server ip
 SET_SERVER_PORT_VALUE   = "20001"       # Default value for the server port
 SET_CLIENT_IP_VALUE     = "192.168.1.1" # Default value for the client ip
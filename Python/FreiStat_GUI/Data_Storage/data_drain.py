@@ -0,0 +1,332 @@
+"""
+Module implementing a thread, which drains the data queue of the experiment
+process into the measurement storage of the interface.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import logging
+import queue
+import threading
+
+# Include internal dependencies
+from .constants import *
+from .measurement_storage import MeasurementStorage
+from .run_recording import RunRecorder
+
+class DataDrain(threading.Thread):
+    """
+    Description
+    -----------
+    Thread taking the records of the experiment process out of the data queue
+    in batches and appending the measurement points to a measurement storage.
+
+    Every record is forwarded unchanged to a local queue, which is handed to
+    the plotter of the FreiStat library instead of the data queue. Therefore a
+    slow redraw of the plotter never backs up the queue of the experiment
+    process. The local queue holds at most `DRAIN_FORWARD_SIZE` records, if
+    the plotter falls behind the oldest records are dropped from the live
+    feed. They are still stored and recorded. Optionally every batch is handed
+    over to a recorder, which writes it to disk. The static plot of the
+    interface reads copies of the stored data with `get_Snapshot`. Without a
+    plotter (headless mode) storing and forwarding can be disabled, so that 
+    the data only goes to disk.
+
+    Records are expected as sequence with the layout defined by the `DQ_*`
+    indices. Records which are not of this form (e.g. control messages of the
+    experiment process) are only forwarded. They are counted and the first of
+    them is logged, so that a differing layout of the data queue doesn't go
+    unnoticed.
+
+    """
+
+    def __init__(self, dataQueue, measurementStorage : MeasurementStorage,
+                 runRecorder : RunRecorder = None,
+                 bForward : bool = True, logger = None) -> None:
+        """
+        Description
+        -----------
+        Constructor of class DataDrain
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Data queue filled by the experiment process
+
+        `measurementStorage` : MeasurementStorage
+            Measurement storage in which the data is stored, None if the data
+            should not be kept in memory
+
+        `runRecorder` : RunRecorder
+            Optional recorder to which every batch is handed over for writing
+            it to disk
+
+        `bForward` : bool
+            Flag indicating if the records are forwarded to the local queue
+
+        `logger` : Logger
+            Logger to which the first skipped record is reported, the logger
+            of the module if not given
+
+        """
+        super().__init__(daemon= True)
+
+        # Initialize class variables
+        self._dataQueue = dataQueue
+        self._forwardQueue : queue.Queue = queue.Queue(DRAIN_FORWARD_SIZE)
+        self._measurementStorage : MeasurementStorage = measurementStorage
+        self._runRecorder : RunRecorder = runRecorder
+        self._bForward : bool = bForward
+        self._iSkippedRecords : int = 0
+        self._iDroppedRecords : int = 0
+        self._logger = logger if logger is not None else \
+            logging.getLogger(__name__)
+        self._lockStorage = threading.Lock()
+        self._eventStop = threading.Event()
+
+    def run(self) -> None:
+        """
+        Description
+        -----------
+        Main loop of the thread draining the data queue until a stop is
+        requested. Remaining records are drained before the thread ends.
+
+        """
+        while (self._eventStop.is_set() == False):
+            self._drainBatch(DRAIN_TIMEOUT)
+
+        # Drain what is left in the queue
+        while (self._drainBatch(0) > 0):
+            pass
+
+    def stop(self) -> None:
+        """
+        Description
+        -----------
+        Request the thread to stop and wait until the remaining records are
+        drained.
+
+        """
+        self._eventStop.set()
+
+        if (self.is_alive() == True):
+            self.join()
+
+    def get_ForwardQueue(self) -> queue.Queue:
+        """
+        Description
+        -----------
+        Get the queue into which the records are forwarded.
+
+        Return
+        ------
+        `forwardQueue` : Queue
+            Queue containing every drained record
+
+        """
+        return self._forwardQueue
+
+    def get_SkippedRecords(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of records, which didn't match the layout of the data
+        queue and were therefore not stored.
+
+        Return
+        ------
+        `iSkippedRecords` : int
+            Amount of skipped records
+
+        """
+        return self._iSkippedRecords
+
+    def get_DroppedRecords(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of records, which were dropped from the forward queue,
+        since the plotter didn't keep up.
+
+        Return
+        ------
+        `iDroppedRecords` : int
+            Amount of dropped records
+
+        """
+        return self._iDroppedRecords
+
+    def get_Snapshot(self, iMethodIndex : int = None) -> dict:
+        """
+        Description
+        -----------
+        Get a copy of the stored data, which is safe to use while the thread
+        keeps appending.
+
+        Parameters
+        ----------
+        `iMethodIndex` : int
+            Index of the method in a sequence, whose data is copied, None
+            copies the data of every method
+
+        Return
+        ------
+        `dicColumns` : dict
+            Dictionary containing a copy of every column
+
+        """
+        with self._lockStorage:
+            if (iMethodIndex is not None):
+                return self._measurementStorage.get_MethodColumns(iMethodIndex)
+
+            return {strColumn : fColumn.copy() for strColumn, fColumn in
+                    self._measurementStorage.get_Columns().items()}
+
+    def _drainBatch(self, fTimeout : float) -> int:
+        """
+        Description
+        -----------
+        Wait for the first record and take all further available records up to
+        `DRAIN_BATCH_SIZE` without blocking.
+
+        Parameters
+        ----------
+        `fTimeout` : float
+            Time in s waiting for the first record
+
+        Return
+        ------
+        `iRecords` : int
+            Amount of drained records
+
+        """
+        listRecords : list = []
+
+        try:
+            if (fTimeout > 0):
+                listRecords.append(self._dataQueue.get(timeout= fTimeout))
+
+            while (len(listRecords) < DRAIN_BATCH_SIZE):
+                listRecords.append(self._dataQueue.get_nowait())
+        except (queue.Empty, EOFError, OSError, ValueError):
+            # Queue is empty or was closed by the experiment process
+            pass
+
+        if (len(listRecords) == 0):
+            return 0
+
+        self._storeRecords(listRecords)
+
+        if (self._bForward == True):
+            for record in listRecords:
+                self._forwardRecord(record)
+
+        return len(listRecords)
+
+    def _forwardRecord(self, record) -> None:
+        """
+        Description
+        -----------
+        Put a record into the forward queue. If the queue is full, the oldest
+        record is dropped, so that the live feed shows the latest data.
+
+        Parameters
+        ----------
+        `record` : object
+            Drained record
+
+        """
+        while (True):
+            try:
+                self._forwardQueue.put_nowait(record)
+                return
+            except queue.Full:
+                pass
+
+            try:
+                self._forwardQueue.get_nowait()
+                self._iDroppedRecords += 1
+            except queue.Empty:
+                pass
+
+    def _storeRecords(self, listRecords : list) -> None:
+        """
+        Description
+        -----------
+        Append the measurement points of a batch of records to the storage.
+
+        Parameters
+        ----------
+        `listRecords` : list
+            List containing the drained records
+
+        """
+        listTime : list = []
+        listPotential : list = []
+        listCurrent : list = []
+        listCycle : list = []
+        listMethodIndex : list = []
+
+        for record in listRecords:
+            try:
+                fTime = float(record[DQ_TIME])
+                fPotential = float(record[DQ_POTENTIAL])
+                fCurrent = float(record[DQ_CURRENT])
+                iCycle = int(record[DQ_CYCLE])
+                iMethodIndex = 0
+                if (len(record) > DQ_METHOD_INDEX):
+                    iMethodIndex = int(record[DQ_METHOD_INDEX])
+            except (TypeError, ValueError, IndexError, KeyError):
+                # No measurement point
+                self._skipRecord(record)
+                continue
+
+            listTime.append(fTime)
+            listPotential.append(fPotential)
+            listCurrent.append(fCurrent)
+            listCycle.append(iCycle)
+            listMethodIndex.append(iMethodIndex)
+
+        if (self._measurementStorage is not None):
+            with self._lockStorage:
+                self._measurementStorage.extend(listTime, listPotential,
+                    listCurrent, listCycle, listMethodIndex)
+
+        if (self._runRecorder is not None and len(listTime) > 0):
+            self._runRecorder.write(listTime, listPotential, listCurrent,
+                                    listCycle, listMethodIndex)
+
+    def _skipRecord(self, record) -> None:
+        """
+        Description
+        -----------
+        Count a record, which doesn't match the layout of the data queue. The
+        first skipped record is logged with its type and length.
+
+        Parameters
+        ----------
+        `record` : object
+            Skipped record
+
+        """
+        self._iSkippedRecords += 1
+
+        if (self._iSkippedRecords > 1):
+            return
+
+        try:
+            strLength : str = str(len(record))
+        except TypeError:
+            strLength : str = "-"
+
+        self._logger.warning("Record of type " + type(record).__name__ +
+            " (length " + strLength + ") doesn't match the layout of the " +
+            "data queue and is not stored: " + repr(record)[:DRAIN_LOG_LENGTH])
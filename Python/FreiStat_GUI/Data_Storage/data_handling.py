@@ -16,15 +16,106 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 import os
 import pickle
 import csv
-import ast
 from FreiStat.Data_storage.constants import *
 from FreiStat.Data_storage.dictionaries import *
 
 # Import internal dependencies
 from .constants import *
 from .data_storage import DataStorage
+from .measurement_storage import MeasurementStorage
+from .template_container import LazyDataStorage
+from .template_container import _encode_Parameters
+from .template_container import _is_Container
+from .template_container import _read_Container
+from .template_container import _read_Index
+from .template_container import _read_LegacyFile
+from .template_container import _write_Container
 from .dictionaries import *
 from ..Utility import _decodeParameters
+from ..Utility import conv_Flag
+from ..Utility import conv_MilliList
+from ..Utility import dic_parameterDecoding
+
+# Parameter keys of the labels used in .csv-files
+dic_csvParameters : dict = {values[1] : key for key, values in 
+                            dic_configParameters.items()}
+
+def _parse_Cell(strCell : str, strKey : str):
+    """
+    Description
+    -----------
+    Parse the value of a cell in a .csv-file and check it against the type
+    expected for the experiment parameter. Supported are numbers, flags 
+    (booleans or 0/ 1) and lists of numbers (e.g. "[100, 200]"). Raises a
+    ValueError describing the problem, if the value doesn't match.
+
+    Parameters
+    ----------
+    `strCell` : string
+        Content of the cell
+
+    `strKey` : string
+        Key of the experiment parameter
+
+    Return
+    ------
+    `value` : int, float, bool or list
+        Parsed value
+
+    """
+    tupleDecoding = dic_parameterDecoding.get(strKey)
+    conversion = tupleDecoding[2] if tupleDecoding is not None else None
+    strCell = strCell.strip()
+
+    # Lists
+    if (conversion is conv_MilliList):
+        if (not (strCell.startswith("[") and strCell.endswith("]"))):
+            raise ValueError("Expected a list of numbers")
+
+        strCell = strCell[1:-1].strip()
+        if (strCell == ""):
+            return []
+        return [_parse_Number(strElement) for strElement in strCell.split(",")]
+
+    # Flags
+    if (conversion is conv_Flag):
+        if (strCell in ("True", "False")):
+            return strCell == "True"
+        if (strCell in ("0", "1")):
+            return int(strCell)
+        raise ValueError("Expected True, False, 0 or 1")
+
+    return _parse_Number(strCell)
+
+def _parse_Number(strCell : str):
+    """
+    Description
+    -----------
+    Parse a number (integer or float) of a cell in a .csv-file. Raises a 
+    ValueError, if the cell contains no number.
+
+    Parameters
+    ----------
+    `strCell` : string
+        Content of the cell
+
+    Return
+    ------
+    `value` : int or float
+        Parsed value
+
+    """
+    strCell = strCell.strip()
+
+    try:
+        return int(strCell)
+    except ValueError:
+        pass
+
+    try:
+        return float(strCell)
+    except ValueError:
+        raise ValueError("Expected a number") from None
 
 class DataHandling:
     """
@@ -36,6 +127,10 @@ class DataHandling:
     of DataStorage objects, since the data is stored in a list format, which is
     accessed in form of a ring structure from outside.
 
+    Additionally the templates are indexed by experiment type and template
+    name, which allows looking them up with `find_Template` without walking
+    through the ring.
+
     """
 
     def __init__(self, strRootPath) -> None:
@@ -54,6 +149,9 @@ class DataHandling:
         self._preferences : list = []
         self._listDataObject : list = []
         self._currentDataObject : int = 0
+        self._dicTemplateIndex : dict = {}
+        self._listImportErrors : list = []
+        self._listExportErrors : list = []
         self._strRootPath = strRootPath
 
     def create_DataObject(self) -> None:
@@ -68,6 +166,7 @@ class DataHandling:
         """
         # Create data object and append it to the list
         self._listDataObject.append(DataStorage())
+        self._indexDataObject(self._listDataObject[-1])
 
         # Set reference to this new Data object
         self._currentDataObject = len(self._listDataObject) - 1
@@ -85,6 +184,7 @@ class DataHandling:
 
         """        
         self._listDataObject.append(dataStorage)
+        self._indexDataObject(dataStorage)
 
         # Set reference to this new Data object
         self._currentDataObject = len(self._listDataObject) - 1
@@ -96,6 +196,7 @@ class DataHandling:
         Delete the currently pointed to data object from the list.
 
         """   
+        self._unindexDataObject(self._listDataObject[self._currentDataObject])
         del self._listDataObject[self._currentDataObject]
 
     def move_first_DataObject(self) -> None:
@@ -147,6 +248,142 @@ class DataHandling:
             # Jump to previous object
             self._currentDataObject -= 1
 
+    def find_Template(self, strExperimentType : str, 
+                      strTemplateName : str) -> DataStorage:
+        """
+        Description
+        -----------
+        Look up a template by experiment type and template name. The reference
+        to the current data object is not changed.
+
+        Parameters
+        ----------
+        `strExperimentType` : string
+            String containing electrochemical method of the template
+
+        `strTemplateName` : string
+            String containing the name of the template
+
+        Return
+        ------
+        `dataStorage` : DataStorage
+            Reference to the DataStorage object or None if no template matches
+
+        """
+        tupleKey : tuple = (strExperimentType, strTemplateName)
+        listEntries : list = self._dicTemplateIndex.get(tupleKey)
+
+        # Objects renamed directly instead of using `rename_Template` leave
+        # an outdated entry, rebuild the index in this case
+        if (listEntries and self._getTemplateKey(listEntries[0]) != tupleKey):
+            self._rebuildIndex()
+            listEntries = self._dicTemplateIndex.get(tupleKey)
+
+        if (not listEntries):
+            return None
+
+        return listEntries[0]
+
+    def select_Template(self, strExperimentType : str, 
+                        strTemplateName : str) -> bool:
+        """
+        Description
+        -----------
+        Set the reference to the data object of the given template.
+
+        Parameters
+        ----------
+        `strExperimentType` : string
+            String containing electrochemical method of the template
+
+        `strTemplateName` : string
+            String containing the name of the template
+
+        Return
+        ------
+        `bFound` : bool
+            Flag indicating if the template was found
+
+        """
+        dataStorage = self.find_Template(strExperimentType, strTemplateName)
+
+        if (dataStorage is None):
+            return False
+
+        self._currentDataObject = self._getPosition(dataStorage)
+        return True
+
+    def delete_Template(self, strExperimentType : str, 
+                        strTemplateName : str) -> bool:
+        """
+        Description
+        -----------
+        Delete a template by experiment type and template name. The reference
+        to the current data object keeps pointing to the same object, if this
+        object was not deleted.
+
+        Parameters
+        ----------
+        `strExperimentType` : string
+            String containing electrochemical method of the template
+
+        `strTemplateName` : string
+            String containing the name of the template
+
+        Return
+        ------
+        `bDeleted` : bool
+            Flag indicating if the template was found and deleted
+
+        """
+        dataStorage = self.find_Template(strExperimentType, strTemplateName)
+
+        if (dataStorage is None):
+            return False
+
+        iPosition : int = self._getPosition(dataStorage)
+
+        self._unindexDataObject(dataStorage)
+        del self._listDataObject[iPosition]
+
+        # Keep reference on the current data object
+        if (iPosition < self._currentDataObject or 
+            self._currentDataObject >= len(self._listDataObject)):
+            self._currentDataObject = max(self._currentDataObject - 1, 0)
+
+        return True
+
+    def get_UniqueTemplateName(self, strExperimentType : str, 
+                               strTemplateName : str) -> str:
+        """
+        Description
+        -----------
+        Get a template name, which is not used yet for the experiment type. If
+        the name is already used, a counter is appended (e.g. "Name (2)").
+
+        Parameters
+        ----------
+        `strExperimentType` : string
+            String containing electrochemical method of the template
+
+        `strTemplateName` : string
+            String containing the requested name of the template
+
+        Return
+        ------
+        `strTemplateName` : string
+            String containing the unused template name
+
+        """
+        strUniqueName : str = strTemplateName
+        iCounter : int = 2
+
+        while (self.find_Template(strExperimentType, strUniqueName) is not None):
+            strUniqueName = strTemplateName + " (" + str(iCounter) + ")"
+            iCounter += 1
+
+        return strUniqueName
+
     def export_Templates(self, strFilePath : str, dataStorageList : list) -> None:
         """
         Description
@@ -163,10 +400,9 @@ class DataHandling:
             should be exported
 
         """
-        with open(strFilePath, "wb") as output:
-            # Write data objects as data file into the chosen directory.
-            pickle.dump(dataStorageList, output, 
-                pickle.HIGHEST_PROTOCOL)
+        # Write data objects as template file into the chosen directory.
+        _write_Container(strFilePath, 
+                         self._prepare_Export(strFilePath, dataStorageList))
 
         # Change back to base directory
         os.chdir(self._strRootPath)
@@ -183,14 +419,82 @@ class DataHandling:
             String containing the location where the data should be stored
 
         """
-        with open(strFilePath, "wb") as output:
-            # Write data objects as data file into the chosen directory.
-            pickle.dump(self._listDataObject, output, 
-                pickle.HIGHEST_PROTOCOL)
+        # Write data objects as template file into the chosen directory.
+        _write_Container(strFilePath, 
+                         self._prepare_Export(strFilePath, self._listDataObject))
 
         # Change back to base directory
         os.chdir(self._strRootPath)
 
+    def _prepare_Export(self, strFilePath : str, listDataStorage : list) -> list:
+        """
+        Description
+        -----------
+        Helper method loading the lazy templates before a template file is 
+        written. Every lazy template of the data handling, which was read from
+        the written file, is loaded so that it keeps its parameters. Templates
+        which can't be loaded (e.g. their file was deleted) or whose parameters
+        can't be encoded are not exported and reported in the export errors.
+        
+        Parameters
+        ----------
+        `strFilePath` : string
+            String containing the location of the written file
+
+        `listDataStorage` : list
+            List containing the DataStorage objects which should be exported
+
+        Return
+        ------
+        Returns list containing the DataStorage objects which can be exported
+
+        """
+        # Reset errors of the last export
+        self._listExportErrors = []
+
+        strFilePath = os.path.abspath(strFilePath)
+
+        for dataStorage in self._listDataObject + listDataStorage:
+            if (isinstance(dataStorage, LazyDataStorage) and 
+                dataStorage.is_Loaded() == False and
+                dataStorage.get_FilePath() == strFilePath):
+                try:
+                    dataStorage.load_Template()
+                except (OSError, ValueError):
+                    # Reported below, if the template is exported
+                    pass
+
+        listExport : list = []
+
+        for dataStorage in listDataStorage:
+            try:
+                if (isinstance(dataStorage, LazyDataStorage)):
+                    dataStorage.load_Template()
+
+                _encode_Parameters(dataStorage.get_ExperimentParameters())
+            except (OSError, TypeError, ValueError) as exception:
+                self._listExportErrors.append(
+                    dataStorage.get_TemplateName() + ": " + str(exception))
+                continue
+
+            listExport.append(dataStorage)
+
+        return listExport
+
+    def get_ExportErrors(self) -> list:
+        """
+        Description
+        -----------
+        Get the templates which couldn't be written during the last export.
+
+        Return
+        ------
+        `listExportErrors` : list
+            List containing a message for every template which wasn't written
+            
+        """
+        return self._listExportErrors
+
     def import_Configuration(self, strFilePath : str) -> list:
         """
         Description
@@ -206,68 +510,216 @@ class DataHandling:
         ------
         Returns list containing loaded dataStorage objects
 
+        """
+        # Reset errors of the last import
+        self._listImportErrors = []
+
+        return self.read_Templates(strFilePath, self._listImportErrors)
+
+    def read_Templates(self, strFilePath : str, listErrors : list, 
+                       strTemplateName : str = "Insert Template Name here") \
+                       -> list:
+        """
+        Description
+        -----------
+        Read the templates of a template (.fst) or .csv-file without changing
+        the state of the data handling, therefore it can be called from worker
+        threads.
+        
+        Parameters
+        ----------
+        `strFilePath` : string
+            String containing the location of the file
+
+        `listErrors` : list
+            List to which a message is appended for every error
+
+        `strTemplateName` : string
+            Name given to the templates of .csv-files
+
+        Return
+        ------
+        Returns list containing loaded dataStorage objects
+
         """
         # Load data storage object
         try:
             if (".fst" in strFilePath):
-                with open(strFilePath, "rb") as input:
-                    # Temporary save loaded dataStorage objects from import to
-                    # enable management through the Template Management
-                    listDataStorage = pickle.load(input)   
+                # Template files of older versions are read completely
+                if (_is_Container(strFilePath) == False):
+                    return _read_LegacyFile(strFilePath)
 
-                # Close input reader
-                input.close   
+                # Temporary save loaded dataStorage objects from import to
+                # enable management through the Template Management, the
+                # experiment parameters are loaded on demand
+                listDataStorage = _read_Container(strFilePath)
 
                 return listDataStorage   
 
             elif (".csv" in strFilePath):
-                # Create data storage object
-                tempDataStorage = DataStorage()
-
-                # Create temp list for experiment parameters
-                listTempExPara : list = []
+                return self._import_CSV(strFilePath, listErrors, 
+                                        strTemplateName)
+        except Exception as exception:
+            listErrors.append(os.path.basename(strFilePath) + ": " + 
+                              str(exception))
 
-                # Open .csv-file
-                with open(strFilePath) as input:
-                    # Temporary save loaded .csv file and convert it into an 
-                    # data storage object
-                    csvFile = csv.reader(input, delimiter= ",")   
+        # Return empty list
+        return []
 
-                    # Read and set experiment type in template
-                    tempDataStorage.save_ExperimentType(next(csvFile)[1])
+    def _import_CSV(self, strFilePath : str, listErrors : list,
+                    strTemplateName : str) -> list:
+        """
+        Description
+        -----------
+        Import the templates of a .csv-file. Every template starts with a row
+        containing the experiment type, followed by one row per experiment 
+        parameter. A file can contain several templates. Invalid rows are 
+        skipped and reported in the import errors.
+        
+        Parameters
+        ----------
+        `strFilePath` : string
+            String containing the location of the .csv-file
 
-                    # Loop over all rows
-                    for row in csvFile :
-                        # Loop over the dictionary values
-                        for key, values in dic_configParameters.items():
-                            if (row[0] == values[1]):
+        `listErrors` : list
+            List to which a message is appended for every invalid row
 
-                                listTempExPara.append([key, ast.literal_eval(row[1])])
+        `strTemplateName` : string
+            Name given to the templates
 
-                # Close input reader
-                input.close   
+        Return
+        ------
+        Returns list containing loaded dataStorage objects
 
-                # Convert experiment parameters
+        """
+        strFileName : str = os.path.basename(strFilePath)
+        strHeader : str = None
+        listTemplates : list = []
+
+        # Open .csv-file and read it row by row
+        with open(strFilePath, newline= "") as input:
+            for iRow, row in enumerate(csv.reader(input, delimiter= ","), 1):
+                # Skip empty rows
+                if (len(row) == 0 or all(strCell.strip() == "" 
+                                         for strCell in row)):
+                    continue
+
+                strErrorPrefix : str = strFileName + ", row " + str(iRow) + ": "
+
+                if (len(row) < 2):
+                    listErrors.append(strErrorPrefix + 
+                        "Expected label and value")
+                    continue
+
+                strLabel : str = row[0].strip()
+
+                # First row and every row with the same label start a template
+                if (strHeader is None or strLabel == strHeader):
+                    strHeader = strLabel
+                    listTemplates.append([row[1].strip(), []])
+                    continue
+
+                # Look up experiment parameter of the label
+                strKey = dic_csvParameters.get(strLabel)
+
+                if (strKey is None):
+                    listErrors.append(strErrorPrefix + 
+                        "Unknown parameter \"" + strLabel + "\"")
+                    continue
+
+                try:
+                    listTemplates[-1][1].append(
+                        [strKey, _parse_Cell(row[1], strKey)])
+                except ValueError as error:
+                    listErrors.append(strErrorPrefix + 
+                        "Invalid value \"" + row[1] + "\" for \"" + 
+                        strLabel + "\": " + str(error))
+
+        listDataStorage : list = []
+
+        for iTemplate, (strExperimentType, listTempExPara) in \
+            enumerate(listTemplates, 1):
+            strErrorPrefix : str = strFileName + ", template " + \
+                str(iTemplate) + " (" + strExperimentType + "): "
+
+            if (len(listTempExPara) == 0):
+                listErrors.append(strErrorPrefix + "Contains no parameters")
+                continue
+
+            # Convert experiment parameters of every template on its own, so
+            # an invalid template doesn't affect the others
+            try:
                 _decodeParameters(listTempExPara)
-                
-                # Append missing parameters
-                listTempExPara.append([ENABLE_OPTIMIZER, True])
-                listTempExPara.append([LOW_PERFORMANCE_MODE, False])
+            except ValueError as error:
+                listErrors.append(strErrorPrefix + str(error))
+                continue
+
+            # Create data storage object
+            tempDataStorage = DataStorage()
+            tempDataStorage.save_ExperimentType(strExperimentType)
+
+            # Append missing parameters
+            listTempExPara.append([ENABLE_OPTIMIZER, True])
+            listTempExPara.append([LOW_PERFORMANCE_MODE, False])
+
+            # Save experiment parameters    
+            tempDataStorage.save_ExperimentParameters(listTempExPara)        
+
+            # Give template a name
+            if (len(listTemplates) > 1):
+                tempDataStorage.save_TemplateName(strTemplateName + " " + 
+                                                  str(len(listDataStorage) + 1))
+            else :
+                tempDataStorage.save_TemplateName(strTemplateName)
+        
+            # Append object to list
+            listDataStorage.append(tempDataStorage)
 
-                # Save experiment parameters    
-                tempDataStorage.save_ExperimentParameters(listTempExPara)        
+        return listDataStorage
+
+    def get_ImportErrors(self) -> list:
+        """
+        Description
+        -----------
+        Get the errors which occurred during the last import.
 
-                # Give template a name
-                tempDataStorage.save_TemplateName("Insert Template Name here")
+        Return
+        ------
+        `listImportErrors` : list
+            List containing a message for every error
             
-                # Append object to list
-                listDataStorage : list = [tempDataStorage]
+        """
+        return self._listImportErrors
 
-                return listDataStorage 
+    def list_Templates(self, strFilePath : str) -> list:
+        """
+        Description
+        -----------
+        List name and type of the templates in a template file, without 
+        loading their experiment parameters.
+        
+        Parameters
+        ----------
+        `strFilePath` : string
+            String containing the location of the template file
+
+        Return
+        ------
+        Returns list containing [name, type] of every template
+
+        """
+        try:
+            if (_is_Container(strFilePath) == False):
+                return [[dataStorage.get_TemplateName(), 
+                         dataStorage.get_ExperimentType()] for dataStorage in
+                        _read_LegacyFile(strFilePath)]
+
+            return [[strName, strType] for strKey, strName, strType in 
+                    _read_Index(strFilePath)]
         except:
             # Return empty list
             return []
-        
+
     def export_Settings(self) -> None:
         """
         Description
@@ -292,7 +744,12 @@ class DataHandling:
             listPreferences : list = [
                 [SET_GLPM, SET_GLPM_VALUE],
                 [SET_GLPM_LATENCY, SET_GLPM_LATENCY_VALUE],
+                [SET_TICK_RATE, SET_TICK_RATE_VALUE],
+                [SET_TERMINAL_LINES, SET_TERMINAL_LINES_VALUE],
                 [SET_WLAN_MODE, SET_WLAN_MODE_VALUE],
+                [SET_SIMULATION, SET_SIMULATION_VALUE],
+                [SET_SIMULATION_RATE, SET_SIMULATION_RATE_VALUE],
+                [SET_SIMULATION_NOISE, SET_SIMULATION_NOISE_VALUE],
                 [SET_SERVER_IP, SET_SERVER_IP_VALUE],
                 [SET_SERVER_PORT, SET_SERVER_PORT_VALUE],
                 [SET_CLIENT_IP, SET_CLIENT_IP_VALUE],
@@ -322,8 +779,34 @@ class DataHandling:
             String containing the name of the template
             
         """
-        self._listDataObject[self._currentDataObject]. \
-            save_TemplateName(strTemplateName)
+        self.rename_Template(self._listDataObject[self._currentDataObject],
+                             strTemplateName)
+
+    def rename_Template(self, dataStorage : DataStorage, 
+                        strTemplateName : str) -> None:
+        """
+        Description
+        -----------
+        Rename a template and update the template index. Templates have to be
+        renamed with this method instead of renaming the DataStorage object
+        directly, otherwise `find_Template` doesn't find the new name.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Reference to the DataStorage object, which doesn't have to be 
+            part of the data handling
+
+        `strTemplateName` : string
+            String containing the new name of the template
+
+        """
+        bIndexed : bool = self._unindexDataObject(dataStorage)
+        dataStorage.save_TemplateName(strTemplateName)
+
+        # Objects which aren't part of the data handling aren't indexed
+        if (bIndexed == True):
+            self._indexDataObject(dataStorage)
 
     def save_ExperimentParmeters(self, listExperimentParameters : list) -> None:
         """
@@ -356,8 +839,11 @@ class DataHandling:
 
         """
         # Save experiment type in the current referenced data object
-        self._listDataObject[self._currentDataObject]. \
-            save_ExperimentType(strExperimentType)
+        dataStorage = self._listDataObject[self._currentDataObject]
+
+        self._unindexDataObject(dataStorage)
+        dataStorage.save_ExperimentType(strExperimentType)
+        self._indexDataObject(dataStorage)
 
     def save_SequenceCycles(self, iSeqCycle: int) -> None:
         """
@@ -376,6 +862,64 @@ class DataHandling:
         self._listDataObject[self._currentDataObject]. \
             save_SequenceCycles(iSeqCycle)
 
+    def append_Data(self, fTime : float, fPotential : float, fCurrent : float,
+                    iCycle : int, iMethodIndex : int = 0) -> None:
+        """
+        Description
+        -----------
+        Append one measurement point to the current data object.
+
+        Parameters
+        ----------
+        `fTime` : float
+            Time stamp of the measurement point
+
+        `fPotential` : float
+            Applied potential
+
+        `fCurrent` : float
+            Measured current
+
+        `iCycle` : int
+            Cycle in which the point was measured
+
+        `iMethodIndex` : int
+            Index of the method in a sequence
+
+        """
+        self._listDataObject[self._currentDataObject]. \
+            append_Data(fTime, fPotential, fCurrent, iCycle, iMethodIndex)
+
+    def set_StoredData(self, measurementStorage : MeasurementStorage) -> None:
+        """
+        Description
+        -----------
+        Overwrite the stored measurement data of the current data object.
+
+        Parameters
+        ----------
+        `measurementStorage` : MeasurementStorage
+            Measurement storage containing the data
+
+        """
+        self._listDataObject[self._currentDataObject]. \
+            set_StoredData(measurementStorage)
+
+    def get_StoredData(self) -> MeasurementStorage:
+        """
+        Description
+        -----------
+        Get the stored measurement data of the current data object.
+
+        Return
+        ------
+        `measurementStorage` : MeasurementStorage
+            Measurement storage containing the data
+
+        """
+        return self._listDataObject[self._currentDataObject]. \
+            get_StoredData()
+
     def get_TemplateName(self) -> None:
         """
         Description
@@ -493,6 +1037,7 @@ class DataHandling:
             
         """
         self._listDataObject = listDataStorages
+        self._rebuildIndex()
 
     def get_SequenceLength(self) -> int:
         """
@@ -506,4 +1051,104 @@ class DataHandling:
             Integer containing the length of the current experiment sequence
             
         """
-        return len(self._listDataObject)
\ No newline at end of file
+        return len(self._listDataObject)
+
+    def _indexDataObject(self, dataStorage : DataStorage) -> None:
+        """
+        Description
+        -----------
+        Add a data object to the template index. Objects sharing the same key
+        are kept in the order they were added, lookups return the first one.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Reference to the DataStorage object
+
+        """
+        self._dicTemplateIndex.setdefault(self._getTemplateKey(dataStorage), 
+                                          []).append(dataStorage)
+
+    def _unindexDataObject(self, dataStorage : DataStorage) -> bool:
+        """
+        Description
+        -----------
+        Remove a data object from the template index.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Reference to the DataStorage object
+
+        Return
+        ------
+        `bFound` : bool
+            Flag indicating if the data object was part of the index
+
+        """
+        bFound : bool = False
+        tupleKey : tuple = self._getTemplateKey(dataStorage)
+        listEntries : list = self._dicTemplateIndex.get(tupleKey, [])
+
+        for iIndex, dataObject in enumerate(listEntries):
+            if (dataObject is dataStorage):
+                del listEntries[iIndex]
+                bFound = True
+                break
+
+        if (len(listEntries) == 0):
+            self._dicTemplateIndex.pop(tupleKey, None)
+
+        return bFound
+
+    def _rebuildIndex(self) -> None:
+        """
+        Description
+        -----------
+        Rebuild the template index from the list of data objects.
+
+        """
+        self._dicTemplateIndex = {}
+
+        for dataStorage in self._listDataObject:
+            self._indexDataObject(dataStorage)
+
+    def _getTemplateKey(self, dataStorage : DataStorage) -> tuple:
+        """
+        Description
+        -----------
+        Helper method returning the key of a data object in the template index.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Reference to the DataStorage object
+
+        Return
+        ------
+        `tupleKey` : tuple
+            Tuple containing experiment type and template name
+
+        """
+        return (dataStorage.get_ExperimentType(), 
+                dataStorage.get_TemplateName())
+
+    def _getPosition(self, dataStorage : DataStorage) -> int:
+        """
+        Description
+        -----------
+        Helper method returning the position of a data object in the list.
+
+        Parameters
+        ----------
+        `dataStorage` : DataStorage
+            Reference to the DataStorage object
+
+        Return
+        ------
+        `iPosition` : int
+            Position of the data object in the list
+
+        """
+        # Data objects are compared by identity
+        return self._listDataObject.index(dataStorage)
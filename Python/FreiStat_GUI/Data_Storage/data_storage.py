@@ -7,7 +7,7 @@ The class handles the following variables:
 TODO
 Experiment type         : `self._strElectrochemicalMethod`
 Experiment parameters   : `self._listExperimentParameters`
-Experiment data         : `self._listStoredData`
+Experiment data         : `self._measurementStorage`
 
 These are accessed by :
 Experiment type         : `save_ExperimentType`      | `get_ExperimentType`
@@ -28,6 +28,7 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 # Include dependencies
 
 # Include internal dependencies
+from .measurement_storage import MeasurementStorage
 
 class DataStorage:
     """
@@ -47,9 +48,79 @@ class DataStorage:
         # Initalize class variable
         self._strTemplateName : str = ""
         self._strElectrochemicalMethod : str = ""
-        self._listStoredData : list = []
         self._listExperimentParameters : list = []
 
+        # Measurement data is created on first use
+        self._measurementStorage : MeasurementStorage = None
+
+    def __getstate__(self) -> dict:
+        """
+        Description
+        -----------
+        Exclude the measurement data when pickling, so that templates only 
+        contain the configuration.
+
+        """
+        dicState : dict = self.__dict__.copy()
+        dicState["_measurementStorage"] = None
+
+        return dicState
+
+    def __setstate__(self, dicState : dict) -> None:
+        """
+        Description
+        -----------
+        Restore pickled object. Templates of older versions still contain the
+        unused list of stored data, which is dropped.
+
+        """
+        dicState.pop("_listStoredData", None)
+        dicState["_measurementStorage"] = None
+
+        self.__dict__.update(dicState)
+
+    def append_Data(self, fTime : float, fPotential : float, fCurrent : float,
+                    iCycle : int, iMethodIndex : int = 0) -> None:
+        """
+        Description
+        -----------
+        Append one measurement point to the stored data.
+
+        Parameters
+        ----------
+        `fTime` : float
+            Time stamp of the measurement point
+
+        `fPotential` : float
+            Applied potential
+
+        `fCurrent` : float
+            Measured current
+
+        `iCycle` : int
+            Cycle in which the point was measured
+
+        `iMethodIndex` : int
+            Index of the method in a sequence
+
+        """
+        self.get_StoredData().append(fTime, fPotential, fCurrent, iCycle, 
+                                     iMethodIndex)
+
+    def set_StoredData(self, measurementStorage : MeasurementStorage) -> None:
+        """
+        Description
+        -----------
+        Overwrite the stored measurement data.
+
+        Parameters
+        ----------
+        `measurementStorage` : MeasurementStorage
+            Measurement storage containing the data
+
+        """
+        self._measurementStorage = measurementStorage
+
     def save_TemplateName(self, strTemplateName : str) -> None:
         """
         Description
@@ -162,4 +233,21 @@ class DataStorage:
             Amout of cycles in the sequence mode
 
         """
-        return self._iSeqCycle
\ No newline at end of file
+        return self._iSeqCycle
+
+    def get_StoredData(self) -> MeasurementStorage:
+        """
+        Description
+        -----------
+        Get the stored measurement data. The storage is created on first use.
+
+        Return
+        ------
+        `measurementStorage` : MeasurementStorage
+            Measurement storage containing the data
+
+        """
+        if (self._measurementStorage is None):
+            self._measurementStorage = MeasurementStorage()
+
+        return self._measurementStorage
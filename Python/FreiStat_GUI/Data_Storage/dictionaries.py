@@ -22,8 +22,18 @@ dic_parameters = {
                            "Disables the visualization of the measurement results in the plot to increase the performance."],
     SET_GLPM_LATENCY    : ["Low performance mode latency (ms):", 
                            "Defines the time interval in which the plot is updated."],
+    SET_TICK_RATE       : ["Interface tick interval (ms):", 
+                           "Time interval in which the interface polls the experiment status. Increased automatically while idle."],
+    SET_TERMINAL_LINES  : ["Max. terminal lines:", 
+                           "Amount of lines kept in the terminal. Older lines are moved into a rotating log file."],
     SET_WLAN_MODE       : ["WLAN mode:", 
                            "Disable serial communication and enable connection via WiFi."],
+    SET_SIMULATION      : ["Simulated device:", 
+                           "Run the experiments on a simulated FreiStat instead of the connected device, e.g. to test the interface."],
+    SET_SIMULATION_RATE : ["Simulated sample rate factor:", 
+                           "Factor by which the simulated device runs faster than the configured experiment."],
+    SET_SIMULATION_NOISE: ["Simulated noise (%):", 
+                           "Standard deviation of the noise added to the simulated current relative to the peak current."],
     SET_SERVER_IP       : ["Server IP:", 
                            "Ip address of the system running the GUI. Format: xxx.xxx.xxx.xxx"],
     SET_SERVER_PORT     : ["Server Port:", 
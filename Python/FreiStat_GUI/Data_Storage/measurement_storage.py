@@ -0,0 +1,256 @@
+"""
+Module implementing a columnar storage for the measurement data of one
+electrochemical method.
+
+The data is stored in the following columns:
+
+Time stamps             : `MS_TIME`
+Applied potential       : `MS_POTENTIAL`
+Measured current        : `MS_CURRENT`
+Cycle number            : `MS_CYCLE`
+Method index (sequence) : `MS_METHOD_INDEX`
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import numpy as np
+
+# Include internal dependencies
+from .constants import *
+
+# Data type of every column
+dic_measurementColumns : dict = {
+    MS_TIME         : np.float64,
+    MS_POTENTIAL    : np.float64,
+    MS_CURRENT      : np.float64,
+    MS_CYCLE        : np.int32,
+    MS_METHOD_INDEX : np.int32
+}
+
+class MeasurementStorage:
+    """
+    Description
+    -----------
+    Class storing the measurement data in preallocated NumPy arrays (one per
+    column). If the arrays are full, the capacity is multiplied by
+    `MS_GROWTH_FACTOR`, which results in an amortized O(1) append.
+
+    """
+
+    def __init__(self, iCapacity : int = MS_INITIAL_SIZE) -> None:
+        """
+        Description
+        -----------
+        Constructor of class MeasurementStorage
+
+        Parameters
+        ----------
+        `iCapacity` : int
+            Amount of initially preallocated rows
+
+        """
+        # Initialize class variables
+        self._iLength : int = 0
+        self._iCapacity : int = max(int(iCapacity), 1)
+        self._dicColumns : dict = {}
+
+        for strColumn, dataType in dic_measurementColumns.items():
+            self._dicColumns[strColumn] = np.zeros(self._iCapacity,
+                                                   dtype= dataType)
+
+    def append(self, fTime : float, fPotential : float, fCurrent : float,
+               iCycle : int, iMethodIndex : int = 0) -> None:
+        """
+        Description
+        -----------
+        Append one measurement point to the storage.
+
+        Parameters
+        ----------
+        `fTime` : float
+            Time stamp of the measurement point
+
+        `fPotential` : float
+            Applied potential
+
+        `fCurrent` : float
+            Measured current
+
+        `iCycle` : int
+            Cycle in which the point was measured
+
+        `iMethodIndex` : int
+            Index of the method in a sequence
+
+        """
+        if (self._iLength == self._iCapacity):
+            self._reserve(self._iLength + 1)
+
+        iIndex : int = self._iLength
+        self._dicColumns[MS_TIME][iIndex] = fTime
+        self._dicColumns[MS_POTENTIAL][iIndex] = fPotential
+        self._dicColumns[MS_CURRENT][iIndex] = fCurrent
+        self._dicColumns[MS_CYCLE][iIndex] = iCycle
+        self._dicColumns[MS_METHOD_INDEX][iIndex] = iMethodIndex
+
+        self._iLength += 1
+
+    def extend(self, fTime, fPotential, fCurrent, iCycle,
+               iMethodIndex = 0) -> None:
+        """
+        Description
+        -----------
+        Append a batch of measurement points to the storage. Scalars are
+        broadcasted to the length of the batch.
+
+        Parameters
+        ----------
+        `fTime` : array_like
+            Time stamps of the measurement points
+
+        `fPotential` : array_like
+            Applied potentials
+
+        `fCurrent` : array_like
+            Measured currents
+
+        `iCycle` : array_like or int
+            Cycles in which the points were measured
+
+        `iMethodIndex` : array_like or int
+            Indices of the method in a sequence
+
+        """
+        fTime = np.atleast_1d(np.asarray(fTime, dtype= np.float64))
+        iBatch : int = len(fTime)
+
+        if (iBatch == 0):
+            return
+
+        self._reserve(self._iLength + iBatch)
+
+        iStart : int = self._iLength
+        iEnd : int = self._iLength + iBatch
+        self._dicColumns[MS_TIME][iStart:iEnd] = fTime
+        self._dicColumns[MS_POTENTIAL][iStart:iEnd] = fPotential
+        self._dicColumns[MS_CURRENT][iStart:iEnd] = fCurrent
+        self._dicColumns[MS_CYCLE][iStart:iEnd] = iCycle
+        self._dicColumns[MS_METHOD_INDEX][iStart:iEnd] = iMethodIndex
+
+        self._iLength = iEnd
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Remove all measurement points, the allocated memory is kept.
+
+        """
+        self._iLength = 0
+
+    def get_Column(self, strColumn : str) -> np.ndarray:
+        """
+        Description
+        -----------
+        Get the stored data of one column. The returned array is a view on the
+        internal storage and is only valid until the next append.
+
+        Parameters
+        ----------
+        `strColumn` : string
+            Name of the column (e.g. `MS_CURRENT`)
+
+        Return
+        ------
+        `fColumn` : np.ndarray
+            Contiguous array containing the data of the column
+
+        """
+        return self._dicColumns[strColumn][:self._iLength]
+
+    def get_Columns(self) -> dict:
+        """
+        Description
+        -----------
+        Get the stored data of all columns as views on the internal storage.
+
+        Return
+        ------
+        `dicColumns` : dict
+            Dictionary containing the data of every column
+
+        """
+        return {strColumn : fColumn[:self._iLength]
+                for strColumn, fColumn in self._dicColumns.items()}
+
+    def get_MethodColumns(self, iMethodIndex : int) -> dict:
+        """
+        Description
+        -----------
+        Get a copy of the measurement points of one method of a sequence.
+
+        Parameters
+        ----------
+        `iMethodIndex` : int
+            Index of the method in the sequence
+
+        Return
+        ------
+        `dicColumns` : dict
+            Dictionary containing the data of every column
+
+        """
+        bMethod = self._dicColumns[MS_METHOD_INDEX][:self._iLength] == \
+            iMethodIndex
+
+        return {strColumn : fColumn[:self._iLength][bMethod]
+                for strColumn, fColumn in self._dicColumns.items()}
+
+    def get_Length(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of stored measurement points.
+
+        Return
+        ------
+        `iLength` : int
+            Amount of stored measurement points
+
+        """
+        return self._iLength
+
+    def _reserve(self, iRequired : int) -> None:
+        """
+        Description
+        -----------
+        Grow the capacity of all columns geometrically, until at least the
+        required amount of rows fits.
+
+        Parameters
+        ----------
+        `iRequired` : int
+            Amount of rows which need to fit into the storage
+
+        """
+        if (iRequired <= self._iCapacity):
+            return
+
+        iCapacity : int = self._iCapacity
+        while (iCapacity < iRequired):
+            iCapacity *= MS_GROWTH_FACTOR
+
+        for strColumn, fColumn in self._dicColumns.items():
+            fGrown = np.zeros(iCapacity, dtype= fColumn.dtype)
+            fGrown[:self._iLength] = fColumn[:self._iLength]
+            self._dicColumns[strColumn] = fGrown
+
+        self._iCapacity = iCapacity
@@ -0,0 +1,623 @@
+"""
+Module implementing the registry of the electrochemical methods supported by
+the interface. For every method it defines the experiment parameters in the
+order in which they are stored in a template, the keyword argument of the
+FreiStat facade each parameter is passed to, the variable of the interface
+holding its value and how it is shown in the central frame. The facade
+(`Run_*`), the call adding the method to a sequence (`add_*`) and the buttons
+of the method are defined there as well.
+
+The registry is built once on import and is shared by the interface and the
+headless mode, therefore it depends neither on Tk nor on the facades.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+from FreiStat.Data_storage.constants import *
+
+# Import internal dependencies
+from .constants import *
+
+class MethodParameter:
+    """
+    Description
+    -----------
+    Class describing one experiment parameter of an electrochemical method.
+
+    """
+
+    def __init__(self, strKey : str, strArgument : str, strVariable : str,
+                 typeValue : type, default = None, iDecimals : int = None,
+                 iValidation : int = VALIDATE_VALUE, strLabel : str = None,
+                 bAdvanced : bool = False, bSequence : bool = True) -> None:
+        """
+        Description
+        -----------
+        Constructor of class MethodParameter
+
+        Parameters
+        ----------
+        `strKey` : string
+            Key of the parameter in the template (e.g. `START_POTENTIAL`)
+
+        `strArgument` : string
+            Keyword argument of the facade the parameter is passed to
+
+        `strVariable` : string
+            Name of the interface variable holding the value of the entry
+
+        `typeValue` : type
+            Type of the stored value (float, int, bool or list of floats)
+
+        `default` : object
+            Value set when a method is opened without template, None if the
+            entry keeps its value
+
+        `iDecimals` : int
+            Amount of decimals shown when a template is loaded
+
+        `iValidation` : int
+            Validation of the entry (`VALIDATE_ARRAY`, `VALIDATE_VALUE`,
+            `VALIDATE_POSITIVE`)
+
+        `strLabel` : string
+            Key of the label and tooltip, the key of the parameter if not given
+
+        `bAdvanced` : bool
+            Flag indicating if the parameter is shown in the advanced settings
+
+        `bSequence` : bool
+            Flag indicating if the parameter is passed when the method is added
+            to a sequence
+
+        """
+        # Initialize class variables
+        self._strKey : str = strKey
+        self._strArgument : str = strArgument
+        self._strVariable : str = strVariable
+        self._typeValue : type = typeValue
+        self._default = default
+        self._iDecimals : int = iDecimals
+        self._iValidation : int = iValidation
+        self._strLabel : str = strLabel if strLabel is not None else strKey
+        self._bAdvanced : bool = bAdvanced
+        self._bSequence : bool = bSequence
+
+    def get_Key(self) -> str:
+        """
+        Description
+        -----------
+        Get the key of the parameter in the template.
+
+        """
+        return self._strKey
+
+    def get_Argument(self) -> str:
+        """
+        Description
+        -----------
+        Get the keyword argument of the facade.
+
+        """
+        return self._strArgument
+
+    def get_Variable(self) -> str:
+        """
+        Description
+        -----------
+        Get the name of the interface variable holding the value.
+
+        """
+        return self._strVariable
+
+    def get_Label(self) -> str:
+        """
+        Description
+        -----------
+        Get the key of the label and tooltip of the entry.
+
+        """
+        return self._strLabel
+
+    def get_Validation(self) -> int:
+        """
+        Description
+        -----------
+        Get the validation of the entry.
+
+        """
+        return self._iValidation
+
+    def get_Default(self):
+        """
+        Description
+        -----------
+        Get the default value of the entry, None if the entry keeps its value.
+
+        """
+        if (self._typeValue == list and self._default is not None):
+            return " , ".join(str(fValue) for fValue in self._default)
+
+        return self._default
+
+    def is_Checkbutton(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the parameter is set with a check button instead of an entry.
+
+        """
+        return self._typeValue == bool
+
+    def is_Advanced(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the parameter is shown in the advanced settings.
+
+        """
+        return self._bAdvanced
+
+    def is_SequenceParameter(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the parameter is passed when the method is added to a
+        sequence.
+
+        """
+        return self._bSequence
+
+    def to_Value(self, content):
+        """
+        Description
+        -----------
+        Convert the content of the interface variable into the stored value.
+
+        Parameters
+        ----------
+        `content` : object
+            Content of the interface variable
+
+        Return
+        ------
+        `value` : object
+            Value stored in the template
+
+        """
+        if (self._typeValue == list):
+            return [float(strValue) for strValue in str(content).split(",")]
+
+        return self._typeValue(content)
+
+    def to_Text(self, value):
+        """
+        Description
+        -----------
+        Convert a stored value into the content of the interface variable.
+
+        Parameters
+        ----------
+        `value` : object
+            Value stored in the template
+
+        Return
+        ------
+        `content` : object
+            Content of the interface variable
+
+        """
+        if (self._typeValue == list):
+            return " , ".join(str(fValue) for fValue in value)
+
+        # Templates of older versions store the duty cycle as list
+        if (self._typeValue == float and type(value) == list):
+            value = sum(value)
+
+        if (self._iDecimals is not None):
+            iTemp : int = 10 ** self._iDecimals
+            return float(int(value * iTemp) / iTemp)
+
+        return value
+
+class MethodDefinition:
+    """
+    Description
+    -----------
+    Class describing an electrochemical method of the interface.
+
+    """
+
+    def __init__(self, strMethod : str, strFacadeModule : str, strFacade : str,
+                 strSequenceCall : str, iNavIndex : int, iButton : int,
+                 iButtonAdd : int, iButtonParameter : int, strIcon : str,
+                 listParameters : list) -> None:
+        """
+        Description
+        -----------
+        Constructor of class MethodDefinition
+
+        Parameters
+        ----------
+        `strMethod` : string
+            Electrochemical method (e.g. `CV`)
+
+        `strFacadeModule` : string
+            Module of the FreiStat library containing the facade
+
+        `strFacade` : string
+            Class name of the facade (e.g. `Run_CV`)
+
+        `strSequenceCall` : string
+            Method of the sequence facade adding the method (e.g. `add_CV`)
+
+        `iNavIndex` : int
+            Navigation index of the method in the single mode
+
+        `iButton` : int
+            Command of the method button in the single mode
+
+        `iButtonAdd` : int
+            Command adding the method to a sequence
+
+        `iButtonParameter` : int
+            Command showing the parameters of the method in a sequence
+
+        `strIcon` : string
+            Name of the interface attribute holding the icon
+
+        `listParameters` : list
+            List containing the MethodParameter objects in template order
+
+        """
+        # Initialize class variables
+        self._strMethod : str = strMethod
+        self._strFacadeModule : str = strFacadeModule
+        self._strFacade : str = strFacade
+        self._strSequenceCall : str = strSequenceCall
+        self._iNavIndex : int = iNavIndex
+        self._iButton : int = iButton
+        self._iButtonAdd : int = iButtonAdd
+        self._iButtonParameter : int = iButtonParameter
+        self._strIcon : str = strIcon
+        self._listParameters : list = listParameters
+
+    def get_Method(self) -> str:
+        """
+        Description
+        -----------
+        Get the electrochemical method.
+
+        """
+        return self._strMethod
+
+    def get_Facade(self) -> tuple:
+        """
+        Description
+        -----------
+        Get the module and class name of the facade.
+
+        """
+        return self._strFacadeModule, self._strFacade
+
+    def get_SequenceCall(self) -> str:
+        """
+        Description
+        -----------
+        Get the method of the sequence facade adding the method.
+
+        """
+        return self._strSequenceCall
+
+    def get_NavIndex(self) -> int:
+        """
+        Description
+        -----------
+        Get the navigation index of the method in the single mode.
+
+        """
+        return self._iNavIndex
+
+    def get_Button(self) -> int:
+        """
+        Description
+        -----------
+        Get the command of the method button in the single mode.
+
+        """
+        return self._iButton
+
+    def get_ButtonAdd(self) -> int:
+        """
+        Description
+        -----------
+        Get the command adding the method to a sequence.
+
+        """
+        return self._iButtonAdd
+
+    def get_ButtonParameter(self) -> int:
+        """
+        Description
+        -----------
+        Get the command showing the parameters of the method in a sequence.
+
+        """
+        return self._iButtonParameter
+
+    def get_Icon(self) -> str:
+        """
+        Description
+        -----------
+        Get the name of the interface attribute holding the icon.
+
+        """
+        return self._strIcon
+
+    def get_Parameters(self) -> list:
+        """
+        Description
+        -----------
+        Get the parameters of the method in the order of the template.
+
+        """
+        return self._listParameters
+
+    def get_FormParameters(self, bAdvanced : bool = False) -> list:
+        """
+        Description
+        -----------
+        Get the parameters shown in the central frame.
+
+        Parameters
+        ----------
+        `bAdvanced` : bool
+            Flag indicating if the parameters of the advanced settings should
+            be returned
+
+        """
+        return [parameter for parameter in self._listParameters
+                if parameter.is_Advanced() == bAdvanced]
+
+    def create_Arguments(self, listExperimentParameters : list,
+                         bSequence : bool = False) -> dict:
+        """
+        Description
+        -----------
+        Create the keyword arguments of the facade from the experiment
+        parameters of a template. Parameters are matched by their key, so the
+        order in the template does not matter.
+
+        Parameters
+        ----------
+        `listExperimentParameters` : list
+            List containing [key, value] pairs of the method
+
+        `bSequence` : bool
+            Flag indicating if the arguments of the `add_*` call of the
+            sequence facade should be created
+
+        Return
+        ------
+        `dicArguments` : dict
+            Keyword arguments of the facade
+
+        """
+        dicValues : dict = {listParameter[0] : listParameter[1]
+                            for listParameter in listExperimentParameters}
+        dicArguments : dict = {}
+
+        for parameter in self._listParameters:
+            if (bSequence == True and parameter.is_SequenceParameter() == False):
+                continue
+
+            if (parameter.get_Key() not in dicValues):
+                raise ValueError("Parameter " + parameter.get_Key() +
+                                 " of " + self._strMethod + " is missing")
+
+            dicArguments[parameter.get_Argument()] = \
+                dicValues[parameter.get_Key()]
+
+        return dicArguments
+
+# Module and class name of the sequence facade
+SEQUENCE_FACADE : tuple = ("FreiStat.Methods.run_sequence", "Run_Sequence")
+
+def _create_CommonParameters(bFixedWEPotential : bool = True) -> list:
+    """
+    Description
+    -----------
+    Create the parameters shared by every method, which follow the method
+    specific parameters.
+
+    Parameters
+    ----------
+    `bFixedWEPotential` : bool
+        Flag indicating if the method supports a fixed working electrode
+        potential
+
+    Return
+    ------
+    `listParameters` : list
+        List containing the MethodParameter objects
+
+    """
+    listParameters : list = [
+        MethodParameter(CYCLE, "Cycle", "_strCycle", int, CYCLE_I,
+                        iValidation= VALIDATE_POSITIVE),
+        MethodParameter(LPTIA_RTIA_SIZE, "CurrentRange", "_strCurrentrange",
+                        float, CURRENT_RANGE_F, 6)]
+
+    if (bFixedWEPotential == True):
+        listParameters.append(MethodParameter(FIXED_WE_POTENTIAL,
+            "FixedWEPotential", "_iFixedWEPotential", bool, bAdvanced= True))
+
+    listParameters += [
+        MethodParameter(MAINS_FILTER, "MainsFilter", "_iMainsFilter", bool,
+                        bAdvanced= True),
+        MethodParameter(SINC2_OVERSAMPLING, "Sinc2_Oversampling",
+                        "_strOsrSinc2", int, SINC2_OVERSAMPLING_I,
+                        iValidation= VALIDATE_POSITIVE, bAdvanced= True),
+        MethodParameter(SINC3_OVERSAMPLING, "Sinc3_Oversampling",
+                        "_strOsrSinc3", int, SINC3_OVERSAMPLING_I,
+                        iValidation= VALIDATE_POSITIVE, bAdvanced= True),
+        MethodParameter(ENABLE_OPTIMIZER, "EnableOptimizer",
+                        "_iEnableOptimizer", bool, bAdvanced= True,
+                        bSequence= False),
+        MethodParameter(LOW_PERFORMANCE_MODE, "LowPerformanceMode",
+                        "_iLowPerformanceMode", bool, bAdvanced= True,
+                        bSequence= False)]
+
+    return listParameters
+
+def _create_Registry() -> dict:
+    """
+    Description
+    -----------
+    Create the definitions of every electrochemical method.
+
+    Return
+    ------
+    `dicRegistry` : dict
+        Dictionary containing the MethodDefinition of every method, in the
+        order in which the methods are shown in the interface
+
+    """
+    listDefinitions : list = [
+        MethodDefinition(CA, "FreiStat.Methods.run_chronoamperometry",
+            "Run_CA", "add_CA", NI_SM_CA, BUTTON_EC_CA, BUTTON_SM_ADD_EC_CA,
+            BUTTON_SM_PARA_EC_CA, "_IconCA", [
+            MethodParameter(POTENTIAL_STEPS, "Potential_Steps",
+                "_strPotentialSteps", list,
+                [START_POTENTIAL_F, START_POTENTIAL_F],
+                iValidation= VALIDATE_ARRAY),
+            MethodParameter(PULSE_LENGTH, "Pulse_Lengths", "_strPulseLengths",
+                list, [PULSE_LENGTH_F, PULSE_LENGTH_F],
+                iValidation= VALIDATE_ARRAY),
+            MethodParameter(SAMPLING_RATE, "Sampling_Rate", "_strSamplingRate",
+                float, SAMPLING_RATE_F, 3)] +
+            _create_CommonParameters(bFixedWEPotential= False)),
+
+        MethodDefinition(LSV, "FreiStat.Methods.run_linear_sweep_voltammetry",
+            "Run_LSV", "add_LSV", NI_SM_LSV, BUTTON_EC_LSV,
+            BUTTON_SM_ADD_EC_LSV, BUTTON_SM_PARA_EC_LSV, "_IconLSV", [
+            MethodParameter(START_POTENTIAL, "StartVoltage", "_strStartVoltage",
+                float, START_POTENTIAL_F, 3),
+            MethodParameter(STOP_POTENTIAL, "StopVoltage", "_strStopVoltage",
+                float, UPPER_POTENTIAL_F, 3),
+            MethodParameter(STEP_SIZE, "Stepsize", "_strStepsize", float,
+                STEP_SIZE_F, 6),
+            MethodParameter(SCAN_RATE, "Scanrate", "_strScanrate", float,
+                SCAN_RATE_F, 3)] +
+            _create_CommonParameters()),
+
+        MethodDefinition(CV, "FreiStat.Methods.run_cyclic_voltammetry",
+            "Run_CV", "add_CV", NI_SM_CV, BUTTON_EC_CV, BUTTON_SM_ADD_EC_CV,
+            BUTTON_SM_PARA_EC_CV, "_IconCV", [
+            MethodParameter(START_POTENTIAL, "StartVoltage", "_strStartVoltage",
+                float, START_POTENTIAL_F, 3),
+            MethodParameter(LOWER_POTENTIAL, "SecondVertex", "_strLowerVoltage",
+                float, LOWER_POTENTIAL_F, 3),
+            MethodParameter(UPPER_POTENTIAL, "FirstVertex", "_strUpperVoltage",
+                float, UPPER_POTENTIAL_F, 3),
+            MethodParameter(STEP_SIZE, "Stepsize", "_strStepsize", float,
+                STEP_SIZE_F, 6),
+            MethodParameter(SCAN_RATE, "Scanrate", "_strScanrate", float,
+                SCAN_RATE_F, 3)] +
+            _create_CommonParameters()),
+
+        MethodDefinition(NPV, "FreiStat.Methods.run_normal_pulse_voltammetry",
+            "Run_NPV", "add_NPV", NI_SM_NPV, BUTTON_EC_NPV,
+            BUTTON_SM_ADD_EC_NPV, BUTTON_SM_PARA_EC_NPV, "_IconNPV", [
+            MethodParameter(BASE_POTENTIAL, "BaseVoltage", "_strBaseVoltage",
+                float, BASE_POTENTIAL_F, 3),
+            MethodParameter(START_POTENTIAL, "StartVoltage", "_strStartVoltage",
+                float, START_POTENTIAL_F, 3),
+            MethodParameter(STOP_POTENTIAL, "StopVoltage", "_strStopVoltage",
+                float, UPPER_POTENTIAL_F, 3),
+            MethodParameter(DELTA_V_STAIRCASE, "DeltaV_Staircase",
+                "_strDeltaVStaircase", float, DELTA_V_STAIRCASE_F, 6),
+            MethodParameter(PULSE_LENGTH, "Pulse_Lengths", "_strPulseLengths",
+                list, [PULSE_LENGTH_F, PULSE_LENGTH_F],
+                iValidation= VALIDATE_ARRAY),
+            MethodParameter(SAMPLING_DURATION, "Sampling_Duration",
+                "_strSamplingDuration", float, SAMPLING_DURATION_F, 6)] +
+            _create_CommonParameters()),
+
+        MethodDefinition(DPV,
+            "FreiStat.Methods.run_differential_pulse_voltammetry",
+            "Run_DPV", "add_DPV", NI_SM_DPV, BUTTON_EC_DPV,
+            BUTTON_SM_ADD_EC_DPV, BUTTON_SM_PARA_EC_DPV, "_IconDPV", [
+            MethodParameter(START_POTENTIAL, "StartVoltage", "_strStartVoltage",
+                float, START_POTENTIAL_F, 3),
+            MethodParameter(STOP_POTENTIAL, "StopVoltage", "_strStopVoltage",
+                float, UPPER_POTENTIAL_F, 3),
+            MethodParameter(DELTA_V_STAIRCASE, "DeltaV_Staircase",
+                "_strDeltaVStaircase", float, DELTA_V_STAIRCASE_F, 6),
+            MethodParameter(DELTA_V_PEAK, "DeltaV_Peak", "_strDeltaVPeak",
+                float, DELTA_V_PEAK_F, 6),
+            MethodParameter(PULSE_LENGTH, "Pulse_Lengths", "_strPulseLengths",
+                list, [PULSE_LENGTH_F, PULSE_LENGTH_F],
+                iValidation= VALIDATE_ARRAY),
+            MethodParameter(SAMPLING_DURATION, "Sampling_Duration",
+                "_strSamplingDuration", float, SAMPLING_DURATION_F, 6)] +
+            _create_CommonParameters()),
+
+        # The duty cycle is stored under the key of the pulse length
+        MethodDefinition(SWV, "FreiStat.Methods.run_square_wave_voltammetry",
+            "Run_SWV", "add_SWV", NI_SM_SWV, BUTTON_EC_SWV,
+            BUTTON_SM_ADD_EC_SWV, BUTTON_SM_PARA_EC_SWV, "_IconSWV", [
+            MethodParameter(START_POTENTIAL, "StartVoltage", "_strStartVoltage",
+                float, START_POTENTIAL_F, 3),
+            MethodParameter(STOP_POTENTIAL, "StopVoltage", "_strStopVoltage",
+                float, UPPER_POTENTIAL_F, 3),
+            MethodParameter(DELTA_V_STAIRCASE, "DeltaV_Staircase",
+                "_strDeltaVStaircase", float, DELTA_V_STAIRCASE_F, 6),
+            MethodParameter(DELTA_V_PEAK, "DeltaV_Peak", "_strDeltaVPeak",
+                float, DELTA_V_PEAK_F, 6),
+            MethodParameter(PULSE_LENGTH, "DutyCycle", "_strDutyCycle", float,
+                PULSE_LENGTH_F, 6, strLabel= DUTY_CYCLE),
+            MethodParameter(SAMPLING_DURATION, "Sampling_Duration",
+                "_strSamplingDuration", float, SAMPLING_DURATION_F, 6)] +
+            _create_CommonParameters())]
+
+    return {definition.get_Method() : definition
+            for definition in listDefinitions}
+
+def _create_CommandTable(dicRegistry : dict) -> dict:
+    """
+    Description
+    -----------
+    Create the lookup of the method belonging to a button command.
+
+    Parameters
+    ----------
+    `dicRegistry` : dict
+        Dictionary containing the MethodDefinition of every method
+
+    Return
+    ------
+    `dicCommands` : dict
+        Dictionary mapping the single mode, add and parameter commands of
+        every method to its MethodDefinition
+
+    """
+    dicCommands : dict = {}
+
+    for definition in dicRegistry.values():
+        dicCommands[definition.get_Button()] = definition
+        dicCommands[definition.get_ButtonAdd()] = definition
+        dicCommands[definition.get_ButtonParameter()] = definition
+
+    return dicCommands
+
+dic_methodRegistry : dict = _create_Registry()
+dic_methodCommands : dict = _create_CommandTable(dic_methodRegistry)
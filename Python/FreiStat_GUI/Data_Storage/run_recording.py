@@ -0,0 +1,747 @@
+"""
+Module implementing the streaming recording of measurement data to disk while
+an experiment is running.
+
+A recording has the following layout:
+
+Header  : `RR_MAGIC` | header length (uint32) | header (JSON)
+Data    : fixed size records (see `dtype_record`)
+Footer  : index (JSON) | index length (uint64) | `RR_TRAILER_MAGIC`
+
+The footer is only written when the recording is closed. Recordings without a
+footer (e.g. after a crash) are recovered with `_recover_Recording`, which
+truncates the data to whole records and rebuilds the index.
+
+While a recording is written, the recorder holds an exclusive lock on the
+lock file `<recording>` + `RR_LOCK_EXTENSION`. Recordings whose lock is held
+are still being written (e.g. by another instance of the interface) and are
+not recovered. The operating system releases the lock if the writing process
+crashes, so that a remaining lock file doesn't prevent the recovery.
+
+Recordings are read with `RunReader`, which maps the records into memory, so
+that only the requested cycles or ranges are paged in from disk.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import json
+import os
+import queue
+import struct
+import threading
+import time
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    import msvcrt
+
+# Include internal dependencies
+from .constants import *
+from .measurement_storage import dic_measurementColumns
+
+# Layout of one record on disk (little endian, independent of the platform)
+dtype_record = np.dtype([(strColumn, np.dtype(dataType).newbyteorder("<"))
+                         for strColumn, dataType in
+                         dic_measurementColumns.items()])
+
+class RunRecorder(threading.Thread):
+    """
+    Description
+    -----------
+    Thread writing batches of measurement points append only into a recording.
+    Batches are handed over with `write` and written by the thread, so that
+    writing never blocks the caller. The file is synced to disk every
+    `RR_FSYNC_INTERVAL` seconds.
+
+    """
+
+    def __init__(self, strFilePath : str, dicHeader : dict) -> None:
+        """
+        Description
+        -----------
+        Constructor of class RunRecorder. Locks the recording, creates the file
+        and writes the header.
+
+        Parameters
+        ----------
+        `strFilePath` : string
+            Path of the recording
+
+        `dicHeader` : dict
+            Dictionary containing information about the experiment, which is
+            stored in the header
+
+        """
+        super().__init__(daemon= True)
+
+        # Initialize class variables
+        self._strFilePath : str = strFilePath
+        self._queueBatches : queue.Queue = queue.Queue()
+        self._eventStop = threading.Event()
+        self._iRecords : int = 0
+        self._listCycles : list = []
+        self._listMethods : list = []
+        self._fSyncTime : float = time.monotonic()
+
+        # Lock before creating the recording, so that it is never recovered
+        # while it is written
+        self._lockFile = open(strFilePath + RR_LOCK_EXTENSION, "wb")
+        if (_lock_File(self._lockFile) == False):
+            self._lockFile.close()
+            raise OSError("Recording " + strFilePath + " is already written")
+
+        self._file = open(strFilePath, "wb")
+        _write_Header(self._file, dicHeader)
+        self._sync()
+
+    def write(self, fTime, fPotential, fCurrent, iCycle,
+              iMethodIndex) -> None:
+        """
+        Description
+        -----------
+        Hand over a batch of measurement points to the thread.
+
+        Parameters
+        ----------
+        `fTime` : array_like
+            Time stamps of the measurement points
+
+        `fPotential` : array_like
+            Applied potentials
+
+        `fCurrent` : array_like
+            Measured currents
+
+        `iCycle` : array_like
+            Cycles in which the points were measured
+
+        `iMethodIndex` : array_like
+            Indices of the method in a sequence
+
+        """
+        recordBatch = np.empty(len(fTime), dtype= dtype_record)
+        recordBatch[MS_TIME] = fTime
+        recordBatch[MS_POTENTIAL] = fPotential
+        recordBatch[MS_CURRENT] = fCurrent
+        recordBatch[MS_CYCLE] = iCycle
+        recordBatch[MS_METHOD_INDEX] = iMethodIndex
+
+        self._queueBatches.put(recordBatch)
+
+    def run(self) -> None:
+        """
+        Description
+        -----------
+        Main loop of the thread writing the handed over batches until a stop is
+        requested. Afterwards the remaining batches and the footer are written
+        and the lock is released.
+
+        """
+        while (self._eventStop.is_set() == False):
+            try:
+                self._writeBatch(self._queueBatches.get(timeout= RR_TIMEOUT))
+            except queue.Empty:
+                pass
+
+            if (time.monotonic() - self._fSyncTime >= RR_FSYNC_INTERVAL):
+                self._sync()
+
+        # Write remaining batches
+        while (self._queueBatches.empty() == False):
+            self._writeBatch(self._queueBatches.get_nowait())
+
+        _write_Footer(self._file, self._iRecords, self._listCycles,
+                      self._listMethods)
+        self._sync()
+        self._file.close()
+
+        _unlock_File(self._lockFile)
+        self._lockFile.close()
+        _remove_LockFile(self._strFilePath)
+
+    def stop(self) -> None:
+        """
+        Description
+        -----------
+        Request the thread to stop and wait until the recording is completed.
+
+        """
+        self._eventStop.set()
+
+        if (self.is_alive() == True):
+            self.join()
+
+    def get_FilePath(self) -> str:
+        """
+        Description
+        -----------
+        Get the path of the recording.
+
+        Return
+        ------
+        `strFilePath` : string
+            Path of the recording
+
+        """
+        return self._strFilePath
+
+    def get_RecordCount(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of records written so far.
+
+        Return
+        ------
+        `iRecords` : int
+            Amount of written records
+
+        """
+        return self._iRecords
+
+    def _writeBatch(self, recordBatch : np.ndarray) -> None:
+        """
+        Description
+        -----------
+        Append one batch to the file and update the index.
+
+        Parameters
+        ----------
+        `recordBatch` : np.ndarray
+            Structured array containing the records of the batch
+
+        """
+        self._file.write(recordBatch.tobytes())
+
+        _update_Index(self._listCycles, recordBatch[MS_CYCLE], self._iRecords)
+        _update_Index(self._listMethods, recordBatch[MS_METHOD_INDEX],
+                      self._iRecords)
+
+        self._iRecords += len(recordBatch)
+
+    def _sync(self) -> None:
+        """
+        Description
+        -----------
+        Flush the written data and sync it to disk.
+
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._fSyncTime = time.monotonic()
+
+class RunReader:
+    """
+    Description
+    -----------
+    Class giving read access to a recording. The records are memory mapped and
+    the index of the footer is used to find the records of a cycle or method
+    without reading the whole file.
+
+    """
+
+    def __init__(self, strFilePath : str) -> None:
+        """
+        Description
+        -----------
+        Constructor of class RunReader
+
+        Parameters
+        ----------
+        `strFilePath` : string
+            Path of the recording
+
+        """
+        # Initialize class variables
+        self._strFilePath : str = strFilePath
+
+        with open(strFilePath, "rb") as file:
+            self._dicHeader, iDataOffset = _read_Header(file)
+            dicFooter : dict = _read_Footer(file)
+            iFileSize : int = file.seek(0, os.SEEK_END)
+
+        if (dicFooter is not None):
+            iRecords : int = dicFooter["Records"]
+        else :
+            # Recording is still written or was interrupted
+            iRecords = max(iFileSize - iDataOffset, 0) // dtype_record.itemsize
+
+        if (iRecords > 0):
+            self._recordData = np.memmap(strFilePath, dtype= dtype_record, 
+                mode= "r", offset= iDataOffset, shape= (iRecords,))
+        else :
+            self._recordData = np.empty(0, dtype= dtype_record)
+
+        if (dicFooter is not None):
+            self._listCycles : list = dicFooter["Cycles"]
+            self._listMethods : list = dicFooter["Methods"]
+        else :
+            # Rebuild the index from the records
+            self._listCycles = []
+            self._listMethods = []
+            _update_Index(self._listCycles, 
+                np.asarray(self._recordData[MS_CYCLE]), 0)
+            _update_Index(self._listMethods, 
+                np.asarray(self._recordData[MS_METHOD_INDEX]), 0)
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Release the memory mapping of the recording.
+
+        """
+        self._recordData = np.empty(0, dtype= dtype_record)
+
+    def get_Header(self) -> dict:
+        """
+        Description
+        -----------
+        Get the header of the recording.
+
+        Return
+        ------
+        `dicHeader` : dict
+            Dictionary containing information about the experiment
+
+        """
+        return self._dicHeader
+
+    def get_Length(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of records in the recording.
+
+        Return
+        ------
+        `iRecords` : int
+            Amount of records
+
+        """
+        return len(self._recordData)
+
+    def get_Segments(self) -> list:
+        """
+        Description
+        -----------
+        Get the ranges of consecutive records, which belong to the same method
+        and cycle. Calculated from the index only.
+
+        Return
+        ------
+        `listSegments` : list
+            List containing [method index, cycle, first record, amount of 
+            records] entries
+
+        """
+        listSegments : list = []
+        iMethod : int = 0
+        iCycle : int = 0
+
+        # Intersect both sorted lists of ranges
+        while (iMethod < len(self._listMethods) and 
+               iCycle < len(self._listCycles)):
+            iMethodValue, iMethodFirst, iMethodCount = self._listMethods[iMethod]
+            iCycleValue, iCycleFirst, iCycleCount = self._listCycles[iCycle]
+
+            iFirst : int = max(iMethodFirst, iCycleFirst)
+            iEnd : int = min(iMethodFirst + iMethodCount, 
+                             iCycleFirst + iCycleCount)
+
+            if (iEnd > iFirst):
+                listSegments.append([iMethodValue, iCycleValue, iFirst,
+                                     iEnd - iFirst])
+
+            if (iMethodFirst + iMethodCount <= iCycleFirst + iCycleCount):
+                iMethod += 1
+            else :
+                iCycle += 1
+
+        return listSegments
+
+    def get_Records(self, iFirst : int = 0, iCount : int = None) -> np.ndarray:
+        """
+        Description
+        -----------
+        Get a range of records. The returned array is a view on the memory 
+        mapped file, data is only read when it is accessed.
+
+        Parameters
+        ----------
+        `iFirst` : int
+            First record of the range
+
+        `iCount` : int
+            Amount of records, all remaining records if None
+
+        Return
+        ------
+        `recordData` : np.ndarray
+            Structured array with the columns of `dtype_record`
+
+        """
+        if (iCount is None):
+            return self._recordData[iFirst:]
+
+        return self._recordData[iFirst:iFirst + iCount]
+
+def _write_Header(file, dicHeader : dict) -> None:
+    """
+    Description
+    -----------
+    Write the header of a recording.
+
+    Parameters
+    ----------
+    `file` : file object
+        File opened in binary mode
+
+    `dicHeader` : dict
+        Dictionary containing information about the experiment
+
+    """
+    dicHeader = dict(dicHeader)
+    dicHeader["Columns"] = [[strColumn, dtype_record.fields[strColumn][0].str]
+                            for strColumn in dtype_record.names]
+    dicHeader["RecordSize"] = dtype_record.itemsize
+
+    byteHeader : bytes = json.dumps(dicHeader, default= str).encode("utf-8")
+
+    file.write(RR_MAGIC)
+    file.write(struct.pack("<I", len(byteHeader)))
+    file.write(byteHeader)
+
+def _read_Header(file) -> list:
+    """
+    Description
+    -----------
+    Read the header of a recording.
+
+    Parameters
+    ----------
+    `file` : file object
+        File opened in binary mode
+
+    Return
+    ------
+    `dicHeader` : dict
+        Dictionary containing information about the experiment
+
+    `iDataOffset` : int
+        Offset of the first record in byte
+
+    """
+    file.seek(0)
+
+    if (file.read(len(RR_MAGIC)) != RR_MAGIC):
+        raise ValueError("File is no FreiStat recording")
+
+    iHeaderLength : int = struct.unpack("<I", file.read(4))[0]
+    dicHeader : dict = json.loads(file.read(iHeaderLength).decode("utf-8"))
+
+    return [dicHeader, len(RR_MAGIC) + 4 + iHeaderLength]
+
+def _write_Footer(file, iRecords : int, listCycles : list,
+                  listMethods : list) -> None:
+    """
+    Description
+    -----------
+    Write the index footer and the trailer of a recording.
+
+    Parameters
+    ----------
+    `file` : file object
+        File opened in binary mode, positioned after the last record
+
+    `iRecords` : int
+        Amount of records in the recording
+
+    `listCycles` : list
+        List containing [cycle, first record, amount of records] entries
+
+    `listMethods` : list
+        List containing [method index, first record, amount of records] entries
+
+    """
+    byteFooter : bytes = json.dumps({
+        "Records" : iRecords,
+        "Cycles" : listCycles,
+        "Methods" : listMethods}).encode("utf-8")
+
+    file.write(byteFooter)
+    file.write(struct.pack("<Q", len(byteFooter)))
+    file.write(RR_TRAILER_MAGIC)
+
+def _read_Footer(file) -> dict:
+    """
+    Description
+    -----------
+    Read the index footer of a recording.
+
+    Parameters
+    ----------
+    `file` : file object
+        File opened in binary mode
+
+    Return
+    ------
+    `dicFooter` : dict
+        Dictionary containing the index or None, if the recording has no
+        footer (e.g. not completed)
+
+    """
+    iTrailer : int = 8 + len(RR_TRAILER_MAGIC)
+    iFileSize : int = file.seek(0, os.SEEK_END)
+
+    if (iFileSize < iTrailer):
+        return None
+
+    file.seek(iFileSize - iTrailer)
+    iFooterLength : int = struct.unpack("<Q", file.read(8))[0]
+
+    if (file.read(len(RR_TRAILER_MAGIC)) != RR_TRAILER_MAGIC or
+        iFooterLength > iFileSize - iTrailer):
+        return None
+
+    file.seek(iFileSize - iTrailer - iFooterLength)
+    try:
+        return json.loads(file.read(iFooterLength).decode("utf-8"))
+    except ValueError:
+        return None
+
+def _update_Index(listIndex : list, iValues : np.ndarray,
+                  iOffset : int) -> None:
+    """
+    Description
+    -----------
+    Append runs of equal values to an index of [value, first record, amount of
+    records] entries. A run continuing the last entry extends it.
+
+    Parameters
+    ----------
+    `listIndex` : list
+        Index which should be updated
+
+    `iValues` : np.ndarray
+        Values (cycle or method index) of consecutive records
+
+    `iOffset` : int
+        Record number of the first value
+
+    """
+    if (len(iValues) == 0):
+        return
+
+    iStart = np.concatenate(([0], np.flatnonzero(np.diff(iValues)) + 1))
+    iLength = np.diff(np.concatenate((iStart, [len(iValues)])))
+
+    for iIndex in range(len(iStart)):
+        iValue : int = int(iValues[iStart[iIndex]])
+        iFirst : int = iOffset + int(iStart[iIndex])
+
+        if (len(listIndex) > 0 and listIndex[-1][0] == iValue and
+            listIndex[-1][1] + listIndex[-1][2] == iFirst):
+            listIndex[-1][2] += int(iLength[iIndex])
+        else :
+            listIndex.append([iValue, iFirst, int(iLength[iIndex])])
+
+def _lock_File(file) -> bool:
+    """
+    Description
+    -----------
+    Try to take an exclusive lock on a file without blocking. The lock is held
+    until it is released with `_unlock_File`, the file is closed or the process
+    ends.
+
+    Parameters
+    ----------
+    `file` : file object
+        File opened in binary mode
+
+    Return
+    ------
+    `bLocked` : bool
+        Flag indicating if the lock was taken, False if it is held by another
+        file object
+
+    """
+    try:
+        if ("fcntl" in globals()):
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else :
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+
+    return True
+
+def _unlock_File(file) -> None:
+    """
+    Description
+    -----------
+    Release the lock taken with `_lock_File`.
+
+    Parameters
+    ----------
+    `file` : file object
+        Locked file
+
+    """
+    if ("fcntl" in globals()):
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else :
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _remove_LockFile(strFilePath : str) -> None:
+    """
+    Description
+    -----------
+    Remove the lock file of a recording. A lock file which can't be removed
+    (e.g. opened by another process on Windows) is left, since it is only
+    considered while it is locked.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the recording
+
+    """
+    try:
+        os.remove(strFilePath + RR_LOCK_EXTENSION)
+    except OSError:
+        pass
+
+def _recover_Recording(strFilePath : str) -> bool:
+    """
+    Description
+    -----------
+    Recover a recording, which was not completed. A partially written record is
+    removed and the index is rebuilt from the records. Recordings which are
+    still written (locked lock file) are left untouched.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the recording
+
+    Return
+    ------
+    `bRecovered` : bool
+        Flag indicating if the recording had to be recovered
+
+    """
+    if (os.path.isfile(strFilePath + RR_LOCK_EXTENSION) == False):
+        return _rebuild_Footer(strFilePath)
+
+    # Hold the lock while recovering, so that the recording isn't recovered
+    # twice at the same time
+    with open(strFilePath + RR_LOCK_EXTENSION, "ab") as lockFile:
+        if (_lock_File(lockFile) == False):
+            return False
+
+        try:
+            bRecovered : bool = _rebuild_Footer(strFilePath)
+        finally:
+            _unlock_File(lockFile)
+
+    # Lock file was left by a writer, which didn't complete the recording
+    _remove_LockFile(strFilePath)
+    return bRecovered
+
+def _rebuild_Footer(strFilePath : str) -> bool:
+    """
+    Description
+    -----------
+    Truncate a recording without footer to whole records and append the
+    rebuilt index.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the recording
+
+    Return
+    ------
+    `bRecovered` : bool
+        Flag indicating if the recording had no footer and was recovered
+
+    """
+    with open(strFilePath, "r+b") as file:
+        if (_read_Footer(file) is not None):
+            return False
+
+        dicHeader, iDataOffset = _read_Header(file)
+        iFileSize : int = file.seek(0, os.SEEK_END)
+
+        # Cut off partially written record
+        iRecords : int = max(iFileSize - iDataOffset, 0) // dtype_record.itemsize
+        file.truncate(iDataOffset + iRecords * dtype_record.itemsize)
+
+    listCycles : list = []
+    listMethods : list = []
+
+    if (iRecords > 0):
+        recordData = np.memmap(strFilePath, dtype= dtype_record, mode= "r",
+                               offset= iDataOffset, shape= (iRecords,))
+        _update_Index(listCycles, np.asarray(recordData[MS_CYCLE]), 0)
+        _update_Index(listMethods, np.asarray(recordData[MS_METHOD_INDEX]), 0)
+        del recordData
+
+    with open(strFilePath, "r+b") as file:
+        file.seek(0, os.SEEK_END)
+        _write_Footer(file, iRecords, listCycles, listMethods)
+        file.flush()
+        os.fsync(file.fileno())
+
+    return True
+
+def _recover_Recordings(strFolderPath : str) -> list:
+    """
+    Description
+    -----------
+    Recover all recordings in a folder, which were not completed. Recordings
+    which are still written are skipped.
+
+    Parameters
+    ----------
+    `strFolderPath` : string
+        Folder containing the recordings
+
+    Return
+    ------
+    `listRecovered` : list
+        List containing the paths of the recovered recordings
+
+    """
+    listRecovered : list = []
+
+    if (os.path.isdir(strFolderPath) == False):
+        return listRecovered
+
+    for strFileName in sorted(os.listdir(strFolderPath)):
+        if (strFileName.endswith(RR_FILE_EXTENSION) == False):
+            continue
+
+        strFilePath : str = os.path.join(strFolderPath, strFileName)
+        try:
+            if (_recover_Recording(strFilePath) == True):
+                listRecovered.append(strFilePath)
+        except (OSError, ValueError, struct.error):
+            # Not a valid recording, leave it untouched
+            pass
+
+    return listRecovered
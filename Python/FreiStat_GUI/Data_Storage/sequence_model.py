@@ -0,0 +1,317 @@
+"""
+Module implementing the model of the sequence edited in the sequence mode.
+
+Every step of the sequence gets a stable ID on creation, which doesn't change
+when steps are moved or deleted. The widgets of a step are therefore looked up
+by its ID and only the rows of the affected steps have to be repacked.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+class SequenceModel:
+    """
+    Description
+    -----------
+    Ordered list of the steps of a sequence. A step is stored as list
+    containing [method, template name, experiment parameters].
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Description
+        -----------
+        Constructor of class SequenceModel
+
+        """
+        # Initialize class variables
+        self._iNextID : int = 0
+        self._listOrder : list = []
+        self._dicSteps : dict = {}
+
+    def __len__(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of steps in the sequence.
+
+        Return
+        ------
+        `iLength` : int
+            Amount of steps
+
+        """
+        return len(self._listOrder)
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Remove every step of the sequence.
+
+        """
+        self._listOrder = []
+        self._dicSteps = {}
+
+    def add_Step(self, strMethod : str, strTemplateName : str = "",
+                 listExperimentParameters : list = None) -> int:
+        """
+        Description
+        -----------
+        Append a step to the end of the sequence.
+
+        Parameters
+        ----------
+        `strMethod` : string
+            Electrochemical method of the step
+
+        `strTemplateName` : string
+            Name of the template used by the step
+
+        `listExperimentParameters` : list
+            Experiment parameters of the step
+
+        Return
+        ------
+        `iStepID` : int
+            Stable ID of the new step
+
+        """
+        iStepID : int = self._iNextID
+        self._iNextID += 1
+
+        if (listExperimentParameters is None):
+            listExperimentParameters = []
+
+        self._dicSteps[iStepID] = [strMethod, strTemplateName,
+                                   listExperimentParameters]
+        self._listOrder.append(iStepID)
+
+        return iStepID
+
+    def remove_Step(self, iStepID : int) -> int:
+        """
+        Description
+        -----------
+        Remove a step from the sequence.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        Return
+        ------
+        `iIndex` : int
+            Position the step had in the sequence
+
+        """
+        iIndex : int = self._listOrder.index(iStepID)
+
+        del self._listOrder[iIndex]
+        del self._dicSteps[iStepID]
+
+        return iIndex
+
+    def move_Step(self, iStepID : int, iIndex : int) -> int:
+        """
+        Description
+        -----------
+        Move a step to a new position in the sequence. Positions outside of
+        the sequence are limited to the first respectively last position.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        `iIndex` : int
+            New position of the step
+
+        Return
+        ------
+        `iIndex` : int
+            Position of the step after moving it
+
+        """
+        iIndex = min(max(iIndex, 0), len(self._listOrder) - 1)
+
+        self._listOrder.remove(iStepID)
+        self._listOrder.insert(iIndex, iStepID)
+
+        return iIndex
+
+    def has_Step(self, iStepID : int) -> bool:
+        """
+        Description
+        -----------
+        Check if a step is part of the sequence.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        Return
+        ------
+        `bFound` : bool
+            True if the step is part of the sequence
+
+        """
+        return iStepID in self._dicSteps
+
+    def get_Index(self, iStepID : int) -> int:
+        """
+        Description
+        -----------
+        Get the position of a step in the sequence.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        Return
+        ------
+        `iIndex` : int
+            Position of the step
+
+        """
+        return self._listOrder.index(iStepID)
+
+    def get_StepID(self, iIndex : int) -> int:
+        """
+        Description
+        -----------
+        Get the ID of the step at a position in the sequence.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Position of the step
+
+        Return
+        ------
+        `iStepID` : int
+            ID of the step, None if the position is outside of the sequence
+
+        """
+        if (iIndex < 0 or iIndex >= len(self._listOrder)):
+            return None
+
+        return self._listOrder[iIndex]
+
+    def get_StepIDs(self) -> list:
+        """
+        Description
+        -----------
+        Get the IDs of every step in the order of the sequence.
+
+        Return
+        ------
+        `listStepIDs` : list
+            List containing the IDs of the steps
+
+        """
+        return list(self._listOrder)
+
+    def get_Method(self, iStepID : int) -> str:
+        """
+        Description
+        -----------
+        Get the electrochemical method of a step.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        Return
+        ------
+        `strMethod` : string
+            Electrochemical method of the step
+
+        """
+        return self._dicSteps[iStepID][0]
+
+    def get_TemplateName(self, iStepID : int) -> str:
+        """
+        Description
+        -----------
+        Get the name of the template used by a step.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        Return
+        ------
+        `strTemplateName` : string
+            Name of the template, empty if no template was assigned
+
+        """
+        return self._dicSteps[iStepID][1]
+
+    def get_ExperimentParameters(self, iStepID : int) -> list:
+        """
+        Description
+        -----------
+        Get the experiment parameters of a step.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        Return
+        ------
+        `listExperimentParameters` : list
+            Experiment parameters of the step
+
+        """
+        return self._dicSteps[iStepID][2]
+
+    def set_Template(self, iStepID : int, strTemplateName : str,
+                     listExperimentParameters : list) -> None:
+        """
+        Description
+        -----------
+        Assign a template to a step.
+
+        Parameters
+        ----------
+        `iStepID` : int
+            ID of the step
+
+        `strTemplateName` : string
+            Name of the template
+
+        `listExperimentParameters` : list
+            Experiment parameters of the template
+
+        """
+        self._dicSteps[iStepID][1] = strTemplateName
+        self._dicSteps[iStepID][2] = listExperimentParameters
+
+    def get_Sequence(self) -> list:
+        """
+        Description
+        -----------
+        Get the sequence in the format stored in the templates.
+
+        Return
+        ------
+        `listSequence` : list
+            List containing [method, template name, experiment parameters]
+            for every step in the order of the sequence
+
+        """
+        return [list(self._dicSteps[iStepID]) for iStepID in self._listOrder]
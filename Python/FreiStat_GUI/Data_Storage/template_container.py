@@ -0,0 +1,425 @@
+"""
+Module implementing the container format of the template files (.fst).
+
+A template file is a SQLite database with the following tables:
+
+Meta data   : `meta`        (key, value), e.g. the format version
+Templates   : `templates`   (id, position, name, type, sequence cycles,
+                             parameters as JSON, key)
+
+The name and type of every template can be listed from an index without
+reading the experiment parameters, which are only loaded on demand by
+`LazyDataStorage`. Since the ids change whenever a file is rewritten, a lazy
+template is found by its key, which is kept when the template is written
+again. Template files of older versions (pickled lists of DataStorage objects)
+are read by `_read_LegacyFile` and only written as template container on an
+explicit save.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import json
+import os
+import pickle
+import sqlite3
+import uuid
+from contextlib import closing
+
+# Include internal dependencies
+from .constants import *
+from .data_storage import DataStorage
+
+class LazyDataStorage(DataStorage):
+    """
+    Description
+    -----------
+    DataStorage object of a template in a template file. Name and type are
+    known from the index, the experiment parameters are read from the file the
+    first time they are requested.
+
+    """
+
+    def __init__(self, strFilePath : str, strTemplateKey : str,
+                 strTemplateName : str,
+                 strExperimentType : str) -> None:
+        """
+        Description
+        -----------
+        Constructor of class LazyDataStorage
+
+        Parameters
+        ----------
+        `strFilePath` : string
+            Path of the template file
+
+        `strTemplateKey` : string
+            Key of the template in the template file
+
+        `strTemplateName` : string
+            Name of the template
+
+        `strExperimentType` : string
+            Experiment type of the template
+
+        """
+        super().__init__()
+
+        # Initialize class variables
+        self._strFilePath : str = strFilePath
+        self._strTemplateKey : str = strTemplateKey
+        self._strStoredName : str = strTemplateName
+        self._bLoaded : bool = False
+
+        self._strTemplateName = strTemplateName
+        self._strElectrochemicalMethod = strExperimentType
+
+    def save_ExperimentParameters(self, listExperimentParameters: list) -> None:
+        """
+        Description
+        -----------
+        Overwritten method, parameters set by the interface replace the ones
+        in the template file.
+
+        """
+        self._bLoaded = True
+        super().save_ExperimentParameters(listExperimentParameters)
+
+    def save_SequenceCycles(self, iSeqCycle: int) -> None:
+        """
+        Description
+        -----------
+        Overwritten method, which loads the template before the amount of
+        cycles is replaced.
+
+        """
+        self._loadTemplate()
+        super().save_SequenceCycles(iSeqCycle)
+
+    def get_ExperimentParameters(self) -> list:
+        """
+        Description
+        -----------
+        Overwritten method, which loads the template on first use.
+
+        """
+        self._loadTemplate()
+        return super().get_ExperimentParameters()
+
+    def get_SequenceCycles(self) -> int:
+        """
+        Description
+        -----------
+        Overwritten method, which loads the template on first use.
+
+        """
+        self._loadTemplate()
+        return super().get_SequenceCycles()
+
+    def get_FilePath(self) -> str:
+        """
+        Description
+        -----------
+        Get the path of the template file the template was read from.
+
+        Return
+        ------
+        `strFilePath` : string
+            Absolute path of the template file
+
+        """
+        return self._strFilePath
+
+    def get_TemplateKey(self) -> str:
+        """
+        Description
+        -----------
+        Get the key identifying the template in its template file.
+
+        Return
+        ------
+        `strTemplateKey` : string
+            Key of the template in the template file
+
+        """
+        return self._strTemplateKey
+
+    def is_Loaded(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the experiment parameters were read from the template file.
+
+        Return
+        ------
+        `bLoaded` : bool
+            Flag indicating if the template is loaded
+
+        """
+        return self._bLoaded
+
+    def load_Template(self) -> None:
+        """
+        Description
+        -----------
+        Read the experiment parameters and the amount of sequence cycles from
+        the template file, if not done yet. Has to be called before the 
+        template file is rewritten.
+
+        """
+        self._loadTemplate()
+
+    def _loadTemplate(self) -> None:
+        """
+        Description
+        -----------
+        Read the experiment parameters and the amount of sequence cycles from
+        the template file, if not done yet. The template is found by its key.
+        Raises a FileNotFoundError if the template file was moved or deleted
+        and a ValueError if it can't be read or doesn't contain the template
+        anymore.
+
+        """
+        if (self._bLoaded == True):
+            return
+
+        # Connecting would create an empty database at the path
+        if (os.path.isfile(self._strFilePath) == False):
+            raise FileNotFoundError("Template file " + self._strFilePath +
+                " of template " + self._strStoredName + 
+                " was moved or deleted")
+
+        try:
+            with closing(sqlite3.connect(self._strFilePath)) as connection:
+                row = connection.execute(
+                    "SELECT parameters, sequence_cycles FROM templates "
+                    "WHERE key = ?", (self._strTemplateKey,)).fetchone()
+        except sqlite3.Error as error:
+            raise ValueError("Template file " + self._strFilePath + 
+                             " can't be read: " + str(error))
+
+        if (row is None):
+            raise ValueError("Template " + self._strStoredName + 
+                " doesn't exist in " + self._strFilePath + " anymore")
+
+        self._listExperimentParameters = json.loads(row[0])
+        if (row[1] is not None):
+            self._iSeqCycle = row[1]
+
+        self._bLoaded = True
+
+def _is_Container(strFilePath : str) -> bool:
+    """
+    Description
+    -----------
+    Check if a template file is a template container or a legacy pickle file.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the template file
+
+    Return
+    ------
+    `bContainer` : bool
+        Flag indicating if the file is a template container
+
+    """
+    with open(strFilePath, "rb") as file:
+        return file.read(len(TC_MAGIC)) == TC_MAGIC
+
+def _write_Container(strFilePath : str, listDataStorage : list) -> None:
+    """
+    Description
+    -----------
+    Write templates into a template file. The file is written next to the
+    destination and replaces it afterwards, so that a failed write never
+    destroys an existing file. Lazy templates keep their key, all others get
+    a new one. Raises a TypeError if the parameters of a template can't be
+    encoded as JSON.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the template file
+
+    `listDataStorage` : list
+        List containing the DataStorage objects, which should be written
+
+    """
+    strTempPath : str = strFilePath + ".tmp"
+
+    if (os.path.exists(strTempPath)):
+        os.remove(strTempPath)
+
+    # Parameters of lazy objects are read before the file is replaced
+    listRows : list = []
+    setKeys : set = set()
+    for iIndex, dataStorage in enumerate(listDataStorage):
+        try:
+            iSeqCycle = dataStorage.get_SequenceCycles()
+        except AttributeError:
+            # Amount of cycles is only set for sequences
+            iSeqCycle = None
+
+        strTemplateKey : str = None
+        if (isinstance(dataStorage, LazyDataStorage)):
+            strTemplateKey = dataStorage.get_TemplateKey()
+
+        # Keys are unique within a file
+        if (strTemplateKey is None or strTemplateKey in setKeys):
+            strTemplateKey = uuid.uuid4().hex
+        setKeys.add(strTemplateKey)
+
+        listRows.append((iIndex, dataStorage.get_TemplateName(),
+            dataStorage.get_ExperimentType(), iSeqCycle,
+            _encode_Parameters(dataStorage.get_ExperimentParameters()),
+            strTemplateKey))
+
+    with closing(sqlite3.connect(strTempPath)) as connection:
+        with connection:
+            connection.execute(
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute(
+                "CREATE TABLE templates (id INTEGER PRIMARY KEY, "
+                "position INTEGER, name TEXT, type TEXT, "
+                "sequence_cycles INTEGER, parameters TEXT, "
+                "key TEXT UNIQUE)")
+            connection.execute(
+                "CREATE INDEX templates_index ON templates (type, name)")
+            connection.execute("INSERT INTO meta VALUES (?, ?)",
+                               ("format_version", str(TC_FORMAT_VERSION)))
+            connection.executemany(
+                "INSERT INTO templates (position, name, type, "
+                "sequence_cycles, parameters, key) VALUES (?, ?, ?, ?, ?, ?)",
+                listRows)
+
+    os.replace(strTempPath, strFilePath)
+
+def _read_Index(strFilePath : str) -> list:
+    """
+    Description
+    -----------
+    List the templates of a template file without reading their experiment
+    parameters. Raises a ValueError if the file isn't of the format version
+    `TC_FORMAT_VERSION`.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the template file
+
+    Return
+    ------
+    `listIndex` : list
+        List containing [key, name, type] entries in the stored order
+
+    """
+    with closing(sqlite3.connect(strFilePath)) as connection:
+        row = connection.execute(
+            "SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+
+        if (row is None or row[0] != str(TC_FORMAT_VERSION)):
+            raise ValueError("Unsupported template file version")
+
+        return [list(row) for row in connection.execute(
+            "SELECT key, name, type FROM templates ORDER BY position")]
+
+def _read_Container(strFilePath : str) -> list:
+    """
+    Description
+    -----------
+    Read the templates of a template file as lazily loaded DataStorage objects.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the template file
+
+    Return
+    ------
+    `listDataStorage` : list
+        List containing a LazyDataStorage object for every template
+
+    """
+    strFilePath = os.path.abspath(strFilePath)
+
+    return [LazyDataStorage(strFilePath, strKey, strName, strType)
+            for strKey, strName, strType in _read_Index(strFilePath)]
+
+def _read_LegacyFile(strFilePath : str) -> list:
+    """
+    Description
+    -----------
+    Read a template file of an older version (pickled list of DataStorage
+    objects). The file itself is left unchanged, it is only written as
+    template container, when it is saved.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the template file
+
+    Return
+    ------
+    `listDataStorage` : list
+        List containing the loaded DataStorage objects
+
+    """
+    with open(strFilePath, "rb") as input:
+        return pickle.load(input)
+
+def _encode_Parameters(listExperimentParameters : list) -> str:
+    """
+    Description
+    -----------
+    Encode the experiment parameters of a template as JSON. Raises a TypeError
+    if a value can't be encoded.
+
+    Parameters
+    ----------
+    `listExperimentParameters` : list
+        List containing the experiment parameters
+
+    Return
+    ------
+    `strParameters` : string
+        Experiment parameters as JSON
+
+    """
+    return json.dumps(listExperimentParameters, default= _encode_JSON)
+
+def _encode_JSON(value):
+    """
+    Description
+    -----------
+    Helper function converting values, which are not supported by JSON (e.g.
+    NumPy scalars or tuples in sets), while writing the parameters. Raises a
+    TypeError for all other values, so that they are never written as string,
+    which couldn't be read back as the original value.
+
+    Parameters
+    ----------
+    `value` : object
+        Value which should be converted
+
+    Return
+    ------
+    `value` : object
+        JSON serializable representation of the value
+
+    """
+    if (hasattr(value, "tolist")):
+        return value.tolist()
+    if (isinstance(value, (set, frozenset))):
+        return list(value)
+
+    raise TypeError("Parameter value " + repr(value) + " of type " + 
+                    type(value).__name__ + " can't be written")
@@ -0,0 +1,220 @@
+"""
+Module implementing the import of all template files of a folder.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Include internal dependencies
+from .constants import *
+from .data_handling import DataHandling
+
+class TemplateImport:
+    """
+    Description
+    -----------
+    Class importing many template files (.fst and .csv) at once.
+
+    The files are read by a pool of worker threads. The read templates are
+    merged into the data handling by `merge_Completed`, which has to be called
+    from the thread of the interface (e.g. polled with `after`). Templates are
+    merged in the order of the files and renamed if their name is already 
+    used for the experiment type.
+
+    """
+
+    def __init__(self, dataHandling : DataHandling, listFilePaths : list,
+                 iWorkers : int = IMPORT_WORKERS) -> None:
+        """
+        Description
+        -----------
+        Constructor of class TemplateImport
+
+        Parameters
+        ----------
+        `dataHandling` : DataHandling
+            Reference to the dataHandling object
+
+        `listFilePaths` : list
+            List containing the paths of the files which should be imported
+
+        `iWorkers` : int
+            Amount of worker threads
+
+        """
+        # Initialize class variables
+        self._dataHandling : DataHandling = dataHandling
+        self._listFilePaths : list = listFilePaths
+        self._listFutures : list = []
+        self._listErrors : list = []
+        self._iMerged : int = 0
+        self._iTemplates : int = 0
+
+        self._executor = ThreadPoolExecutor(max_workers= max(iWorkers, 1),
+                                            thread_name_prefix= "TemplateImport")
+
+    @classmethod
+    def from_Folder(cls, dataHandling : DataHandling, strFolderPath : str):
+        """
+        Description
+        -----------
+        Create an import of all template files in a folder and its subfolders.
+
+        Parameters
+        ----------
+        `dataHandling` : DataHandling
+            Reference to the dataHandling object
+
+        `strFolderPath` : string
+            Path of the folder
+
+        Return
+        ------
+        `templateImport` : TemplateImport
+            Import of the found template files
+
+        """
+        listFilePaths : list = []
+
+        for strPattern in IMPORT_FILE_PATTERNS:
+            listFilePaths += glob.glob(os.path.join(glob.escape(strFolderPath),
+                "**", strPattern), recursive= True)
+
+        return cls(dataHandling, sorted(listFilePaths))
+
+    def start(self) -> None:
+        """
+        Description
+        -----------
+        Hand all files over to the worker threads.
+
+        """
+        for strFilePath in self._listFilePaths:
+            self._listFutures.append(self._executor.submit(self._readFile, 
+                                                           strFilePath))
+
+        self._executor.shutdown(wait= False)
+
+    def cancel(self) -> None:
+        """
+        Description
+        -----------
+        Cancel the reading of all files, which were not started yet.
+
+        """
+        for future in self._listFutures:
+            future.cancel()
+
+    def merge_Completed(self) -> bool:
+        """
+        Description
+        -----------
+        Merge the templates of all completely read files into the data
+        handling, keeping the order of the files.
+
+        Return
+        ------
+        `bDone` : bool
+            Flag indicating if all files are merged
+
+        """
+        while (self._iMerged < len(self._listFutures)):
+            future = self._listFutures[self._iMerged]
+
+            if (future.done() == False):
+                return False
+
+            if (future.cancelled() == False):
+                listDataStorage, listErrors = future.result()
+                self._listErrors += listErrors
+
+                for dataStorage in listDataStorage:
+                    # Resolve conflicts with existing templates
+                    dataStorage.save_TemplateName(
+                        self._dataHandling.get_UniqueTemplateName(
+                            dataStorage.get_ExperimentType(),
+                            dataStorage.get_TemplateName()))
+
+                    self._dataHandling.import_DataObject(dataStorage)
+                    self._iTemplates += 1
+
+            self._iMerged += 1
+
+        return True
+
+    def get_Progress(self) -> tuple:
+        """
+        Description
+        -----------
+        Get the progress of the import.
+
+        Return
+        ------
+        `tupleProgress` : tuple
+            Tuple containing the amount of merged files and of all files
+
+        """
+        return self._iMerged, len(self._listFilePaths)
+
+    def get_TemplateCount(self) -> int:
+        """
+        Description
+        -----------
+        Get the amount of imported templates.
+
+        Return
+        ------
+        `iTemplates` : int
+            Amount of templates merged into the data handling
+
+        """
+        return self._iTemplates
+
+    def get_Errors(self) -> list:
+        """
+        Description
+        -----------
+        Get the errors which occurred while reading the merged files.
+
+        Return
+        ------
+        `listErrors` : list
+            List containing a message for every error
+
+        """
+        return self._listErrors
+
+    def _readFile(self, strFilePath : str) -> tuple:
+        """
+        Description
+        -----------
+        Read the templates of one file (executed by the worker threads). 
+        Templates of .csv-files are named after the file.
+
+        Parameters
+        ----------
+        `strFilePath` : string
+            Path of the file
+
+        Return
+        ------
+        `tupleResult` : tuple
+            Tuple containing the read DataStorage objects and the errors
+
+        """
+        listErrors : list = []
+        listDataStorage : list = self._dataHandling.read_Templates(strFilePath,
+            listErrors, os.path.splitext(os.path.basename(strFilePath))[0])
+
+        return listDataStorage, listErrors
@@ -19,6 +19,7 @@ from FreiStat.Data_storage.constants import *
 # Import internal dependencies
 from ..Data_Storage.constants import *
 from ..Data_Storage.dictionaries import *
+from ..Data_Storage.method_registry import dic_methodRegistry
 
 def _create_CentralFrame(self, parentFrame: Frame) -> None:
     """
@@ -105,7 +106,8 @@ def _update_CentralFrame_EntryScreen(self, parentFrame: Frame) -> None:
         __version__, style= "fLabelGeneralWhite.TLabel")
     TextVersionInfo.pack(side= TOP, expand= FALSE, padx= 5, pady= 5)
 
-def _update_CentralFrame_Base(self, parentFrame: Frame) -> None:
+def _update_CentralFrame_Base(self, parentFrame: Frame, 
+                              listForm : list = None) -> None:
     """
     Description
     -----------
@@ -115,8 +117,15 @@ def _update_CentralFrame_Base(self, parentFrame: Frame) -> None:
     ----------
     `parentFrame` : Frame
         Parent frame in which the central frame is embedded
+
+    `listForm` : list
+        Cached form (see `FormCache`) which is shown instead of creating a new
+        base frame
         
     """    
+    # Cached forms are only hidden
+    self._formCache.hide_Forms()
+
     # Check if an experiment is running
     if (self._iSystemStatus != FS_RUNNING):
         # Clear present widgets
@@ -140,11 +149,26 @@ def _update_CentralFrame_Base(self, parentFrame: Frame) -> None:
         else :
             self._initEntries(self._strMethod)
 
+    # Show the cached form, its entries are bound to the updated variables
+    if (listForm is not None):
+        self._fCentralForm = listForm[0]
+        self._fCentralParameterFrame = listForm[1]
+        self._fAdvancedSettingContainer = listForm[2]
+
+        # Advanced settings are unchecked by the update of the entries
+        self._fAdvancedSettingContainer.pack_forget()
+        self._fCentralForm.pack(fill= "both", side= TOP, expand= True)
+        return
+
+    # Create a frame containing the whole form, so that it can be cached
+    self._fCentralForm = Frame(parentFrame, style="fCentralFrame.TFrame")
+    self._fCentralForm.pack(fill= "both", side= TOP, expand= True)
+
     # Create utility band
-    self._create_UtilitybandFrame(parentFrame)
+    self._create_UtilitybandFrame(self._fCentralForm)
     
     # Create a canvas window
-    canvasCentral = Canvas(parentFrame, background= "white",
+    canvasCentral = Canvas(self._fCentralForm, background= "white",
         borderwidth= 0, highlightthickness= 0)
     
     # Bind resize event to canvas
@@ -152,7 +176,7 @@ def _update_CentralFrame_Base(self, parentFrame: Frame) -> None:
         self._on_resize(event, canvas))
 
     # Create a scrollbar
-    scrollbarCentral=Scrollbar(parentFrame, orient="vertical",
+    scrollbarCentral=Scrollbar(self._fCentralForm, orient="vertical",
         command= canvasCentral.yview)
     scrollbarCentral.pack(side= RIGHT, fill= Y)
 
@@ -250,6 +274,44 @@ def _update_CentralFrame_Options(self, parentFrame: Frame) -> None:
     EntryGLpModeL.bind("<Leave>", lambda event, 
         entry = SET_GLPM_LATENCY  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
 
+    # Scheduler tick interval
+    fTickRate = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
+    fTickRate.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextTickRate = Label(fTickRate, text= dic_parameters[SET_TICK_RATE][0], 
+        width= TEXTBOX_WIDTH_SETTINGS, style= "fLabelGeneralBold.TLabel")
+    TextTickRate.pack(side= LEFT, padx= 5, pady= 5)
+
+    EntryTickRate = Entry(fTickRate, textvariable= self._strTickRate, 
+        width= ENTRY_WIDTH, validate="key", validatecommand= (fTickRate.
+        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
+    EntryTickRate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    EntryTickRate.bind("<Enter>", lambda event, 
+        entry = SET_TICK_RATE : self._PopUpWindowTooltip._on_rightclick(event, entry))
+    EntryTickRate.bind("<Leave>", lambda event, 
+        entry = SET_TICK_RATE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+
+    # Maximum amount of terminal lines
+    fTerminalLines = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
+    fTerminalLines.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextTerminalLines = Label(fTerminalLines, 
+        text= dic_parameters[SET_TERMINAL_LINES][0], 
+        width= TEXTBOX_WIDTH_SETTINGS, style= "fLabelGeneralBold.TLabel")
+    TextTerminalLines.pack(side= LEFT, padx= 5, pady= 5)
+
+    EntryTerminalLines = Entry(fTerminalLines, 
+        textvariable= self._strTerminalLines, width= ENTRY_WIDTH, 
+        validate="key", validatecommand= (fTerminalLines.
+        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
+    EntryTerminalLines.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    EntryTerminalLines.bind("<Enter>", lambda event, 
+        entry = SET_TERMINAL_LINES : self._PopUpWindowTooltip._on_rightclick(event, entry))
+    EntryTerminalLines.bind("<Leave>", lambda event, 
+        entry = SET_TERMINAL_LINES  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+
     # WLAN mode
     fWLANMode = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
     fWLANMode.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
@@ -267,6 +329,63 @@ def _update_CentralFrame_Options(self, parentFrame: Frame) -> None:
     EntryWLANMode.bind("<Leave>", lambda event, 
         entry = SET_WLAN_MODE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
 
+    # Simulated device
+    fSimulation = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
+    fSimulation.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextSimulation = Label(fSimulation, text= dic_parameters[SET_SIMULATION][0],
+        width= TEXTBOX_WIDTH_SETTINGS, style= "fLabelGeneralBold.TLabel")
+    TextSimulation.pack(side= LEFT, padx= 5, pady= 5)
+
+    EntrySimulation = Checkbutton(fSimulation, variable= self._iSimulation,
+        onvalue= True, offvalue= False)
+    EntrySimulation.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    EntrySimulation.bind("<Enter>", lambda event,
+        entry = SET_SIMULATION : self._PopUpWindowTooltip._on_rightclick(event, entry))
+    EntrySimulation.bind("<Leave>", lambda event,
+        entry = SET_SIMULATION  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+
+    # Sample rate factor of the simulated device
+    fSimulationRate = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
+    fSimulationRate.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextSimulationRate = Label(fSimulationRate,
+        text= dic_parameters[SET_SIMULATION_RATE][0],
+        width= TEXTBOX_WIDTH_SETTINGS, style= "fLabelGeneralBold.TLabel")
+    TextSimulationRate.pack(side= LEFT, padx= 5, pady= 5)
+
+    EntrySimulationRate = Entry(fSimulationRate,
+        textvariable= self._strSimulationRate, width= ENTRY_WIDTH,
+        validate="key", validatecommand= (fSimulationRate.
+        register(_valdiate_ValueEntriesPositive),'%S','%d'))
+    EntrySimulationRate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    EntrySimulationRate.bind("<Enter>", lambda event,
+        entry = SET_SIMULATION_RATE : self._PopUpWindowTooltip._on_rightclick(event, entry))
+    EntrySimulationRate.bind("<Leave>", lambda event,
+        entry = SET_SIMULATION_RATE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+
+    # Noise of the simulated device
+    fSimulationNoise = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
+    fSimulationNoise.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextSimulationNoise = Label(fSimulationNoise,
+        text= dic_parameters[SET_SIMULATION_NOISE][0],
+        width= TEXTBOX_WIDTH_SETTINGS, style= "fLabelGeneralBold.TLabel")
+    TextSimulationNoise.pack(side= LEFT, padx= 5, pady= 5)
+
+    EntrySimulationNoise = Entry(fSimulationNoise,
+        textvariable= self._strSimulationNoise, width= ENTRY_WIDTH,
+        validate="key", validatecommand= (fSimulationNoise.
+        register(_valdiate_ValueEntriesPositive),'%S','%d'))
+    EntrySimulationNoise.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    EntrySimulationNoise.bind("<Enter>", lambda event,
+        entry = SET_SIMULATION_NOISE : self._PopUpWindowTooltip._on_rightclick(event, entry))
+    EntrySimulationNoise.bind("<Leave>", lambda event,
+        entry = SET_SIMULATION_NOISE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+
     # Server IP
     fServerIP = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
     fServerIP.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
@@ -346,421 +465,38 @@ def _update_CentralFrame_Options(self, parentFrame: Frame) -> None:
     # Update the preferences
     self._updatePreferences()
 
-def _update_CentralFrame_CA(self, parentFrame: Frame) -> None:
+def _update_CentralFrame_Method(self, parentFrame: Frame, 
+                                strMethod : str) -> None:
     """
     Description
     -----------
     Method for creating the central frame in the middle of the interface, 
-    which is created when the user wants to start a CA in single mode.
+    which is created when the user wants to configure an electrochemical 
+    method. The entries are created from the definition of the method in the
+    method registry.
 
     Parameters
     ----------
     `parentFrame` : Frame
         Parent frame in which the central frame is embedded
-        
-    """      
-    # Update class variables
-    self._strMethod = CA
-
-    # Create base frame
-    self._update_CentralFrame_Base(parentFrame)
-
-    # Create frames for every parameter
-    # Potential steps
-    fPotentialSteps = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fPotentialSteps.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextPotentialSteps = Label(fPotentialSteps, width= TEXTBOX_WIDTH,
-        text= dic_parameters[POTENTIAL_STEPS][0], style= "fLabelGeneral.TLabel")
-    TextPotentialSteps.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryPotentialSteps = Entry(fPotentialSteps, textvariable= 
-        self._strPotentialSteps, width= ENTRY_WIDTH, validate="key", 
-        validatecommand= (fPotentialSteps.register(_valdiate_ArrayEntries),'%S','%d'))        
-    EntryPotentialSteps.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryPotentialSteps.bind("<Enter>", lambda event, 
-        entry = POTENTIAL_STEPS : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryPotentialSteps.bind("<Leave>", lambda event, 
-        entry = POTENTIAL_STEPS  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Pulse lengths
-    fPulseLengths = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fPulseLengths.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextPulseLengths = Label(fPulseLengths, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[PULSE_LENGTH][0], style= "fLabelGeneral.TLabel")
-    TextPulseLengths.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryPulseLengths = Entry(fPulseLengths, textvariable= self._strPulseLengths, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= 
-        (fPulseLengths.register(_valdiate_ArrayEntries),'%S','%d'))        
-    EntryPulseLengths.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryPulseLengths.bind("<Enter>", lambda event, 
-        entry = PULSE_LENGTH : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryPulseLengths.bind("<Leave>", lambda event, 
-        entry = PULSE_LENGTH  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Sampling rate
-    fSamplingRate = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fSamplingRate.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextSamplingRate = Label(fSamplingRate, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[SAMPLING_RATE][0], style= "fLabelGeneral.TLabel")
-    TextSamplingRate.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntrySamplingRate = Entry(fSamplingRate, width= ENTRY_WIDTH, 
-        textvariable= self._strSamplingRate, validate="key", validatecommand= 
-        (fSamplingRate.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntrySamplingRate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntrySamplingRate.bind("<Enter>", lambda event, 
-        entry = SAMPLING_RATE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntrySamplingRate.bind("<Leave>", lambda event, 
-        entry = SAMPLING_RATE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Cycles
-    fCycles = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fCycles.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCycle = Label(fCycles, text= dic_parameters[CYCLE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextCycle.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCycle = Entry(fCycles, textvariable= self._strCycle, width= ENTRY_WIDTH, 
-        validate="key", validatecommand= (fCycles.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryCycle.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCycle.bind("<Enter>", lambda event, 
-        entry = CYCLE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCycle.bind("<Leave>", lambda event, 
-        entry = CYCLE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # CurrentRange
-    fCurrentRange = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fCurrentRange.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCurrentRange = Label(fCurrentRange, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[LPTIA_RTIA_SIZE][0], style= "fLabelGeneral.TLabel")
-    TextCurrentRange.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCurrentRange = Entry(fCurrentRange, textvariable= self._strCurrentrange,
-        width= ENTRY_WIDTH, validate="key", validatecommand= 
-        (fCurrentRange.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryCurrentRange.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCurrentRange.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCurrentRange.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Fill in spacer frame to separate parameters
-    self._createSpacerFrame(self._fCentralParameterFrame, "fCentralFrame.TFrame")
-
-    # Create frame to enable/ disable advanced settings
-    fAdvancedSetting = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fAdvancedSetting.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextAdvancedSetting = Label(fAdvancedSetting, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[ADVANCED_SETTING][0], style= "fLabelGeneral.TLabel")
-    TextAdvancedSetting.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryAdvancedSetting = Checkbutton(fAdvancedSetting, 
-        command= lambda : self._clickCheckButton(CHECKBUTTON_ADV_SETTING), 
-        variable= self._iAdvancedSetting, onvalue= True, offvalue= False)        
-    EntryAdvancedSetting.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-def _update_CentralFrame_LSV(self, parentFrame: Frame) -> None:
-    """
-    Description
-    -----------
-    Method for creating the central frame in the middle of the interface, 
-    which is created when the user wants to start a LSV in single mode.
 
-    Parameters
-    ----------
-    `parentFrame` : Frame
-        Parent frame in which the parameter band frame is embedded
+    `strMethod` : string
+        Electrochemical method which should be configured
         
     """      
     # Update class variables
-    self._strMethod = LSV
-
-    # Create base frame
-    self._update_CentralFrame_Base(parentFrame)
-
-    # Create frames for every parameter
-    # StartVoltage
-    fStartVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStartVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStartVoltage = Label(fStartVoltage, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[START_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStartVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStartVoltage = Entry(fStartVoltage, textvariable= self._strStartVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStartVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStartVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStartVoltage.bind("<Enter>", lambda event, 
-        entry = START_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStartVoltage.bind("<Leave>", lambda event, 
-        entry = START_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # StopVoltage
-    fStopVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStopVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStopVoltage = Label(fStopVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[STOP_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStopVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStopVoltage = Entry(fStopVoltage, textvariable= self._strStopVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStopVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStopVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStopVoltage.bind("<Enter>", lambda event, 
-        entry = STOP_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStopVoltage.bind("<Leave>", lambda event, 
-        entry = STOP_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Stepsize
-    fStepsize = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStepsize.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStepsize = Label(fStepsize, text= dic_parameters[STEP_SIZE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextStepsize.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStepsize = Entry(fStepsize, textvariable= self._strStepsize, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStepsize.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStepsize.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStepsize.bind("<Enter>", lambda event, 
-        entry = STEP_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStepsize.bind("<Leave>", lambda event, 
-        entry = STEP_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Scanrate
-    fScanrate = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fScanrate.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextScanrate = Label(fScanrate, text= dic_parameters[SCAN_RATE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextScanrate.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryScanrate = Entry(fScanrate, textvariable= self._strScanrate, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fScanrate.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryScanrate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryScanrate.bind("<Enter>", lambda event, 
-        entry = SCAN_RATE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryScanrate.bind("<Leave>", lambda event, 
-        entry = SCAN_RATE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Cycles
-    fCycles = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fCycles.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCycle = Label(fCycles, text= dic_parameters[CYCLE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextCycle.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCycle = Entry(fCycles, textvariable= self._strCycle, width= ENTRY_WIDTH, 
-        validate="key", validatecommand= (fCycles.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryCycle.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCycle.bind("<Enter>", lambda event, 
-        entry = CYCLE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCycle.bind("<Leave>", lambda event, 
-        entry = CYCLE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # CurrentRange
-    fCurrentRange = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fCurrentRange.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCurrentRange = Label(fCurrentRange, width= TEXTBOX_WIDTH,
-        text= dic_parameters[LPTIA_RTIA_SIZE][0], style= "fLabelGeneral.TLabel")
-    TextCurrentRange.pack(side= LEFT, padx= 5, pady= 5)
+    self._strMethod = strMethod
 
-    EntryCurrentRange = Entry(fCurrentRange, textvariable= self._strCurrentrange, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fCurrentRange.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryCurrentRange.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCurrentRange.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCurrentRange.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Fill in spacer frame to separate parameters
-    self._createSpacerFrame(self._fCentralParameterFrame, "fCentralFrame.TFrame")
-
-    # Create frame to enable/ disable advanced settings
-    fAdvancedSetting = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fAdvancedSetting.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextAdvancedSetting = Label(fAdvancedSetting, width= TEXTBOX_WIDTH,
-        text= dic_parameters[ADVANCED_SETTING][0], style= "fLabelGeneral.TLabel")
-    TextAdvancedSetting.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryAdvancedSetting = Checkbutton(fAdvancedSetting, 
-        command= lambda : self._clickCheckButton(CHECKBUTTON_ADV_SETTING), 
-        variable= self._iAdvancedSetting, onvalue= True, offvalue= False)        
-    EntryAdvancedSetting.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-def _update_CentralFrame_CV(self, parentFrame: Frame) -> None:
-    """
-    Description
-    -----------
-    Method for creating the central frame in the middle of the interface, 
-    which is created when the user wants to start a CV in single mode.
-
-    Parameters
-    ----------
-    `parentFrame` : Frame
-        Parent frame in which the parameter band frame is embedded
-        
-    """      
-    # Update class variables
-    self._strMethod = CV
+    # Show the form of the method, if it was already created
+    listForm : list = self._formCache.get_Form(parentFrame, strMethod)
+    self._update_CentralFrame_Base(parentFrame, listForm)
 
-    # Create base frame
-    self._update_CentralFrame_Base(parentFrame)
+    if (listForm is not None):
+        return
 
     # Create frames for every parameter
-    # StartVoltage
-    fStartVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStartVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStartVoltage = Label(fStartVoltage, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[START_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStartVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStartVoltage = Entry(fStartVoltage, textvariable= self._strStartVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStartVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStartVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStartVoltage.bind("<Enter>", lambda event, 
-        entry = START_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStartVoltage.bind("<Leave>", lambda event, 
-        entry = START_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # LowerTurningVoltage
-    fLowerVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fLowerVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextLowerVoltage = Label(fLowerVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[LOWER_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextLowerVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryLowerVoltage = Entry(fLowerVoltage, textvariable= self._strLowerVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fLowerVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryLowerVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryLowerVoltage.bind("<Enter>", lambda event, 
-        entry = LOWER_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryLowerVoltage.bind("<Leave>", lambda event, 
-        entry = LOWER_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # UpperTurningVoltage
-    fUpperVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fUpperVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextUpperVoltage = Label(fUpperVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[UPPER_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextUpperVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryUpperVoltage = Entry(fUpperVoltage, textvariable= self._strUpperVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fUpperVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryUpperVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryUpperVoltage.bind("<Enter>", lambda event, 
-        entry = UPPER_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryUpperVoltage.bind("<Leave>", lambda event, 
-        entry = UPPER_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Stepsize
-    fStepsize = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStepsize.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStepsize = Label(fStepsize, text= dic_parameters[STEP_SIZE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextStepsize.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStepsize = Entry(fStepsize, textvariable= self._strStepsize, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStepsize.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStepsize.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStepsize.bind("<Enter>", lambda event, 
-        entry = STEP_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStepsize.bind("<Leave>", lambda event, 
-        entry = STEP_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Scanrate
-    fScanrate = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fScanrate.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextScanrate = Label(fScanrate, text= dic_parameters[SCAN_RATE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextScanrate.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryScanrate = Entry(fScanrate, textvariable= self._strScanrate, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fScanrate.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryScanrate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryScanrate.bind("<Enter>", lambda event, 
-        entry = SCAN_RATE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryScanrate.bind("<Leave>", lambda event, 
-        entry = SCAN_RATE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Cycles
-    fCycles = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fCycles.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCycle = Label(fCycles, text= dic_parameters[CYCLE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextCycle.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCycle = Entry(fCycles, textvariable= self._strCycle, width= ENTRY_WIDTH, 
-        validate="key", validatecommand= (fCycles.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryCycle.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCycle.bind("<Enter>", lambda event, 
-        entry = CYCLE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCycle.bind("<Leave>", lambda event, 
-        entry = CYCLE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # CurrentRange
-    fCurrentRange = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fCurrentRange.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCurrentRange = Label(fCurrentRange, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[LPTIA_RTIA_SIZE][0], style= "fLabelGeneral.TLabel")
-    TextCurrentRange.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCurrentRange = Entry(fCurrentRange, textvariable= self._strCurrentrange, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fCurrentRange.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryCurrentRange.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCurrentRange.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCurrentRange.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+    for parameter in dic_methodRegistry[strMethod].get_FormParameters():
+        self._createParameterFrame(self._fCentralParameterFrame, parameter)
 
     # Fill in spacer frame to separate parameters
     self._createSpacerFrame(self._fCentralParameterFrame, "fCentralFrame.TFrame")
@@ -778,551 +514,61 @@ def _update_CentralFrame_CV(self, parentFrame: Frame) -> None:
         variable= self._iAdvancedSetting, onvalue= True, offvalue= False)        
     EntryAdvancedSetting.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
 
-def _update_CentralFrame_NPV(self, parentFrame: Frame) -> None:
-    """
-    Description
-    -----------
-    Method for creating the central frame in the middle of the interface, 
-    which is created when the user wants to start a NPV in single mode.
-
-    Parameters
-    ----------
-    `parentFrame` : Frame
-        Parent frame in which the parameter band frame is embedded
-        
-    """      
-    # Update class variables
-    self._strMethod = NPV
-
-    # Create base frame
-    self._update_CentralFrame_Base(parentFrame)
-
-    # Create frames for every parameter
-    # BaseVoltage
-    fBaseVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fBaseVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextBaseVoltage = Label(fBaseVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[BASE_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextBaseVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryBaseVoltage = Entry(fBaseVoltage, textvariable= self._strBaseVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fBaseVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryBaseVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryBaseVoltage.bind("<Enter>", lambda event, 
-        entry = BASE_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryBaseVoltage.bind("<Leave>", lambda event, 
-        entry = BASE_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # StartVoltage
-    fStartVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStartVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStartVoltage = Label(fStartVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[START_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStartVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStartVoltage = Entry(fStartVoltage, textvariable= self._strStartVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStartVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStartVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStartVoltage.bind("<Enter>", lambda event, 
-        entry = START_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStartVoltage.bind("<Leave>", lambda event, 
-        entry = START_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # StopVoltage
-    fStopVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStopVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStopVoltage = Label(fStopVoltage, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[STOP_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStopVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStopVoltage = Entry(fStopVoltage, textvariable= self._strStopVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStopVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStopVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStopVoltage.bind("<Enter>", lambda event, 
-        entry = STOP_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStopVoltage.bind("<Leave>", lambda event, 
-        entry = STOP_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # DeltaV staircase
-    fDeltaVStaircase = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fDeltaVStaircase.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextDeltaVStaircase = Label(fDeltaVStaircase, width= TEXTBOX_WIDTH,
-        text= dic_parameters[DELTA_V_STAIRCASE][0], style= "fLabelGeneral.TLabel")
-    TextDeltaVStaircase.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryDeltaVStaircase = Entry(fDeltaVStaircase, textvariable= 
-        self._strDeltaVStaircase, width= ENTRY_WIDTH, validate="key", 
-        validatecommand= (fDeltaVStaircase.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryDeltaVStaircase.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryDeltaVStaircase.bind("<Enter>", lambda event, 
-        entry = DELTA_V_STAIRCASE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryDeltaVStaircase.bind("<Leave>", lambda event, 
-        entry = DELTA_V_STAIRCASE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Pulse lengths
-    fPulseLengths = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fPulseLengths.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextPulseLengths = Label(fPulseLengths, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[PULSE_LENGTH][0], style= "fLabelGeneral.TLabel")
-    TextPulseLengths.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryPulseLengths = Entry(fPulseLengths, textvariable= self._strPulseLengths, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= 
-        (fPulseLengths.register(_valdiate_ArrayEntries),'%S','%d'))        
-    EntryPulseLengths.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryPulseLengths.bind("<Enter>", lambda event, 
-        entry = PULSE_LENGTH : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryPulseLengths.bind("<Leave>", lambda event, 
-        entry = PULSE_LENGTH  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Sampling duration
-    fSamplingDuration = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fSamplingDuration.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextSamplingDuration = Label(fSamplingDuration, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[SAMPLING_DURATION][0], style= "fLabelGeneral.TLabel")
-    TextSamplingDuration.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntrySamplingDuration = Entry(fSamplingDuration, width= ENTRY_WIDTH,
-        textvariable= self._strSamplingDuration, validate="key", validatecommand= 
-        (fSamplingDuration. register(_valdiate_ValueEntries),'%S','%d'))        
-    EntrySamplingDuration.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntrySamplingDuration.bind("<Enter>", lambda event, 
-        entry = SAMPLING_DURATION : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntrySamplingDuration.bind("<Leave>", lambda event, 
-        entry = SAMPLING_DURATION  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Cycles
-    fCycles = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fCycles.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCycle = Label(fCycles, text= dic_parameters[CYCLE][0],  
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextCycle.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCycle = Entry(fCycles, textvariable= self._strCycle, width= ENTRY_WIDTH, 
-        validate="key", validatecommand= (fCycles.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryCycle.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCycle.bind("<Enter>", lambda event, 
-        entry = CYCLE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCycle.bind("<Leave>", lambda event, 
-        entry = CYCLE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # CurrentRange
-    fCurrentRange = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fCurrentRange.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCurrentRange = Label(fCurrentRange, width= TEXTBOX_WIDTH,
-        text= dic_parameters[LPTIA_RTIA_SIZE][0], style= "fLabelGeneral.TLabel")
-    TextCurrentRange.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCurrentRange = Entry(fCurrentRange, textvariable= self._strCurrentrange, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fCurrentRange.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryCurrentRange.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCurrentRange.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCurrentRange.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+    # Advanced settings are shown by the check button
+    self._createAdvancedSettingFrame(self._fCentralParameterFrame)
 
-    # Fill in spacer frame to separate parameters
-    self._createSpacerFrame(self._fCentralParameterFrame, "fCentralFrame.TFrame")
-
-    # Create frame to enable/ disable advanced settings
-    fAdvancedSetting = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fAdvancedSetting.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+    # Cache the form
+    self._formCache.add_Form(parentFrame, strMethod, [self._fCentralForm,
+        self._fCentralParameterFrame, self._fAdvancedSettingContainer])
 
-    TextAdvancedSetting = Label(fAdvancedSetting, width= TEXTBOX_WIDTH,
-        text= dic_parameters[ADVANCED_SETTING][0], style= "fLabelGeneral.TLabel")
-    TextAdvancedSetting.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryAdvancedSetting = Checkbutton(fAdvancedSetting, 
-        command= lambda : self._clickCheckButton(CHECKBUTTON_ADV_SETTING),
-        variable= self._iAdvancedSetting, onvalue= True, offvalue= False)        
-    EntryAdvancedSetting.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-def _update_CentralFrame_DPV(self, parentFrame: Frame) -> None:
+def _createParameterFrame(self, parentFrame : Frame, parameter) -> None:
     """
     Description
     -----------
-    Method for creating the central frame in the middle of the interface, 
-    which is created when the user wants to start a DPV in single mode.
+    Helper method creating the frame of one experiment parameter, containing
+    its label and an entry or a check button.
 
     Parameters
     ----------
     `parentFrame` : Frame
-        Parent frame in which the parameter band frame is embedded
-        
-    """      
-    # Update class variables
-    self._strMethod = DPV
-
-    # Create base frame
-    self._update_CentralFrame_Base(parentFrame)
-
-    # Create frames for every parameter
-    # StartVoltage
-    fStartVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStartVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStartVoltage = Label(fStartVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[START_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStartVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStartVoltage = Entry(fStartVoltage, textvariable= self._strStartVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStartVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStartVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStartVoltage.bind("<Enter>", lambda event, 
-        entry = START_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStartVoltage.bind("<Leave>", lambda event, 
-        entry = START_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # StopVoltage
-    fStopVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStopVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStopVoltage = Label(fStopVoltage, width= TEXTBOX_WIDTH,
-        text= dic_parameters[STOP_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStopVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStopVoltage = Entry(fStopVoltage, textvariable= self._strStopVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStopVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStopVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStopVoltage.bind("<Enter>", lambda event, 
-        entry = STOP_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStopVoltage.bind("<Leave>", lambda event, 
-        entry = STOP_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # DeltaV staircase
-    fDeltaVStaircase = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fDeltaVStaircase.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextDeltaVStaircase = Label(fDeltaVStaircase, width= TEXTBOX_WIDTH,
-        text= dic_parameters[DELTA_V_STAIRCASE][0], style= "fLabelGeneral.TLabel")
-    TextDeltaVStaircase.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryDeltaVStaircase = Entry(fDeltaVStaircase, width= ENTRY_WIDTH, 
-        textvariable= self._strDeltaVStaircase,  validate="key", validatecommand= 
-        (fDeltaVStaircase.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryDeltaVStaircase.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryDeltaVStaircase.bind("<Enter>", lambda event, 
-        entry = DELTA_V_STAIRCASE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryDeltaVStaircase.bind("<Leave>", lambda event, 
-        entry = DELTA_V_STAIRCASE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # DeltaV peak
-    fDeltaVPeak = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fDeltaVPeak.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextDeltaVPeak= Label(fDeltaVPeak, text= dic_parameters[DELTA_V_PEAK][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextDeltaVPeak.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryDeltaVPeak = Entry(fDeltaVPeak, textvariable= self._strDeltaVPeak, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fDeltaVPeak.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryDeltaVPeak.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryDeltaVPeak.bind("<Enter>", lambda event, 
-        entry = DELTA_V_PEAK : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryDeltaVPeak.bind("<Leave>", lambda event, 
-        entry = DELTA_V_PEAK  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Pulse lengths
-    fPulseLengths = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fPulseLengths.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextPulseLengths = Label(fPulseLengths, width= TEXTBOX_WIDTH,
-        text= dic_parameters[PULSE_LENGTH][0], style= "fLabelGeneral.TLabel")
-    TextPulseLengths.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryPulseLengths = Entry(fPulseLengths, textvariable= self._strPulseLengths, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= 
-        (fPulseLengths.register(_valdiate_ArrayEntries),'%S','%d'))        
-    EntryPulseLengths.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryPulseLengths.bind("<Enter>", lambda event, 
-        entry = PULSE_LENGTH : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryPulseLengths.bind("<Leave>", lambda event, 
-        entry = PULSE_LENGTH  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Sampling duration
-    fSamplingDuration = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fSamplingDuration.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextSamplingDuration = Label(fSamplingDuration, width= TEXTBOX_WIDTH,
-        text= dic_parameters[SAMPLING_DURATION][0], style= "fLabelGeneral.TLabel")
-    TextSamplingDuration.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntrySamplingDuration = Entry(fSamplingDuration, width= ENTRY_WIDTH, 
-        textvariable= self._strSamplingDuration, validate="key", validatecommand= 
-        (fSamplingDuration.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntrySamplingDuration.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntrySamplingDuration.bind("<Enter>", lambda event, 
-        entry = SAMPLING_DURATION : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntrySamplingDuration.bind("<Leave>", lambda event, 
-        entry = SAMPLING_DURATION  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Cycles
-    fCycles = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fCycles.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCycle = Label(fCycles, text= dic_parameters[CYCLE][0],  
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextCycle.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCycle = Entry(fCycles, textvariable= self._strCycle, width= ENTRY_WIDTH, 
-        validate="key", validatecommand= (fCycles.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryCycle.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCycle.bind("<Enter>", lambda event, 
-        entry = CYCLE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCycle.bind("<Leave>", lambda event, 
-        entry = CYCLE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # CurrentRange
-    fCurrentRange = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fCurrentRange.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCurrentRange = Label(fCurrentRange, width= TEXTBOX_WIDTH,
-        text= dic_parameters[LPTIA_RTIA_SIZE][0], style= "fLabelGeneral.TLabel")
-    TextCurrentRange.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCurrentRange = Entry(fCurrentRange, textvariable= self._strCurrentrange, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fCurrentRange.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryCurrentRange.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCurrentRange.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCurrentRange.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Fill in spacer frame to separate parameters
-    self._createSpacerFrame(self._fCentralParameterFrame, "fCentralFrame.TFrame")
-
-    # Create frame to enable/ disable advanced settings
-    fAdvancedSetting = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fAdvancedSetting.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+        Parent frame in which the parameter frame is embedded
 
-    TextAdvancedSetting = Label(fAdvancedSetting, width= TEXTBOX_WIDTH,
-        text= dic_parameters[ADVANCED_SETTING][0], style= "fLabelGeneral.TLabel")
-    TextAdvancedSetting.pack(side= LEFT, padx= 5, pady= 5)
+    `parameter` : MethodParameter
+        Definition of the parameter in the method registry
 
-    EntryAdvancedSetting = Checkbutton(fAdvancedSetting, 
-        command= lambda : self._clickCheckButton(CHECKBUTTON_ADV_SETTING),
-        variable= self._iAdvancedSetting, onvalue= True, offvalue= False)        
-    EntryAdvancedSetting.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-def _update_CentralFrame_SWV(self, parentFrame: Frame) -> None:
     """
-    Description
-    -----------
-    Method for creating the central frame in the middle of the interface, 
-    which is created when the user wants to start a SWV in single mode.
-
-    Parameters
-    ----------
-    `parentFrame` : Frame
-        Parent frame in which the parameter band frame is embedded
-        
-    """      
-    # Update class variables
-    self._strMethod = SWV
-
-    # Create base frame
-    self._update_CentralFrame_Base(parentFrame)
-
-    # Create frames for every parameter
-    # StartVoltage
-    fStartVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStartVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStartVoltage = Label(fStartVoltage, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[START_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStartVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStartVoltage = Entry(fStartVoltage, textvariable= self._strStartVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStartVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStartVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStartVoltage.bind("<Enter>", lambda event, 
-        entry = START_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStartVoltage.bind("<Leave>", lambda event, 
-        entry = START_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # StopVoltage
-    fStopVoltage = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fStopVoltage.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextStopVoltage = Label(fStopVoltage, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[STOP_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextStopVoltage.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryStopVoltage = Entry(fStopVoltage, textvariable= self._strStopVoltage, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fStopVoltage.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryStopVoltage.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryStopVoltage.bind("<Enter>", lambda event, 
-        entry = STOP_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryStopVoltage.bind("<Leave>", lambda event, 
-        entry = STOP_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # DeltaV staircase
-    fDeltaVStaircase = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fDeltaVStaircase.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextDeltaVStaircase = Label(fDeltaVStaircase, width= TEXTBOX_WIDTH,
-        text= dic_parameters[DELTA_V_STAIRCASE][0], style= "fLabelGeneral.TLabel")
-    TextDeltaVStaircase.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryDeltaVStaircase = Entry(fDeltaVStaircase, width= ENTRY_WIDTH, 
-        textvariable= self._strDeltaVStaircase, validate="key", validatecommand= 
-        (fDeltaVStaircase.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryDeltaVStaircase.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryDeltaVStaircase.bind("<Enter>", lambda event, 
-        entry = DELTA_V_STAIRCASE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryDeltaVStaircase.bind("<Leave>", lambda event, 
-        entry = DELTA_V_STAIRCASE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # DeltaV peak
-    fDeltaVPeak = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fDeltaVPeak.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextDeltaVPeak= Label(fDeltaVPeak, text= dic_parameters[DELTA_V_PEAK][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextDeltaVPeak.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryDeltaVPeak = Entry(fDeltaVPeak, textvariable= self._strDeltaVPeak, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fDeltaVPeak.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryDeltaVPeak.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryDeltaVPeak.bind("<Enter>", lambda event, 
-        entry = DELTA_V_PEAK : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryDeltaVPeak.bind("<Leave>", lambda event, 
-        entry = DELTA_V_PEAK  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Duty cycle
-    fPulseLengths = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fPulseLengths.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextPulseLengths = Label(fPulseLengths, text= dic_parameters[DUTY_CYCLE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextPulseLengths.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryPulseLengths = Entry(fPulseLengths, textvariable= self._strDutyCycle, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fPulseLengths.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryPulseLengths.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryPulseLengths.bind("<Enter>", lambda event, 
-        entry = DUTY_CYCLE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryPulseLengths.bind("<Leave>", lambda event, 
-        entry = DUTY_CYCLE : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Sampling duration
-    fSamplingDuration = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fSamplingDuration.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextSamplingDuration = Label(fSamplingDuration, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[SAMPLING_DURATION][0], style= "fLabelGeneral.TLabel")
-    TextSamplingDuration.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntrySamplingDuration = Entry(fSamplingDuration, width= ENTRY_WIDTH, 
-        textvariable= self._strSamplingDuration, validate="key", validatecommand= 
-        (fSamplingDuration.register(_valdiate_ValueEntries),'%S','%d'))        
-    EntrySamplingDuration.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntrySamplingDuration.bind("<Enter>", lambda event, 
-        entry = SAMPLING_DURATION : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntrySamplingDuration.bind("<Leave>", lambda event, 
-        entry = SAMPLING_DURATION : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Cycles
-    fCycles = Frame(self._fCentralParameterFrame, style="fWidget.TFrame")
-    fCycles.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCycle = Label(fCycles, text= dic_parameters[CYCLE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextCycle.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCycle = Entry(fCycles, textvariable= self._strCycle, width= ENTRY_WIDTH, 
-        validate="key", validatecommand= (fCycles.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryCycle.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCycle.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCycle.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # CurrentRange
-    fCurrentRange = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fCurrentRange.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextCurrentRange = Label(fCurrentRange, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[LPTIA_RTIA_SIZE][0], style= "fLabelGeneral.TLabel")
-    TextCurrentRange.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryCurrentRange = Entry(fCurrentRange, textvariable= self._strCurrentrange, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fCurrentRange.
-        register(_valdiate_ValueEntries),'%S','%d'))        
-    EntryCurrentRange.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryCurrentRange.bind("<Enter>", lambda event, 
-        entry = LPTIA_RTIA_SIZE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryCurrentRange.bind("<Leave>", lambda event, 
-        entry = LPTIA_RTIA_SIZE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Fill in spacer frame to separate parameters
-    self._createSpacerFrame(self._fCentralParameterFrame, "fCentralFrame.TFrame")
-
-    # Create frame to enable/ disable advanced settings
-    fAdvancedSetting = Frame(self._fCentralParameterFrame, style= "fWidget.TFrame")
-    fAdvancedSetting.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextAdvancedSetting = Label(fAdvancedSetting, width= TEXTBOX_WIDTH, 
-        text= dic_parameters[ADVANCED_SETTING][0], style= "fLabelGeneral.TLabel")
-    TextAdvancedSetting.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryAdvancedSetting = Checkbutton(fAdvancedSetting, 
-        command= lambda : self._clickCheckButton(CHECKBUTTON_ADV_SETTING),
-        variable= self._iAdvancedSetting, onvalue= True, offvalue= False)        
-    EntryAdvancedSetting.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+    fParameter = Frame(parentFrame, style="fWidget.TFrame")
+    fParameter.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextParameter = Label(fParameter, width= TEXTBOX_WIDTH, 
+        text= dic_parameters[parameter.get_Label()][0], 
+        style= "fLabelGeneral.TLabel")
+    TextParameter.pack(side= LEFT, padx= 5, pady= 5)
+
+    if (parameter.is_Checkbutton() == True):
+        EntryParameter = Checkbutton(fParameter, 
+            variable= getattr(self, parameter.get_Variable()), 
+            onvalue= True, offvalue= False)
+    else :
+        EntryParameter = Entry(fParameter, 
+            textvariable= getattr(self, parameter.get_Variable()), 
+            width= ENTRY_WIDTH, validate="key", validatecommand= (fParameter.
+            register(dic_entryValidation[parameter.get_Validation()]),
+            '%S','%d'))
+    EntryParameter.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    EntryParameter.bind("<Enter>", lambda event, 
+        entry = parameter.get_Label() : self._PopUpWindowTooltip._on_rightclick(event, entry))
+    EntryParameter.bind("<Leave>", lambda event, 
+        entry = parameter.get_Label() : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
 
 def _createAdvancedSettingFrame(self, parentFrame : Frame) -> None:
     """
     Description
     -----------
-    Method for creating a frame for the advanced settings.
+    Method for creating a frame for the advanced settings of the method which
+    is currently configured. The frame is hidden until the advanced settings
+    are checked.
 
     Parameters
     ----------
@@ -1333,112 +579,10 @@ def _createAdvancedSettingFrame(self, parentFrame : Frame) -> None:
     # Create frame to house advanced settings
     self._fAdvancedSettingContainer = Frame(parentFrame, 
                                             style= "fCentralFrame.TFrame",)
-    self._fAdvancedSettingContainer.pack(fill= X, side= TOP, expand= FALSE, padx=10)
-
-    # Fixed working electrode potential
-    fFixedWEPotential = Frame(self._fAdvancedSettingContainer, 
-                              style="fWidget.TFrame")
-    fFixedWEPotential.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextFixedWEPotential = Label(fFixedWEPotential, width= TEXTBOX_WIDTH,
-        text= dic_parameters[FIXED_WE_POTENTIAL][0], style= "fLabelGeneral.TLabel")
-    TextFixedWEPotential.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryFixedWEPotential = Checkbutton(fFixedWEPotential, 
-        variable= self._iFixedWEPotential, onvalue= True, offvalue= False)        
-    EntryFixedWEPotential.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryFixedWEPotential.bind("<Enter>", lambda event, 
-        entry = FIXED_WE_POTENTIAL : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryFixedWEPotential.bind("<Leave>", lambda event, 
-        entry = FIXED_WE_POTENTIAL  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Mains filter
-    fMainsFilter = Frame(self._fAdvancedSettingContainer, style="fWidget.TFrame")
-    fMainsFilter.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextMainsFilter = Label(fMainsFilter, text= dic_parameters[MAINS_FILTER][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextMainsFilter.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryMainsFilter = Checkbutton(fMainsFilter, variable= self._iMainsFilter, 
-        onvalue= True, offvalue= False)        
-    EntryMainsFilter.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryMainsFilter.bind("<Enter>", lambda event, 
-        entry = MAINS_FILTER : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryMainsFilter.bind("<Leave>", lambda event, 
-        entry = MAINS_FILTER  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Sinc 2 oversampling rate
-    fOsrSinc2 = Frame(self._fAdvancedSettingContainer, style="fWidget.TFrame")
-    fOsrSinc2.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextOsrSinc2 = Label(fOsrSinc2, text= dic_parameters[SINC2_OVERSAMPLING][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextOsrSinc2.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryOsrSinc2 = Entry(fOsrSinc2, textvariable= self._strOsrSinc2, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fOsrSinc2.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryOsrSinc2.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryOsrSinc2.bind("<Enter>", lambda event, 
-        entry = SINC2_OVERSAMPLING : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryOsrSinc2.bind("<Leave>", lambda event, 
-        entry = SINC2_OVERSAMPLING  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Sinc 3 oversmapling rate
-    fOsrSinc3 = Frame(self._fAdvancedSettingContainer, style="fWidget.TFrame")
-    fOsrSinc3.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextOsrSinc3 = Label(fOsrSinc3, text= dic_parameters[SINC3_OVERSAMPLING][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextOsrSinc3.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryOsrSinc3 = Entry(fOsrSinc3, textvariable= self._strOsrSinc3, 
-        width= ENTRY_WIDTH, validate="key", validatecommand= (fOsrSinc3.
-        register(_valdiate_ValueEntriesPositive),'%S','%d'))        
-    EntryOsrSinc3.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryOsrSinc3.bind("<Enter>", lambda event, 
-        entry = SINC3_OVERSAMPLING : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryOsrSinc3.bind("<Leave>", lambda event, 
-        entry = SINC3_OVERSAMPLING  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Enable optimizer
-    fOptimizer = Frame(self._fAdvancedSettingContainer, style="fWidget.TFrame")
-    fOptimizer.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextOptimizer = Label(fOptimizer, text= dic_parameters[ENABLE_OPTIMIZER][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextOptimizer.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryOptimizer = Checkbutton(fOptimizer, variable= self._iEnableOptimizer, 
-                                 onvalue= True, offvalue= False)        
-    EntryOptimizer.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    EntryOptimizer.bind("<Enter>", lambda event, 
-        entry = ENABLE_OPTIMIZER : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryOptimizer.bind("<Leave>", lambda event, 
-        entry = ENABLE_OPTIMIZER  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
-
-    # Low performance mode
-    fLpMode = Frame(self._fAdvancedSettingContainer, style="fWidget.TFrame")
-    fLpMode.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    TextLpMode = Label(fLpMode, text= dic_parameters[LOW_PERFORMANCE_MODE][0], 
-        width= TEXTBOX_WIDTH, style= "fLabelGeneral.TLabel")
-    TextLpMode.pack(side= LEFT, padx= 5, pady= 5)
-
-    EntryLpMode = Checkbutton(fLpMode, variable= self._iLowPerformanceMode, 
-        onvalue= True, offvalue= False)        
-    EntryLpMode.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
 
-    EntryLpMode.bind("<Enter>", lambda event, 
-        entry = LOW_PERFORMANCE_MODE : self._PopUpWindowTooltip._on_rightclick(event, entry))
-    EntryLpMode.bind("<Leave>", lambda event, 
-        entry = LOW_PERFORMANCE_MODE  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
+    for parameter in dic_methodRegistry[self._strMethod].get_FormParameters(
+        bAdvanced= True):
+        self._createParameterFrame(self._fAdvancedSettingContainer, parameter)
 
 def _update_CentralFrame_Sequence(self, parentFrame : Frame) -> None:
     """
@@ -1572,93 +716,54 @@ def _update_CentralFrame_Sequence(self, parentFrame : Frame) -> None:
     ButtonSave.bind("<Leave>", lambda event, 
         entry = SAVE_SEQUENCE_BUTTON  : self._PopUpWindowTooltip._on_rightclick_release(event, entry))
 
-def _update_CentralFrame_Sequence_Add(self, strMethod : str) -> None:
+def _update_CentralFrame_Sequence_Add(self, strMethod : str) -> int:
     """
     Description
     -----------
-    Method for creating the base structure of the central frame for the 
-    sequence mode.
+    Method for adding a method at the end of the sequence. Each step is 
+    displayed in its own row, which is repacked in place when the step is 
+    moved.
 
     Parameters
     ----------
     `strMethod` : string
         Method which should be added to the sequence
+
+    Return
+    ------
+    `iStepID` : int
+        ID of the added step, None if the max sequence length is reached
         
     """   
     # Check if max sequnece length is reached
-    if (len(self._SequenceList) == FREISTAT_SEQUENCE_LENGTH):
-        return
+    if (len(self._sequenceModel) == FREISTAT_SEQUENCE_LENGTH):
+        return None
+
+    iStepID : int = self._sequenceModel.add_Step(strMethod)
+
+    # Create row containing the link arrow and the step
+    fRow = Frame(self._fDisplaySequence, style="fCentralFrameSequence.TFrame")
+    fRow.pack(fill= X, side= TOP, anchor= W)
 
-    # Check if link arrow should be added
-    if (len(self._SequenceList) > 0):
-        canvas = Canvas(self._fDisplaySequence, width= 44, height= 28)
-        canvas.pack(side= TOP, anchor= NW)
-        canvas.create_image(22, 0, image=self._SequenceLink, anchor=NW)
+    # Link arrow is hidden for the first step of the sequence
+    canvasLink = Canvas(fRow, width= 44, height= 28)
+    canvasLink.create_image(22, 0, image=self._SequenceLink, anchor=NW)
+    if (len(self._sequenceModel) > 1):
+        canvasLink.pack(side= TOP, anchor= NW)
 
     # Create base frame
-    fBaseFrame = Frame(self._fDisplaySequence, style="fWidgetButton.TFrame")
+    fBaseFrame = Frame(fRow, style="fWidgetButton.TFrame")
     fBaseFrame.pack(side= TOP, padx= 5, pady= 5, anchor= W)
 
-    # Check which method should be added
-    if (strMethod == CA):
-        ButtonCA = Button(fBaseFrame, image=self._IconCA, command= lambda : 
-            self._clickSequenceMethod(BUTTON_SM_PARA_EC_CA, ButtonCA))        
-        ButtonCA.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-        self._SequenceList.append([ButtonCA, CA,[],[]])
-
-        TextCA = Label(fBaseFrame, text= "CA config", 
-            style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ)
-        TextCA.pack(side= LEFT, padx= 5, pady= 5)
-
-    elif (strMethod == LSV):
-        ButtonLSV = Button(fBaseFrame, image=self._IconLSV, command= lambda : 
-            self._clickSequenceMethod(BUTTON_SM_PARA_EC_LSV, ButtonLSV))        
-        ButtonLSV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-        self._SequenceList.append([ButtonLSV, LSV,[],[]])
-
-        TextLSV = Label(fBaseFrame, text= "LSV config", 
-            style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ)
-        TextLSV.pack(side= LEFT, padx= 5, pady= 5)
-
-    elif (strMethod == CV):
-        ButtonCV = Button(fBaseFrame, image=self._IconCV, command= lambda : 
-            self._clickSequenceMethod(BUTTON_SM_PARA_EC_CV, ButtonCV))        
-        ButtonCV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-        self._SequenceList.append([ButtonCV, CV,[],[]])
-
-        TextCV = Label(fBaseFrame, text= "CV config", 
-            style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ)
-        TextCV.pack(side= LEFT, padx= 5, pady= 5)
-
-    elif (strMethod == NPV):
-        ButtonNPV = Button(fBaseFrame, image=self._IconNPV, command= lambda : 
-            self._clickSequenceMethod(BUTTON_SM_PARA_EC_NPV, ButtonNPV))        
-        ButtonNPV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-        self._SequenceList.append([ButtonNPV, NPV,[],[]])
-
-        TextNPV = Label(fBaseFrame, text= "NPV config", 
-            style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ)
-        TextNPV.pack(side= LEFT, padx= 5, pady= 5)
-
-    elif (strMethod == DPV):
-        ButtonDPV = Button(fBaseFrame, image=self._IconDPV, command= lambda : 
-            self._clickSequenceMethod(BUTTON_SM_PARA_EC_DPV, ButtonDPV))        
-        ButtonDPV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-        self._SequenceList.append([ButtonDPV, DPV,[],[]])
-
-        TextDPV = Label(fBaseFrame, text= "DPV config", 
-            style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ)
-        TextDPV.pack(side= LEFT, padx= 5, pady= 5)
-
-    elif (strMethod == SWV):
-        ButtonSWV = Button(fBaseFrame, image=self._IconSWV, command= lambda : 
-            self._clickSequenceMethod(BUTTON_SM_PARA_EC_SWV, ButtonSWV))        
-        ButtonSWV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-        self._SequenceList.append([ButtonSWV, SWV,[],[]])
-        
-        TextSWV = Label(fBaseFrame, text= "SWV config", 
-            style= "fLabelGeneralBold.TLabel")
-        TextSWV.pack(side= LEFT, padx= 5, pady= 5)
+    definition = dic_methodRegistry[strMethod]
+
+    ButtonMethod = Button(fBaseFrame, image= getattr(self, definition.get_Icon()),
+        command= lambda : self._clickSequenceMethod(iStepID))        
+    ButtonMethod.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+    TextMethod = Label(fBaseFrame, text= strMethod + " config", 
+        style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ)
+    TextMethod.pack(side= LEFT, padx= 5, pady= 5)
 
     # Add frame displaying the used template
     fUsedTemplate = Frame(fBaseFrame, style="fWidgetButton.TFrame")
@@ -1668,9 +773,22 @@ def _update_CentralFrame_Sequence_Add(self, strMethod : str) -> None:
         style= "fLabelGeneralBold.TLabel", width= TEXTBOX_WIDTH_SEQ_NAME)
     TextTemplate.pack(side= TOP, padx= 5)
 
-    TextTemplate = Label(fUsedTemplate, text= "Undefined", 
+    TextTemplateName = Label(fUsedTemplate, text= "Undefined", 
         style= "fLabelGeneral.TLabel", width= TEXTBOX_WIDTH_SEQ_NAME)
-    TextTemplate.pack(side= TOP, padx= 5)
+    TextTemplateName.pack(side= TOP, padx= 5)
+
+    # Steps are dragged by everything except the button, which sets the focus
+    for widget in [fBaseFrame, TextMethod, fUsedTemplate, TextTemplate, 
+                   TextTemplateName]:
+        widget.bind("<ButtonPress-1>", lambda event, iStepID = iStepID : 
+            self._on_sequence_drag_start(event, iStepID))
+        widget.bind("<B1-Motion>", self._on_sequence_drag_motion)
+        widget.bind("<ButtonRelease-1>", self._on_sequence_drag_release)
+
+    self._dicSequenceRows[iStepID] = [fRow, canvasLink, fBaseFrame, 
+                                      TextTemplateName]
+
+    return iStepID
 
 def _update_CentralFrame_Sequence_Load(self) -> None:
     """
@@ -1680,9 +798,10 @@ def _update_CentralFrame_Sequence_Load(self) -> None:
     configuration.
         
     """   
-    # Reset sequence list
-    self._SequenceList = []
-    self._strFocusedFrame = None
+    # Reset sequence
+    self._sequenceModel.clear()
+    self._dicSequenceRows = {}
+    self._iFocusedStep = None
 
     # Temporary save experiment parameters
     listExperimentParameters : list = self._dataHandling.get_ExperimentParameters()
@@ -1696,18 +815,106 @@ def _update_CentralFrame_Sequence_Load(self) -> None:
     # Loop over all experiments in the sequence
     for iIndex in range(len(listExperimentParameters)):
         # Add method to the list
-        self._update_CentralFrame_Sequence_Add(listExperimentParameters[iIndex][0])
-        
+        iStepID : int = self._update_CentralFrame_Sequence_Add(
+            listExperimentParameters[iIndex][0])
+
+        if (iStepID is None):
+            break
+
+        # Save template name and experiment parameters of the method
+        self._sequenceModel.set_Template(iStepID, 
+            listExperimentParameters[iIndex][1], 
+            listExperimentParameters[iIndex][2])
+
         # Change text in widget to the template name
-        Widget.nametowidget(self._Root, self._SequenceList[iIndex][0].
-            winfo_parent() + ".!frame.!label2").configure(
+        self._dicSequenceRows[iStepID][3].configure(
             text = listExperimentParameters[iIndex][1])
+
+def _update_CentralFrame_Sequence_Move(self, iStepID : int, 
+                                       iIndex : int) -> None:
+    """
+    Description
+    -----------
+    Method for moving a step of the sequence to a new position. Only the row
+    of the moved step is repacked and the link arrows of the old and new first
+    step are updated.
+
+    Parameters
+    ----------
+    `iStepID` : int
+        ID of the step which should be moved
+
+    `iIndex` : int
+        New position of the step
         
-        # Save template name of methods in sequence
-        self._SequenceList[iIndex][2] = listExperimentParameters[iIndex][1]
+    """   
+    iOldIndex : int = self._sequenceModel.get_Index(iStepID)
+    iFirstStepID : int = self._sequenceModel.get_StepID(0)
+
+    iIndex = self._sequenceModel.move_Step(iStepID, iIndex)
+    if (iIndex == iOldIndex):
+        return
 
-        # Save experiment parameters
-        self._SequenceList[iIndex][3] = listExperimentParameters[iIndex][2]
+    # Repack the row in front of its new successor or behind its predecessor
+    fRow = self._dicSequenceRows[iStepID][0]
+    iNextStepID : int = self._sequenceModel.get_StepID(iIndex + 1)
+
+    if (iNextStepID is not None):
+        fRow.pack_configure(before= self._dicSequenceRows[iNextStepID][0])
+    else :
+        fRow.pack_configure(after= self._dicSequenceRows[
+            self._sequenceModel.get_StepID(iIndex - 1)][0])
+
+    self._update_CentralFrame_Sequence_Links(iFirstStepID)
+
+def _update_CentralFrame_Sequence_Delete(self, iStepID : int) -> None:
+    """
+    Description
+    -----------
+    Method for deleting a step of the sequence. Only the row of the deleted 
+    step is destroyed.
+
+    Parameters
+    ----------
+    `iStepID` : int
+        ID of the step which should be deleted
+        
+    """   
+    iFirstStepID : int = self._sequenceModel.get_StepID(0)
+
+    self._sequenceModel.remove_Step(iStepID)
+    self._dicSequenceRows.pop(iStepID)[0].destroy()
+
+    if (self._iFocusedStep == iStepID):
+        self._iFocusedStep = None
+
+    self._update_CentralFrame_Sequence_Links(iFirstStepID)
+
+def _update_CentralFrame_Sequence_Links(self, iFirstStepID : int) -> None:
+    """
+    Description
+    -----------
+    Method for updating the link arrows after the first step of the sequence
+    changed. The first step has no link arrow.
+
+    Parameters
+    ----------
+    `iFirstStepID` : int
+        ID of the step, which was the first step before the change
+        
+    """   
+    iNewFirstStepID : int = self._sequenceModel.get_StepID(0)
+    if (iNewFirstStepID == iFirstStepID):
+        return
+
+    # Show link arrow of the previous first step
+    if (iFirstStepID in self._dicSequenceRows):
+        listRow : list = self._dicSequenceRows[iFirstStepID]
+        listRow[1].pack(side= TOP, anchor= NW, before= listRow[2])
+
+    # Hide link arrow of the new first step
+    if (iNewFirstStepID is not None):
+        self._dicSequenceRows[iNewFirstStepID][1].pack_forget()
 
 def _valdiate_ArrayEntries(strInput : str, acttyp) -> bool:
     """
@@ -1781,4 +988,10 @@ def _valdiate_ValueEntriesPositive(strInput : str, acttyp) -> bool:
         if (not strInput.isdigit()):
             return False
 
-    return True
\ No newline at end of file
+    return True
+
+# Validation of the entries of the method parameters
+dic_entryValidation = {
+    VALIDATE_ARRAY      : _valdiate_ArrayEntries,
+    VALIDATE_VALUE      : _valdiate_ValueEntries,
+    VALIDATE_POSITIVE   : _valdiate_ValueEntriesPositive}
@@ -97,3 +97,71 @@ def _on_resize(self, event, canvas):
 
     # Scale the canvas
     canvas.scale("all", 0, 0, fscaleWidth, 1)
+
+def _on_sequence_drag_start(self, event, iStepID : int) -> None:
+    """
+    Description
+    -----------
+    Method implementing the start of dragging a step of the sequence.
+
+    Parameters
+    ----------
+    `event` : event
+        Event which should be handled
+
+    `iStepID` : int
+        ID of the step which is dragged
+
+    """
+    self._iDragStep = iStepID
+    self._fDisplaySequence.configure(cursor= "fleur")
+
+def _on_sequence_drag_motion(self, event) -> None:
+    """
+    Description
+    -----------
+    Method implementing the dragging of a step of the sequence. The step is
+    swapped with its neighbour, as soon as the mouse passes the middle of the
+    neighbouring row.
+
+    Parameters
+    ----------
+    `event` : event
+        Event which should be handled
+
+    """
+    if (self._iDragStep is None or 
+        self._sequenceModel.has_Step(self._iDragStep) == False):
+        return
+
+    iIndex : int = self._sequenceModel.get_Index(self._iDragStep)
+
+    # Check if the mouse passed the middle of the previous row
+    iNeighbourID : int = self._sequenceModel.get_StepID(iIndex - 1)
+    if (iNeighbourID is not None):
+        fRow = self._dicSequenceRows[iNeighbourID][0]
+        if (event.y_root < fRow.winfo_rooty() + fRow.winfo_height() / 2):
+            self._update_CentralFrame_Sequence_Move(self._iDragStep, iIndex - 1)
+            return
+
+    # Check if the mouse passed the middle of the next row
+    iNeighbourID = self._sequenceModel.get_StepID(iIndex + 1)
+    if (iNeighbourID is not None):
+        fRow = self._dicSequenceRows[iNeighbourID][0]
+        if (event.y_root > fRow.winfo_rooty() + fRow.winfo_height() / 2):
+            self._update_CentralFrame_Sequence_Move(self._iDragStep, iIndex + 1)
+
+def _on_sequence_drag_release(self, event) -> None:
+    """
+    Description
+    -----------
+    Method implementing the end of dragging a step of the sequence.
+
+    Parameters
+    ----------
+    `event` : event
+        Event which should be handled
+
+    """
+    self._iDragStep = None
+    self._fDisplaySequence.configure(cursor= "")
@@ -13,27 +13,28 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
+import os
+import time
+from functools import partial
 from tkinter import *
 from tkinter.ttk import *
 from FreiStat.Data_storage.constants import *
-from FreiStat.Methods.run_electrochemical_method import Run_Electrochemical_Method
-from FreiStat.Methods.run_chronoamperometry import Run_CA
-from FreiStat.Methods.run_linear_sweep_voltammetry import Run_LSV
-from FreiStat.Methods.run_cyclic_voltammetry import Run_CV
-from FreiStat.Methods.run_normal_pulse_voltammetry import Run_NPV
-from FreiStat.Methods.run_differential_pulse_voltammetry import Run_DPV
-from FreiStat.Methods.run_square_wave_voltammetry import Run_SWV
-from FreiStat.Methods.run_sequence import Run_Sequence
-
-from matplotlib import pyplot as plt
-from matplotlib.figure import SubplotParams
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-import matplotlib
-matplotlib.use('TkAgg')
+
+# The facades of the FreiStat library and matplotlib are imported on first use
+# inside the methods, see `_warmUpImports`
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
+from ..Data_Storage.data_drain import DataDrain
+from ..Data_Storage.measurement_storage import MeasurementStorage
+from ..Data_Storage.run_recording import RunRecorder
+from ..Utility.decimation import DecimatedAxes
+from ..Utility.deferred_import import _warmUp_Imports
+from ..Utility.experiment_facades import _create_FacadeSettings
+from ..Utility.experiment_facades import _get_ParameterValue
+from ..Utility.experiment_facades import _start_SingleMethod
+from ..Utility.experiment_facades import _start_Sequence
+from ..Utility.simulated_device import SimulatedDevice
 
 def _executeExperiment(self) -> None:
     """
@@ -43,9 +44,6 @@ def _executeExperiment(self) -> None:
     the chosen experiment parameters
     
     """
-    # Clear central frame
-    self._clearFrame(self._fCentralFrame)
-
     if (self._dataHandling.get_ExperimentType() == SEQUENCE):
         # Execute the sequence
         self._executeSequence()
@@ -53,6 +51,33 @@ def _executeExperiment(self) -> None:
         # Execute in single mode
         self._executeSingleMethod()
 
+def _rejectExperiment(self, error : ValueError) -> None:
+    """
+    Description
+    -----------
+    Method called if the experiment parameters are rejected before the
+    experiment is started. The error is logged and the interface returns to 
+    the idle status.
+
+    Parameters
+    ----------
+    `error` : ValueError
+        Error raised while creating the experiment
+
+    """
+    self._logger.warning("Experiment not started: " + str(error))
+    self._process = None
+
+    # Restore the idle status
+    self._iSystemStatus = FS_WAITING
+    self._strInfo.set(self._decodeSystemStatus(self._iSystemStatus))
+    self._TextInfo.configure(style= "fLabelGeneralBoldGrey.TLabel")
+
+    # Enable start button and disable stop / live feed button
+    self._ButtonStart["state"] = NORMAL
+    self._ButtonStop["state"] = DISABLED
+    self._ButtonLiveFeed["state"] = DISABLED
+
 def _executeSingleMethod(self) -> None:
     """
     Description
@@ -61,233 +86,45 @@ def _executeSingleMethod(self) -> None:
     experiment parameters
     
     """
+    # Import on first use, usually already done by `_warmUpImports`
+    from ..Utility.live_plot import LivePlotCanvas, Toolbar
+
     # Initialize variables
-    iCommunicationMode : int
+    strMethod : str = self._dataHandling.get_ExperimentType()
+    bSimulation : bool = self._iSimulation.get() == True
+    Facade = None
 
-    listExperimentParameters : list = []
+    # Temporary store experiment paramters
+    listExperimentParameters : list = \
+        self._dataHandling.get_ExperimentParameters()
 
-    if (self._iWLANMode.get() == True):
-        iCommunicationMode = FREISTAT_WLAN
-    else :
-        iCommunicationMode = FREISTAT_SERIAL
-
-    RunEcMethod : Run_Electrochemical_Method = None
-
-    # Check which experiment should be executed
-    if (self._dataHandling.get_ExperimentType() == CA):
-        # Temporary store experiment paramters
-        listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-        # Save low performance mode
-        self._bLowPerformanceMode = listExperimentParameters[9][1]
-
-        # Run chronoamperometry on FreiStat
-        RunEcMethod = Run_CA(logger= self._logger, mode= FREISTAT_BACKEND, 
-                             commnicationMode= iCommunicationMode, 
-                             wlanSetting=[self._strServerIP.get(),
-                                          int(self._strServerPort.get()),
-                                          self._strClientIP.get(),
-                                          int(self._strClientPort.get())])
-        self._EcMethod = RunEcMethod
-        
-        RunEcMethod.start(Potential_Steps= listExperimentParameters[0][1], 
-                          Pulse_Lengths= listExperimentParameters[1][1],
-                          Sampling_Rate= listExperimentParameters[2][1],
-                          Cycle= listExperimentParameters[3][1],
-                          CurrentRange= listExperimentParameters[4][1],
-                          MainsFilter = listExperimentParameters[5][1],
-                          Sinc2_Oversampling = listExperimentParameters[6][1],
-                          Sinc3_Oversampling = listExperimentParameters[7][1],
-                          EnableOptimizer= listExperimentParameters[8][1],
-                          LowPerformanceMode= listExperimentParameters[9][1])
-
-        if (listExperimentParameters[8][1] == True):
-            self._dataHandling.save_ExperimentParmeters(
-                self._decodeOptimizerParameters(
-                    RunEcMethod._listExperimentParameters))
-            self._update_PrameterbandFrame(self._fParameterBand)
-
-    elif (self._dataHandling.get_ExperimentType() == LSV):
-        # Temporary store experiment paramters
-        listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-        # Save low performance mode
-        self._bLowPerformanceMode = listExperimentParameters[11][1]
-
-        # Run linear sweep voltammetry on FreiStat
-        RunEcMethod = Run_LSV(logger= self._logger, mode= FREISTAT_BACKEND, 
-                              commnicationMode= iCommunicationMode, 
-                              wlanSetting=[self._strServerIP.get(),
-                                           int(self._strServerPort.get()),
-                                           self._strClientIP.get(),
-                                           int(self._strClientPort.get())])
-        self._EcMethod = RunEcMethod
-
-        RunEcMethod.start(StartVoltage= listExperimentParameters[0][1], 
-                          StopVoltage= listExperimentParameters[1][1],
-                          Stepsize= listExperimentParameters[2][1],
-                          Scanrate= listExperimentParameters[3][1],
-                          Cycle= listExperimentParameters[4][1],
-                          CurrentRange= listExperimentParameters[5][1],
-                          FixedWEPotential= listExperimentParameters[6][1],
-                          MainsFilter = listExperimentParameters[7][1],
-                          Sinc2_Oversampling = listExperimentParameters[8][1],
-                          Sinc3_Oversampling = listExperimentParameters[9][1],
-                          EnableOptimizer= listExperimentParameters[10][1],
-                          LowPerformanceMode= listExperimentParameters[11][1])
-
-        if (listExperimentParameters[10][1] == True):
-            self._dataHandling.save_ExperimentParmeters(
-                self._decodeOptimizerParameters(
-                    RunEcMethod._listExperimentParameters))
-            self._update_PrameterbandFrame(self._fParameterBand)
-
-    elif (self._dataHandling.get_ExperimentType() == CV):
-        # Temporary store experiment paramters
-        listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-        # Save low performance mode
-        self._bLowPerformanceMode = listExperimentParameters[12][1]
-
-        # Run cyclic voltammetry on FreiStat
-        RunEcMethod = Run_CV(logger= self._logger, mode= FREISTAT_BACKEND, 
-                             commnicationMode= iCommunicationMode, 
-                             wlanSetting=[self._strServerIP.get(),
-                                          int(self._strServerPort.get()),
-                                          self._strClientIP.get(),
-                                          int(self._strClientPort.get())])
-        self._EcMethod = RunEcMethod
-
-        RunEcMethod.start(StartVoltage= listExperimentParameters[0][1], 
-                          SecondVertex= listExperimentParameters[1][1],
-                          FirstVertex= listExperimentParameters[2][1],
-                          Stepsize= listExperimentParameters[3][1],
-                          Scanrate= listExperimentParameters[4][1],
-                          Cycle= listExperimentParameters[5][1],
-                          CurrentRange= listExperimentParameters[6][1],
-                          FixedWEPotential= listExperimentParameters[7][1],
-                          MainsFilter = listExperimentParameters[8][1],
-                          Sinc2_Oversampling = listExperimentParameters[9][1],
-                          Sinc3_Oversampling = listExperimentParameters[10][1],
-                          EnableOptimizer= listExperimentParameters[11][1],
-                          LowPerformanceMode= listExperimentParameters[12][1])
-
-        if (listExperimentParameters[11][1] == True):
-            self._dataHandling.save_ExperimentParmeters(
-                self._decodeOptimizerParameters(
-                    RunEcMethod._listExperimentParameters))
-            self._update_PrameterbandFrame(self._fParameterBand)
-
-    elif (self._dataHandling.get_ExperimentType() == NPV):
-        # Temporary store experiment paramters
-        listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-        # Save low performance mode
-        self._bLowPerformanceMode = listExperimentParameters[13][1]
-
-        # Run normal pulse voltammetry on FreiStat
-        RunEcMethod = Run_NPV(logger= self._logger, mode= FREISTAT_BACKEND, 
-                              commnicationMode= iCommunicationMode, 
-                              wlanSetting=[self._strServerIP.get(),
-                                           int(self._strServerPort.get()),
-                                           self._strClientIP.get(),
-                                           int(self._strClientPort.get())])
-        self._EcMethod = RunEcMethod
-        
-        RunEcMethod.start(BaseVoltage= listExperimentParameters[0][1],
-                          StartVoltage= listExperimentParameters[1][1], 
-                          StopVoltage= listExperimentParameters[2][1],
-                          DeltaV_Staircase= listExperimentParameters[3][1],
-                          Pulse_Lengths= listExperimentParameters[4][1],
-                          Sampling_Duration= listExperimentParameters[5][1],
-                          Cycle= listExperimentParameters[6][1],
-                          CurrentRange= listExperimentParameters[7][1],
-                          FixedWEPotential= listExperimentParameters[8][1],
-                          MainsFilter = listExperimentParameters[9][1],
-                          Sinc2_Oversampling = listExperimentParameters[10][1],
-                          Sinc3_Oversampling = listExperimentParameters[11][1],
-                          EnableOptimizer= listExperimentParameters[12][1],
-                          LowPerformanceMode= listExperimentParameters[13][1])
-
-        if (listExperimentParameters[12][1] == True):
-            self._dataHandling.save_ExperimentParmeters(
-                self._decodeOptimizerParameters(
-                    RunEcMethod._listExperimentParameters))
-            self._update_PrameterbandFrame(self._fParameterBand)
-
-    elif (self._dataHandling.get_ExperimentType() == DPV):
-        # Temporary store experiment paramters
-        listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-        # Save low performance mode
-        self._bLowPerformanceMode = listExperimentParameters[13][1]
-
-        # Run differential pulse voltammetry on FreiStat
-        RunEcMethod = Run_DPV(logger= self._logger, mode= FREISTAT_BACKEND, 
-                              commnicationMode= iCommunicationMode, 
-                              wlanSetting=[self._strServerIP.get(),
-                                           int(self._strServerPort.get()),
-                                           self._strClientIP.get(),
-                                           int(self._strClientPort.get())])
-        self._EcMethod = RunEcMethod
-        
-        RunEcMethod.start(StartVoltage= listExperimentParameters[0][1], 
-                          StopVoltage= listExperimentParameters[1][1],
-                          DeltaV_Staircase= listExperimentParameters[2][1],
-                          DeltaV_Peak= listExperimentParameters[3][1],
-                          Pulse_Lengths= listExperimentParameters[4][1],
-                          Sampling_Duration= listExperimentParameters[5][1],
-                          Cycle= listExperimentParameters[6][1],
-                          CurrentRange= listExperimentParameters[7][1],
-                          FixedWEPotential= listExperimentParameters[8][1],
-                          MainsFilter = listExperimentParameters[9][1],
-                          Sinc2_Oversampling = listExperimentParameters[10][1],
-                          Sinc3_Oversampling = listExperimentParameters[11][1],
-                          EnableOptimizer= listExperimentParameters[12][1],
-                          LowPerformanceMode= listExperimentParameters[13][1])
-
-        if (listExperimentParameters[12][1] == True):
-            self._dataHandling.save_ExperimentParmeters(
-                self._decodeOptimizerParameters(
-                    RunEcMethod._listExperimentParameters))
-            self._update_PrameterbandFrame(self._fParameterBand)
-
-    elif (self._dataHandling.get_ExperimentType() == SWV):
-        # Temporary store experiment paramters
-        listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-        # Save low performance mode
-        self._bLowPerformanceMode = listExperimentParameters[13][1]
-
-        # Run square wave voltammetry on FreiStat
-        RunEcMethod = Run_SWV(logger= self._logger, mode= FREISTAT_BACKEND, 
-                              commnicationMode= iCommunicationMode, 
-                              wlanSetting=[self._strServerIP.get(),
-                                           int(self._strServerPort.get()),
-                                           self._strClientIP.get(),
-                                           int(self._strClientPort.get())])
-        self._EcMethod = RunEcMethod
-
-        RunEcMethod.start(StartVoltage= listExperimentParameters[0][1], 
-                          StopVoltage= listExperimentParameters[1][1],
-                          DeltaV_Staircase= listExperimentParameters[2][1],
-                          DeltaV_Peak= listExperimentParameters[3][1],
-                          DutyCycle= listExperimentParameters[4][1],
-                          Sampling_Duration= listExperimentParameters[5][1],
-                          Cycle= listExperimentParameters[6][1],
-                          CurrentRange= listExperimentParameters[7][1],
-                          FixedWEPotential= listExperimentParameters[8][1],
-                          MainsFilter = listExperimentParameters[9][1],
-                          Sinc2_Oversampling = listExperimentParameters[10][1],
-                          Sinc3_Oversampling = listExperimentParameters[11][1],
-                          EnableOptimizer= listExperimentParameters[12][1],
-                          LowPerformanceMode= listExperimentParameters[13][1])
-
-        if (listExperimentParameters[12][1] == True):
-            self._dataHandling.save_ExperimentParmeters(
-                self._decodeOptimizerParameters(
+    # Save low performance mode
+    self._bLowPerformanceMode = _get_ParameterValue(listExperimentParameters,
+                                                    LOW_PERFORMANCE_MODE)
+
+    try:
+        # Replace the facade by the simulated device, which has no optimizer
+        if (bSimulation == True):
+            Facade = self._createSimulatedDevice(strMethod)
+
+        # Run the electrochemical method on FreiStat
+        RunEcMethod = _start_SingleMethod(strMethod, listExperimentParameters,
+            self._getFacadeSettings(), Facade)
+    except ValueError as error:
+        self._rejectExperiment(error)
+        return
+
+    self._EcMethod = RunEcMethod
+
+    # Clear central frame once the experiment is started
+    self._clearFrame(self._fCentralFrame)
+
+    if (_get_ParameterValue(listExperimentParameters, ENABLE_OPTIMIZER) == True
+        and bSimulation == False):
+        self._dataHandling.save_ExperimentParmeters(
+            self._decodeOptimizerParameters(
                 RunEcMethod._listExperimentParameters))
-            self._update_PrameterbandFrame(self._fParameterBand)
+        self._update_PrameterbandFrame(self._fParameterBand)
 
     # Save reference of the plotter
     self._plotter = RunEcMethod.get_plotter()
@@ -300,6 +137,9 @@ def _executeSingleMethod(self) -> None:
 
     # Save reference of the data queue to prevent garbage collection
     self._dataQueue = RunEcMethod.get_dataQueue()
+
+    # Drain the data queue into the measurement storage
+    self._startDataDrain(self._dataQueue)
     
     # Resize figure
     iDpi = self._fCentralFrame.winfo_fpixels('3c')
@@ -310,7 +150,9 @@ def _executeSingleMethod(self) -> None:
     # Draw frame of the figure
     self._fLiveFeed = Frame(self._fCentralFrame, style="fCentralFrame.TFrame")
     self._fLiveFeed.pack(fill= 'both', side=TOP, expand=TRUE, padx= 2, pady= 2)
-    self._canvas = FigureCanvasTkAgg(self._fig, master= self._fLiveFeed)
+    self._strFPS.set("")
+    self._canvas = LivePlotCanvas(self._fig, master= self._fLiveFeed, 
+                                  strFPS= self._strFPS)
     self._canvas.get_tk_widget().pack(side= TOP, expand= TRUE)
     self._canvas.draw()
 
@@ -326,11 +168,12 @@ def _executeSingleMethod(self) -> None:
     
     # Call animate function of plotter
     if (self._bLowPerformanceMode == False):
-        self._plotter.T_Animate(self._dataQueue)
+        self._plotter.T_Animate(self._dataDrain.get_ForwardQueue())
         self._animate = self._plotter.get_animate()
         self._canvas.draw()
     else :
-        self._plotter.T_Print(self._strGLpmLatency.get(), self._dataQueue)
+        self._plotter.T_Print(self._strGLpmLatency.get(), 
+                              self._dataDrain.get_ForwardQueue())
         self._animate = self._plotter.get_animate()
 
     # Update frame
@@ -344,138 +187,35 @@ def _executeSequence(self) -> None:
     experiment parameters
     
     """
-    # Initialize variabels
-    bEnableOptimizer : bool = False
-    bLowPerformanceMode : bool = False
-    iCommunicationMode : int
-    self._listCanvas = []
-    
-    if (self._iWLANMode.get() == True):
-        iCommunicationMode = FREISTAT_WLAN
-    else :
-        iCommunicationMode = FREISTAT_SERIAL
+    # Import on first use, usually already done by `_warmUpImports`
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from ..Utility.live_plot import Toolbar
 
+    # Initialize variabels
+    Facade = None
+    self._iPlotIDprevious = None
+    self._listRunMethods = None
+    self._listSequenceMethods = [listMethod[0] for listMethod in 
+                                 self._dataHandling.get_ExperimentParameters()]
+
+    try:
+        # Replace the facade by the simulated device
+        if (self._iSimulation.get() == True):
+            Facade = self._createSimulatedDevice(SEQUENCE)
+
+        # Create the sequence and start it
+        RunEcMethod2 = _start_Sequence(
+            self._dataHandling.get_ExperimentParameters(),
+            self._dataHandling.get_SequenceCycles(), self._getFacadeSettings(),
+            Facade)
+    except ValueError as error:
+        self._rejectExperiment(error)
+        return
 
-    # Temporary store experiment paramters
-    listExperimentParameters = self._dataHandling.get_ExperimentParameters()
-
-    # Check if the optimizer and the low performance mode should be enabled
-    # Loop over the experiment parameter list
-    for iIndex in range(len(listExperimentParameters)):
-        # Loop over the experiment parameters in each method
-        for iParameter in range(len(listExperimentParameters[iIndex][2])):
-            if (listExperimentParameters[iIndex][2][iParameter][0] ==
-                ENABLE_OPTIMIZER):
-                
-                # Check if the optimizer of one method is enabled
-                if (listExperimentParameters[iIndex][2][iParameter][1] == True):
-                    bEnableOptimizer = True
-
-            if (listExperimentParameters[iIndex][2][iParameter][0] ==
-                LOW_PERFORMANCE_MODE):
-                
-                # Check if the optimizer of one method is enabled
-                if (listExperimentParameters[iIndex][2][iParameter][1] == True):
-                    bLowPerformanceMode = True
-
-    # Create a sequence object
-    RunEcMethod2 = Run_Sequence(EnableOptimizer= bEnableOptimizer, 
-                               logger=self._logger, mode= FREISTAT_BACKEND, 
-                               commnicationMode= iCommunicationMode, 
-                               wlanSetting=[self._strServerIP.get(),
-                                            int(self._strServerPort.get()),
-                                            self._strClientIP.get(),
-                                            int(self._strClientPort.get())])
     self._EcMethod = RunEcMethod2
 
-    # Add methods to the sequence
-    for iMethod in range(len(listExperimentParameters)):
-        if (listExperimentParameters[iMethod][0] == CA):
-            RunEcMethod2.add_CA(
-                Potential_Steps= listExperimentParameters[iMethod][2][0][1], 
-                Pulse_Lengths= listExperimentParameters[iMethod][2][1][1],
-                Sampling_Rate= listExperimentParameters[iMethod][2][2][1],
-                Cycle= listExperimentParameters[iMethod][2][3][1],
-                CurrentRange= listExperimentParameters[iMethod][2][4][1],
-                MainsFilter = listExperimentParameters[iMethod][2][5][1],
-                Sinc2_Oversampling = listExperimentParameters[iMethod][2][6][1],
-                Sinc3_Oversampling = listExperimentParameters[iMethod][2][7][1])
-
-        elif (listExperimentParameters[iMethod][0] == LSV):
-            RunEcMethod2.add_LSV(
-                StartVoltage= listExperimentParameters[iMethod][2][0][1], 
-                StopVoltage= listExperimentParameters[iMethod][2][1][1],
-                Stepsize= listExperimentParameters[iMethod][2][2][1],
-                Scanrate= listExperimentParameters[iMethod][2][3][1],
-                Cycle= listExperimentParameters[iMethod][2][4][1],
-                CurrentRange= listExperimentParameters[iMethod][2][5][1],
-                FixedWEPotential= listExperimentParameters[iMethod][2][6][1],
-                MainsFilter = listExperimentParameters[iMethod][2][7][1],
-                Sinc2_Oversampling = listExperimentParameters[iMethod][2][8][1],
-                Sinc3_Oversampling = listExperimentParameters[iMethod][2][9][1])
-
-        elif (listExperimentParameters[iMethod][0] == CV):
-            RunEcMethod2.add_CV(
-                StartVoltage= listExperimentParameters[iMethod][2][0][1], 
-                SecondVertex= listExperimentParameters[iMethod][2][1][1],
-                FirstVertex= listExperimentParameters[iMethod][2][2][1],
-                Stepsize= listExperimentParameters[iMethod][2][3][1],
-                Scanrate= listExperimentParameters[iMethod][2][4][1],
-                Cycle= listExperimentParameters[iMethod][2][5][1],
-                CurrentRange= listExperimentParameters[iMethod][2][6][1],
-                FixedWEPotential= listExperimentParameters[iMethod][2][7][1],
-                MainsFilter = listExperimentParameters[iMethod][2][8][1],
-                Sinc2_Oversampling = listExperimentParameters[iMethod][2][9][1],
-                Sinc3_Oversampling = listExperimentParameters[iMethod][2][10][1])
-
-        elif (listExperimentParameters[iMethod][0] == NPV):
-            RunEcMethod2.add_NPV(
-                BaseVoltage= listExperimentParameters[iMethod][2][0][1],
-                StartVoltage= listExperimentParameters[iMethod][2][1][1], 
-                StopVoltage= listExperimentParameters[iMethod][2][2][1],
-                DeltaV_Staircase= listExperimentParameters[iMethod][2][3][1],
-                Pulse_Lengths= listExperimentParameters[iMethod][2][4][1],
-                Sampling_Duration= listExperimentParameters[iMethod][2][5][1],
-                Cycle= listExperimentParameters[iMethod][2][6][1],
-                CurrentRange= listExperimentParameters[iMethod][2][7][1],
-                FixedWEPotential= listExperimentParameters[iMethod][2][8][1],
-                MainsFilter = listExperimentParameters[iMethod][2][9][1],
-                Sinc2_Oversampling = listExperimentParameters[iMethod][2][10][1],
-                Sinc3_Oversampling = listExperimentParameters[iMethod][2][11][1])
-
-        elif (listExperimentParameters[iMethod][0] == DPV):
-            RunEcMethod2.add_DPV(
-                StartVoltage= listExperimentParameters[iMethod][2][0][1], 
-                StopVoltage= listExperimentParameters[iMethod][2][1][1],
-                DeltaV_Staircase= listExperimentParameters[iMethod][2][2][1],
-                DeltaV_Peak= listExperimentParameters[iMethod][2][3][1],
-                Pulse_Lengths= listExperimentParameters[iMethod][2][4][1],
-                Sampling_Duration= listExperimentParameters[iMethod][2][5][1],
-                Cycle= listExperimentParameters[iMethod][2][6][1],
-                CurrentRange= listExperimentParameters[iMethod][2][7][1],
-                FixedWEPotential= listExperimentParameters[iMethod][2][8][1],
-                MainsFilter = listExperimentParameters[iMethod][2][9][1],
-                Sinc2_Oversampling = listExperimentParameters[iMethod][2][10][1],
-                Sinc3_Oversampling = listExperimentParameters[iMethod][2][11][1])
-
-        elif (listExperimentParameters[iMethod][0] == SWV):
-            RunEcMethod2.add_SWV(
-                StartVoltage= listExperimentParameters[iMethod][2][0][1], 
-                StopVoltage= listExperimentParameters[iMethod][2][1][1],
-                DeltaV_Staircase= listExperimentParameters[iMethod][2][2][1],
-                DeltaV_Peak= listExperimentParameters[iMethod][2][3][1],
-                DutyCycle= listExperimentParameters[iMethod][2][4][1],
-                Sampling_Duration= listExperimentParameters[iMethod][2][5][1],
-                Cycle= listExperimentParameters[iMethod][2][6][1],
-                CurrentRange= listExperimentParameters[iMethod][2][7][1],
-                FixedWEPotential= listExperimentParameters[iMethod][2][8][1],
-                MainsFilter = listExperimentParameters[iMethod][2][9][1],
-                Sinc2_Oversampling = listExperimentParameters[iMethod][2][10][1],
-                Sinc3_Oversampling = listExperimentParameters[iMethod][2][11][1])
-
-    # Start the sequence
-    RunEcMethod2.start(SequenceCycles= self._dataHandling.get_SequenceCycles(),
-                      LowPerformanceMode= bLowPerformanceMode)
+    # Clear central frame once the experiment is started
+    self._clearFrame(self._fCentralFrame)
 
     # Save reference of the plotter
     self._plotter = RunEcMethod2.get_plotter()
@@ -492,6 +232,9 @@ def _executeSequence(self) -> None:
     # Save reference of the data queue to prevent garbage collection
     self._dataQueue = RunEcMethod2.get_dataQueue()
 
+    # Drain the data queue into the measurement storage
+    self._startDataDrain(self._dataQueue)
+
     # Resize figure
     iDpi = self._fCentralFrame.winfo_fpixels('3c')
     self._fig.set_size_inches(self._fCentralFrame.winfo_width() / iDpi, 
@@ -512,32 +255,95 @@ def _executeSequence(self) -> None:
     toolbar.config(background= "white")
     toolbar._message_label.config(background= "white", font= "Arial 10 bold")
 
-    # Draw frame of the figure
-    self._fStaticPlot = Frame(self._fCentralFrame, style="fCentralFrame.TFrame")
-    self._fStaticPlot.pack(fill= 'both', side=TOP, expand=TRUE, padx= 2, pady= 2)
+    # Show a thumbnail for each plot, the static plot is created on the first
+    # click onto a thumbnail
+    self._thumbnailStrip.set_Figures(self._listFigures)
 
-    # Create canvas for each plot
-    for iIndex in range(len(self._listFigures)):
-        # Resize figure
-        iDpi = self._fPlotFrame.winfo_fpixels('3c')
+    self._plotter.set_listBox(self._TextTerminal)
+    self._plotter.set_progressBar(self._ProgressBar)
 
-        self._listFigures[iIndex].set_size_inches(
-            self._fPlotFrameHeight / iDpi * 1.2, 
-            self._fPlotFrameHeight / iDpi, forward=True)
+    # Call animate function of plotter
+    self._plotter.T_Animate(self._dataDrain.get_ForwardQueue())
+    self._animate = self._plotter.get_animate()
+    self._canvas.draw()
+
+    # Update frame
+    self._fLiveFeed.update()
 
-        # Draw frame of the figure
-        self._listCanvas.append(FigureCanvasTkAgg(self._listFigures[iIndex], 
-                                                  master= self._fPlotFrame))
-        self._listCanvas[iIndex].get_tk_widget().pack(side= LEFT, 
-            anchor= N, padx = 5)
-        self._listCanvas[iIndex].mpl_connect("button_press_event", lambda event, 
-            iPlotID = iIndex: self._on_mouse_press(event, iPlotID))
-        self._listCanvas[iIndex].draw()
+def _getFacadeSettings(self) -> dict:
+    """
+    Description
+    -----------
+    Helper method creating the keyword arguments of the facades of the Python
+    library from the communication settings in the preferences.
+
+    Return
+    ------
+    `dicSettings` : dict
+        Keyword arguments of the facades
+
+    """
+    return _create_FacadeSettings(self._logger, self._iWLANMode.get() == True,
+        [self._strServerIP.get(), self._strServerPort.get(),
+         self._strClientIP.get(), self._strClientPort.get()])
+
+def _createSimulatedDevice(self, strMethod : str):
+    """
+    Description
+    -----------
+    Helper method creating a replacement of a facade of the Python library,
+    which runs the experiment on the simulated device with the sample rate
+    factor and noise set in the preferences.
+
+    Parameters
+    ----------
+    `strMethod` : string
+        Electrochemical method of the facade (`SEQUENCE` for the sequence mode)
+
+    Return
+    ------
+    `funcFacade` : function
+        Function taking the arguments of the facade and returning a
+        SimulatedDevice
+
+    """
+    try:
+        fRateFactor : float = float(self._strSimulationRate.get())
+    except ValueError:
+        fRateFactor : float = float(SET_SIMULATION_RATE_VALUE)
+
+    try:
+        fNoise : float = float(self._strSimulationNoise.get())
+    except ValueError:
+        fNoise : float = float(SET_SIMULATION_NOISE_VALUE)
+
+    return partial(SimulatedDevice, strMethod, fRateFactor, fNoise)
+
+def _create_StaticPlot(self) -> None:
+    """
+    Description
+    -----------
+    Method creating the static plot in the central frame, in which stored data
+    is displayed (e.g. a plot of the plot band or a recorded run). The data is 
+    decimated to the screen resolution.
+    
+    """
+    # Import on first use, usually already done by `_warmUpImports`
+    from matplotlib.figure import Figure, SubplotParams
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from ..Utility.live_plot import Toolbar
+
+    # Draw frame of the figure
+    self._fStaticPlot = Frame(self._fCentralFrame, style="fCentralFrame.TFrame")
+    self._fStaticPlot.pack(fill= 'both', side=TOP, expand=TRUE, padx= 2, pady= 2)
 
     # Create one central plot
+    iDpi = self._fCentralFrame.winfo_fpixels('3c')
+
     subplotParams = SubplotParams(top= 0.95, right= 0.75)
-    self._figureStatic, (self._axesStatic) = plt.subplots(1, 1,
-                                        subplotpars= subplotParams)
+    # Not registered in pyplot, so the figure is freed with the frame
+    self._figureStatic = Figure(subplotpars= subplotParams)
+    self._axesStatic = self._figureStatic.add_subplot(1, 1, 1)
     self._figureStatic.set_size_inches(self._fCentralFrame.winfo_width() / iDpi, 
                                        self._fCentralFrame.winfo_height()/ iDpi, 
                                        forward=True)
@@ -548,6 +354,8 @@ def _executeSequence(self) -> None:
     self._canvasStatic.get_tk_widget().pack(side= TOP, expand= TRUE)
     self._canvasStatic.draw()
 
+    # Decimate static plot to the screen resolution
+    self._decimatedStatic = DecimatedAxes(self._axesStatic)
 
     # Create the toolbar
     self._toolbarFrameStatic = Frame(master= self._fStaticPlot)
@@ -555,29 +363,107 @@ def _executeSequence(self) -> None:
     toolbarStatic.config(background= "white")
     toolbarStatic._message_label.config(background= "white", font= "Arial 10 bold")
 
-    self._fStaticPlot.pack_forget()
+def _startDataDrain(self, dataQueue) -> None:
+    """
+    Description
+    -----------
+    Method starting a thread, which drains the data queue of the experiment
+    process into a new measurement storage of the current data object and into
+    a new recording. The plotter reads the drained records from the forward
+    queue of the thread.
+
+    Parameters
+    ----------
+    `dataQueue` : Queue
+        Data queue filled by the experiment process
 
-    self._plotter.set_listBox(self._TextTerminal)
-    self._plotter.set_progressBar(self._ProgressBar)
+    """
+    # Stop thread of the previous experiment
+    self._stopDataDrain()
+
+    # Reference is kept for the static plot, since the current data object
+    # changes when another template is selected
+    self._measurementStorage = MeasurementStorage()
+    self._dataHandling.set_StoredData(self._measurementStorage)
+
+    # Stream the measurement data into a new recording
+    os.makedirs(self._strOsPathRecordings, exist_ok= True)
+    strFilePath : str = os.path.join(self._strOsPathRecordings, 
+        time.strftime("%Y%m%d_%H%M%S_") + 
+        self._dataHandling.get_ExperimentType() + RR_FILE_EXTENSION)
+
+    self._runRecorder = RunRecorder(strFilePath, {
+        "ExperimentType" : self._dataHandling.get_ExperimentType(),
+        "TemplateName" : self._dataHandling.get_TemplateName(),
+        "ExperimentParameters" : 
+            self._dataHandling.get_ExperimentParameters(),
+        "Created" : time.strftime("%Y-%m-%d %H:%M:%S")})
+    self._runRecorder.start()
+
+    self._dataDrain = DataDrain(dataQueue, self._measurementStorage, 
+                                self._runRecorder, logger= self._logger)
+    self._dataDrain.start()
+
+def _stopDataDrain(self) -> None:
+    """
+    Description
+    -----------
+    Method stopping the thread draining the data queue, after the remaining
+    records are stored, and completing the recording.
 
-    # Call animate function of plotter
-    self._plotter.T_Animate(self._dataQueue)
-    self._animate = self._plotter.get_animate()
-    self._canvas.draw()
+    """
+    if (self._dataDrain is not None):
+        self._dataDrain.stop()
+
+        if (self._dataDrain.get_SkippedRecords() > 0):
+            self._logger.warning(str(self._dataDrain.get_SkippedRecords()) + 
+                " records of the data queue were not stored.")
+        if (self._dataDrain.get_DroppedRecords() > 0):
+            self._logger.info(str(self._dataDrain.get_DroppedRecords()) + 
+                " records were not shown in the live feed, since the plot " +
+                "didn't keep up. The recording is complete.")
+        self._dataDrain = None
+
+    # Complete the recording after the last batch was handed over
+    if (self._runRecorder is not None):
+        self._runRecorder.stop()
+        self._logger.info("Measurement data saved in " + 
+                          self._runRecorder.get_FilePath())
+        self._runRecorder = None
+
+def _warmUpImports(self) -> None:
+    """
+    Description
+    -----------
+    Method called once the window is shown. The facades of the FreiStat library
+    and matplotlib are imported in a background thread after
+    `DEFERRED_IMPORT_DELAY`, so that they are available when the first
+    experiment is started or the first plot is opened.
 
-    # Update frame
-    self._fLiveFeed.update()
+    """
+    if (self._startupProfile is not None):
+        self._startupProfile.mark("Window shown")
+        self._startupProfile.print_Report("Startup")
+
+    self._Root.after(DEFERRED_IMPORT_DELAY, 
+                     lambda: _warmUp_Imports(self._onDeferredImports))
 
-class Toolbar(NavigationToolbar2Tk): 
+def _onDeferredImports(self, listErrors : list) -> None:
     """
     Description
     -----------
-    Custom class overwriting the default matplotlib plot toolbar.
-    
+    Method called from the import thread, when the deferred imports are done.
+
+    Parameters
+    ----------
+    `listErrors` : list
+        List containing [module name, error message] for every failed import
+
     """
-    def __init__(self, plotCanvas, frame):
-        # Create the default toolbar
-        NavigationToolbar2Tk.__init__(self, plotCanvas, frame)
+    for strModule, strError in listErrors:
+        self._logger.warning("Import of " + strModule + " failed: " + strError)
 
-        # Remove the button to reconfig the subplots
-        self.children['!button4'].pack_forget() 
\ No newline at end of file
+    if (self._startupProfile is not None):
+        self._startupProfile.mark("Deferred imports")
+        self._startupProfile.print_Report("Deferred imports (background)")
+        self._startupProfile.stop()
@@ -82,6 +82,10 @@ def _create_MenubandFrame(self, parentFrame: Frame) -> None:
                      relief= SUNKEN)
     self._TextInfo.pack(side= TOP, padx= 5, pady= 5)
 
+    TextFPS = Label(fInfo, textvariable= self._strFPS,
+                    style= "fLabelGeneral.TLabel")
+    TextFPS.pack(side= TOP, padx= 5)
+
     self._ProgressBar = Progressbar(fInfo, orient= "horizontal", length= 180,
                                     mode= "determinate", style="LabeledProgressbar")
     self._ProgressBar.pack(side= BOTTOM, padx= 5, pady= 5)    
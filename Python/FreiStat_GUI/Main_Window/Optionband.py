@@ -18,6 +18,7 @@ from FreiStat.Data_storage.constants import *
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
+from ..Data_Storage.method_registry import dic_methodRegistry
 
 def _create_OptionbandFrame(self, parentFrame: Frame) -> None:
     """
@@ -52,71 +53,19 @@ def _update_OptionbandFrame_SingleMode(self, parentFarme: Frame) -> None:
     # Clear present widgets
     self._clearFrame(parentFarme)
 
-    # Create CA frame
-    fCA = Frame(parentFarme, style="fWidgetButton.TFrame")
-    fCA.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+    # Create a frame for every method
+    for definition in dic_methodRegistry.values():
+        fMethod = Frame(parentFarme, style="fWidgetButton.TFrame")
+        fMethod.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
 
-    ButtonCA = Button(fCA, image=self._IconCA,
-                        command= lambda : self._clickButton(BUTTON_EC_CA))        
-    ButtonCA.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+        ButtonMethod = Button(fMethod, image= getattr(self, definition.get_Icon()),
+            command= lambda iCommand = definition.get_Button() : 
+            self._clickButton(iCommand))        
+        ButtonMethod.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
 
-    TextCA = Label(fCA, text= "CA", style= "fLabelGeneralBold.TLabel")
-    TextCA.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create LSV frame
-    fLSV = Frame(parentFarme, style="fWidgetButton.TFrame")
-    fLSV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonLSV = Button(fLSV, image=self._IconLSV,
-                        command= lambda : self._clickButton(BUTTON_EC_LSV))        
-    ButtonLSV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextLSV = Label(fLSV, text= "LSV", style= "fLabelGeneralBold.TLabel")
-    TextLSV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create CV frame
-    fCV = Frame(parentFarme, style="fWidgetButton.TFrame")
-    fCV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonCV = Button(fCV, image=self._IconCV,
-                        command= lambda : self._clickButton(BUTTON_EC_CV))        
-    ButtonCV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextCV = Label(fCV, text= "CV", style= "fLabelGeneralBold.TLabel")
-    TextCV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create NPV frame
-    fNPV = Frame(parentFarme, style="fWidgetButton.TFrame")
-    fNPV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonNPV = Button(fNPV, image=self._IconNPV,
-                        command= lambda : self._clickButton(BUTTON_EC_NPV))        
-    ButtonNPV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextNPV = Label(fNPV, text= "NPV", style= "fLabelGeneralBold.TLabel")
-    TextNPV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create DPV frame
-    fDPV = Frame(parentFarme, style="fWidgetButton.TFrame")
-    fDPV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonDPV = Button(fDPV, image=self._IconDPV,
-                        command= lambda : self._clickButton(BUTTON_EC_DPV))        
-    ButtonDPV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextDPV = Label(fDPV, text= "DPV", style= "fLabelGeneralBold.TLabel")
-    TextDPV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create SWV frame
-    fSWV = Frame(parentFarme, style="fWidgetButton.TFrame")
-    fSWV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonSWV = Button(fSWV, image=self._IconSWV,
-                        command= lambda : self._clickButton(BUTTON_EC_SWV))        
-    ButtonSWV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextSWV = Label(fSWV, text= "SWV", style= "fLabelGeneralBold.TLabel")
-    TextSWV.pack(side= LEFT, padx= 5, pady= 5)
+        TextMethod = Label(fMethod, text= definition.get_Method(), 
+                           style= "fLabelGeneralBold.TLabel")
+        TextMethod.pack(side= LEFT, padx= 5, pady= 5)
 
 def _update_OptionbandFrame_SequeneceMode(self, parentFrame: Frame) -> None:
     """
@@ -205,69 +154,16 @@ def _popupEcMethod(self):
     # Set focus on the window
     self._fPopupEcMethod.focus_force()
 
-    # Create CA frame
-    fCA = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
-    fCA.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonCA = Button(fCA, image=self._IconCA,
-                        command= lambda : self._clickButton(BUTTON_SM_ADD_EC_CA))        
-    ButtonCA.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextCA = Label(fCA, text= "CA", style= "fLabelGeneralBold.TLabel")
-    TextCA.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create LSV frame
-    fLSV = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
-    fLSV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonLSV = Button(fLSV, image=self._IconLSV,
-                        command= lambda : self._clickButton(BUTTON_SM_ADD_EC_LSV))        
-    ButtonLSV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextLSV = Label(fLSV, text= "LSV", style= "fLabelGeneralBold.TLabel")
-    TextLSV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create CV frame
-    fCV = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
-    fCV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonCV = Button(fCV, image=self._IconCV,
-                        command= lambda : self._clickButton(BUTTON_SM_ADD_EC_CV))        
-    ButtonCV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextCV = Label(fCV, text= "CV", style= "fLabelGeneralBold.TLabel")
-    TextCV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create NPV frame
-    fNPV = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
-    fNPV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonNPV = Button(fNPV, image=self._IconNPV,
-                        command= lambda : self._clickButton(BUTTON_SM_ADD_EC_NPV))        
-    ButtonNPV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextNPV = Label(fNPV, text= "NPV", style= "fLabelGeneralBold.TLabel")
-    TextNPV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create DPV frame
-    fDPV = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
-    fDPV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    ButtonDPV = Button(fDPV, image=self._IconDPV,
-                        command= lambda : self._clickButton(BUTTON_SM_ADD_EC_DPV))        
-    ButtonDPV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-
-    TextDPV = Label(fDPV, text= "DPV", style= "fLabelGeneralBold.TLabel")
-    TextDPV.pack(side= LEFT, padx= 5, pady= 5)
-
-    # Create SWV frame
-    fSWV = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
-    fSWV.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+    # Create a frame for every method
+    for definition in dic_methodRegistry.values():
+        fMethod = Frame(self._fPopupEcMethod, style="fWidgetButton.TFrame")
+        fMethod.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
 
-    ButtonSWV = Button(fSWV, image=self._IconSWV,
-                        command= lambda : self._clickButton(BUTTON_SM_ADD_EC_SWV))        
-    ButtonSWV.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+        ButtonMethod = Button(fMethod, image= getattr(self, definition.get_Icon()),
+            command= lambda iCommand = definition.get_ButtonAdd() : 
+            self._clickButton(iCommand))        
+        ButtonMethod.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
 
-    TextSWV = Label(fSWV, text= "SWV", style= "fLabelGeneralBold.TLabel")
-    TextSWV.pack(side= LEFT, padx= 5, pady= 5)
-    
+        TextMethod = Label(fMethod, text= definition.get_Method(), 
+                           style= "fLabelGeneralBold.TLabel")
+        TextMethod.pack(side= LEFT, padx= 5, pady= 5)
@@ -18,6 +18,7 @@ from FreiStat.Data_storage.constants import *
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
+from ..Data_Storage.method_registry import dic_methodRegistry
 
 def _create_ParameterbandFrame(self, parentFrame: Frame) -> None:
     """
@@ -43,65 +44,80 @@ def _update_PrameterbandFrame(self, parentFrame : Frame) -> None:
     Method for updating the parameter band to display the parameters of the
     experiment.
 
+    The labels are bound to string variables. Widgets are only recreated if the
+    layout of the parameter band changes (e.g. other experiment type or
+    sequence length) or if the parameter band was used otherwise in between. 
+    Otherwise only the changed texts are updated.
+
     Parameters
     ----------
     `parentFrame` : Frame
         Parent frame in which the parameter band frame is embedded
 
     """
-    # Clear present widgets
-    self._clearFrame(parentFrame)        
-
-    # Create frame for template name and experiment type 
-    fGeneralInfo = Frame(parentFrame, style="fWidget.TFrame")
-    fGeneralInfo.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+    strExperimentType : str = self._dataHandling.get_ExperimentType()
+    listExperimentParameters : list = \
+        self._dataHandling.get_ExperimentParameters()
 
-    TextExperimentType = Label(fGeneralInfo, text= "Template: " + 
-        self._dataHandling.get_TemplateName(), width= TEXTBOX_WIDTH, 
-        style= "fLabelGeneralBold.TLabel")
-    TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
-
-    TextExperimentType = Label(fGeneralInfo, text= "Experiment type: " + 
-        self._dataHandling.get_ExperimentType(), width= TEXTBOX_WIDTH, 
-        style= "fLabelGeneralBold.TLabel")
-    TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
+    # Collect texts and styles of the labels, one list per frame
+    listFrames : list = [[
+        ["Template: " + self._dataHandling.get_TemplateName(), 
+         "fLabelGeneralBold.TLabel"],
+        ["Experiment type: " + strExperimentType, "fLabelGeneralBold.TLabel"]]]
 
     # Check for sequence mode and display amount of cycles
-    if (self._dataHandling.get_ExperimentType() == SEQUENCE):
-        # Create frame
-        fExperimentParameter = Frame(parentFrame, style="fWidget.TFrame")
-        fExperimentParameter.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-        TextExperimentType = Label(fExperimentParameter, text= "Sequence length: " + 
-                                   str(len(self._dataHandling.get_ExperimentParameters())), 
-                                   width= TEXTBOX_WIDTH, 
-                                   style= "fLabelGeneralBold.TLabel")
-        TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
-
-        TextExperimentType = Label(fExperimentParameter, text= "Sequence cycles: " +
-                                   str(self._dataHandling.get_SequenceCycles()), 
-                                   width= TEXTBOX_WIDTH, 
-                                   style= "fLabelGeneralBold.TLabel")
-        TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
-
-    # Create frame for every experiment parameter
-    fExperimentParameter = Frame(parentFrame, style="fWidget.TFrame")
-    fExperimentParameter.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
-
-    for iIndex in range(len(self._dataHandling.get_ExperimentParameters())):
+    if (strExperimentType == SEQUENCE):
+        listFrames.append([
+            ["Sequence length: " + str(len(listExperimentParameters)), 
+             "fLabelGeneralBold.TLabel"],
+            ["Sequence cycles: " + str(self._dataHandling.get_SequenceCycles()),
+             "fLabelGeneralBold.TLabel"]])
+
+    listLabels : list = []
+    for listExperimentPair in listExperimentParameters:
         # Decode experiment parameter entry back into label and value pair
-        strLabel, strValue = self._decodeExperimentParameters(
-            self._dataHandling.get_ExperimentParameters()[iIndex])
-            
-        TextExperimentType = Label(fExperimentParameter, text= strLabel, 
-                                   width= TEXTBOX_WIDTH, 
-                                   style= "fLabelGeneralBold.TLabel")
-        TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
-
-        TextExperimentType = Label(fExperimentParameter, text= strValue, 
-                                   width= TEXTBOX_WIDTH, 
-                                   style= "fLabelGeneral.TLabel")
-        TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
+        strLabel, strValue = self._decodeExperimentParameters(listExperimentPair)
+
+        listLabels.append([strLabel, "fLabelGeneralBold.TLabel"])
+        listLabels.append([strValue, "fLabelGeneral.TLabel"])
+    listFrames.append(listLabels)
+
+    tupleLayout : tuple = (strExperimentType, tuple(tuple(listLabel[1] 
+        for listLabel in listFrame) for listFrame in listFrames))
+
+    # Recreate widgets if the layout changed or the frame was cleared
+    if (tupleLayout != self._tupleParameterBandLayout or
+        parentFrame.pack_slaves() != self._listParameterBandFrames):
+        self._clearFrame(parentFrame)
+
+        self._tupleParameterBandLayout = tupleLayout
+        self._listParameterBandFrames = []
+        self._listParameterBandText = []
+
+        for listFrame in listFrames:
+            fExperimentParameter = Frame(parentFrame, style="fWidget.TFrame")
+            fExperimentParameter.pack(fill= X, side= TOP, expand= FALSE, 
+                                      padx= 5, pady= 5)
+            self._listParameterBandFrames.append(fExperimentParameter)
+
+            for strText, strStyle in listFrame:
+                strLabelText = StringVar(value= strText)
+
+                TextExperimentType = Label(fExperimentParameter, 
+                    textvariable= strLabelText, width= TEXTBOX_WIDTH, 
+                    style= strStyle)
+                TextExperimentType.pack(side= TOP, padx= 5, pady= 5)
+
+                self._listParameterBandText.append(strLabelText)
+        return
+
+    # Only update changed texts
+    listTexts : list = [strText for listFrame in listFrames 
+                        for strText, strStyle in listFrame]
+
+    for strLabelText, strText in zip(self._listParameterBandText, listTexts):
+        if (strLabelText.get() != strText):
+            strLabelText.set(strText)
 
 def _update_PrameterbandFrame_Template(self, iCommandID : int ,
                                        parentFrame : Frame) -> None:
@@ -123,9 +139,6 @@ def _update_PrameterbandFrame_Template(self, iCommandID : int ,
     # Clear present widgets
     self._clearFrame(parentFrame)   
 
-    # Move to the first data object
-    self._dataHandling.move_first_DataObject()
-
     # Create listbox
     self._TemplateListBox = Listbox(parentFrame, width= TEXTBOX_WIDTH, 
                                     font= "Arial 10 bold")
@@ -162,13 +175,10 @@ def _update_PrameterbandFrame_Template(self, iCommandID : int ,
         tempSet = {}
 
     # Loop over all templates
-    for iIndex in range(self._dataHandling.get_SequenceLength()):
-        if (self._dataHandling.get_ExperimentType() in tempSet):
-            self._TemplateListBox.insert(END, self._dataHandling.get_ExperimentType() + 
-                " - " + self._dataHandling.get_TemplateName())
-
-        # Move to the next data object
-        self._dataHandling.move_next_DataObject()
+    for dataStorage in self._dataHandling.get_DataStorages():
+        if (dataStorage.get_ExperimentType() in tempSet):
+            self._TemplateListBox.insert(END, dataStorage.get_ExperimentType() + 
+                " - " + dataStorage.get_TemplateName())
 
 def _onSelect(self, event):
     """
@@ -193,7 +203,7 @@ def _onSelect(self, event):
     strTemplateName = widget.get(int(widget.curselection()[0]))
 
     # Separate method from template name
-    strTemplateName = strTemplateName.split(" - ")[1]
+    strExperimentType, strTemplateName = strTemplateName.split(" - ", 1)
 
     frame : Frame = ""
 
@@ -204,63 +214,36 @@ def _onSelect(self, event):
     elif (self._iNavIndex == NI_SEQ_MODE):
         frame = self._fOptionsSequence               
 
-    for iIndex in range(self._dataHandling.get_SequenceLength()):
-        if (self._dataHandling.get_TemplateName() == strTemplateName):
-            # Update parameter band
-            self._update_PrameterbandFrame(self._fParameterBand)
-
-            # Update central frame depending on the ec method
-            if (self._dataHandling.get_ExperimentType() == CA):
-                # Update navigations index
-                if (self._iNavIndex != NI_SEQ_MODE):
-                    self._iNavIndex = NI_SM_CA
-                self._update_CentralFrame_CA(frame)
-            elif (self._dataHandling.get_ExperimentType() == LSV):
-                # Update navigations index
-                if (self._iNavIndex != NI_SEQ_MODE):
-                    self._iNavIndex = NI_SM_LSV
-                self._update_CentralFrame_LSV(frame)
-            elif (self._dataHandling.get_ExperimentType() == CV):
-                # Update navigations index
-                if (self._iNavIndex != NI_SEQ_MODE):
-                    self._iNavIndex = NI_SM_CV
-                self._update_CentralFrame_CV(frame)
-            elif (self._dataHandling.get_ExperimentType() == NPV):
-                # Update navigations index
-                if (self._iNavIndex != NI_SEQ_MODE):
-                    self._iNavIndex = NI_SM_NPV
-                self._update_CentralFrame_NPV(frame)
-            elif (self._dataHandling.get_ExperimentType() == DPV):
-                # Update navigations index
-                if (self._iNavIndex != NI_SEQ_MODE):
-                    self._iNavIndex = NI_SM_DPV
-                self._update_CentralFrame_DPV(frame)
-            elif (self._dataHandling.get_ExperimentType() == SWV):
-                # Update navigations index
-                if (self._iNavIndex != NI_SEQ_MODE):
-                    self._iNavIndex = NI_SM_SWV
-                self._update_CentralFrame_SWV(frame)
-            elif (self._dataHandling.get_ExperimentType() == SEQUENCE):
-                # Update navigations index
-                self._iNavIndex = NI_SEQ_MODE
-                self._update_OptionbandFrame_SequeneceMode(self._fOptionBand)
-                self._update_CentralFrame_Sequence(self._fCentralFrame)
-
-                # Reconstruct the sequence
-                self._update_CentralFrame_Sequence_Load()
-            break
-        # Move to the next data object
-        self._dataHandling.move_next_DataObject()
+    # Set reference to the selected template
+    if (self._dataHandling.select_Template(strExperimentType, 
+                                           strTemplateName) == True):
+        # Update parameter band
+        self._update_PrameterbandFrame(self._fParameterBand)
+
+        # Update central frame depending on the ec method
+        strExperimentType = self._dataHandling.get_ExperimentType()
+
+        if (strExperimentType in dic_methodRegistry):
+            # Update navigations index
+            if (self._iNavIndex != NI_SEQ_MODE):
+                self._iNavIndex = dic_methodRegistry[strExperimentType]. \
+                    get_NavIndex()
+            self._update_CentralFrame_Method(frame, strExperimentType)
+        elif (strExperimentType == SEQUENCE):
+            # Update navigations index
+            self._iNavIndex = NI_SEQ_MODE
+            self._update_OptionbandFrame_SequeneceMode(self._fOptionBand)
+            self._update_CentralFrame_Sequence(self._fCentralFrame)
+
+            # Reconstruct the sequence
+            self._update_CentralFrame_Sequence_Load()
 
     if (self._iNavIndex == NI_SEQ_MODE):
         frame = self._fOptionsSequence
 
         if (self._dataHandling.get_ExperimentType() != SEQUENCE):
             # Move back to the sequence object
-            for iIndex in range(self._dataHandling.get_SequenceLength()):
-                if (self._dataHandling.get_TemplateName() == self._strTemplateSeq.get()):
-                    # Update parameter band
-                    self._update_PrameterbandFrame(self._fParameterBand)
-                    return
-                # Move to the next data object
-                self._dataHandling.move_next_DataObject() 
\ No newline at end of file
+            if (self._dataHandling.select_Template(
+                SEQUENCE, self._strTemplateSeq.get()) == True):
+                # Update parameter band
+                self._update_PrameterbandFrame(self._fParameterBand)
\ No newline at end of file
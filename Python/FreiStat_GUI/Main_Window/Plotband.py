@@ -12,12 +12,16 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
+import struct
+import numpy as np
 from tkinter import *
 from tkinter.ttk import *
 from FreiStat.Data_storage.constants import *
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
+from ..Data_Storage.run_recording import RunReader
+from ..Utility.thumbnail_strip import ThumbnailStrip
 
 def _create_PlotbandTabFrame(self, parentFrame: Frame) -> None:
     """
@@ -101,12 +105,10 @@ def _create_PlotbandFrame(self, parentFrame: Frame) -> None:
     # Add scroll command to canvas
     self._canvasPlot.configure(xscrollcommand= ScrollbarXTerminal.set)
 
-    self._fPlotFrame = Frame(self._canvasPlot, style="fPlotBand.TFrame")
-    self._fPlotFrame.pack(fill= BOTH, side= TOP, expand= TRUE)
-    
-    # Update windows to get correct size informations
-    self._canvasPlot.create_window((0,0), window= self._fPlotFrame, 
-        anchor= NW, width= 2000, height= self._fPlotFrameHeight)
+    # The figures of a sequence are drawn as thumbnails onto the canvas, a 
+    # click opens the figure in the static plot
+    self._thumbnailStrip = ThumbnailStrip(self._canvasPlot, 
+        self._fPlotFrameHeight - THUMBNAIL_MARGIN, self._on_mouse_press)
 
     self._fPlotHeadFrame.pack_forget() 
 
@@ -120,6 +122,9 @@ def _multiscroll_plotband(self, *args):
     self._canvasPlot.xview(*args)
     self._TextTerminal.xview(*args)
 
+    # Place the thumbnails which scrolled into view
+    self._thumbnailStrip.update_View()
+
 
 def _update_PlotbandFrame_Terminal(self, parentFrame: Frame) -> None:
     """
@@ -157,20 +162,17 @@ def _update_PlotbandFrame_Plots(self, parentFrame: Frame) -> None:
 
     # Show the frame for the plots
     self._fPlotHeadFrame.pack(fill= BOTH, side= TOP, expand= True, padx= 5, pady= 5)
-    """
-    # Remove legend of the figure
-    for iIndex in range(len(self._listFigures)):
-        if (self._listFigures[iIndex].gca().get_legend() is not None):
-            self._listFigures[iIndex].gca().get_legend().set_visible(False)
-            self._listCanvas[iIndex].draw()
-    """
+
+    # Render the thumbnails, which changed while the plots were hidden
+    self._fPlotHeadFrame.update_idletasks()
+    self._thumbnailStrip.update_View()
 
 def _on_mouse_press(self, event, iPlotID):
     """
     Description
     -----------
-    Click event when clicking on a plot in the plot window. The plot is then
-    displayed in the central frame.
+    Click event when clicking on a plot in the plot window. The measured data
+    of the method is then displayed in the central frame.
 
     Parameters
     ----------
@@ -193,28 +195,50 @@ def _on_mouse_press(self, event, iPlotID):
 
     # Hide live feed and show static plot
     self._hideFrame(self._fCentralFrame)
+
+    # Interactive plot is only created on the first click
+    if (self._fStaticPlot is None or self._fStaticPlot.winfo_exists() == False):
+        self._create_StaticPlot()
+
     self._fStaticPlot.pack(fill= 'both', side= TOP, expand= TRUE, padx= 2, pady= 2)
     self._toolbarFrameStatic.pack(fill= X, side= BOTTOM, expand= False, padx= 5)
 
+    # Thumbnails of a recording are plotted from the memory mapped file
+    if (self._listRunMethods is not None):
+        self._plotRunSegment(-1, self._listRunMethods[iPlotID])
+        return
+
+    # Copy of the measured data, the drain thread may still append to it
+    if (self._dataDrain is not None):
+        dicColumns : dict = self._dataDrain.get_Snapshot(iPlotID)
+    else :
+        dicColumns : dict = \
+            self._measurementStorage.get_MethodColumns(iPlotID)
+
+    # Chronoamperometry is plotted over time
+    bTime : bool = self._listSequenceMethods[iPlotID] == CA
+    strXColumn : str = MS_TIME if bTime else MS_POTENTIAL
+
     # Remove lines from static plot
-    for iIndex in range(len(self._axesStatic.lines)):
-        self._axesStatic.lines[0].remove()
-
-    # Add new lines to static plot with the correct data
-    for iIndex in range(len(self._listFigures[iPlotID].gca().lines)):
-        self._axesStatic.plot(
-            self._listFigures[iPlotID].gca().lines[iIndex].get_xdata(), 
-            self._listFigures[iPlotID].gca().lines[iIndex].get_ydata())
-
-    # Add labels to the plot
-    for iIndex in range(len(self._axesStatic.lines)):
-        self._axesStatic.lines[iIndex].set_label(
-            self._listFigures[iPlotID].gca().lines[iIndex].get_label())
-        
-        self._axesStatic.set_xlabel(
-            self._listFigures[iPlotID].gca().xaxis.get_label().get_text())
-        self._axesStatic.set_ylabel(
-            self._listFigures[iPlotID].gca().yaxis.get_label().get_text())
+    self._decimatedStatic.clear()
+
+    # Add one line per cycle to the static plot (decimated to the screen 
+    # resolution)
+    for iCycle in np.unique(dicColumns[MS_CYCLE]):
+        bCycle = dicColumns[MS_CYCLE] == iCycle
+        self._decimatedStatic.plot(dicColumns[strXColumn][bCycle], 
+            dicColumns[MS_CURRENT][bCycle], bSorted= bTime, 
+            label= "Cycle " + str(iCycle))
+
+    # Rescale to the new lines
+    self._axesStatic.relim()
+    self._axesStatic.autoscale()
+
+    # Add labels of the live feed to the plot
+    self._axesStatic.set_xlabel(
+        self._listFigures[iPlotID].gca().xaxis.get_label().get_text())
+    self._axesStatic.set_ylabel(
+        self._listFigures[iPlotID].gca().yaxis.get_label().get_text())
 
     # Update legend
     self._axesStatic.legend(title= PLOT_LEGEND_NAME, 
@@ -222,3 +246,197 @@ def _on_mouse_press(self, event, iPlotID):
     
     self._figureStatic.canvas.draw()
 
+def _displayRun(self, strFilePath : str) -> None:
+    """
+    Description
+    -----------
+    Display a recorded run in the static plot of the central frame and one
+    thumbnail per method in the plot band. The recording is memory mapped, 
+    only the displayed cycles are read from disk.
+
+    Parameters
+    ----------
+    `strFilePath` : string
+        Path of the recording
+
+    """
+    # Check if experiment is running
+    if (self._iSystemStatus == FS_RUNNING):
+        self._logger.info("Experiment is running, recording not opened.")
+        return
+
+    try:
+        runReader = RunReader(strFilePath)
+    except (OSError, ValueError, struct.error):
+        self._logger.info("File is no valid recording, recording not opened.")
+        return
+
+    # Clear central frame
+    self._clearFrame(self._fCentralFrame)
+    self._iPlotIDprevious = None
+
+    if (self._runReader is not None):
+        self._runReader.close()
+    self._runReader = runReader
+
+    # Create selection of the displayed cycle
+    listSegments : list = self._runReader.get_Segments()
+    bSequence : bool = len(set(segment[0] for segment in listSegments)) > 1
+
+    listEntries : list = ["All cycles"]
+    for iMethodIndex, iCycle, iFirst, iCount in listSegments:
+        listEntries.append(self._decodeRunSegment(iMethodIndex, iCycle, 
+                                                  bSequence))
+
+    fRunSelection = Frame(self._fCentralFrame, style="fWidget.TFrame")
+    fRunSelection.pack(fill= X, side= TOP, expand= FALSE, padx= 5, pady= 5)
+
+    TextRunSelection = Label(fRunSelection, text= "Displayed cycle:",
+                             style= "fLabelGeneralBold.TLabel")
+    TextRunSelection.pack(side= LEFT, padx= 5, pady= 5)
+
+    ComboboxRunSelection = Combobox(fRunSelection, values= listEntries, 
+                                    state= "readonly")
+    ComboboxRunSelection.current(0)
+    ComboboxRunSelection.pack(side= LEFT, padx= 5, pady= 5)
+    ComboboxRunSelection.bind("<<ComboboxSelected>>", lambda event :
+        self._plotRunSegment(ComboboxRunSelection.current() - 1))
+
+    # Show static plot
+    self._create_StaticPlot()
+    self._toolbarFrameStatic.pack(fill= X, side= BOTTOM, expand= False, padx= 5)
+
+    self._plotRunSegment(-1)
+
+    # Show an overview of every method in the plot band
+    self._createRunThumbnails()
+
+def _createRunThumbnails(self) -> None:
+    """
+    Description
+    -----------
+    Create one figure per method of the opened recording and show them as
+    thumbnails in the plot band. Every cycle is strided to at most 
+    `THUMBNAIL_RUN_SAMPLES` records, so that only a small part of the 
+    recording is read.
+
+    """
+    # Import on first use, usually already done by `_warmUpImports`
+    from matplotlib.figure import Figure
+
+    listSegments : list = self._runReader.get_Segments()
+    self._listRunMethods = sorted(set(segment[0] for segment in listSegments))
+    bSequence : bool = len(self._listRunMethods) > 1
+
+    strExperimentType : str = self._runReader.get_Header().get("ExperimentType")
+    bTime : bool = strExperimentType in [CA, SEQUENCE]
+    strXColumn : str = MS_TIME if bTime else MS_POTENTIAL
+
+    self._listFigures = []
+    for iMethodIndex in self._listRunMethods:
+        # Not registered in pyplot, so the figures are freed with the list
+        figure = Figure()
+        axes = figure.add_subplot(1, 1, 1)
+
+        for iSegmentMethod, iCycle, iFirst, iCount in listSegments:
+            if (iSegmentMethod != iMethodIndex):
+                continue
+
+            iStride : int = max(-(-iCount // THUMBNAIL_RUN_SAMPLES), 1)
+            recordData = self._runReader.get_Records(iFirst, iCount)[::iStride]
+            axes.plot(recordData[strXColumn], recordData[MS_CURRENT])
+
+        if (bSequence == True):
+            axes.set_title("Method " + str(iMethodIndex))
+        else :
+            axes.set_title(strExperimentType)
+        axes.set_xlabel(strXColumn)
+        axes.set_ylabel(MS_CURRENT)
+
+        self._listFigures.append(figure)
+
+    self._thumbnailStrip.set_Figures(self._listFigures)
+
+def _plotRunSegment(self, iSegment : int, iMethodIndex : int = None) -> None:
+    """
+    Description
+    -----------
+    Plot the records of one method and cycle of the opened recording into the 
+    static plot.
+
+    Parameters
+    ----------
+    `iSegment` : int
+        Index of the segment (see `RunReader.get_Segments`), -1 plots all
+        segments
+
+    `iMethodIndex` : int
+        Index of the method, whose segments are plotted if `iSegment` is -1,
+        None plots the segments of every method
+
+    """
+    listSegments : list = self._runReader.get_Segments()
+    bSequence : bool = len(set(segment[0] for segment in listSegments)) > 1
+
+    if (iSegment >= 0):
+        listSegments = [listSegments[iSegment]]
+    elif (iMethodIndex is not None):
+        listSegments = [segment for segment in listSegments 
+                        if segment[0] == iMethodIndex]
+
+    # Chronoamperometry and sequences are plotted over time
+    strExperimentType : str = self._runReader.get_Header().get("ExperimentType")
+    bTime : bool = strExperimentType in [CA, SEQUENCE]
+    strXColumn : str = MS_TIME if bTime else MS_POTENTIAL
+
+    # Remove lines from static plot
+    self._decimatedStatic.clear()
+
+    # Add the records, which are only read in the displayed range
+    for iMethodIndex, iCycle, iFirst, iCount in listSegments:
+        recordData = self._runReader.get_Records(iFirst, iCount)
+        self._decimatedStatic.plot(recordData[strXColumn], 
+            recordData[MS_CURRENT], bSorted= bTime, 
+            label= self._decodeRunSegment(iMethodIndex, iCycle, bSequence))
+
+    # Rescale to the new lines
+    self._axesStatic.relim()
+    self._axesStatic.autoscale()
+
+    self._axesStatic.set_xlabel(strXColumn)
+    self._axesStatic.set_ylabel(MS_CURRENT)
+
+    # Update legend
+    self._axesStatic.legend(title= PLOT_LEGEND_NAME, 
+        bbox_to_anchor=(1.05, 1), loc='upper left')
+    
+    self._figureStatic.canvas.draw()
+
+def _decodeRunSegment(self, iMethodIndex : int, iCycle : int, 
+                      bSequence : bool) -> str:
+    """
+    Description
+    -----------
+    Helper method returning the label of a segment of a recording.
+
+    Parameters
+    ----------
+    `iMethodIndex` : int
+        Index of the method in a sequence
+
+    `iCycle` : int
+        Cycle of the segment
+
+    `bSequence` : bool
+        Flag indicating if the recording contains multiple methods
+
+    Return
+    ------
+    `strLabel` : string
+        Label of the segment
+
+    """
+    if (bSequence == True):
+        return "Method " + str(iMethodIndex) + ", Cycle " + str(iCycle)
+
+    return "Cycle " + str(iCycle)
@@ -45,6 +45,10 @@ def _create_RibbonFrame(self, parentFrame: Frame) -> None:
     menuFile.add_command(label="Load Templae", command= lambda : 
         self._clickRibbonButton(BUTTON_LOAD))
 
+    # Create import folder button
+    menuFile.add_command(label="Import Template Folder", command= lambda : 
+        self._clickRibbonButton(BUTTON_LOAD_FOLDER))
+
     # Create save button
     menuFile.add_command(label="Save Template", command= lambda : 
         self._clickRibbonButton(BUTTON_SAVE))
@@ -55,6 +59,12 @@ def _create_RibbonFrame(self, parentFrame: Frame) -> None:
 
     menuFile.add_separator()
 
+    # Create open run button
+    menuFile.add_command(label="Open Run", command= lambda : 
+        self._clickRibbonButton(BUTTON_OPEN_RUN))
+
+    menuFile.add_separator()
+
     # Create preferences button
     menuFile.add_command(label="Preferences", command= lambda : 
         self._clickRibbonButton(BUTTON_PREFERENCES))
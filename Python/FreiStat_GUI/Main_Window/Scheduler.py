@@ -0,0 +1,146 @@
+"""
+Sub module of the class FreiStatInterface, which implements the event driven
+scheduler polling the experiment and system status.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+from tkinter import *
+from tkinter.ttk import *
+from FreiStat.Data_storage.constants import *
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+
+def _startScheduler(self) -> None:
+    """
+    Description
+    -----------
+    Method starting the scheduler, which is called periodically by the Tk event
+    loop instead of spinning in a loop.
+
+    """
+    # Start with the configured tick interval
+    self._iTickInterval = self._getTickRate()
+
+    self._SchedulerID = self._Root.after(self._iTickInterval,
+                                         self._updateScheduler)
+
+def _stopScheduler(self) -> None:
+    """
+    Description
+    -----------
+    Method cancelling the next pending call of the scheduler.
+
+    """
+    if (self._SchedulerID is not None):
+        self._Root.after_cancel(self._SchedulerID)
+        self._SchedulerID = None
+
+def _wakeScheduler(self) -> None:
+    """
+    Description
+    -----------
+    Method resetting the scheduler to the configured tick interval, e.g. after
+    an experiment was started and the scheduler is backed off.
+
+    """
+    self._stopScheduler()
+
+    if (self._bAppRunning == True):
+        self._startScheduler()
+
+def _updateScheduler(self) -> None:
+    """
+    Description
+    -----------
+    Method called by the scheduler on every tick. Polls the experiment process
+    and the system status and schedules the next tick. While no experiment is
+    running the tick interval is increased up to `SCHEDULER_IDLE_MAX`.
+
+    """
+    self._SchedulerID = None
+
+    # Check if window was closed in the meantime
+    if (self._bAppRunning == False):
+        return
+
+    # Check if experiment is still running
+    if (self._iSystemStatus ==  FS_RUNNING and self._process is not None and
+        self._process.is_alive() == False):
+        # Update system status
+        self._iSystemStatus = FS_COMPLETED
+
+        # Enable start button and disable stop / live feed button
+        self._ButtonStart["state"] = NORMAL
+        self._ButtonStop["state"] = DISABLED
+        self._ButtonLiveFeed["state"] = DISABLED
+
+        self._TextInfo.configure(style= "fLabelCompleted.TLabel")
+
+        # Store remaining records of the data queue
+        self._stopDataDrain()
+
+        # Show the final state of the thumbnails in view
+        self._thumbnailStrip.update_View()
+
+    elif (self._iSystemStatus == FS_STOP):
+        self._TextInfo.configure(style= "fLabelCanceled.TLabel")
+
+        # Store remaining records of the data queue
+        self._stopDataDrain()
+
+    # Update the thumbnails in view to the new data of the sequence
+    if (self._iSystemStatus == FS_RUNNING and self._iNavIndex == NI_SEQ_MODE):
+        self._thumbnailStrip.refresh()
+
+    # Update info box with current system status (only on changes)
+    strSystemStatus : str = self._decodeSystemStatus(self._iSystemStatus)
+    if (self._strInfo.get() != strSystemStatus):
+        self._strInfo.set(strSystemStatus)
+
+    # Calculate interval until the next tick
+    iTickRate : int = self._getTickRate()
+
+    if (self._iSystemStatus == FS_RUNNING):
+        self._iTickInterval = iTickRate
+    else :
+        # Back off while the interface is idle
+        self._iTickInterval = min(max(self._iTickInterval *
+            SCHEDULER_IDLE_FACTOR, iTickRate),
+            max(SCHEDULER_IDLE_MAX, iTickRate))
+
+    self._SchedulerID = self._Root.after(self._iTickInterval,
+                                         self._updateScheduler)
+
+def _getTickRate(self) -> int:
+    """
+    Description
+    -----------
+    Helper method returning the tick interval of the scheduler set in the
+    preferences.
+
+    Return
+    ------
+    `iTickRate` : int
+        Tick interval of the scheduler in ms
+
+    """
+    try:
+        iTickRate : int = int(self._strTickRate.get())
+    except ValueError:
+        iTickRate = int(SET_TICK_RATE_VALUE)
+
+    # Prevent the scheduler from spinning
+    if (iTickRate < 1):
+        iTickRate = int(SET_TICK_RATE_VALUE)
+
+    return iTickRate
@@ -13,12 +13,14 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
+import os
 from tkinter import *
 from tkinter.ttk import *
 from FreiStat.Data_storage.constants import *
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
+from ..Utility.asset_manager import AssetManager
 
 def _StyleConfig(self) -> None:
     """
@@ -94,42 +96,9 @@ def _LoadIcons(self) -> None:
     """
     Description
     -----------
-    Helper method for loading all icons of the interface
+    Helper method creating the asset manager of the interface. The icons are
+    loaded on first access of their attribute (see `dic_interfaceImages`).
 
     """
-    # FreiStat logos
-    self._IconLogo = PhotoImage(file= self._strAssetPath + '/assets/logo/FreiStat.gif')
-    self._TextLogo = PhotoImage(file= self._strAssetPath + '/assets/logo/FreiStat.png')
-
-    # Menu band
-    self._IconLiveFeed = PhotoImage(file= self._strAssetPath + 'assets/icons/live.png')
-    self._IconSequence = PhotoImage(file= self._strAssetPath + 'assets/icons/sequence.png')
-    self._IconSingleMode = PhotoImage(file= self._strAssetPath + 'assets/icons/single_mode.png')
-
-    # Central frame options
-    self._IconSave  = PhotoImage(file= self._strAssetPath + 'assets/icons/Save.png')
-    self._IconLoad  = PhotoImage(file= self._strAssetPath +'assets/icons/Load.png')
-    self._IconDelete = PhotoImage(file= self._strAssetPath +'assets/icons/Delete.png')
-
-    self._IconSaveSequence  = PhotoImage(file= self._strAssetPath + 'assets/icons/Save_Sequence.png')
-    self._IconLoadSequence  = PhotoImage(file= self._strAssetPath +'assets/icons/Load_Sequence.png')
-    self._IconDeleteSequence = PhotoImage(file= self._strAssetPath +'assets/icons/Delete_Sequence.png')    
-
-    # EC-methods
-    self._IconCA  = PhotoImage(file= self._strAssetPath + 'assets/icons/CA.png')
-    self._IconLSV = PhotoImage(file= self._strAssetPath + 'assets/icons/LSV.png')
-    self._IconCV  = PhotoImage(file= self._strAssetPath + 'assets/icons/CV.png')
-    self._IconNPV = PhotoImage(file= self._strAssetPath + 'assets/icons/NPV.png')
-    self._IconDPV = PhotoImage(file= self._strAssetPath + 'assets/icons/DPV.png')
-    self._IconSWV = PhotoImage(file= self._strAssetPath + 'assets/icons/SWV.png')
-
-    # Plotband
-    self._IconMinimize = PhotoImage(file= self._strAssetPath + 'assets/icons/minimize.png')
-
-    # Sequence mode
-    self._IconAdd  = PhotoImage(file= self._strAssetPath + 'assets/icons/Add.png')
-    self._IconRemove  = PhotoImage(file= self._strAssetPath + 'assets/icons/Remove.png')
-    self._IconMoveUp = PhotoImage(file= self._strAssetPath + 'assets/icons/Move_up.png')
-    self._IconMoveDown = PhotoImage(file= self._strAssetPath + 'assets/icons/Move_down.png')
-
-    self._SequenceLink = PhotoImage(file= self._strAssetPath + 'assets/icons/sequence_link.png')
\ No newline at end of file
+    self._assetManager = AssetManager(os.path.join(self._strAssetPath, 
+                                                   "assets"), self._Root)
@@ -23,6 +23,7 @@ from FreiStat.Data_storage.dictionaries import *
 # Import internal dependencies
 from ..Data_Storage.constants import *
 from ..Utility import _decodeParameters
+from ..Utility import dic_parameterDecoding
 
 
 def _openFileExplorer(self, iCommand : int) -> str :
@@ -51,6 +52,14 @@ def _openFileExplorer(self, iCommand : int) -> str :
         strFilePath = filedialog.askopenfilename(initialdir = os.getcwd(),
             filetypes= data, defaultextension= data,
             title = "Select a config file")
+    elif (iCommand == BUTTON_LOAD_FOLDER):
+        strFilePath = filedialog.askdirectory(initialdir = os.getcwd(),
+            title = "Select a folder containing templates") or ""
+    elif (iCommand == BUTTON_OPEN_RUN):
+        data = [("FreiStat Recording(*.fsr)","*" + RR_FILE_EXTENSION)]
+        strFilePath = filedialog.askopenfilename(
+            initialdir = self._strOsPathRecordings, filetypes= data, 
+            defaultextension= data, title = "Select a recording")
     elif (iCommand == BUTTON_SAVE):
         strFilePath = os.getcwd()
     elif (iCommand == BUTTON_SAVEAS):
@@ -112,49 +121,18 @@ def _decodeExperimentParameters(self, listExperimentPair : list) \
         value of the experiment parameter encoded as string
 
     """
-    # Initialize variable
-    strLabel : str = ""
-    strValue : str = ""
-
     # Sequence mode parameters
     if (len(listExperimentPair) > 2):
         return listExperimentPair[0] , listExperimentPair[1]
 
     # Experiment parameters
-    listParameterNames : list = [
-        [SEQUENCE_LENGTH, dic_configParameters[SEQUENCE_LENGTH][0], SEQUENCE_LENGTH_U],
-        [BASE_POTENTIAL, dic_configParameters[BASE_POTENTIAL][0], BASE_POTENTIAL_U],
-        [START_POTENTIAL, dic_configParameters[START_POTENTIAL][0], START_POTENTIAL_U],
-        [STOP_POTENTIAL, dic_configParameters[STOP_POTENTIAL][0], STOP_POTENTIAL_U],
-        [LOWER_POTENTIAL, dic_configParameters[LOWER_POTENTIAL][0], LOWER_POTENTIAL_U],
-        [UPPER_POTENTIAL, dic_configParameters[UPPER_POTENTIAL][0], UPPER_POTENTIAL_U],
-        [POTENTIAL_STEPS, dic_configParameters[POTENTIAL_STEPS][0], POTENTIAL_STEPS_U],
-        [PULSE_LENGTH, dic_configParameters[PULSE_LENGTH][0], PULSE_LENGTH_U],
-        [SAMPLING_RATE, dic_configParameters[SAMPLING_RATE][0], SAMPLING_RATE_U],
-        [SAMPLING_DURATION, dic_configParameters[SAMPLING_DURATION][0], SAMPLING_DURATION_U],
-        [STEP_SIZE, dic_configParameters[STEP_SIZE][0], STEP_SIZE_U],
-        [SCAN_RATE, dic_configParameters[SCAN_RATE][0], SCAN_RATE_U],
-        [DELTA_V_STAIRCASE, dic_configParameters[DELTA_V_STAIRCASE][0], DELTA_V_STAIRCASE_U],
-        [DELTA_V_PEAK, dic_configParameters[DELTA_V_PEAK][0], DELTA_V_PEAK_U],
-        [CYCLE, dic_configParameters[CYCLE][0], CYCLE_U],
-        [LPTIA_RTIA_SIZE, dic_configParameters[LPTIA_RTIA_SIZE][0], LPTIA_RTIA_SIZE_U],
-        [FIXED_WE_POTENTIAL, dic_configParameters[FIXED_WE_POTENTIAL][0], FIXED_WE_POTENTIAL_U],
-        [MAINS_FILTER, dic_configParameters[MAINS_FILTER][0], MAINS_FILTER_U],
-        [SINC2_OVERSAMPLING, dic_configParameters[SINC2_OVERSAMPLING][0], SINC2_OVERSAMPLING_U],
-        [SINC3_OVERSAMPLING, dic_configParameters[SINC3_OVERSAMPLING][0], SINC3_OVERSAMPLING_U]
-    ]
-
-    # Seach list of experiment parameters for entry
-    for iIndex in range(len(listParameterNames)):
-        if (listExperimentPair[0] == listParameterNames[iIndex][0]):
-            strLabel = listParameterNames[iIndex][1] + " " + \
-            listParameterNames[iIndex][2]
-    
-            # Covert value from int/ float to string
-            strValue = str(listExperimentPair[1]) 
+    tupleDecoding = dic_parameterDecoding.get(listExperimentPair[0])
 
-    return strLabel, strValue
+    if (tupleDecoding is None):
+        return "", ""
 
+    # Covert value from int/ float to string
+    return tupleDecoding[0] + " " + tupleDecoding[1], str(listExperimentPair[1])
 
 def _decodeOptimizerParameters(self, listExperimentParameters : list) -> list:
     """
@@ -19,6 +19,8 @@ from FreiStat.Data_storage.constants import *
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
+from ..Data_Storage.method_registry import dic_methodCommands
+from ..Data_Storage.template_import import TemplateImport
 
 def _clickRibbonButton(self, iCommand : int) -> None:
     """
@@ -36,11 +38,26 @@ def _clickRibbonButton(self, iCommand : int) -> None:
         # Get file path
         self._strOsPath = self._openFileExplorer(BUTTON_LOAD)
         if (self._strOsPath != ""):
+            listDataStorage : list = \
+                self._dataHandling.import_Configuration(self._strOsPath)
+
+            # Report invalid entries of the file
+            for strError in self._dataHandling.get_ImportErrors():
+                self._logger.info("Import error: " + strError)
+
             self._PopUpWindow.PopUp_TemplateHandler(IMPORT_TEMPLATE, self._dataHandling,
-                self._dataHandling.import_Configuration(self._strOsPath), self._strOsPath)
+                listDataStorage, self._strOsPath)
         else :
             self._logger.info("No path selected, configuration not loaded.")
 
+    elif (iCommand == BUTTON_LOAD_FOLDER):
+        # Get folder path
+        strFolderPath : str = self._openFileExplorer(BUTTON_LOAD_FOLDER)
+        if (strFolderPath != ""):
+            self._startTemplateImport(strFolderPath)
+        else :
+            self._logger.info("No path selected, templates not imported.")
+
     elif (iCommand == BUTTON_SAVE):
         # Check if already saved
         if (self._strOsPath == ""):
@@ -55,6 +72,10 @@ def _clickRibbonButton(self, iCommand : int) -> None:
             # Save config at location
             self._dataHandling.export_Configuration(self._strOsPath)
 
+        # Report templates which couldn't be saved
+        for strError in self._dataHandling.get_ExportErrors():
+            self._logger.info("Template not saved: " + strError)
+
         # Save safety backup
         self._dataHandling.export_Configuration(self._strOsPathBackup)
 
@@ -71,6 +92,14 @@ def _clickRibbonButton(self, iCommand : int) -> None:
         # Save safety backup
         self._dataHandling.export_Configuration(self._strOsPathBackup)
 
+    elif (iCommand == BUTTON_OPEN_RUN):
+        # Get file path
+        strFilePath = self._openFileExplorer(BUTTON_OPEN_RUN)
+        if (strFilePath != ""):
+            self._displayRun(strFilePath)
+        else :
+            self._logger.info("No path selected, recording not opened.")
+
     elif (iCommand == BUTTON_PREFERENCES):
         # Open option menu in central frame
         self._update_CentralFrame_Options(self._fCentralFrame)
@@ -123,16 +152,24 @@ def _clickButton(self, iCommand : int) -> None:
         # Update navigation index
         self._iNavIndex = NI_SEQ_MODE
 
-        # Reset sequence list
-        self._SequenceList = []
-        self._strFocusedFrame = None
+        # Reset sequence
+        self._sequenceModel.clear()
+        self._dicSequenceRows = {}
+        self._iFocusedStep = None
 
         self._update_OptionbandFrame_SequeneceMode(self._fOptionBand)
         self._update_CentralFrame_Sequence(self._fCentralFrame)
     elif (iCommand == BUTTON_START):
+        # Progress bar and data handling are used by the template import
+        if (self._templateImport is not None):
+            self._logger.info("Experiments can't be started while templates " +
+                              "are imported.")
+            return
+
         # Clear plot and terminal
-        self._clearFrame(self._fPlotFrame)
-        self._TextTerminal.delete(0, END)
+        self._thumbnailStrip.clear()
+        self._listRunMethods = None
+        self._logHandler.clear_Listbox()
 
         # Update info box with current system status
         self._iSystemStatus = FS_RUNNING
@@ -150,6 +187,9 @@ def _clickButton(self, iCommand : int) -> None:
 
         # Execute the experiment
         self._executeExperiment()
+
+        # Poll the experiment with the configured tick interval
+        self._wakeScheduler()
         
     elif (iCommand == BUTTON_STOP):
         # Update system status
@@ -167,206 +207,54 @@ def _clickButton(self, iCommand : int) -> None:
         # End experiment
         self._EcMethod._terminateExperiment()
 
-    # Option band commands
-    # Single mode
-    if (iCommand == BUTTON_EC_CA):
-        # Update navigation index
-        self._iNavIndex = NI_SM_CA
-
-        # Open parameter config
-        self._update_CentralFrame_CA(self._fCentralFrame)
-
-    elif (iCommand == BUTTON_EC_LSV):
-        # Update navigation index
-        self._iNavIndex = NI_SM_LSV
-
-        # Open parameter config
-        self._update_CentralFrame_LSV(self._fCentralFrame)
-
-    elif (iCommand == BUTTON_EC_CV):
-        # Update navigation index
-        self._iNavIndex = NI_SM_CV
-
-        # Open parameter config
-        self._update_CentralFrame_CV(self._fCentralFrame)
-
-    elif (iCommand == BUTTON_EC_NPV):
-        # Update navigation index
-        self._iNavIndex = NI_SM_NPV
+        # Update the system status immediately
+        self._wakeScheduler()
 
-        # Open parameter config
-        self._update_CentralFrame_NPV(self._fCentralFrame)
-
-    elif (iCommand == BUTTON_EC_DPV):
-        # Update navigation index
-        self._iNavIndex = NI_SM_DPV
-
-        # Open parameter config
-        self._update_CentralFrame_DPV(self._fCentralFrame)
-
-    elif (iCommand == BUTTON_EC_SWV):
-        # Update navigation index
-        self._iNavIndex = NI_SM_SWV
-
-        # Open parameter config
-        self._update_CentralFrame_SWV(self._fCentralFrame)
-        
-    # Sequence mode
-    if (iCommand == BUTTON_SM_ADD_EC_CA):
-        # Add method to the sequence
-        self._update_CentralFrame_Sequence_Add(CA)
-
-        # Close the popup window
-        self._fPopupEcMethod.destroy()
-
-    elif (iCommand == BUTTON_SM_ADD_EC_LSV):
-        # Add method to the sequence
-        self._update_CentralFrame_Sequence_Add(LSV)
-
-        # Close the popup window
-        self._fPopupEcMethod.destroy()
-
-    elif (iCommand == BUTTON_SM_ADD_EC_CV):
-        # Add method to the sequence
-        self._update_CentralFrame_Sequence_Add(CV)
-
-        # Close the popup window
-        self._fPopupEcMethod.destroy()
-
-    elif (iCommand == BUTTON_SM_ADD_EC_NPV):
-        # Add method to the sequence
-        self._update_CentralFrame_Sequence_Add(NPV)
-
-        # Close the popup window
-        self._fPopupEcMethod.destroy()
+    # Option band commands
+    if (iCommand in dic_methodCommands):
+        definition = dic_methodCommands[iCommand]
 
-    elif (iCommand == BUTTON_SM_ADD_EC_DPV):
-        # Add method to the sequence
-        self._update_CentralFrame_Sequence_Add(DPV)
+        # Single mode
+        if (iCommand == definition.get_Button()):
+            # Update navigation index
+            self._iNavIndex = definition.get_NavIndex()
 
-        # Close the popup window
-        self._fPopupEcMethod.destroy()
+            # Open parameter config
+            self._update_CentralFrame_Method(self._fCentralFrame,
+                                             definition.get_Method())
 
-    elif (iCommand == BUTTON_SM_ADD_EC_SWV):
-        # Add method to the sequence
-        self._update_CentralFrame_Sequence_Add(SWV)
+        # Sequence mode
+        elif (iCommand == definition.get_ButtonAdd()):
+            # Add method to the sequence
+            self._update_CentralFrame_Sequence_Add(definition.get_Method())
 
-        # Close the popup window
-        self._fPopupEcMethod.destroy()
+            # Close the popup window
+            self._fPopupEcMethod.destroy()
 
-    elif (iCommand == BUTTON_ADD):
+    if (iCommand == BUTTON_ADD):
         # Open popup window
         self._popupEcMethod()
 
     elif (iCommand == BUTTON_DELETE):
-        # Search for the last focused sequence (Button)
-        for iIndex in range(len(self._SequenceList)):
-            if (self._SequenceList[iIndex][0].winfo_parent() == 
-                self._strFocusedFrame):
-                # Remove entry from the sequence list
-                del self._SequenceList[iIndex]
-                break
-
-        # Clear window
-        self._clearFrame(self._fDisplaySequence)
-
-        # Temporary save the sequence list
-        listTempSequence : list = self._SequenceList
-
-        # Reset sequence list
-        self._SequenceList = []
-        self._strFocusedFrame = None
-        
-        # Redraw the window
-        for iIndex in range(len(listTempSequence)):
-            # Add method to the list
-            self._update_CentralFrame_Sequence_Add(listTempSequence[iIndex][1])
+        # Remove the last focused step, the other rows are kept
+        if (self._iFocusedStep is not None):
+            self._update_CentralFrame_Sequence_Delete(self._iFocusedStep)
 
-            # Change text in widget to the template name
-            Widget.nametowidget(self._Root, self._SequenceList[iIndex][0].
-                winfo_parent() + ".!frame.!label2").configure(
-                text = listTempSequence[iIndex][2])
+    elif (iCommand == BUTTON_MOVE_UP or iCommand == BUTTON_MOVE_DOWN):
+        # Check if a step is focused
+        if (self._iFocusedStep is None):
+            return
 
-            # Save template name of methods in sequence
-            self._SequenceList[iIndex][2] = listTempSequence[iIndex][2]
+        iIndex : int = self._sequenceModel.get_Index(self._iFocusedStep)
 
-            # Save experiment parameters
-            self._SequenceList[iIndex][3] = listTempSequence[iIndex][3]
+        # Check which command is used
+        if (iCommand == BUTTON_MOVE_UP):
+            iIndex -= 1
+        elif (iCommand == BUTTON_MOVE_DOWN):
+            iIndex += 1
 
-    elif (iCommand == BUTTON_MOVE_UP or iCommand == BUTTON_MOVE_DOWN):
-        iFocusIndex : int = 0
-
-        # Search for the last focused sequence (Button)
-        for iIndex in range(len(self._SequenceList)):
-            if (self._SequenceList[iIndex][0].winfo_parent() == 
-                self._strFocusedFrame):
-                # Save index last focus
-                iFocusIndex = iIndex
-
-                # Check which command is used
-                if (iCommand == BUTTON_MOVE_UP):
-                    # Check if method can't moved further up
-                    if (iIndex == 0):
-                        return
-
-                    # Swtich the entries
-                    self._SequenceList[iIndex - 1], self._SequenceList[iIndex] = \
-                        self._SequenceList[iIndex], self._SequenceList[iIndex - 1]
-                    
-                    iFocusIndex -= 1
-                    
-                elif (iCommand == BUTTON_MOVE_DOWN):
-                    # Check if method can't moved down further
-                    if (iIndex == len(self._SequenceList) - 1):
-                        return
-
-                    # Swtich the entries
-                    self._SequenceList[iIndex + 1], self._SequenceList[iIndex] = \
-                        self._SequenceList[iIndex], self._SequenceList[iIndex + 1]                
-                
-                    iFocusIndex += 1
-                break
-
-        # Limit iFocusIndex
-        if (iFocusIndex < 0):
-            iFocusIndex = 0
-        elif (iFocusIndex > len(self._SequenceList) - 1):
-            iFocusIndex = len(self._SequenceList) - 1
-
-        # Clear window
-        self._clearFrame(self._fDisplaySequence)
-
-        # Temporary save the sequence list
-        listTempSequence : list = self._SequenceList
-
-        # Reset sequence list
-        self._SequenceList = []
-        self._strFocusedFrame = None
-
-        # Redraw the window
-        for iIndex in range(len(listTempSequence)):
-            # Add method to the list
-            self._update_CentralFrame_Sequence_Add(listTempSequence[iIndex][1])
-
-            # Check what last focused element was
-            if (iFocusIndex == iIndex):
-                # Update focused element
-                self._strFocusedFrame = self._SequenceList[iIndex][0].winfo_parent()
-
-                # Update color of new element
-                Widget.nametowidget(self._Root, self._strFocusedFrame). \
-                    configure(style= "fFocusFrame.TFrame")
-
-            # Change text in widget to the template name
-            Widget.nametowidget(self._Root, self._SequenceList[iIndex][0].
-                winfo_parent() + ".!frame.!label2").configure(
-                text = listTempSequence[iIndex][2])
-
-            # Save template name of methods in sequence
-            self._SequenceList[iIndex][2] = listTempSequence[iIndex][2]
-
-            # Save experiment parameters
-            self._SequenceList[iIndex][3] = listTempSequence[iIndex][3]
+        # Swap the focused step with its neighbour
+        self._update_CentralFrame_Sequence_Move(self._iFocusedStep, iIndex)
 
     # Plotband
     if (iCommand == BUTTON_TERMINAL):
@@ -393,16 +281,9 @@ def _clickButton(self, iCommand : int) -> None:
                                   "templated is not saved.")
                 return
             
-            bTemplateFound : bool = False
-
             # Check if template is already used
-            for iIndex in range(self._dataHandling.get_SequenceLength()):
-                if (self._dataHandling.get_TemplateName() == self._strTemplate.get()):
-                    bTemplateFound = True 
-                    break
-
-                # Move to the next data object
-                self._dataHandling.move_next_DataObject()
+            bTemplateFound : bool = self._dataHandling.select_Template(
+                self._strMethod, self._strTemplate.get())
 
             # Create instance of the data storage was not found
             if (bTemplateFound == False):
@@ -428,13 +309,8 @@ def _clickButton(self, iCommand : int) -> None:
 
         elif (iCommand == BUTTON_DELETE_TEMPLATE):
             # Delete current template
-            for iIndex in range(self._dataHandling.get_SequenceLength()):
-                if (self._dataHandling.get_TemplateName() == self._strTemplate.get()):
-                    self._dataHandling.delete_DataObject()
-                    break  
-
-                # Move to the next data object
-                self._dataHandling.move_next_DataObject()
+            self._dataHandling.delete_Template(self._strMethod, 
+                                               self._strTemplate.get())
               
     # Parameter button in: Sequence Mode
     if (self._iNavIndex == NI_SEQ_MODE):
@@ -447,21 +323,15 @@ def _clickButton(self, iCommand : int) -> None:
 
             bTemplateFound : bool = False
 
-            # Search for the last focused sequence (Button)
-            for iIndex in range(len(self._SequenceList)):
-                if (self._SequenceList[iIndex][0].winfo_parent() == 
-                    self._strFocusedFrame):
-
-                    # Save template
-                    self._SequenceList[iIndex][2] = self._strTemplate.get()
+            # Check if a step of the sequence is focused
+            if (self._iFocusedStep is not None):
+                # Save template and parameter
+                self._sequenceModel.set_Template(self._iFocusedStep,
+                    self._strTemplate.get(), self._saveEntriesInList())
 
-                    # Save parameter
-                    self._SequenceList[iIndex][3] = self._saveEntriesInList()
-
-                    # Change text in widget to the template name
-                    Widget.nametowidget(self._Root, self._strFocusedFrame + 
-                        ".!frame.!label2").configure(
-                        text = self._SequenceList[iIndex][2])
+                # Change text in widget to the template name
+                self._dicSequenceRows[self._iFocusedStep][3].configure(
+                    text = self._strTemplate.get())
 
             self._logger.info("Template successfully saved as parameters for the selected method.")
 
@@ -489,23 +359,16 @@ def _clickButton(self, iCommand : int) -> None:
             return
             
         # Check if every method in the sequence was given a template
-        for iIndex in range(len(self._SequenceList)):
-            if (not self._SequenceList[iIndex][2]):
+        for iIndex, iStepID in enumerate(self._sequenceModel.get_StepIDs()):
+            if (not self._sequenceModel.get_TemplateName(iStepID)):
                 self._logger.info("Method " + str(iIndex) + " (" + 
-                    self._SequenceList[iIndex][1] + ") has no underlying " + 
+                    self._sequenceModel.get_Method(iStepID) + ") has no underlying " + 
                     "template. Add a template to the method and try again.")
                 return     
 
-        bTemplateFound : bool = False
-
         # Check if template is already used
-        for iIndex in range(self._dataHandling.get_SequenceLength()):
-            if (self._dataHandling.get_TemplateName() == self._strTemplateSeq.get()):
-                bTemplateFound = True 
-                break
-
-            # Move to the next data object
-            self._dataHandling.move_next_DataObject()
+        bTemplateFound : bool = self._dataHandling.select_Template(
+            SEQUENCE, self._strTemplateSeq.get())
 
         # Create instance of the data storage was not found
         if (bTemplateFound == False):
@@ -531,14 +394,9 @@ def _clickButton(self, iCommand : int) -> None:
 
     elif (iCommand == BUTTON_DELETE_TEMP_SEQ):
         # Delete current template
-        for iIndex in range(self._dataHandling.get_SequenceLength()):
-            if (self._dataHandling.get_TemplateName() == self._strTemplateSeq.get()):
-                self._dataHandling.delete_DataObject()  
-                break
-            # Move to the next data object
-            self._dataHandling.move_next_DataObject()
-
-def _clickSequenceMethod(self, iCommand : int, button : Button) -> None:
+        self._dataHandling.delete_Template(SEQUENCE, self._strTemplateSeq.get())
+
+def _clickSequenceMethod(self, iStepID : int) -> None:
     """
     Description
     -----------
@@ -546,53 +404,27 @@ def _clickSequenceMethod(self, iCommand : int, button : Button) -> None:
 
     Parameters
     ----------
-    `iCommand` : int
-        Command encoded as integer
-
-    `button` : Button
-        Id of the button which was clicked
+    `iStepID` : int
+        ID of the sequence step whose button was clicked
     
     """
-    # Reset color of old focused element
-    if (self._strFocusedFrame is not None):
-        Widget.nametowidget(self._Root, self._strFocusedFrame). \
+    if (self._iFocusedStep is not None):
+        # Reset color of old focused element
+        self._dicSequenceRows[self._iFocusedStep][2]. \
             configure(style= "fWidgetButton.TFrame")
 
-    # Save template of previous method on changing focus
-    if (self._strFocusedFrame is not None):
+        # Save template of previous method on changing focus
         self._clickButton(BUTTON_SAVE_TEMPLATE)
 
     # Update new focused element
-    self._strFocusedFrame = button.winfo_parent()
+    self._iFocusedStep = iStepID
 
     # Update color of new element
-    Widget.nametowidget(self._Root, button.winfo_parent()). \
-        configure(style= "fFocusFrame.TFrame")
+    self._dicSequenceRows[iStepID][2].configure(style= "fFocusFrame.TFrame")
     
-    # Central frame
-    if (iCommand == BUTTON_SM_PARA_EC_CA):
-        # Open config for ec-method
-        self._update_CentralFrame_CA(self._fOptionsSequence)
-
-    elif (iCommand == BUTTON_SM_PARA_EC_LSV):
-        # Open config for ec-method
-        self._update_CentralFrame_LSV(self._fOptionsSequence)
-
-    elif (iCommand == BUTTON_SM_PARA_EC_CV):
-        # Open config for ec-method
-        self._update_CentralFrame_CV(self._fOptionsSequence)
-
-    elif (iCommand == BUTTON_SM_PARA_EC_NPV):
-        # Open config for ec-method
-        self._update_CentralFrame_NPV(self._fOptionsSequence)
-
-    elif (iCommand == BUTTON_SM_PARA_EC_DPV):
-        # Open config for ec-method
-        self._update_CentralFrame_DPV(self._fOptionsSequence)
-
-    elif (iCommand == BUTTON_SM_PARA_EC_SWV):
-        # Open config for ec-method
-        self._update_CentralFrame_SWV(self._fOptionsSequence)
+    # Open config for ec-method
+    self._update_CentralFrame_Method(self._fOptionsSequence, 
+                                     self._sequenceModel.get_Method(iStepID))
 
 def _clickCheckButton(self, iCommand : int) -> None:
     """
@@ -613,7 +445,8 @@ def _clickCheckButton(self, iCommand : int) -> None:
             self._fAdvancedSettingContainer.pack_forget()
         else :
             # Show advanced settings
-            self._createAdvancedSettingFrame(self._fCentralParameterFrame)
+            self._fAdvancedSettingContainer.pack(fill= X, side= TOP, 
+                                                 expand= FALSE, padx=10)
 
 def _clickMinimizeButton(self, iCommand : int) -> None:
     """
@@ -637,3 +470,72 @@ def _clickMinimizeButton(self, iCommand : int) -> None:
             self._bPlotbandHidden = False
             # Show plotband
             self._fPlotBand.pack(fill= X, side= TOP, expand= False)
+
+def _startTemplateImport(self, strFolderPath : str) -> None:
+    """
+    Description
+    -----------
+    Start importing all template files of a folder in the background. The
+    progress is shown in the progress bar.
+
+    Parameters
+    ----------
+    `strFolderPath` : string
+        Path of the folder containing the template files
+
+    """
+    # Progress bar is used by the plotter while an experiment is running
+    if (self._iSystemStatus == FS_RUNNING):
+        self._logger.info("Templates can't be imported while an experiment " + 
+                          "is running.")
+        return
+
+    if (self._templateImport is not None):
+        self._logger.info("Another import is still running.")
+        return
+
+    self._templateImport = TemplateImport.from_Folder(self._dataHandling, 
+                                                      strFolderPath)
+
+    iDone, iTotal = self._templateImport.get_Progress()
+    if (iTotal == 0):
+        self._templateImport = None
+        self._logger.info("No template files found in " + strFolderPath)
+        return
+
+    self._logger.info("Importing " + str(iTotal) + " template files...")
+
+    self._ProgressBar.configure(maximum= iTotal, value= 0)
+    self._templateImport.start()
+
+    self._Root.after(IMPORT_POLL_INTERVAL, self._pollTemplateImport)
+
+def _pollTemplateImport(self) -> None:
+    """
+    Description
+    -----------
+    Merge the completely read template files and update the progress bar. 
+    Reschedules itself until all files are merged.
+
+    """
+    if (self._templateImport is None or self._bAppRunning == False):
+        return
+
+    bDone : bool = self._templateImport.merge_Completed()
+
+    iDone, iTotal = self._templateImport.get_Progress()
+    self._ProgressBar.configure(value= iDone)
+
+    if (bDone == False):
+        self._Root.after(IMPORT_POLL_INTERVAL, self._pollTemplateImport)
+        return
+
+    # Report result of the import
+    for strError in self._templateImport.get_Errors():
+        self._logger.info("Import error: " + strError)
+
+    self._logger.info("Imported " + 
+        str(self._templateImport.get_TemplateCount()) + " templates from " + 
+        str(iTotal) + " files.")
+
+    self._templateImport = None
@@ -14,6 +14,9 @@ __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 # Import dependencies
 import logging
 import os
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
 from tkinter import *
 from tkinter.ttk import *
 from FreiStat.Data_storage.constants import *
@@ -21,7 +24,12 @@ from FreiStat.Data_storage.constants import *
 # Import internal dependencies
 from ..Data_Storage.constants import *
 from ..Data_Storage.data_handling import DataHandling
+from ..Data_Storage.method_registry import dic_methodRegistry
+from ..Data_Storage.run_recording import _recover_Recordings
+from ..Data_Storage.sequence_model import SequenceModel
 from ..PopUp_Window import FreiStatPopUp
+from ..Utility.asset_manager import dic_interfaceImages
+from ..Utility.form_cache import FormCache
 from ..Utility.positioning import _calculate_WindowPosition
 
 class QueueHandler(logging.Handler):
@@ -30,28 +38,175 @@ class QueueHandler(logging.Handler):
     -----------
     Class implementing custom print functionality for logging.Logger
 
+    Records are buffered in a thread safe ring buffer and inserted into the
+    listbox in batches by a timer running in the Tk event loop. The listbox is
+    capped at a maximum amount of lines, older lines are moved into a rotating
+    log file.
+
     """
 
-    def __init__(self, listBox):
+    def __init__(self, listBox, iMaxLines : int, strSpillPath : str):
         """
         Description
         -----------
         Overwritten logging handler constructor
+
+        Parameters
+        ----------
+        `listBox` : Listbox
+            Listbox in which the records are displayed
+
+        `iMaxLines` : int
+            Maximum amount of lines kept in the listbox
+
+        `strSpillPath` : string
+            Path of the log file, into which older lines are moved
         
         """
         super().__init__()
         self._listBox = listBox
         self.formatter = None
 
+        self._iMaxLines : int = iMaxLines
+        self._FlushID = None
+
+        # Ring buffer holding the records until the next flush
+        self._dequeRecords : deque = deque()
+        self._lockRecords = threading.Lock()
+
+        # Rotating log file for lines removed from the listbox
+        self._spillHandler = RotatingFileHandler(strSpillPath, 
+            maxBytes= LOG_FILE_SIZE, backupCount= LOG_FILE_COUNT, delay= True)
+        self._spillHandler.setFormatter(logging.Formatter("%(message)s"))
+
     def emit(self, record):
         """
         Description
         -----------
-        Method called by the logger when a message should be printed
+        Method called by the logger when a message should be printed. Can be
+        called from any thread, the record is only buffered.
         
         """
-        self._listBox.insert("end", record.msg)
-        self._listBox.yview("end")
+        strLine : str = record.getMessage()
+
+        with self._lockRecords:
+            # Move oldest record to the log file if the buffer is full
+            if (len(self._dequeRecords) >= LOG_BUFFER_SIZE):
+                self._spillLines([self._dequeRecords.popleft()])
+
+            self._dequeRecords.append(strLine)
+
+    def start_Flush(self) -> None:
+        """
+        Description
+        -----------
+        Start the timer flushing the buffered records into the listbox.
+
+        """
+        self._flushRecords()
+
+    def stop_Flush(self) -> None:
+        """
+        Description
+        -----------
+        Stop the timer and flush the remaining records into the log file.
+
+        """
+        if (self._FlushID is not None):
+            self._listBox.after_cancel(self._FlushID)
+            self._FlushID = None
+
+        with self._lockRecords:
+            self._spillLines(list(self._dequeRecords))
+            self._dequeRecords.clear()
+
+    def set_MaxLines(self, iMaxLines : int) -> None:
+        """
+        Description
+        -----------
+        Set the maximum amount of lines kept in the listbox.
+
+        Parameters
+        ----------
+        `iMaxLines` : int
+            Maximum amount of lines kept in the listbox
+
+        """
+        self._iMaxLines = max(iMaxLines, 1)
+
+    def clear_Listbox(self) -> None:
+        """
+        Description
+        -----------
+        Clear the listbox, the removed lines are moved into the log file.
+
+        """
+        self._trimListbox(0)
+
+    def close(self) -> None:
+        """
+        Description
+        -----------
+        Overwritten close method, which also closes the log file.
+
+        """
+        self._spillHandler.close()
+        super().close()
+
+    def _flushRecords(self) -> None:
+        """
+        Description
+        -----------
+        Insert all buffered records as one batch into the listbox and restart 
+        the timer.
+
+        """
+        # Take all buffered records at once
+        with self._lockRecords:
+            listLines : list = list(self._dequeRecords)
+            self._dequeRecords.clear()
+
+        if (len(listLines) > 0):
+            self._listBox.insert("end", *listLines)
+            self._trimListbox(self._iMaxLines)
+            self._listBox.yview("end")
+
+        self._FlushID = self._listBox.after(LOG_FLUSH_INTERVAL, 
+                                            self._flushRecords)
+
+    def _trimListbox(self, iMaxLines : int) -> None:
+        """
+        Description
+        -----------
+        Remove the oldest lines from the listbox until the maximum amount of
+        lines is reached. Removed lines are moved into the log file.
+
+        Parameters
+        ----------
+        `iMaxLines` : int
+            Maximum amount of lines kept in the listbox
+
+        """
+        iOverflow : int = self._listBox.size() - iMaxLines
+
+        if (iOverflow > 0):
+            self._spillLines(self._listBox.get(0, iOverflow - 1))
+            self._listBox.delete(0, iOverflow - 1)
+
+    def _spillLines(self, listLines : list) -> None:
+        """
+        Description
+        -----------
+        Write the given lines into the rotating log file.
+
+        Parameters
+        ----------
+        `listLines` : list
+            List containing the lines which should be written
+
+        """
+        for strLine in listLines:
+            self._spillHandler.emit(logging.makeLogRecord({"msg": strLine}))
 
 class FreiStatInterface():
     """
@@ -65,26 +220,36 @@ class FreiStatInterface():
     from .CentralFrame import _update_CentralFrame_EntryScreen
     from .CentralFrame import _update_CentralFrame_Base
     from .CentralFrame import _update_CentralFrame_Options
-    from .CentralFrame import _update_CentralFrame_CA
-    from .CentralFrame import _update_CentralFrame_LSV
-    from .CentralFrame import _update_CentralFrame_CV
-    from .CentralFrame import _update_CentralFrame_NPV
-    from .CentralFrame import _update_CentralFrame_DPV
-    from .CentralFrame import _update_CentralFrame_SWV
+    from .CentralFrame import _update_CentralFrame_Method
     from .CentralFrame import _update_CentralFrame_Sequence
     from .CentralFrame import _update_CentralFrame_Sequence_Add
     from .CentralFrame import _update_CentralFrame_Sequence_Load
+    from .CentralFrame import _update_CentralFrame_Sequence_Move
+    from .CentralFrame import _update_CentralFrame_Sequence_Delete
+    from .CentralFrame import _update_CentralFrame_Sequence_Links
     from .CentralFrame import _createAdvancedSettingFrame
+    from .CentralFrame import _createParameterFrame
 
     from .Events import _on_focus_out
     from .Events import _on_resize
     from .Events import _bound_MouseWheel
     from .Events import _unbound_MouseWheel
     from .Events import _onMouseWheel
+    from .Events import _on_sequence_drag_start
+    from .Events import _on_sequence_drag_motion
+    from .Events import _on_sequence_drag_release
 
     from .Experiment import _executeExperiment
     from .Experiment import _executeSequence
     from .Experiment import _executeSingleMethod
+    from .Experiment import _rejectExperiment
+    from .Experiment import _create_StaticPlot
+    from .Experiment import _createSimulatedDevice
+    from .Experiment import _getFacadeSettings
+    from .Experiment import _warmUpImports
+    from .Experiment import _onDeferredImports
+    from .Experiment import _startDataDrain
+    from .Experiment import _stopDataDrain
 
     from .Menuband import _create_MenubandFrame
 
@@ -103,9 +268,18 @@ class FreiStatInterface():
     from .Plotband import _update_PlotbandFrame_Plots
     from .Plotband import _update_PlotbandFrame_Terminal
     from .Plotband import _multiscroll_plotband
+    from .Plotband import _displayRun
+    from .Plotband import _plotRunSegment
+    from .Plotband import _decodeRunSegment
     
     from .Ribbon import _create_RibbonFrame
 
+    from .Scheduler import _startScheduler
+    from .Scheduler import _stopScheduler
+    from .Scheduler import _wakeScheduler
+    from .Scheduler import _updateScheduler
+    from .Scheduler import _getTickRate
+
     from .Style import _LoadIcons
     from .Style import _StyleConfig
 
@@ -120,36 +294,58 @@ class FreiStatInterface():
     from .Widgets import _clickMinimizeButton
     from .Widgets import _clickRibbonButton
     from .Widgets import _clickSequenceMethod
+    from .Widgets import _startTemplateImport
+    from .Widgets import _pollTemplateImport
     from .Plotband import _on_mouse_press
 
-    def __init__(self) -> None:
+    def __init__(self, startupProfile = None) -> None:
         """
         Description
         -----------
         Constructor of the class FreiStatInterface.
+
+        Parameters
+        ----------
+        `startupProfile` : StartupProfile
+            Optional profile, in which the phases of the startup are marked
         
         """
         # Intialize class variables
+        self._startupProfile = startupProfile
         self._bAppRunning : bool= True
         self._bPlotbandHidden : bool = False
 
         self._iNavIndex : int = NI_SINGLE_MODE
         self._iSystemStatus : int = FS_WAITING
         self._iPlotIDprevious : int = None
+        self._iTickInterval : int = int(SET_TICK_RATE_VALUE)
+        self._iFocusedStep : int = None
+        self._iDragStep : int = None
 
         self._strMethod : str = UNDEFIEND
-        self._strFocusedFrame : str = None
         self._strOsPath : str = ""
         self._strAssetPath : str = __path__[0] + './../'
         self._strOsPathBackup : str = self._strAssetPath + "./backup/backup.fst"
+        self._strOsPathRecordings : str = self._strAssetPath + "./recordings"
 
-        self._listCanvas : list = []
         self._listCanvasPressIDs : list = []
         self._listFigures : list = []
-        self._SequenceList : list = []
+        self._listRunMethods : list = None
+        self._listSequenceMethods : list = []
+        self._listParameterBandFrames : list = []
+        self._listParameterBandText : list = []
+        self._tupleParameterBandLayout : tuple = None
+        self._dicSequenceRows : dict = {}
 
         self._fig  = None
         self._fStaticPlot = None
+        self._process = None
+        self._SchedulerID = None
+        self._dataDrain = None
+        self._measurementStorage = None
+        self._runRecorder = None
+        self._runReader = None
+        self._templateImport = None
 
         # save current working directory of the interface
         self._strRootPath = os.getcwd()
@@ -169,16 +365,16 @@ class FreiStatInterface():
         # Set title of the main window
         self._Root.title("FreiStat")
 
+        # Create the asset manager, which loads the icons on first use
+        self._LoadIcons()
+
         # Set icon of the main window
-        img = PhotoImage(file= self._strAssetPath + '/assets/logo/FreiStat.gif')
-        self._Root.tk.call('wm', 'iconphoto', self._Root._w, img)
+        self._Root.tk.call('wm', 'iconphoto', self._Root._w, 
+            self._assetManager.get_Image(LOGO_ICON_FILE, bScaled= False))
 
         # Create all styles used by the interface
         self._StyleConfig()
 
-        # Load all icons
-        self._LoadIcons()
-
         # Initialize entry box values
         self._iAdvancedSetting = IntVar(value= 0)
         self._iFixedWEPotential = IntVar(value= 1)
@@ -187,6 +383,7 @@ class FreiStatInterface():
         self._iLowPerformanceMode = IntVar(value= 0)
         self._iGlobalLowPerformanceMode = IntVar(value= 0)
         self._iWLANMode = IntVar(value= 0)
+        self._iSimulation = IntVar(value= SET_SIMULATION_VALUE)
 
         self._strBaseVoltage = StringVar()
         self._strStartVoltage = StringVar()
@@ -209,12 +406,17 @@ class FreiStatInterface():
         self._strCycleSeq = StringVar()
 
         self._strGLpmLatency = StringVar()
+        self._strTickRate = StringVar(value= SET_TICK_RATE_VALUE)
+        self._strTerminalLines = StringVar(value= SET_TERMINAL_LINES_VALUE)
         self._strServerIP = StringVar()
         self._strServerPort = StringVar()
         self._strClientIP = StringVar()
         self._strClientPort = StringVar()
+        self._strSimulationRate = StringVar(value= SET_SIMULATION_RATE_VALUE)
+        self._strSimulationNoise = StringVar(value= SET_SIMULATION_NOISE_VALUE)
 
         self._strInfo = StringVar()
+        self._strFPS = StringVar()
         self._strTerminal = StringVar()
         self._strTemplate = StringVar()
         self._strTemplateSeq = StringVar()
@@ -222,9 +424,17 @@ class FreiStatInterface():
         # Create instance of the data handling
         self._dataHandling = DataHandling(self._strRootPath)
 
+        # Parameter forms of the methods are built once and then reused
+        self._formCache = FormCache(FORM_CACHE_SIZE)
+
+        # Steps of the sequence edited in the sequence mode
+        self._sequenceModel = SequenceModel()
+
         # Create base for PopUp windows
-        self._PopUpWindow = FreiStatPopUp(iCenterX, iCenterY)
-        self._PopUpWindowTooltip = FreiStatPopUp(iCenterX, iCenterY)
+        self._PopUpWindow = FreiStatPopUp(iCenterX, iCenterY, 
+                                          self._assetManager)
+        self._PopUpWindowTooltip = FreiStatPopUp(iCenterX, iCenterY, 
+                                                 self._assetManager)
 
         # Crfeate the different sub frames inside the main window
         # Ribbon at the most top
@@ -252,12 +462,18 @@ class FreiStatInterface():
         self._logger = logging.getLogger("FreiStat_Interface")
         self._logger.setLevel(logging.INFO)
 
-        handler = QueueHandler(self._TextTerminal)
-        handler.setLevel(logging.INFO)
+        self._logHandler = QueueHandler(self._TextTerminal, 
+            int(SET_TERMINAL_LINES_VALUE), 
+            os.path.join(self._strRootPath, LOG_FILE_NAME))
+        self._logHandler.setLevel(logging.INFO)
         
         formatter = logging.Formatter("%(asctime)s;%(levelname)s;%(message)s")
-        handler.setFormatter(formatter)
-        self._logger.addHandler(handler)
+        self._logHandler.setFormatter(formatter)
+        self._logger.addHandler(self._logHandler)
+
+        # Recover recordings of experiments, which were interrupted
+        for strFilePath in _recover_Recordings(self._strOsPathRecordings):
+            self._logger.info("Recovered interrupted recording " + strFilePath)
 
         # Import safety backup
         self._dataHandling.set_DataStorages(
@@ -266,44 +482,52 @@ class FreiStatInterface():
         # Import settings
         self._dataHandling.import_Settings()
         self._updatePreferences()
+        self._applyTerminalLines()
 
         # Show entry screen
         self._update_CentralFrame_EntryScreen(self._fCentralFrame)
 
+        if (self._startupProfile is not None):
+            self._startupProfile.mark("Window created")
+
         # Call main loop
         self.Main()
 
+    def __getattr__(self, strAttribute : str):
+        """
+        Description
+        -----------
+        Load the images of the interface (see `dic_interfaceImages`) on first
+        access of their attribute. Only called for attributes, which are not
+        set on the object.
+
+        """
+        if (strAttribute in dic_interfaceImages and 
+            "_assetManager" in self.__dict__):
+            return self._assetManager.get_Image(
+                dic_interfaceImages[strAttribute])
+
+        raise AttributeError(strAttribute)
+
     def Main(self) -> None:
         """
         Description
         -----------
-        Main loop of the interface
+        Main loop of the interface. The experiment and system status are
+        polled by the scheduler, which is driven by the Tk event loop.
 
         """
+        # Start polling the experiment and system status
+        self._startScheduler()
+
+        # Start flushing log records into the terminal
+        self._logHandler.start_Flush()
+
+        # Import the facades and matplotlib once the window is shown
+        self._Root.after_idle(self._warmUpImports)
+
         # Loop until window is closed
-        while(self._bAppRunning):
-            # Check if experiment is still running
-            if (self._iSystemStatus ==  FS_RUNNING and 
-                self._process.is_alive() == False):
-                # Update system status
-                self._iSystemStatus = FS_COMPLETED
-                
-                # Enable start button and disable stop / live feed button
-                self._ButtonStart["state"] = NORMAL
-                self._ButtonStop["state"] = DISABLED
-                self._ButtonLiveFeed["state"] = DISABLED
-
-                self._TextInfo.configure(style= "fLabelCompleted.TLabel")
-
-            elif (self._iSystemStatus == FS_STOP):
-                self._TextInfo.configure(style= "fLabelCanceled.TLabel")
-
-            # Update info box with current system status
-            self._strInfo.set(self._decodeSystemStatus(self._iSystemStatus))
-
-            # Update interface
-            self._Root.update_idletasks()
-            self._Root.update()     
+        self._Root.mainloop()
 
     def _createSpacerFrame(self, parentFrame : Frame, strStyle : str) -> None:
         """
@@ -400,9 +624,24 @@ class FreiStatInterface():
             # Low performance mode latency
             elif (listPreferences[iIndex][0] == SET_GLPM_LATENCY):
                 self._strGLpmLatency.set(listPreferences[iIndex][1]) 
+            # Scheduler tick interval
+            elif (listPreferences[iIndex][0] == SET_TICK_RATE):
+                self._strTickRate.set(listPreferences[iIndex][1]) 
+            # Maximum amount of terminal lines
+            elif (listPreferences[iIndex][0] == SET_TERMINAL_LINES):
+                self._strTerminalLines.set(listPreferences[iIndex][1]) 
             # Wlan mode
             elif (listPreferences[iIndex][0] == SET_WLAN_MODE):
                 self._iWLANMode.set(listPreferences[iIndex][1])         
+            # Simulated device
+            elif (listPreferences[iIndex][0] == SET_SIMULATION):
+                self._iSimulation.set(listPreferences[iIndex][1])
+            # Sample rate factor of the simulated device
+            elif (listPreferences[iIndex][0] == SET_SIMULATION_RATE):
+                self._strSimulationRate.set(listPreferences[iIndex][1])
+            # Noise of the simulated device
+            elif (listPreferences[iIndex][0] == SET_SIMULATION_NOISE):
+                self._strSimulationNoise.set(listPreferences[iIndex][1])
             # Server IP
             elif (listPreferences[iIndex][0] == SET_SERVER_IP):
                 self._strServerIP.set(listPreferences[iIndex][1])  
@@ -426,7 +665,12 @@ class FreiStatInterface():
         listPreferences : list = [
             [SET_GLPM, self._iGlobalLowPerformanceMode.get()],
             [SET_GLPM_LATENCY, self._strGLpmLatency.get()],
+            [SET_TICK_RATE, self._strTickRate.get()],
+            [SET_TERMINAL_LINES, self._strTerminalLines.get()],
             [SET_WLAN_MODE, self._iWLANMode.get()],
+            [SET_SIMULATION, self._iSimulation.get()],
+            [SET_SIMULATION_RATE, self._strSimulationRate.get()],
+            [SET_SIMULATION_NOISE, self._strSimulationNoise.get()],
             [SET_SERVER_IP, self._strServerIP.get()],
             [SET_SERVER_PORT, self._strServerPort.get()],
             [SET_CLIENT_IP, self._strClientIP.get()],
@@ -436,6 +680,24 @@ class FreiStatInterface():
         # Save preferences
         self._dataHandling.set_Preferences(listPreferences)
 
+        # Apply maximum amount of terminal lines
+        self._applyTerminalLines()
+
+    def _applyTerminalLines(self) -> None:
+        """
+        Description
+        -----------
+        Helper method which applies the maximum amount of terminal lines set in
+        the preferences to the log handler.
+
+        """
+        try:
+            iMaxLines : int = int(self._strTerminalLines.get())
+        except ValueError:
+            iMaxLines = int(SET_TERMINAL_LINES_VALUE)
+
+        self._logHandler.set_MaxLines(iMaxLines)
+
     def _initEntries(self, strMethod : str) -> None:
         """
         Description
@@ -455,75 +717,11 @@ class FreiStatInterface():
         # Load global value of low performance mode
         self._iLowPerformanceMode.set(self._iGlobalLowPerformanceMode.get())
 
-        if (strMethod == CA):
-            self._strPotentialSteps.set(str(START_POTENTIAL_F) + " , " + 
-                str(START_POTENTIAL_F))
-            self._strPulseLengths.set(str(PULSE_LENGTH_F) + " , " + 
-                str(PULSE_LENGTH_F))
-            self._strSamplingRate.set(SAMPLING_RATE_F)
-            self._strCycle.set(CYCLE_I)
-            self._strCurrentrange.set(CURRENT_RANGE_F)
-            self._strOsrSinc2.set(SINC2_OVERSAMPLING_I)
-            self._strOsrSinc3.set(SINC3_OVERSAMPLING_I)
-
-        elif (strMethod == LSV):
-            self._strStartVoltage.set(START_POTENTIAL_F)
-            self._strStopVoltage.set(UPPER_POTENTIAL_F)
-            self._strStepsize.set(STEP_SIZE_F)
-            self._strScanrate.set(SCAN_RATE_F)
-            self._strCycle.set(CYCLE_I)
-            self._strCurrentrange.set(CURRENT_RANGE_F)
-            self._strOsrSinc2.set(SINC2_OVERSAMPLING_I)
-            self._strOsrSinc3.set(SINC3_OVERSAMPLING_I)
-
-        elif (strMethod == CV):
-            self._strStartVoltage.set(START_POTENTIAL_F)
-            self._strLowerVoltage.set(LOWER_POTENTIAL_F)
-            self._strUpperVoltage.set(UPPER_POTENTIAL_F)
-            self._strStepsize.set(STEP_SIZE_F)
-            self._strScanrate.set(SCAN_RATE_F)
-            self._strCycle.set(CYCLE_I)
-            self._strCurrentrange.set(CURRENT_RANGE_F)
-            self._strOsrSinc2.set(SINC2_OVERSAMPLING_I)
-            self._strOsrSinc3.set(SINC3_OVERSAMPLING_I)
-
-        elif (strMethod == NPV):
-            self._strBaseVoltage.set(BASE_POTENTIAL_F)
-            self._strStartVoltage.set(START_POTENTIAL_F)
-            self._strStopVoltage.set(UPPER_POTENTIAL_F)
-            self._strDeltaVStaircase.set(DELTA_V_STAIRCASE_F)
-            self._strPulseLengths.set(str(PULSE_LENGTH_F) + " , " + 
-                str(PULSE_LENGTH_F))
-            self._strSamplingDuration.set(SAMPLING_DURATION_F)
-            self._strCycle.set(CYCLE_I)
-            self._strCurrentrange.set(CURRENT_RANGE_F)
-            self._strOsrSinc2.set(SINC2_OVERSAMPLING_I)
-            self._strOsrSinc3.set(SINC3_OVERSAMPLING_I)
-
-        elif (strMethod == DPV):
-            self._strStartVoltage.set(START_POTENTIAL_F)
-            self._strStopVoltage.set(UPPER_POTENTIAL_F)
-            self._strDeltaVStaircase.set(DELTA_V_STAIRCASE_F)
-            self._strDeltaVPeak.set(DELTA_V_PEAK_F)
-            self._strPulseLengths.set(str(PULSE_LENGTH_F) + " , " + 
-                str(PULSE_LENGTH_F))
-            self._strSamplingDuration.set(SAMPLING_DURATION_F)
-            self._strCycle.set(CYCLE_I)
-            self._strCurrentrange.set(CURRENT_RANGE_F)
-            self._strOsrSinc2.set(SINC2_OVERSAMPLING_I)
-            self._strOsrSinc3.set(SINC3_OVERSAMPLING_I)
-
-        elif (strMethod == SWV):
-            self._strStartVoltage.set(START_POTENTIAL_F)
-            self._strStopVoltage.set(UPPER_POTENTIAL_F)
-            self._strDeltaVStaircase.set(DELTA_V_STAIRCASE_F)
-            self._strDeltaVPeak.set(DELTA_V_PEAK_F)
-            self._strDutyCycle.set(PULSE_LENGTH_F)
-            self._strSamplingDuration.set(SAMPLING_DURATION_F)
-            self._strCycle.set(CYCLE_I)
-            self._strCurrentrange.set(CURRENT_RANGE_F)
-            self._strOsrSinc2.set(SINC2_OVERSAMPLING_I)
-            self._strOsrSinc3.set(SINC3_OVERSAMPLING_I)
+        for parameter in dic_methodRegistry[strMethod].get_Parameters():
+            # Check buttons keep their value
+            if (parameter.get_Default() is not None):
+                getattr(self, parameter.get_Variable()).set(
+                    parameter.get_Default())
 
     def _updateEntries(self, strMethod : str) -> None:
         """
@@ -546,11 +744,11 @@ class FreiStatInterface():
 
         # Check which method is used
         if(self._dataHandling.get_ExperimentType() == SEQUENCE):
-            for iIndex in range(len(self._SequenceList)):
-                if(self._SequenceList[iIndex][0].winfo_parent() == 
-                    self._strFocusedFrame):
-                    listExperimentParameters = self._SequenceList[iIndex][3]
-                    self._strTemplate.set(self._SequenceList[iIndex][2])
+            if (self._iFocusedStep is not None):
+                listExperimentParameters = self._sequenceModel. \
+                    get_ExperimentParameters(self._iFocusedStep)
+                self._strTemplate.set(self._sequenceModel.get_TemplateName(
+                    self._iFocusedStep))
 
             # Check if entry was found
             if (not listExperimentParameters):
@@ -564,117 +762,14 @@ class FreiStatInterface():
             
             self._strTemplate.set(self._dataHandling.get_TemplateName())
 
-        if (strMethod == CA):
-            strTemp : str = ""
-            for iIndex in range(len(listExperimentParameters[0][1])):
-                strTemp += str(listExperimentParameters[0][1][iIndex])
-                if (iIndex < len(listExperimentParameters[0][1]) - 1):
-                    strTemp += " , "
-            self._strPotentialSteps.set(strTemp)
-            
-            strTemp = ""
-            for iIndex in range(len(listExperimentParameters[1][1])):
-                strTemp += str(listExperimentParameters[1][1][iIndex])
-                if (iIndex < len(listExperimentParameters[1][1]) - 1):
-                    strTemp += " , "
-            self._strPulseLengths.set(strTemp)
-            self._strSamplingRate.set(self._shorten_decimals(listExperimentParameters[2][1], 3))
-            self._strCycle.set(listExperimentParameters[3][1])
-            self._strCurrentrange.set(self._shorten_decimals(listExperimentParameters[4][1], 6))
-            self._iMainsFilter.set(listExperimentParameters[5][1])
-            self._strOsrSinc2.set(listExperimentParameters[6][1])
-            self._strOsrSinc3.set(listExperimentParameters[7][1])
-            self._iEnableOptimizer.set(listExperimentParameters[8][1])
-            self._iLowPerformanceMode.set(listExperimentParameters[9][1])
-
-        elif (strMethod == LSV):
-            self._strStartVoltage.set(self._shorten_decimals(listExperimentParameters[0][1], 3))
-            self._strStopVoltage.set(self._shorten_decimals(listExperimentParameters[1][1], 3))
-            self._strStepsize.set(self._shorten_decimals(listExperimentParameters[2][1], 6))
-            self._strScanrate.set(self._shorten_decimals(listExperimentParameters[3][1], 3))
-            self._strCycle.set(listExperimentParameters[4][1])
-            self._strCurrentrange.set(self._shorten_decimals(listExperimentParameters[5][1], 6))
-            self._iFixedWEPotential.set(listExperimentParameters[6][1])
-            self._iMainsFilter.set(listExperimentParameters[7][1])
-            self._strOsrSinc2.set(listExperimentParameters[8][1])
-            self._strOsrSinc3.set(listExperimentParameters[9][1])
-            self._iEnableOptimizer.set(listExperimentParameters[10][1])
-            self._iLowPerformanceMode.set(listExperimentParameters[11][1])
-
-        elif (strMethod == CV):
-            self._strStartVoltage.set(self._shorten_decimals(listExperimentParameters[0][1], 3))
-            self._strLowerVoltage.set(self._shorten_decimals(listExperimentParameters[1][1], 3))
-            self._strUpperVoltage.set(self._shorten_decimals(listExperimentParameters[2][1], 3))
-            self._strStepsize.set(self._shorten_decimals(listExperimentParameters[3][1], 6))
-            self._strScanrate.set(self._shorten_decimals(listExperimentParameters[4][1], 3))
-            self._strCycle.set(listExperimentParameters[5][1])
-            self._strCurrentrange.set(self._shorten_decimals(listExperimentParameters[6][1], 6))
-            self._iFixedWEPotential.set(listExperimentParameters[7][1])
-            self._iMainsFilter.set(listExperimentParameters[8][1])
-            self._strOsrSinc2.set(listExperimentParameters[9][1])
-            self._strOsrSinc3.set(listExperimentParameters[10][1])
-            self._iEnableOptimizer.set(listExperimentParameters[11][1])
-            self._iLowPerformanceMode.set(listExperimentParameters[12][1])
-
-        elif (strMethod == NPV):
-            self._strBaseVoltage.set(self._shorten_decimals(listExperimentParameters[0][1], 3))
-            self._strStartVoltage.set(self._shorten_decimals(listExperimentParameters[1][1], 3))
-            self._strStopVoltage.set(self._shorten_decimals(listExperimentParameters[2][1], 3))
-            self._strDeltaVStaircase.set(self._shorten_decimals(listExperimentParameters[3][1], 6))
-            strTemp : str = ""
-            for iIndex in range(len(listExperimentParameters[4][1])):
-                strTemp += str(listExperimentParameters[4][1][iIndex])
-                if (iIndex < len(listExperimentParameters[4][1]) - 1):
-                    strTemp += " , "
-            self._strPulseLengths.set(strTemp)
-            self._strSamplingDuration.set(self._shorten_decimals(listExperimentParameters[5][1], 6))
-            self._strCycle.set(listExperimentParameters[6][1])
-            self._strCurrentrange.set(self._shorten_decimals(listExperimentParameters[7][1], 6))
-            self._iFixedWEPotential.set(listExperimentParameters[8][1])
-            self._iMainsFilter.set(listExperimentParameters[9][1])
-            self._strOsrSinc2.set(listExperimentParameters[10][1])
-            self._strOsrSinc3.set(listExperimentParameters[11][1])
-            self._iEnableOptimizer.set(listExperimentParameters[12][1])
-            self._iLowPerformanceMode.set(listExperimentParameters[13][1])
-
-        elif (strMethod == DPV):
-            self._strStartVoltage.set(self._shorten_decimals(listExperimentParameters[0][1], 3))
-            self._strStopVoltage.set(self._shorten_decimals(listExperimentParameters[1][1], 3))
-            self._strDeltaVStaircase.set(self._shorten_decimals(listExperimentParameters[2][1], 6))
-            self._strDeltaVPeak.set(self._shorten_decimals(listExperimentParameters[3][1], 6))
-            strTemp : str = ""
-            for iIndex in range(len(listExperimentParameters[4][1])):
-                strTemp += str(listExperimentParameters[4][1][iIndex])
-                if (iIndex < len(listExperimentParameters[4][1]) - 1):
-                    strTemp += " , "
-            self._strPulseLengths.set(strTemp)
-            self._strSamplingDuration.set(self._shorten_decimals(listExperimentParameters[5][1], 6))
-            self._strCycle.set(listExperimentParameters[6][1])
-            self._strCurrentrange.set(self._shorten_decimals(listExperimentParameters[7][1], 6))
-            self._iFixedWEPotential.set(listExperimentParameters[8][1])
-            self._iMainsFilter.set(listExperimentParameters[9][1])
-            self._strOsrSinc2.set(listExperimentParameters[10][1])
-            self._strOsrSinc3.set(listExperimentParameters[11][1])
-            self._iEnableOptimizer.set(listExperimentParameters[12][1])
-            self._iLowPerformanceMode.set(listExperimentParameters[13][1])
-
-        elif (strMethod == SWV):
-            if (type(listExperimentParameters[4][1]) == list):
-                listExperimentParameters[4][1] = sum(listExperimentParameters[4][1])
-            self._strStartVoltage.set(self._shorten_decimals(listExperimentParameters[0][1], 3))
-            self._strStopVoltage.set(self._shorten_decimals(listExperimentParameters[1][1], 3))
-            self._strDeltaVStaircase.set(self._shorten_decimals(listExperimentParameters[2][1], 6))
-            self._strDeltaVPeak.set(self._shorten_decimals(listExperimentParameters[3][1], 6))
-            self._strDutyCycle.set(self._shorten_decimals(listExperimentParameters[4][1], 6))
-            self._strSamplingDuration.set(self._shorten_decimals(listExperimentParameters[5][1], 6))
-            self._strCycle.set(listExperimentParameters[6][1])
-            self._strCurrentrange.set(self._shorten_decimals(listExperimentParameters[7][1], 6))
-            self._iFixedWEPotential.set(listExperimentParameters[8][1])
-            self._iMainsFilter.set(listExperimentParameters[9][1])
-            self._strOsrSinc2.set(listExperimentParameters[10][1])
-            self._strOsrSinc3.set(listExperimentParameters[11][1])
-            self._iEnableOptimizer.set(listExperimentParameters[12][1])
-            self._iLowPerformanceMode.set(listExperimentParameters[13][1])
+        # Parameters are matched by their key
+        dicValues : dict = {listParameter[0] : listParameter[1]
+                            for listParameter in listExperimentParameters}
+
+        for parameter in dic_methodRegistry[strMethod].get_Parameters():
+            if (parameter.get_Key() in dicValues):
+                getattr(self, parameter.get_Variable()).set(
+                    parameter.to_Text(dicValues[parameter.get_Key()]))
 
     def _saveEntries(self) -> None:
         """
@@ -696,16 +791,8 @@ class FreiStatInterface():
 
             # Sequence mode
             if (self._iNavIndex == NI_SEQ_MODE):
-                listTempExperimentParameters = []
-
-                for iIndex in range(len(self._SequenceList)):
-                    listTempExperimentParameters.append(
-                        [self._SequenceList[iIndex][1], 
-                        self._SequenceList[iIndex][2], 
-                        self._SequenceList[iIndex][3]])
-                
                 self._dataHandling.save_ExperimentParmeters(
-                    listTempExperimentParameters)
+                    self._sequenceModel.get_Sequence())
         else :
             # Save template name
             self._dataHandling.save_TemplateName(self._strTemplate.get())
@@ -729,104 +816,11 @@ class FreiStatInterface():
             List containing the experiment paramters
 
         """
-        if (self._strMethod == CA): 
-            listTempExperimentParameters = [
-                [POTENTIAL_STEPS, [float(x) for x in 
-                    self._strPotentialSteps.get().split(",")]],
-                [PULSE_LENGTH, [float(x) for x in 
-                    self._strPulseLengths.get().split(",")]],
-                [SAMPLING_RATE, float(self._strSamplingRate.get())],
-                [CYCLE, int(self._strCycle.get())],
-                [LPTIA_RTIA_SIZE, float(self._strCurrentrange.get())],
-                [MAINS_FILTER, bool(self._iMainsFilter.get())],
-                [SINC2_OVERSAMPLING, int(self._strOsrSinc2.get())],
-                [SINC3_OVERSAMPLING ,int(self._strOsrSinc3.get())],
-                [ENABLE_OPTIMIZER, bool(self._iEnableOptimizer.get())],
-                [LOW_PERFORMANCE_MODE, bool(self._iLowPerformanceMode.get())]]
-
-        elif (self._strMethod == LSV): 
-            listTempExperimentParameters = [
-                [START_POTENTIAL, float(self._strStartVoltage.get())],
-                [STOP_POTENTIAL, float(self._strStopVoltage.get())],
-                [STEP_SIZE, float(self._strStepsize.get())],
-                [SCAN_RATE, float(self._strScanrate.get())],
-                [CYCLE, int(self._strCycle.get())],
-                [LPTIA_RTIA_SIZE, float(self._strCurrentrange.get())],
-                [FIXED_WE_POTENTIAL, bool(self._iFixedWEPotential.get())],
-                [MAINS_FILTER, bool(self._iMainsFilter.get())],
-                [SINC2_OVERSAMPLING, int(self._strOsrSinc2.get())],
-                [SINC3_OVERSAMPLING ,int(self._strOsrSinc3.get())],
-                [ENABLE_OPTIMIZER, bool(self._iEnableOptimizer.get())],
-                [LOW_PERFORMANCE_MODE, bool(self._iLowPerformanceMode.get())]]
-
-        elif (self._strMethod == CV): 
-            listTempExperimentParameters = [
-                [START_POTENTIAL, float(self._strStartVoltage.get())],
-                [LOWER_POTENTIAL, float(self._strLowerVoltage.get())],
-                [UPPER_POTENTIAL, float(self._strUpperVoltage.get())],
-                [STEP_SIZE, float(self._strStepsize.get())],
-                [SCAN_RATE, float(self._strScanrate.get())],
-                [CYCLE, int(self._strCycle.get())],
-                [LPTIA_RTIA_SIZE, float(self._strCurrentrange.get())],
-                [FIXED_WE_POTENTIAL, bool(self._iFixedWEPotential.get())],
-                [MAINS_FILTER, bool(self._iMainsFilter.get())],
-                [SINC2_OVERSAMPLING, int(self._strOsrSinc2.get())],
-                [SINC3_OVERSAMPLING ,int(self._strOsrSinc3.get())],
-                [ENABLE_OPTIMIZER, bool(self._iEnableOptimizer.get())],
-                [LOW_PERFORMANCE_MODE, bool(self._iLowPerformanceMode.get())]]
-
-        elif (self._strMethod == NPV): 
-            listTempExperimentParameters = [
-                [BASE_POTENTIAL, float(self._strBaseVoltage.get())],
-                [START_POTENTIAL, float(self._strStartVoltage.get())],
-                [STOP_POTENTIAL, float(self._strStopVoltage.get())],
-                [DELTA_V_STAIRCASE, float(self._strDeltaVStaircase.get())],
-                [PULSE_LENGTH, [float(x) for x in 
-                    self._strPulseLengths.get().split(",")]],
-                [SAMPLING_DURATION, float(self._strSamplingDuration.get())],
-                [CYCLE, int(self._strCycle.get())],
-                [LPTIA_RTIA_SIZE, float(self._strCurrentrange.get())],
-                [FIXED_WE_POTENTIAL, bool(self._iFixedWEPotential.get())],
-                [MAINS_FILTER, bool(self._iMainsFilter.get())],
-                [SINC2_OVERSAMPLING, int(self._strOsrSinc2.get())],
-                [SINC3_OVERSAMPLING ,int(self._strOsrSinc3.get())],
-                [ENABLE_OPTIMIZER, bool(self._iEnableOptimizer.get())],
-                [LOW_PERFORMANCE_MODE, bool(self._iLowPerformanceMode.get())]]
-
-        elif (self._strMethod == DPV): 
-            listTempExperimentParameters = [
-                [START_POTENTIAL, float(self._strStartVoltage.get())],
-                [STOP_POTENTIAL, float(self._strStopVoltage.get())],
-                [DELTA_V_STAIRCASE, float(self._strDeltaVStaircase.get())],
-                [DELTA_V_PEAK, float(self._strDeltaVPeak.get())],
-                [PULSE_LENGTH, [float(x) for x in 
-                    self._strPulseLengths.get().split(",")]],
-                [SAMPLING_DURATION, float(self._strSamplingDuration.get())],
-                [CYCLE, int(self._strCycle.get())],
-                [LPTIA_RTIA_SIZE, float(self._strCurrentrange.get())],
-                [FIXED_WE_POTENTIAL, bool(self._iFixedWEPotential.get())],
-                [MAINS_FILTER, bool(self._iMainsFilter.get())],
-                [SINC2_OVERSAMPLING, int(self._strOsrSinc2.get())],
-                [SINC3_OVERSAMPLING ,int(self._strOsrSinc3.get())],
-                [ENABLE_OPTIMIZER, bool(self._iEnableOptimizer.get())],
-                [LOW_PERFORMANCE_MODE, bool(self._iLowPerformanceMode.get())]]
-
-        elif (self._strMethod == SWV): 
-            listTempExperimentParameters = [
-                [START_POTENTIAL, float(self._strStartVoltage.get())],
-                [STOP_POTENTIAL, float(self._strStopVoltage.get())],
-                [DELTA_V_STAIRCASE, float(self._strDeltaVStaircase.get())],
-                [DELTA_V_PEAK, float(self._strDeltaVPeak.get())],
-                [PULSE_LENGTH, float(self._strDutyCycle.get())],
-                [SAMPLING_DURATION, float(self._strSamplingDuration.get())],
-                [CYCLE, int(self._strCycle.get())],
-                [LPTIA_RTIA_SIZE, float(self._strCurrentrange.get())],
-                [FIXED_WE_POTENTIAL, bool(self._iFixedWEPotential.get())],
-                [MAINS_FILTER, bool(self._iMainsFilter.get())],
-                [SINC2_OVERSAMPLING, int(self._strOsrSinc2.get())],
-                [SINC3_OVERSAMPLING ,int(self._strOsrSinc3.get())],
-                [ENABLE_OPTIMIZER, bool(self._iEnableOptimizer.get())],
-                [LOW_PERFORMANCE_MODE, bool(self._iLowPerformanceMode.get())]]
+        listTempExperimentParameters : list = []
+
+        for parameter in dic_methodRegistry[self._strMethod].get_Parameters():
+            listTempExperimentParameters.append([parameter.get_Key(),
+                parameter.to_Value(getattr(self, parameter.get_Variable()).get())])
 
         return listTempExperimentParameters
 
@@ -840,15 +834,30 @@ class FreiStatInterface():
         # Reset variable
         self._bAppRunning = False
 
+        # Stop polling the experiment and system status
+        self._stopScheduler()
+
+        # Move remaining log records into the log file
+        self._logHandler.stop_Flush()
+        self._logHandler.close()
+
         # Check if experiment is still running
         if (self._iSystemStatus == FS_RUNNING):
             # End experiment
             self._EcMethod._terminateExperiment()
 
+        # Store remaining records of the data queue
+        self._stopDataDrain()
+
+        # Stop reading template files
+        if (self._templateImport is not None):
+            self._templateImport.cancel()
+
         # Update the settings
         self._dataHandling.export_Settings()
 
-        # Save safety backup
+        # Save safety backup, templates which can't be loaded anymore (e.g.
+        # their template file was deleted) are skipped
         self._dataHandling.export_Configuration(self._strOsPathBackup)
 
         # Close window
@@ -20,48 +20,31 @@ from FreiStat.Data_storage.constants import *
 # Import internal dependencies
 from ..Data_Storage.dictionaries import *
 
-def _clickSelect(self, iIndex : int) -> None:
+def _clickSelect(self, iRow : int) -> None:
     """
     Description
     -----------
-    Method for selecting method for import/export
+    Method for showing/ hiding the experiment parameters of a template
 
     Parameters
     ----------
-    `iIndex` : int
-        Integer encoding the currently clicked button
+    `iRow` : int
+        Integer encoding the template row of the clicked button
 
     """   
-    if (self._buttonList[iIndex][1]):
-        # Update frame color
-        #Widget.nametowidget(self._PopUpRoot, self._buttonList[iIndex][0].winfo_parent()). \
-        #configure(style= "fUnselectedFrame.TFrame")
+    iIndex : int = self._listTemplateRows[iRow][6]
 
-        # Change button text
-        self._buttonList[iIndex][0].configure(text= "Show")
+    if (iIndex < 0):
+        return
 
-        # Change select variable
-        self._buttonList[iIndex][1] = False
+    if (iIndex == self._iShownTemplate):
+        # Hide experiment parameters
+        self._showTemplateDetails(-1)
     else :
-        # Update frame color
-        #Widget.nametowidget(self._PopUpRoot, self._buttonList[iIndex][0].winfo_parent()). \
-        #configure(style= "fSelectedFrame.TFrame")
-
-        # Change button text
-        self._buttonList[iIndex][0].configure(text= "Hide")
-
-        # Change select variable
-        self._buttonList[iIndex][1] = True
-
-    if (self._buttonList[iIndex][1] == True):
         # Show experiment parameters
-        self._templateFrameList[iIndex].pack(fill= "both", side= "top", padx= 1, pady= 5)
-    else :
-        # Hide experiment parameters
-        self._templateFrameList[iIndex].pack_forget()
+        self._showTemplateDetails(iIndex)
 
-
-def _clickCheckButton(self, iIndex : int) -> None:
+def _clickCheckButton(self, iRow : int) -> None:
     """
     Description
     -----------
@@ -69,12 +52,14 @@ def _clickCheckButton(self, iIndex : int) -> None:
 
     Parameters
     ----------
-    `iIndex` : int
-        Integer encoding the currently clicked checkbutton
+    `iRow` : int
+        Integer encoding the template row of the clicked checkbutton
 
     """
-    # Deprecated
-    pass
+    iIndex : int = self._listTemplateRows[iRow][6]
+
+    if (iIndex >= 0):
+        self._listSelected[iIndex] = bool(self._listTemplateRows[iRow][2].get())
 
 def _clickImport(self) -> None:
     """
@@ -87,27 +72,25 @@ def _clickImport(self) -> None:
     datastorageList : list = []
 
     # Loop over all templates
-    for iIndex in range(len(self._templateList)):
+    for iIndex in range(len(self._listSelected)):
         # Check if method was selected
-        if (self._templateList[iIndex].get()):
+        if (self._listSelected[iIndex] == True):
             # Update template name
-            self._listDataStorage[iIndex].save_TemplateName(
-                self._templateNameList[iIndex].get())
+            self._dataHandling.rename_Template(self._listDataStorage[iIndex],
+                self._listTemplateNames[iIndex])
 
             datastorageList.append(self._listDataStorage[iIndex])
             
-    # Check if template name is already used
-    for iIndex in range(self._dataHandling.get_SequenceLength()):
-        for jIndex in range(len(datastorageList)):
-            if (self._dataHandling.get_TemplateName() == 
-                datastorageList[jIndex].get_TemplateName()):
-                # Renaming of template required
-                datastorageList[jIndex].save_TemplateName(
-                    datastorageList[jIndex].get_TemplateName() + " Import")
-        self._dataHandling.move_next_DataObject()
-
     # Save imported templates
     for jIndex in range(len(datastorageList)):
+        # Check if template name is already used
+        while (self._dataHandling.find_Template(
+            datastorageList[jIndex].get_ExperimentType(),
+            datastorageList[jIndex].get_TemplateName()) is not None):
+            # Renaming of template required
+            self._dataHandling.rename_Template(datastorageList[jIndex],
+                datastorageList[jIndex].get_TemplateName() + " Import")
+
         self._dataHandling.import_DataObject(datastorageList[jIndex])
 
     # Close popup window after import
@@ -124,17 +107,17 @@ def _clickExport(self) -> None:
     datastorageList : list = []
 
     # Loop over all templates
-    for iIndex in range(len(self._templateList)):
+    for iIndex in range(len(self._listSelected)):
         # Check if method was selected
-        if (self._templateList[iIndex].get()):
+        if (self._listSelected[iIndex] == True):
             # Update template name
-            self._listDataStorage[iIndex].save_TemplateName(
-                self._templateNameList[iIndex].get())
+            self._dataHandling.rename_Template(self._listDataStorage[iIndex],
+                self._listTemplateNames[iIndex])
 
             datastorageList.append(self._listDataStorage[iIndex])
 
     # Export templates
-    for jIndex in range(len(datastorageList)):
+    if (len(datastorageList) > 0):
         self._dataHandling.export_Templates(self._strFilePath, datastorageList)
 
     # Close popup window after export
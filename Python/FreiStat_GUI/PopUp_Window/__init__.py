@@ -17,12 +17,12 @@ from tkinter.ttk import *
 from FreiStat.Data_storage.constants import *
 import FreiStat as FS
 import FreiStat_GUI as FS_GUI
-from numpy import var
 
 # Import internal dependencies
 from ..Data_Storage.constants import *
 from ..Data_Storage.dictionaries import *
 from ..Data_Storage.data_handling import DataHandling
+from ..Utility.asset_manager import AssetManager
 
 class FreiStatPopUp():
     """
@@ -42,20 +42,33 @@ class FreiStatPopUp():
     from .Widgets import _clickImport
     from .Widgets import _clickSelect
 
-    def __init__(self, iCenterX : int, iCenterY : int) -> None:
+    def __init__(self, iCenterX : int, iCenterY : int, 
+                 assetManager : AssetManager) -> None:
         """
         Description
         -----------
         Constructor of the class FreiStatPopUp.
+
+        Parameters
+        ----------
+        `iCenterX` : int
+            X coordinate of the center of the main window
+
+        `iCenterY` : int
+            Y coordinate of the center of the main window
+
+        `assetManager` : AssetManager
+            Asset manager of the interface, whose decoded images are shared
         
         """
         # Intialize class variables
         self._iCenterX = iCenterX
         self._iCenterY = iCenterY
+        self._assetManager : AssetManager = assetManager
 
         # Load image
-        self._logo = PhotoImage(file= __path__[0] + 
-            "./../assets/logo/FreiStat.gif")
+        self._logo = self._assetManager.get_Image(LOGO_ICON_FILE, 
+                                                  bScaled= False)
 
         self._initWindow()
 
@@ -171,8 +184,8 @@ class FreiStatPopUp():
         fVersionFrame = Frame(self._PopUpRoot, style="fPopUp.TFrame")
         fVersionFrame.pack(fill= 'both', side= TOP, expand= True)
 
-        self._TextLogo = PhotoImage(file= __path__[0] + "./../assets/logo/FreiStat.png")
-        self._TextLogo = self._TextLogo.subsample(4)
+        self._TextLogo = self._assetManager.get_Image(LOGO_TEXT_FILE, 
+                                                      LOGO_TEXT_SUBSAMPLE)
 
         TextLogoFreiStat = Label(fVersionFrame, image= self._TextLogo, 
                                 style= "fLabelGeneralWhite.TLabel")
@@ -226,7 +239,7 @@ class FreiStatPopUp():
         # Check if window is open and just hidden
         try:
             # Unhide window
-            self._PopUpRoot.geometry(f'{1000}x{600}+{self._iCenterX + 50}+{self._iCenterY + 50}')
+            self._PopUpRoot.geometry(f'{PW_TEMPLATE_X}x{PW_TEMPLATE_Y}+{self._iCenterX + 50}+{self._iCenterY + 50}')
             self._PopUpRoot.overrideredirect(0)
             self._PopUpRoot.deiconify()
             self._clearFrame(self._PopUpRoot)
@@ -244,89 +257,305 @@ class FreiStatPopUp():
         # Save reference to imported dataStorage objects
         self._listDataStorage = listDataStorage
 
-        # Create lists to hold IntVar references
-        self._tempList : list = []
-        self._templateList : list = []
+        # Save selection and (edited) name of every template, since only the
+        # visible templates are represented by widgets
+        self._listSelected : list = [False] * len(listDataStorage)
+        self._listTemplateNames : list = [dataStorage.get_TemplateName() 
+            for dataStorage in listDataStorage]
 
-        # Create list to hold template frame reference
-        self._templateFrameList : list = []
-        self._buttonList : list = []
-        self._templateNameList : list = []
+        # Create list holding the recycled template rows
+        # [frame, window id, IntVar, StringVar, label, button, template index]
+        self._listTemplateRows : list = []
+        self._iShownTemplate : int = -1
+
+        # Create list to hold IntVar references of the details
+        self._tempList : list = []
 
         # Save import/ export path
         self._strFilePath = strFilePath
 
-        # Create a canvas window
-        canvasFrame = Canvas(self._PopUpRoot, background= "gray95",
+        fRibbonFrame = Frame(self._PopUpRoot, style="fMenuBand.TFrame",
+                                relief= RAISED)
+        fRibbonFrame.pack(fill= "both", side= BOTTOM)
+
+        if (iCommandID == IMPORT_TEMPLATE):
+            ButtonContinue = Button(fRibbonFrame, text= "Import templates",
+                command= lambda : self._clickImport())
+            ButtonContinue.pack(side= RIGHT, padx = 5, pady= 5)
+        elif (iCommandID == EXPORT_TEMPLATE):
+            ButtonContinue = Button(fRibbonFrame, text= "Export templates",
+                command= lambda : self._clickExport())
+            ButtonContinue.pack(side= RIGHT, padx = 5, pady= 5)
+
+        # Create frame for the details of the shown template
+        fDetailsFrame = Frame(self._PopUpRoot, style="fPopUpTemplate.TFrame",
+            height= PW_TEMPLATE_DETAILS)
+        fDetailsFrame.pack_propagate(False)
+        fDetailsFrame.pack(fill= X, side= BOTTOM)
+
+        self._canvasDetails = Canvas(fDetailsFrame, background= "gray95",
+            borderwidth= 0, highlightthickness= 0)
+
+        scrollbarDetails = Scrollbar(fDetailsFrame, orient="vertical",
+            command= self._canvasDetails.yview)
+        scrollbarDetails.pack(side= RIGHT, fill= Y)
+
+        self._canvasDetails.pack(fill= "both", expand= True, side= TOP)
+        self._canvasDetails.configure(yscrollcommand= scrollbarDetails.set)
+
+        self._fDetailsFrame = Frame(self._canvasDetails, 
+                                    style="fPopUpTemplate.TFrame")
+        self._canvasDetails.create_window((0,0), window= self._fDetailsFrame, 
+            anchor= NW)
+
+        # Update scroll region if the details change
+        self._fDetailsFrame.bind("<Configure>", lambda event : 
+            self._canvasDetails.configure(
+                scrollregion= self._canvasDetails.bbox("all")))
+
+        self._fDetailsFrame.bind("<Enter>", lambda event, 
+            frame = self._fDetailsFrame, canvas = self._canvasDetails : 
+            self._bound_MouseWheel(event, frame, canvas))
+        self._fDetailsFrame.bind("<Leave>", lambda event, 
+            frame = self._canvasDetails : self._unbound_MouseWheel(event, frame))
+
+        # Create a canvas window for the template rows
+        self._canvasTemplates = Canvas(self._PopUpRoot, background= "gray95",
             borderwidth= 0, highlightthickness= 0)
 
         # Create a scrollbar
         scrollbarCentral=Scrollbar(self._PopUpRoot, orient="vertical",
-            command= canvasFrame.yview)
+            command= self._canvasTemplates.yview)
         scrollbarCentral.pack(side= RIGHT, fill= Y)
 
-        canvasFrame.pack(fill= "both", expand= True, side= TOP)
+        self._canvasTemplates.pack(fill= "both", expand= True, side= TOP)
+
+        # The scroll region covers all templates, while only the visible rows
+        # are updated after every change of the view
+        self._canvasTemplates.configure(
+            scrollregion= (0, 0, 0, len(listDataStorage) * PW_TEMPLATE_ROW_HEIGHT),
+            yscrollincrement= PW_TEMPLATE_ROW_HEIGHT,
+            yscrollcommand= lambda fFirst, fLast : 
+                self._updateTemplateRows(scrollbarCentral, fFirst, fLast))
+
+        self._canvasTemplates.bind("<Configure>", 
+            lambda event : self._updateTemplateRows())
+
+        # Bind mousewheel scroll to the canvas
+        self._canvasTemplates.bind("<Enter>", lambda event, 
+            canvas = self._canvasTemplates : 
+            self._bound_MouseWheel(event, canvas, canvas))
+        self._canvasTemplates.bind("<Leave>", lambda event, 
+            canvas = self._canvasTemplates : 
+            self._unbound_MouseWheel(event, canvas))
+
+    def _updateTemplateRows(self, scrollbar : Scrollbar = None, 
+                            fFirst : str = None, fLast : str = None) -> None:
+        """
+        Description
+        -----------
+        Place the recycled template rows at the visible part of the template
+        list. Rows are only created if the visible area grows, therefore the
+        amount of widgets does not depend on the amount of templates.
 
-        # Add scroll command to canvas
-        canvasFrame.configure(yscrollcommand= scrollbarCentral.set)
+        Parameters
+        ----------
+        `scrollbar` : Scrollbar
+            Scrollbar which should be updated with the new view
 
-        fMainFrame = Frame(canvasFrame, style="fPopUpTemplate.TFrame")
-        fMainFrame.pack(fill= "both", side= TOP, expand= True, padx= 1)
+        `fFirst` : string
+            Fraction of the list at the top of the view
 
-        # Update windows to get correct size informations
-        canvasFrame.create_window((0,0), window= fMainFrame, 
-            anchor= NW, width= 985, height= len(listDataStorage) * 500)
+        `fLast` : string
+            Fraction of the list at the bottom of the view
 
-        # Bind mousewheel scroll to frames
-        fMainFrame.bind("<Enter>", lambda event, 
-            frame = fMainFrame, canvas = canvasFrame : 
-            self._bound_MouseWheel(event, frame, canvas))
-        fMainFrame.bind("<Leave>", lambda event, 
-            frame = canvasFrame : self._unbound_MouseWheel(event, frame))
+        """
+        if (scrollbar is not None):
+            scrollbar.set(fFirst, fLast)
 
-        # Loop over every data storage entry
-        for iIndex in range(len(listDataStorage)):
+        canvas : Canvas = self._canvasTemplates
+        iWidth : int = canvas.winfo_width()
+        iHeight : int = canvas.winfo_height()
 
-            self._DisplayTemplate(fMainFrame, iIndex, False,
-                listDataStorage[iIndex].get_TemplateName(), 
-                listDataStorage[iIndex].get_ExperimentType(), 
-                listDataStorage[iIndex].get_ExperimentParameters())
+        # Calculate visible templates
+        iFirst : int = int(canvas.canvasy(0)) // PW_TEMPLATE_ROW_HEIGHT
+        iRows : int = iHeight // PW_TEMPLATE_ROW_HEIGHT + 2
 
-        fRibbonFrame = Frame(self._PopUpRoot, style="fMenuBand.TFrame",
-                                relief= RAISED)
-        fRibbonFrame.pack(fill= "both", side= BOTTOM)
+        # Create missing rows
+        while (len(self._listTemplateRows) < iRows):
+            self._createTemplateRow()
 
-        if (iCommandID == IMPORT_TEMPLATE):
-            ButtonContinue = Button(fRibbonFrame, text= "Import templates",
-                command= lambda : self._clickImport())
-            ButtonContinue.pack(side= RIGHT, padx = 5, pady= 5)
-        elif (iCommandID == EXPORT_TEMPLATE):
-            ButtonContinue = Button(fRibbonFrame, text= "Export templates",
-                command= lambda : self._clickExport())
-            ButtonContinue.pack(side= RIGHT, padx = 5, pady= 5)
+        for iRow, listRow in enumerate(self._listTemplateRows):
+            iIndex : int = iFirst + iRow
+
+            canvas.itemconfigure(listRow[1], width= iWidth)
+
+            if (iRow >= iRows or iIndex >= len(self._listDataStorage)):
+                # Move unused row out of the view
+                canvas.coords(listRow[1], 0, -2 * PW_TEMPLATE_ROW_HEIGHT)
+                listRow[6] = -1
+                continue
+
+            canvas.coords(listRow[1], 0, iIndex * PW_TEMPLATE_ROW_HEIGHT)
+
+            if (listRow[6] != iIndex):
+                self._bindTemplateRow(listRow, iIndex)
+
+    def _createTemplateRow(self) -> None:
+        """
+        Description
+        -----------
+        Create a template row, which is bound to a template by 
+        `_bindTemplateRow`.
+
+        """
+        iRow : int = len(self._listTemplateRows)
+
+        fTemplateFrame = Frame(self._canvasTemplates, style="fPopUp.TFrame")
+
+        iWindow = self._canvasTemplates.create_window(
+            (0, -2 * PW_TEMPLATE_ROW_HEIGHT), window= fTemplateFrame, 
+            anchor= NW, height= PW_TEMPLATE_ROW_HEIGHT - 2)
+
+        templateIntVar = IntVar()
+        strTemplate = StringVar()
+
+        # Checkbutton for selecting the template
+        ButtonTemplate = Checkbutton(fTemplateFrame, onvalue= True, 
+            offvalue= False, style="fCheckButtonGeneral.TCheckbutton",
+            variable= templateIntVar, command= lambda iRow= iRow : 
+            self._clickCheckButton(iRow))
+        ButtonTemplate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
+
+        # Label for ec-method
+        TextMethodName= Label(fTemplateFrame, width= TEXTBOX_WIDTH_SMALL, 
+            style= "fLabelGeneralWhiteSmallBold.TLabel")
+        TextMethodName.pack(side= LEFT, pady= 5)
+
+        # Label for displaying the template name
+        TextTemplate= Label(fTemplateFrame, 
+            text= dic_parameters[TEMPLATE_NAME][0], 
+            width= TEXTBOX_WIDTH_SMALL, style= "fLabelGeneralWhiteSmallBold.TLabel")
+        TextTemplate.pack(side= LEFT, padx= 5, pady= 5)
+
+        # Entry for the template name which is placed in separate frame
+        fBorderFrameEntry = Frame(fTemplateFrame, style="fPopUpSunken.TFrame")
+        fBorderFrameEntry.pack(fill= 'both', side= LEFT, pady= 5) 
+
+        EntryTemplate = Entry(fBorderFrameEntry, textvariable= strTemplate, 
+            width= TEXTBOX_WIDTH, style= "fLabelGeneralRedSmallBold.TLabel")        
+        EntryTemplate.pack(side= LEFT, padx= 3)   
+
+        # Border frame for button 
+        fBorderFrameButton = Frame(fTemplateFrame, style="fPopUp.TFrame")
+        fBorderFrameButton.pack(fill= 'both', side= RIGHT, padx= 2, pady= 2)   
+
+        ButtonShowExpPara = Button(fBorderFrameButton, text= "Show",
+            command= lambda iRow= iRow: self._clickSelect(iRow))        
+        ButtonShowExpPara.pack(side= RIGHT, fill= Y, padx= 3, pady= 3)
+
+        listRow : list = [fTemplateFrame, iWindow, templateIntVar, strTemplate, 
+                          TextMethodName, ButtonShowExpPara, -1]
+
+        # Keep edited names, when the row is bound to another template
+        strTemplate.trace_add("write", lambda *args, listRow= listRow : 
+            self._saveTemplateName(listRow))
+
+        self._listTemplateRows.append(listRow)
+
+    def _bindTemplateRow(self, listRow : list, iIndex : int) -> None:
+        """
+        Description
+        -----------
+        Show the template with the given index in a recycled template row.
+
+        Parameters
+        ----------
+        `listRow` : list
+            Template row which should be updated
+
+        `iIndex` : int
+            Index of the template in the list
+
+        """
+        # Unbind row first, so that the name of the old template is kept
+        listRow[6] = -1
+
+        listRow[2].set(self._listSelected[iIndex])
+        listRow[3].set(self._listTemplateNames[iIndex])
+        listRow[4].configure(
+            text= self._listDataStorage[iIndex].get_ExperimentType())
+
+        if (iIndex == self._iShownTemplate):
+            listRow[5].configure(text= "Hide")
+        else :
+            listRow[5].configure(text= "Show")
+
+        listRow[6] = iIndex
+
+    def _saveTemplateName(self, listRow : list) -> None:
+        """
+        Description
+        -----------
+        Save the edited template name of a template row.
+
+        Parameters
+        ----------
+        `listRow` : list
+            Template row in which the name was edited
+
+        """
+        if (listRow[6] >= 0):
+            self._listTemplateNames[listRow[6]] = listRow[3].get()
+
+    def _showTemplateDetails(self, iIndex : int) -> None:
+        """
+        Description
+        -----------
+        Show the experiment parameters of a template in the details frame. The 
+        experiment parameters are only loaded at this point.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Index of the template in the list or -1 to hide the details
+
+        """
+        self._clearFrame(self._fDetailsFrame)
+        self._tempList = []
+        self._iShownTemplate = iIndex
+
+        # Update button text of the visible rows
+        for listRow in self._listTemplateRows:
+            if (listRow[6] == iIndex and iIndex >= 0):
+                listRow[5].configure(text= "Hide")
+            else :
+                listRow[5].configure(text= "Show")
+
+        if (iIndex < 0):
+            return
+
+        self._DisplayTemplate(self._fDetailsFrame, 
+            self._listTemplateNames[iIndex], 
+            self._listDataStorage[iIndex].get_ExperimentType(), 
+            self._listDataStorage[iIndex].get_ExperimentParameters())
+
+        self._canvasDetails.yview_moveto(0)
 
     def _DisplayTemplate(self, parentFrame : Frame, 
-                         index : int,
-                         bRecursionCall : bool,
                          templateName : str, 
                          experimentType : str, 
                          experimentParameter : list) -> None:
         """
         Description
         -----------
-        Method to display template in popup window
+        Method to display the details of a template in popup window
 
         Parameters
         ----------
         `parentFrame` : Frame
             Reference to frame in which the template should be shown
 
-        `index` : int
-            Index indicating the position of the template in the list
-            
-        `bRecursionCall` : bool
-            Flag indicating if the method displayed is part of a sequence
-
         `templateName` : str
             Name of the template
 
@@ -344,20 +573,9 @@ class FreiStatPopUp():
         fTemplateGeneralFrame = Frame(fTemplateFrame, style="fPopUp.TFrame")
         fTemplateGeneralFrame.pack(fill= 'both', side= TOP, padx= 1, pady= 1) 
 
-        templateIntVar = IntVar()
-
-        if(not bRecursionCall):
-            # Checkbutton for expanding method parameters
-            ButtonTemplate = Checkbutton(fTemplateGeneralFrame, onvalue= True, 
-                offvalue= False, style="fCheckButtonGeneral.TCheckbutton",
-                variable= templateIntVar, command= lambda index= index : 
-                self._clickCheckButton(index))
-            ButtonTemplate.pack(side= LEFT, fill= Y, padx = 5, pady= 5)
-            self._templateList.append(templateIntVar)
-        else :
-            # Insert spacer element
-            fSpacerFrame = Frame(fTemplateGeneralFrame, style= "fPopUp.TFrame")
-            fSpacerFrame.pack(fill= Y, side= LEFT, expand= FALSE, padx= 15, pady= 5) 
+        # Insert spacer element
+        fSpacerFrame = Frame(fTemplateGeneralFrame, style= "fPopUp.TFrame")
+        fSpacerFrame.pack(fill= Y, side= LEFT, expand= FALSE, padx= 15, pady= 5) 
 
         # Label for ec-method
         TextMethodName= Label(fTemplateGeneralFrame, 
@@ -371,45 +589,17 @@ class FreiStatPopUp():
             width= TEXTBOX_WIDTH_SMALL, style= "fLabelGeneralWhiteSmallBold.TLabel")
         TextTemplate.pack(side= LEFT, padx= 5, pady= 5)
 
-        if(not bRecursionCall):
-            # Entry for the template name which is placed in separate frame
-            strTemplate = StringVar()
-            strTemplate.set(templateName)
-
-            fBorderFrameEntry = Frame(fTemplateGeneralFrame, style="fPopUpSunken.TFrame")
-            fBorderFrameEntry.pack(fill= 'both', side= LEFT, pady= 5) 
-
-            EntryTemplate = Entry(fBorderFrameEntry, textvariable= strTemplate, 
-                width= TEXTBOX_WIDTH, style= "fLabelGeneralRedSmallBold.TLabel")        
-            EntryTemplate.pack(side= LEFT, padx= 3)   
-
-            self._templateNameList.append(strTemplate)
-     
-            # Border frame for button 
-            # (deprecated but can be used to give color frame to button)
-            fBorderFrameButton = Frame(fTemplateGeneralFrame, style="fPopUp.TFrame")
-            fBorderFrameButton.pack(fill= 'both', side= RIGHT, padx= 2, pady= 2)   
-
-            ButtonShowExpPara = Button(fBorderFrameButton, text= "Show",
-                command= lambda index= index: self._clickSelect(index))        
-            ButtonShowExpPara.pack(side= RIGHT, fill= Y, padx= 3, pady= 3)
-            self._buttonList.append([ButtonShowExpPara, False])
-        
-            # Create subframe for display of experiment setup
-            fTemplateParameterFrame = Frame(fTemplateFrame, style="fWidget.TFrame")
-            self._templateFrameList.append(fTemplateParameterFrame)
-        else :
-            EntryTemplate = Label(fTemplateGeneralFrame, text= templateName, 
-                width= TEXTBOX_WIDTH, style= "fLabelGeneralWhiteSmallBold.TLabel")        
-            EntryTemplate.pack(side= LEFT, padx= 3, pady= 2)   
+        EntryTemplate = Label(fTemplateGeneralFrame, text= templateName, 
+            width= TEXTBOX_WIDTH, style= "fLabelGeneralWhiteSmallBold.TLabel")        
+        EntryTemplate.pack(side= LEFT, padx= 3, pady= 2)   
 
-            fTemplateParameterFrame = Frame(fTemplateFrame, style="fWidget.TFrame")
-            fTemplateParameterFrame.pack(fill= "both", side= "top", padx= 1, pady= 5)
+        fTemplateParameterFrame = Frame(fTemplateFrame, style="fWidget.TFrame")
+        fTemplateParameterFrame.pack(fill= "both", side= "top", padx= 1, pady= 5)
 
         if (experimentType == SEQUENCE):
             # Make a recursion call for every method in the sequnece
             for iIndex in range(len(experimentParameter)):
-                self._DisplayTemplate(fTemplateParameterFrame, iIndex, True,
+                self._DisplayTemplate(fTemplateParameterFrame,
                     experimentParameter[iIndex][1], 
                     experimentParameter[iIndex][0], 
                     experimentParameter[iIndex][2])
@@ -12,10 +12,262 @@ __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
 # Import dependencies
+from decimal import Decimal
+from decimal import InvalidOperation
+from functools import lru_cache
+from types import MappingProxyType
 from FreiStat.Data_storage.constants import *
+from FreiStat.Data_storage.dictionaries import *
 from FreiStat.Utility.decoder import _decode_LPTIA_Resistor_Size
 from FreiStat.Utility.decoder import _decode_SincXOSR
 
+# Import internal dependencies
+from ..Data_Storage.constants import *
+
+def _build_RegisterTable(funcDecoder, iRegisters : int) -> tuple:
+    """
+    Description
+    -----------
+    Helper function decoding every value of a register once. Registers which
+    can't be decoded by the framework are left out.
+
+    Parameters
+    ----------
+    `funcDecoder` : function
+        Decoder converting a register value into the display value
+
+    `iRegisters` : int
+        Amount of register values
+
+    Return
+    ------
+    `tupleTables` : tuple
+        Read only dictionaries mapping register to display value and back
+
+    """
+    dicDecoded : dict = {}
+    dicEncoded : dict = {}
+
+    for iRegister in range(iRegisters):
+        try:
+            value = funcDecoder(iRegister)
+        except (ArithmeticError, KeyError, ValueError):
+            continue
+
+        dicDecoded[iRegister] = value
+        dicEncoded.setdefault(value, iRegister)
+
+    return MappingProxyType(dicDecoded), MappingProxyType(dicEncoded)
+
+def _shift_Decimal(value : float, iExponent : int) -> float:
+    """
+    Description
+    -----------
+    Helper function shifting the decimal point of the shortest representation
+    of a value.
+
+    """
+    try:
+        return float(Decimal(str(value)).scaleb(iExponent))
+    except InvalidOperation:
+        raise ValueError("Invalid number: " + repr(value)) from None
+
+@lru_cache(maxsize= CONVERSION_CACHE_SIZE)
+def _decode_Milli(value : float) -> float:
+    """
+    Description
+    -----------
+    Decoder converting a value given in milli units (e.g. mV) into base units.
+    The decimal point of the shortest representation is shifted, so that the
+    conversion can be reverted exactly by `_encode_Milli` (up to 15 
+    significant digits). Raises a ValueError for values which aren't numbers.
+
+    """
+    return _shift_Decimal(value, -3)
+
+@lru_cache(maxsize= CONVERSION_CACHE_SIZE)
+def _encode_Milli(value : float) -> float:
+    """
+    Description
+    -----------
+    Encoder converting a value given in base units into milli units.
+
+    """
+    return _shift_Decimal(value, 3)
+
+def _decode_MilliList(listValues : list) -> list:
+    """
+    Description
+    -----------
+    Decoder converting a list of values given in milli units into base units.
+
+    """
+    return [_decode_Milli(x) for x in listValues]
+
+def _encode_MilliList(listValues : list) -> list:
+    """
+    Description
+    -----------
+    Encoder converting a list of values given in base units into milli units.
+
+    """
+    return [_encode_Milli(x) for x in listValues]
+
+def _decode_Flag(value : int) -> bool:
+    """
+    Description
+    -----------
+    Decoder converting a flag encoded as integer into a boolean.
+
+    """
+    return value == 1
+
+def _encode_Flag(value : bool) -> int:
+    """
+    Description
+    -----------
+    Encoder converting a boolean into a flag encoded as integer.
+
+    """
+    return int(bool(value))
+
+# Display values of every register value and their inverse, the registers have
+# no closed form inverse
+dic_decodedRTIA, dic_encodedRTIA = _build_RegisterTable(
+    lambda iRegister : 0.9 / _decode_LPTIA_Resistor_Size(iRegister),
+    RTIA_REGISTERS)
+dic_decodedSinc2, dic_encodedSinc2 = _build_RegisterTable(
+    lambda iRegister : _decode_SincXOSR(iRegister, SINC2_OVERSAMPLING),
+    SINC2_REGISTERS)
+dic_decodedSinc3, dic_encodedSinc3 = _build_RegisterTable(
+    lambda iRegister : _decode_SincXOSR(iRegister, SINC3_OVERSAMPLING),
+    SINC3_REGISTERS)
+
+def _decode_RTIA(value : int) -> float:
+    """
+    Description
+    -----------
+    Decoder converting the size of the RTIA resistor into the current range.
+
+    """
+    return _lookup_Register(dic_decodedRTIA, value, LPTIA_RTIA_SIZE)
+
+def _encode_RTIA(value : float) -> int:
+    """
+    Description
+    -----------
+    Encoder converting a current range back into the size of the RTIA
+    resistor.
+
+    """
+    return _lookup_Register(dic_encodedRTIA, value, LPTIA_RTIA_SIZE)
+
+def _decode_Sinc2(value : int) -> int:
+    """
+    Description
+    -----------
+    Decoder converting the register value of the sinc2 oversampling rate.
+
+    """
+    return _lookup_Register(dic_decodedSinc2, value, SINC2_OVERSAMPLING)
+
+def _encode_Sinc2(value : int) -> int:
+    """
+    Description
+    -----------
+    Encoder converting a sinc2 oversampling rate back into the register
+    value.
+
+    """
+    return _lookup_Register(dic_encodedSinc2, value, SINC2_OVERSAMPLING)
+
+def _decode_Sinc3(value : int) -> int:
+    """
+    Description
+    -----------
+    Decoder converting the register value of the sinc3 oversampling rate.
+
+    """
+    return _lookup_Register(dic_decodedSinc3, value, SINC3_OVERSAMPLING)
+
+def _encode_Sinc3(value : int) -> int:
+    """
+    Description
+    -----------
+    Encoder converting a sinc3 oversampling rate back into the register
+    value.
+
+    """
+    return _lookup_Register(dic_encodedSinc3, value, SINC3_OVERSAMPLING)
+
+def _lookup_Register(dicTable : dict, value, strParameter : str):
+    """
+    Description
+    -----------
+    Helper function looking up a value in a register table. Raises a
+    ValueError for values outside of the register range.
+
+    """
+    # Booleans are integers, but never valid register values
+    if (isinstance(value, bool) or value not in dicTable):
+        raise ValueError("Invalid value for " + strParameter + ": " + 
+                         repr(value))
+
+    return dicTable[value]
+
+# Conversion between hardware units (optimizer, .csv-files) and display units
+# as pair of decoder and encoder
+conv_Milli = (_decode_Milli, _encode_Milli)
+conv_MilliList = (_decode_MilliList, _encode_MilliList)
+conv_Flag = (_decode_Flag, _encode_Flag)
+conv_RTIA = (_decode_RTIA, _encode_RTIA)
+conv_Sinc2 = (_decode_Sinc2, _encode_Sinc2)
+conv_Sinc3 = (_decode_Sinc3, _encode_Sinc3)
+
+# Label, unit and conversion (None if the value is used as it is) of every 
+# experiment parameter, built once at import and read only afterwards
+dic_parameterDecoding = MappingProxyType({
+    SEQUENCE_LENGTH     : (dic_configParameters[SEQUENCE_LENGTH][0], 
+                           SEQUENCE_LENGTH_U, None),
+    BASE_POTENTIAL      : (dic_configParameters[BASE_POTENTIAL][0], 
+                           BASE_POTENTIAL_U, conv_Milli),
+    START_POTENTIAL     : (dic_configParameters[START_POTENTIAL][0], 
+                           START_POTENTIAL_U, conv_Milli),
+    STOP_POTENTIAL      : (dic_configParameters[STOP_POTENTIAL][0], 
+                           STOP_POTENTIAL_U, conv_Milli),
+    LOWER_POTENTIAL     : (dic_configParameters[LOWER_POTENTIAL][0], 
+                           LOWER_POTENTIAL_U, conv_Milli),
+    UPPER_POTENTIAL     : (dic_configParameters[UPPER_POTENTIAL][0], 
+                           UPPER_POTENTIAL_U, conv_Milli),
+    POTENTIAL_STEPS     : (dic_configParameters[POTENTIAL_STEPS][0], 
+                           POTENTIAL_STEPS_U, conv_MilliList),
+    PULSE_LENGTH        : (dic_configParameters[PULSE_LENGTH][0], 
+                           PULSE_LENGTH_U, conv_MilliList),
+    SAMPLING_RATE       : (dic_configParameters[SAMPLING_RATE][0], 
+                           SAMPLING_RATE_U, conv_Milli),
+    SAMPLING_DURATION   : (dic_configParameters[SAMPLING_DURATION][0], 
+                           SAMPLING_DURATION_U, conv_Milli),
+    STEP_SIZE           : (dic_configParameters[STEP_SIZE][0], 
+                           STEP_SIZE_U, conv_Milli),
+    SCAN_RATE           : (dic_configParameters[SCAN_RATE][0], 
+                           SCAN_RATE_U, conv_Milli),
+    DELTA_V_STAIRCASE   : (dic_configParameters[DELTA_V_STAIRCASE][0], 
+                           DELTA_V_STAIRCASE_U, conv_Milli),
+    DELTA_V_PEAK        : (dic_configParameters[DELTA_V_PEAK][0], 
+                           DELTA_V_PEAK_U, conv_Milli),
+    CYCLE               : (dic_configParameters[CYCLE][0], CYCLE_U, None),
+    LPTIA_RTIA_SIZE     : (dic_configParameters[LPTIA_RTIA_SIZE][0], 
+                           LPTIA_RTIA_SIZE_U, conv_RTIA),
+    FIXED_WE_POTENTIAL  : (dic_configParameters[FIXED_WE_POTENTIAL][0], 
+                           FIXED_WE_POTENTIAL_U, conv_Flag),
+    MAINS_FILTER        : (dic_configParameters[MAINS_FILTER][0], 
+                           MAINS_FILTER_U, conv_Flag),
+    SINC2_OVERSAMPLING  : (dic_configParameters[SINC2_OVERSAMPLING][0], 
+                           SINC2_OVERSAMPLING_U, conv_Sinc2),
+    SINC3_OVERSAMPLING  : (dic_configParameters[SINC3_OVERSAMPLING][0], 
+                           SINC3_OVERSAMPLING_U, conv_Sinc3)
+})
+
 def _decodeParameters(listExperimentParameters : list) -> list:
     """
     Description
@@ -34,81 +286,40 @@ def _decodeParameters(listExperimentParameters : list) -> list:
         List containing the decoded experiment parameters.
 
     """
-    # Loop over the whole list
-    for iIndex in range(len(listExperimentParameters)):
-        if (listExperimentParameters[iIndex][0] == BASE_POTENTIAL):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == START_POTENTIAL):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == STOP_POTENTIAL):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == LOWER_POTENTIAL):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == UPPER_POTENTIAL):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == POTENTIAL_STEPS):
-            listExperimentParameters[iIndex][1] = [x / 1000.0 for x in 
-                listExperimentParameters[iIndex][1]]
-
-        elif (listExperimentParameters[iIndex][0] == PULSE_LENGTH):
-            listExperimentParameters[iIndex][1] = [x / 1000.0 for x in 
-                listExperimentParameters[iIndex][1]]
-
-        elif (listExperimentParameters[iIndex][0] == DELTA_V_STAIRCASE):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == DELTA_V_PEAK):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == STEP_SIZE):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == SCAN_RATE):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == SAMPLING_RATE):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == SAMPLING_DURATION):
-            listExperimentParameters[iIndex][1] = \
-                listExperimentParameters[iIndex][1] / 1000.0
-
-        elif (listExperimentParameters[iIndex][0] == LPTIA_RTIA_SIZE):
-            listExperimentParameters[iIndex][1] = 0.9 / \
-                _decode_LPTIA_Resistor_Size(listExperimentParameters[iIndex][1])
-
-        elif (listExperimentParameters[iIndex][0] == FIXED_WE_POTENTIAL):
-            if (listExperimentParameters[iIndex][1] == 1):
-                listExperimentParameters[iIndex][1] = True
-            else :
-                listExperimentParameters[iIndex][1] = False
-        elif (listExperimentParameters[iIndex][0] == MAINS_FILTER):
-            if (listExperimentParameters[iIndex][1] == 1):
-                listExperimentParameters[iIndex][1] = True
-            else :
-                listExperimentParameters[iIndex][1] = False
-
-        elif (listExperimentParameters[iIndex][0] == SINC2_OVERSAMPLING):
-            listExperimentParameters[iIndex][1] = \
-                _decode_SincXOSR(listExperimentParameters[iIndex][1], 
-                SINC2_OVERSAMPLING)
-
-        elif (listExperimentParameters[iIndex][0] == SINC3_OVERSAMPLING):
-            listExperimentParameters[iIndex][1] = \
-                _decode_SincXOSR(listExperimentParameters[iIndex][1], 
-                SINC3_OVERSAMPLING)
\ No newline at end of file
+    _convertTemplates([listExperimentParameters], 0)
+
+    return listExperimentParameters
+
+def _convertTemplates(listTemplates : list, iDirection : int) -> None:
+    """
+    Description
+    -----------
+    Convert the experiment parameters of many templates in place. The pairs
+    are collected per conversion first and converted in one pass each, repeated
+    values are served by the caches of the converters.
+
+    Parameters
+    ----------
+    `listTemplates` : list
+        List containing the experiment parameter lists of every template
+
+    `iDirection` : int
+        Index of the conversion in the table (0 decode | 1 encode)
+
+    """
+    dicBatches : dict = {}
+
+    # Collect parameter pairs per conversion
+    for listExperimentParameters in listTemplates:
+        for listExperimentPair in listExperimentParameters:
+            tupleDecoding = dic_parameterDecoding.get(listExperimentPair[0])
+
+            if (tupleDecoding is not None and tupleDecoding[2] is not None):
+                dicBatches.setdefault(tupleDecoding[2], []).append(
+                    listExperimentPair)
+
+    for tupleConversion, listPairs in dicBatches.items():
+        converter = tupleConversion[iDirection]
+
+        for listExperimentPair in listPairs:
+            listExperimentPair[1] = converter(listExperimentPair[1])
@@ -0,0 +1,203 @@
+"""
+Module implementing the loading of the images (icons and logos) of the
+interface.
+
+Images are decoded on first use and cached by file and size, so that widgets
+and popup windows which are rebuilt reuse the decoded image. On screens with a
+high resolution (see `ASSET_HIDPI_THRESHOLD`) a pre-scaled variant of the file
+(`name@2x.png`) is used, if it exists, otherwise the image is zoomed.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+from tkinter import *
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+
+# Images of the main window, which are loaded on first access of the attribute
+dic_interfaceImages : dict = {
+    # FreiStat logos
+    "_IconLogo"             : LOGO_ICON_FILE,
+    "_TextLogo"             : LOGO_TEXT_FILE,
+
+    # Menu band
+    "_IconLiveFeed"         : "icons/Live.png",
+    "_IconSequence"         : "icons/Sequence.png",
+    "_IconSingleMode"       : "icons/Single_Mode.png",
+
+    # Central frame options
+    "_IconSave"             : "icons/Save.png",
+    "_IconLoad"             : "icons/Load.png",
+    "_IconDelete"           : "icons/Delete.png",
+    "_IconSaveSequence"     : "icons/Save_Sequence.png",
+    "_IconLoadSequence"     : "icons/Load_Sequence.png",
+    "_IconDeleteSequence"   : "icons/Delete_Sequence.png",
+
+    # EC-methods
+    "_IconCA"               : "icons/CA.png",
+    "_IconLSV"              : "icons/LSV.png",
+    "_IconCV"               : "icons/CV.png",
+    "_IconNPV"              : "icons/NPV.png",
+    "_IconDPV"              : "icons/DPV.png",
+    "_IconSWV"              : "icons/SWV.png",
+
+    # Plotband
+    "_IconMinimize"         : "icons/minimize.png",
+
+    # Sequence mode
+    "_IconAdd"              : "icons/Add.png",
+    "_IconRemove"           : "icons/Remove.png",
+    "_IconMoveUp"           : "icons/Move_up.png",
+    "_IconMoveDown"         : "icons/Move_down.png",
+    "_SequenceLink"         : "icons/Sequence_link.png"
+}
+
+class AssetManager:
+    """
+    Description
+    -----------
+    Class loading and caching the images of the interface. Every image is only
+    decoded once per size.
+
+    """
+
+    def __init__(self, strAssetPath : str, root : Misc) -> None:
+        """
+        Description
+        -----------
+        Constructor of class AssetManager
+
+        Parameters
+        ----------
+        `strAssetPath` : string
+            Path of the assets folder
+
+        `root` : Misc
+            Widget of the Tk instance, in which the images are created
+
+        """
+        # Initialize class variables
+        self._strAssetPath : str = strAssetPath
+        self._root : Misc = root
+        self._iScale : int = None
+        self._dicImages : dict = {}
+
+    def get_Image(self, strFile : str, iSubsample : int = 1, 
+                  bScaled : bool = True) -> PhotoImage:
+        """
+        Description
+        -----------
+        Get an image, which is decoded on first use.
+
+        Parameters
+        ----------
+        `strFile` : string
+            Path of the image file relative to the assets folder
+
+        `iSubsample` : int
+            Factor by which the image is reduced in size
+
+        `bScaled` : bool
+            Flag indicating if the image is scaled to the screen resolution
+            (e.g. not for window icons, which are scaled by the window manager)
+
+        Return
+        ------
+        `image` : PhotoImage
+            Decoded image
+
+        """
+        tupleKey : tuple = (strFile, iSubsample, bScaled)
+
+        image = self._dicImages.get(tupleKey)
+        if (image is not None):
+            return image
+
+        if (iSubsample > 1):
+            image = self.get_Image(strFile, 1, bScaled).subsample(iSubsample)
+        else:
+            image = self._loadImage(strFile, bScaled)
+
+        self._dicImages[tupleKey] = image
+        return image
+
+    def get_Scale(self) -> int:
+        """
+        Description
+        -----------
+        Get the scale of the images, which is determined from the resolution of
+        the screen on first use.
+
+        Return
+        ------
+        `iScale` : int
+            Scale of the images (1 or `ASSET_HIDPI_SCALE`)
+
+        """
+        if (self._iScale is None):
+            # Tk scaling is given in pixels per point, 96 DPI equal 96 / 72
+            fRatio : float = float(self._root.tk.call("tk", "scaling")) * 72 / 96
+
+            if (fRatio >= ASSET_HIDPI_THRESHOLD):
+                self._iScale = ASSET_HIDPI_SCALE
+            else:
+                self._iScale = 1
+
+        return self._iScale
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Remove all cached images.
+
+        """
+        self._dicImages.clear()
+
+    def _loadImage(self, strFile : str, bScaled : bool) -> PhotoImage:
+        """
+        Description
+        -----------
+        Decode an image in the scale of the screen. The pre-scaled variant of
+        the file is preferred over zooming.
+
+        Parameters
+        ----------
+        `strFile` : string
+            Path of the image file relative to the assets folder
+
+        `bScaled` : bool
+            Flag indicating if the image is scaled to the screen resolution
+
+        Return
+        ------
+        `image` : PhotoImage
+            Decoded image
+
+        """
+        strFilePath : str = os.path.join(self._strAssetPath, strFile)
+
+        iScale : int = 1
+        if (bScaled == True):
+            iScale = self.get_Scale()
+
+        if (iScale == 1):
+            return PhotoImage(master= self._root, file= strFilePath)
+
+        strRoot, strExtension = os.path.splitext(strFilePath)
+        strScaledPath : str = strRoot + ASSET_HIDPI_SUFFIX + strExtension
+
+        if (os.path.isfile(strScaledPath)):
+            return PhotoImage(master= self._root, file= strScaledPath)
+
+        return PhotoImage(master= self._root, file= strFilePath).zoom(iScale)
@@ -0,0 +1,314 @@
+"""
+Module implementing a min/max decimation of plot data, which reduces the amount
+of points handed to matplotlib to the amount of pixels on the screen.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import bisect
+import numpy as np
+from typing import Union
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+
+def _decimate_MinMax(fXData, fYData, listXLimits : list,
+                     iPixels : int) -> Union[np.ndarray, np.ndarray]:
+    """
+    Description
+    -----------
+    Decimate the data to the first, minimum, maximum and last sample of every
+    run of consecutive samples falling into the same pixel column. Since runs
+    are built in the order of the samples, non monotonic data (e.g. multiple
+    cycles of a CV) keeps its shape. Samples outside of the limits are merged
+    into one column on each side.
+
+    Parameters
+    ----------
+    `fXData` : array_like
+        X-data of the line in full resolution
+
+    `fYData` : array_like
+        Y-data of the line in full resolution
+
+    `listXLimits` : list
+        Lower and upper x limit of the displayed range
+
+    `iPixels` : int
+        Width of the displayed range in pixels
+
+    Return
+    ------
+    `fXDecimated` : np.ndarray
+        Decimated x-data
+
+    `fYDecimated` : np.ndarray
+        Decimated y-data
+
+    """
+    fXData = np.asarray(fXData, dtype= float)
+    fYData = np.asarray(fYData, dtype= float)
+    iSamples : int = min(len(fXData), len(fYData))
+    fXData = fXData[:iSamples]
+    fYData = fYData[:iSamples]
+
+    iPixels = max(int(iPixels), 1)
+    fXMin, fXMax = min(listXLimits), max(listXLimits)
+
+    # Nothing to gain for small data sets
+    if (iSamples <= DECIMATION_POINTS_PER_PIXEL * iPixels or fXMax <= fXMin):
+        return fXData, fYData
+
+    # Calculate pixel column of every sample
+    bFinite = np.isfinite(fXData) & np.isfinite(fYData)
+    with np.errstate(invalid= "ignore"):
+        fColumn = np.floor((fXData - fXMin) / (fXMax - fXMin) * iPixels)
+    fColumn = np.clip(np.where(bFinite, fColumn, 0), -1, iPixels)
+
+    # Gaps (NaN, inf) stay seperate runs, to keep them visible
+    fColumn[~bFinite] = -2 - np.flatnonzero(~bFinite)
+
+    # Find runs of consecutive samples in the same column
+    iStart = np.concatenate(([0], np.flatnonzero(np.diff(fColumn)) + 1))
+    iEnd = np.concatenate((iStart[1:], [iSamples])) - 1
+
+    fYMin = np.minimum.reduceat(fYData, iStart)
+    fYMax = np.maximum.reduceat(fYData, iStart)
+
+    # Interleave first, minimum, maximum and last sample of every run
+    fXDecimated = np.empty(4 * len(iStart))
+    fYDecimated = np.empty(4 * len(iStart))
+
+    fXDecimated[0::4] = fXData[iStart]
+    fXDecimated[1::4] = fXData[iStart]
+    fXDecimated[2::4] = fXData[iEnd]
+    fXDecimated[3::4] = fXData[iEnd]
+
+    fYDecimated[0::4] = fYData[iStart]
+    fYDecimated[1::4] = fYMin
+    fYDecimated[2::4] = fYMax
+    fYDecimated[3::4] = fYData[iEnd]
+
+    return fXDecimated, fYDecimated
+
+def _decimate_Range(fXData, fYData, listXLimits : list, iPixels : int,
+                    bSorted : bool) -> Union[np.ndarray, np.ndarray]:
+    """
+    Description
+    -----------
+    Decimate the data, reading as few samples as possible. For ascending
+    x-data only the displayed range (and one sample on each side) is taken.
+    Ranges with more than `DECIMATION_MAX_SAMPLES` samples are strided before
+    the decimation, so that large memory mapped data is not read completely
+    for an overview.
+
+    Parameters
+    ----------
+    `fXData` : array_like
+        X-data of the line in full resolution
+
+    `fYData` : array_like
+        Y-data of the line in full resolution
+
+    `listXLimits` : list
+        Lower and upper x limit of the displayed range
+
+    `iPixels` : int
+        Width of the displayed range in pixels
+
+    `bSorted` : bool
+        Flag indicating that the x-data is ascending
+
+    Return
+    ------
+    `fXDecimated` : np.ndarray
+        Decimated x-data
+
+    `fYDecimated` : np.ndarray
+        Decimated y-data
+
+    """
+    if (bSorted == True and len(fXData) > 0):
+        # Binary search on the (strided) data, np.searchsorted would copy it
+        iStart : int = max(bisect.bisect_left(fXData, min(listXLimits)) - 1, 0)
+        iEnd : int = min(bisect.bisect_right(fXData, max(listXLimits)) + 1, 
+                         len(fXData))
+        fXData = fXData[iStart:iEnd]
+        fYData = fYData[iStart:iEnd]
+
+    fXData, fYData = _stride_Data(fXData, fYData, iPixels)
+
+    return _decimate_MinMax(fXData, fYData, listXLimits, iPixels)
+
+def _stride_Data(fXData, fYData, 
+                 iPixels : int) -> Union[np.ndarray, np.ndarray]:
+    """
+    Description
+    -----------
+    Take every n-th sample of data with more than `DECIMATION_MAX_SAMPLES`
+    samples, so that `DECIMATION_OVERVIEW_FACTOR` samples per pixel column are
+    left. Smaller data is returned unchanged.
+
+    Parameters
+    ----------
+    `fXData` : array_like
+        X-data of the line in full resolution
+
+    `fYData` : array_like
+        Y-data of the line in full resolution
+
+    `iPixels` : int
+        Width of the displayed range in pixels
+
+    Return
+    ------
+    `fXStrided` : np.ndarray
+        Strided x-data (view)
+
+    `fYStrided` : np.ndarray
+        Strided y-data (view)
+
+    """
+    if (len(fXData) <= DECIMATION_MAX_SAMPLES):
+        return fXData, fYData
+
+    iStride : int = int(np.ceil(len(fXData) / 
+        (DECIMATION_OVERVIEW_FACTOR * max(int(iPixels), 1))))
+
+    return fXData[::iStride], fYData[::iStride]
+
+class DecimatedAxes:
+    """
+    Description
+    -----------
+    Class holding the full resolution data of all lines plotted into one axes.
+    Only the decimated data is handed to matplotlib and it is decimated again
+    from the full resolution data, whenever the x limits of the axes change
+    (zoom, pan, resize). The data can be memory mapped, it is only read in the
+    displayed range (see `_decimate_Range`).
+
+    """
+
+    def __init__(self, axes) -> None:
+        """
+        Description
+        -----------
+        Constructor of class DecimatedAxes
+
+        Parameters
+        ----------
+        `axes` : Axes
+            Axes in which the lines are plotted
+
+        """
+        # Initialize class variables
+        self._axes = axes
+        self._listLines : list = []
+
+        # Decimate again on zoom, pan and resize
+        self._axes.callbacks.connect("xlim_changed", self._on_LimitsChanged)
+        self._axes.figure.canvas.mpl_connect("resize_event",
+                                             self._on_LimitsChanged)
+
+    def plot(self, fXData, fYData, bSorted : bool = False, **kwargs):
+        """
+        Description
+        -----------
+        Plot a line into the axes. The data is decimated over the whole range of
+        the line, since the axes is autoscaled to it. For unsorted data the
+        range is taken from the strided data (see `_stride_Data`), which is
+        decimated anyway, so that memory mapped data isn't read completely.
+
+        Parameters
+        ----------
+        `fXData` : array_like
+            X-data of the line in full resolution (e.g. memory mapped)
+
+        `fYData` : array_like
+            Y-data of the line in full resolution (e.g. memory mapped)
+
+        `bSorted` : bool
+            Flag indicating that the x-data is ascending (e.g. time), which 
+            allows to only read the displayed range of the data
+
+        `kwargs` : dict
+            Additional keyword arguments handed to `Axes.plot`
+
+        Return
+        ------
+        `line` : Line2D
+            Created line artist
+
+        """
+        fXData = np.asarray(fXData, dtype= float)
+        fYData = np.asarray(fYData, dtype= float)
+
+        iPixels : int = self._getPixels()
+        fXStrided = _stride_Data(fXData, fXData, iPixels)[0]
+
+        listXLimits : list = [0, 0]
+        if (len(fXData) > 0 and bSorted == True):
+            listXLimits = [fXData[0], fXData[-1]]
+        elif (len(fXData) > 0 and np.any(np.isfinite(fXStrided))):
+            listXLimits = [np.nanmin(fXStrided), np.nanmax(fXStrided)]
+
+        fXDecimated, fYDecimated = _decimate_Range(fXData, fYData,
+            listXLimits, iPixels, bSorted)
+
+        line, = self._axes.plot(fXDecimated, fYDecimated, **kwargs)
+        self._listLines.append([line, fXData, fYData, bSorted])
+
+        return line
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Remove all lines managed by this object from the axes.
+
+        """
+        for line, fXData, fYData, bSorted in self._listLines:
+            line.remove()
+
+        self._listLines = []
+
+    def _on_LimitsChanged(self, event) -> None:
+        """
+        Description
+        -----------
+        Event handler decimating all lines again for the current x limits.
+
+        Parameters
+        ----------
+        `event` : Axes or ResizeEvent
+            Axes which limits changed or resize event of the canvas
+
+        """
+        listXLimits : list = list(self._axes.get_xlim())
+        iPixels : int = self._getPixels()
+
+        for line, fXData, fYData, bSorted in self._listLines:
+            line.set_data(*_decimate_Range(fXData, fYData, listXLimits,
+                                           iPixels, bSorted))
+
+    def _getPixels(self) -> int:
+        """
+        Description
+        -----------
+        Helper method returning the width of the axes in pixels.
+
+        Return
+        ------
+        `iPixels` : int
+            Width of the axes in pixels
+
+        """
+        return int(self._axes.bbox.width)
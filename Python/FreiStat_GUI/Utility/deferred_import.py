@@ -0,0 +1,93 @@
+"""
+Module implementing the deferred import of the dependencies, which are only
+required to run an experiment or to plot data (facades of the FreiStat library
+and matplotlib). Importing them at startup would delay the first paint of the
+interface, therefore they are imported by the methods on first use and warmed
+up in a background thread after the window is shown.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import importlib
+import threading
+
+# Modules imported in the background, relative names are resolved against this
+# package
+tuple_deferredModules : tuple = (
+    ".live_plot",
+    "matplotlib.pyplot",
+    "matplotlib.figure",
+    "FreiStat.Methods.run_electrochemical_method",
+    "FreiStat.Methods.run_chronoamperometry",
+    "FreiStat.Methods.run_linear_sweep_voltammetry",
+    "FreiStat.Methods.run_cyclic_voltammetry",
+    "FreiStat.Methods.run_normal_pulse_voltammetry",
+    "FreiStat.Methods.run_differential_pulse_voltammetry",
+    "FreiStat.Methods.run_square_wave_voltammetry",
+    "FreiStat.Methods.run_sequence"
+)
+
+def _warmUp_Imports(funcDone = None) -> threading.Thread:
+    """
+    Description
+    -----------
+    Import the deferred modules in a daemon thread. A module which is requested
+    by the interface while the thread is still running waits for the import of
+    the thread (import lock of the module) instead of importing it twice.
+
+    Parameters
+    ----------
+    `funcDone` : function
+        Optional function called from the thread with the list of failed
+        imports ([module name, error message] entries) when all imports are done
+
+    Return
+    ------
+    `thread` : Thread
+        Started thread importing the modules
+
+    """
+    thread = threading.Thread(target= _import_Deferred, args= (funcDone,),
+                              name= "DeferredImport", daemon= True)
+    thread.start()
+
+    return thread
+
+def _import_Deferred(funcDone = None) -> list:
+    """
+    Description
+    -----------
+    Import every deferred module. Failed imports are only collected, the
+    interface raises the error again, when it imports the module on use.
+
+    Parameters
+    ----------
+    `funcDone` : function
+        Optional function called with the list of failed imports
+
+    Return
+    ------
+    `listErrors` : list
+        List containing [module name, error message] for every failed import
+
+    """
+    listErrors : list = []
+
+    for strModule in tuple_deferredModules:
+        try:
+            importlib.import_module(strModule, __package__)
+        except Exception as exception:
+            listErrors.append([strModule, str(exception)])
+
+    if (funcDone is not None):
+        funcDone(listErrors)
+
+    return listErrors
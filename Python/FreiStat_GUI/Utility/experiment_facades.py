@@ -0,0 +1,222 @@
+"""
+Module implementing the construction of the facades of the FreiStat library
+(`Run_CA`, ..., `Run_Sequence`) from the experiment parameters of a template.
+It is shared by the interface and the headless command line, therefore it
+depends neither on Tk nor on matplotlib. The facades are imported on first use.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import importlib
+from FreiStat.Data_storage.constants import *
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+from ..Data_Storage.method_registry import dic_methodRegistry
+from ..Data_Storage.method_registry import SEQUENCE_FACADE
+
+def _create_FacadeSettings(logger, bWLANMode : bool,
+                           listWLANSetting : list) -> dict:
+    """
+    Description
+    -----------
+    Create the keyword arguments, which are passed to the constructor of every
+    facade.
+
+    Parameters
+    ----------
+    `logger` : Logger
+        Logger used by the FreiStat library
+
+    `bWLANMode` : bool
+        Flag indicating if the FreiStat is connected via WLAN instead of serial
+
+    `listWLANSetting` : list
+        List containing [server IP, server port, client IP, client port]
+
+    Return
+    ------
+    `dicSettings` : dict
+        Keyword arguments of the facades
+
+    """
+    if (bWLANMode == True):
+        iCommunicationMode = FREISTAT_WLAN
+    else :
+        iCommunicationMode = FREISTAT_SERIAL
+
+    return {"logger" : logger, "mode" : FREISTAT_BACKEND,
+            "commnicationMode" : iCommunicationMode,
+            "wlanSetting" : [listWLANSetting[0], int(listWLANSetting[1]),
+                             listWLANSetting[2], int(listWLANSetting[3])]}
+
+def _get_ParameterValue(listExperimentParameters : list, strParameter : str,
+                        default = False):
+    """
+    Description
+    -----------
+    Look up the value of an experiment parameter by its key.
+
+    Parameters
+    ----------
+    `listExperimentParameters` : list
+        List containing [key, value] pairs of one method
+
+    `strParameter` : string
+        Key of the parameter (e.g. `LOW_PERFORMANCE_MODE`)
+
+    `default` : object
+        Value returned if the parameter is not in the list
+
+    Return
+    ------
+    `value` : object
+        Value of the parameter
+
+    """
+    for listParameter in listExperimentParameters:
+        if (listParameter[0] == strParameter):
+            return listParameter[1]
+
+    return default
+
+def _import_Facade(strMethod : str):
+    """
+    Description
+    -----------
+    Import the facade of the FreiStat library of an electrochemical method.
+
+    Parameters
+    ----------
+    `strMethod` : string
+        Electrochemical method (`SEQUENCE` for the sequence mode)
+
+    Return
+    ------
+    `Facade` : class
+        Facade running the method
+
+    """
+    if (strMethod == SEQUENCE):
+        strModule, strFacade = SEQUENCE_FACADE
+    elif (strMethod in dic_methodRegistry):
+        strModule, strFacade = dic_methodRegistry[strMethod].get_Facade()
+    else :
+        raise ValueError("Unknown electrochemical method: " + str(strMethod))
+
+    return getattr(importlib.import_module(strModule), strFacade)
+
+def _start_SingleMethod(strMethod : str, listExperimentParameters : list,
+                        dicSettings : dict, Facade = None):
+    """
+    Description
+    -----------
+    Create the facade of an electrochemical method and start the experiment
+    with the experiment parameters of a template.
+
+    Parameters
+    ----------
+    `strMethod` : string
+        Electrochemical method
+
+    `listExperimentParameters` : list
+        List containing the experiment parameters of the method
+
+    `dicSettings` : dict
+        Keyword arguments of the facade (see `_create_FacadeSettings`)
+
+    `Facade` : class
+        Optional replacement of the facade (e.g. the simulated device)
+
+    Return
+    ------
+    `RunEcMethod` : Run_Electrochemical_Method
+        Started facade
+
+    """
+    if (Facade is None):
+        Facade = _import_Facade(strMethod)
+
+    # Create the arguments first, missing parameters must not open the device
+    dicArguments : dict = dic_methodRegistry[strMethod].create_Arguments(
+        listExperimentParameters)
+
+    RunEcMethod = Facade(**dicSettings)
+    RunEcMethod.start(**dicArguments)
+
+    return RunEcMethod
+
+def _start_Sequence(listExperimentParameters : list, iSequenceCycles : int,
+                    dicSettings : dict, Facade = None):
+    """
+    Description
+    -----------
+    Create the sequence facade, add every method of a sequence template and
+    start the sequence. The optimizer and the low performance mode are enabled
+    for the whole sequence, if they are enabled for one of its methods.
+
+    Parameters
+    ----------
+    `listExperimentParameters` : list
+        List containing [method, name, experiment parameters] of every method
+        in the sequence
+
+    `iSequenceCycles` : int
+        Amount of times the sequence is repeated
+
+    `dicSettings` : dict
+        Keyword arguments of the facade (see `_create_FacadeSettings`)
+
+    `Facade` : class
+        Optional replacement of the facade (e.g. the simulated device)
+
+    Return
+    ------
+    `RunEcMethod` : Run_Sequence
+        Started facade
+
+    """
+    # Initialize variabels
+    bEnableOptimizer : bool = False
+    bLowPerformanceMode : bool = False
+    listCalls : list = []
+
+    if (Facade is None):
+        Facade = _import_Facade(SEQUENCE)
+
+    for listMethod in listExperimentParameters:
+        # Check if the optimizer and the low performance mode should be enabled
+        if (_get_ParameterValue(listMethod[2], ENABLE_OPTIMIZER) == True):
+            bEnableOptimizer = True
+
+        if (_get_ParameterValue(listMethod[2], LOW_PERFORMANCE_MODE) == True):
+            bLowPerformanceMode = True
+
+        if (listMethod[0] not in dic_methodRegistry):
+            raise ValueError("Unknown electrochemical method: " + 
+                             str(listMethod[0]))
+
+        definition = dic_methodRegistry[listMethod[0]]
+        listCalls.append([definition.get_SequenceCall(),
+            definition.create_Arguments(listMethod[2], bSequence= True)])
+
+    # Create a sequence object
+    RunEcMethod = Facade(EnableOptimizer= bEnableOptimizer, **dicSettings)
+
+    # Add methods to the sequence
+    for strCall, dicArguments in listCalls:
+        getattr(RunEcMethod, strCall)(**dicArguments)
+
+    # Start the sequence
+    RunEcMethod.start(SequenceCycles= iSequenceCycles,
+                      LowPerformanceMode= bLowPerformanceMode)
+
+    return RunEcMethod
@@ -0,0 +1,135 @@
+"""
+Module implementing the cache of the parameter forms shown in the central
+frame. Each form is built once per method and parent frame and is hidden with
+`pack_forget` instead of being destroyed, when another method is shown. The
+least recently used form is destroyed, if more than `FORM_CACHE_SIZE` forms
+are cached.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+from collections import OrderedDict
+from tkinter import *
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+
+class FormCache:
+    """
+    Description
+    -----------
+    Least recently used cache of the parameter forms. A form is stored as list
+    containing [form frame, parameter frame, advanced setting frame].
+
+    """
+
+    def __init__(self, iMaxForms : int = FORM_CACHE_SIZE) -> None:
+        """
+        Description
+        -----------
+        Constructor of class FormCache
+
+        Parameters
+        ----------
+        `iMaxForms` : int
+            Maximal amount of cached forms
+
+        """
+        # Initialize class variables
+        self._iMaxForms : int = max(iMaxForms, 1)
+        self._dicForms : OrderedDict = OrderedDict()
+
+    def get_Form(self, parentFrame : Misc, strMethod : str) -> list:
+        """
+        Description
+        -----------
+        Get the cached form of a method, forms whose widgets were destroyed in
+        the meantime (e.g. by clearing the parent frame) are removed.
+
+        Parameters
+        ----------
+        `parentFrame` : Misc
+            Frame in which the form is embedded
+
+        `strMethod` : string
+            Electrochemical method of the form
+
+        Return
+        ------
+        `listForm` : list
+            Cached form, None if no form is cached
+
+        """
+        tupleKey : tuple = (str(parentFrame), strMethod)
+
+        listForm : list = self._dicForms.get(tupleKey)
+        if (listForm is None):
+            return None
+
+        if (listForm[0].winfo_exists() == False):
+            del self._dicForms[tupleKey]
+            return None
+
+        self._dicForms.move_to_end(tupleKey)
+        return listForm
+
+    def add_Form(self, parentFrame : Misc, strMethod : str,
+                 listForm : list) -> None:
+        """
+        Description
+        -----------
+        Add a form to the cache and destroy the least recently used forms, if
+        the cache is full.
+
+        Parameters
+        ----------
+        `parentFrame` : Misc
+            Frame in which the form is embedded
+
+        `strMethod` : string
+            Electrochemical method of the form
+
+        `listForm` : list
+            List containing [form frame, parameter frame, advanced setting
+            frame]
+
+        """
+        self._dicForms[(str(parentFrame), strMethod)] = listForm
+
+        while (len(self._dicForms) > self._iMaxForms):
+            _, listOldForm = self._dicForms.popitem(last= False)
+
+            if (listOldForm[0].winfo_exists() == True):
+                listOldForm[0].destroy()
+
+    def hide_Forms(self) -> None:
+        """
+        Description
+        -----------
+        Hide every cached form without destroying it.
+
+        """
+        for listForm in self._dicForms.values():
+            if (listForm[0].winfo_exists() == True):
+                listForm[0].pack_forget()
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Destroy every cached form.
+
+        """
+        for listForm in self._dicForms.values():
+            if (listForm[0].winfo_exists() == True):
+                listForm[0].destroy()
+
+        self._dicForms.clear()
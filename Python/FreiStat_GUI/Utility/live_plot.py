@@ -0,0 +1,342 @@
+"""
+Module implementing a canvas for the live feed, which only redraws the updated
+line artists instead of the whole figure, and the toolbar of the plots.
+
+Matplotlib is only imported together with this module, which is loaded on the
+first plot (see `deferred_import`).
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import time
+import numpy as np
+from tkinter import *
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+import matplotlib
+matplotlib.use('TkAgg')
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+from .decimation import _decimate_MinMax
+
+class LivePlotCanvas(FigureCanvasTkAgg):
+    """
+    Description
+    -----------
+    Canvas used for the live feed of the plotter.
+
+    The animation of the plotter requests a redraw of the whole figure after
+    every frame. This canvas caches the static background (axes, ticks, legend)
+    and only blits the line artists on top of it. The axes are rescaled by the
+    canvas itself and only if new data leaves the current limits. As soon as
+    the user navigates in the plot, the limits are kept. The lines are drawn
+    with decimated data (see `_decimate_MinMax`).
+
+    """
+
+    def __init__(self, figure, master, strFPS : StringVar = None) -> None:
+        """
+        Description
+        -----------
+        Constructor of class LivePlotCanvas
+
+        Parameters
+        ----------
+        `figure` : Figure
+            Figure of the plotter, which should be displayed
+
+        `master` : Frame
+            Parent frame in which the canvas is embedded
+
+        `strFPS` : StringVar
+            Optional string variable in which the frame rate is reported
+
+        """
+        # Initialize class variables (before the canvas might request a draw)
+        self._strFPS = strFPS
+        self._background = None
+        self._listLines : list = []
+        self._listLimits : list = []
+        self._listBounds : list = []
+        self._listSamples : list = []
+        self._tupleFigureBounds : tuple = None
+        self._bAutoscale : bool = True
+        self._iFrames : int = 0
+        self._fFrameTime : float = time.perf_counter()
+
+        super().__init__(figure, master= master)
+
+        # Cache the background after every full redraw
+        self.mpl_connect("draw_event", self._on_draw)
+
+    def draw_idle(self, *args, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Overwritten method, which is called by the animation of the plotter
+        after every frame. Only blits the line artists, if the cached background
+        is still valid.
+
+        """
+        # Fall back to a full redraw if the background is invalid
+        if (self._checkBackground() == False or self._rescaleAxes() == True):
+            super().draw_idle(*args, **kwargs)
+            return
+
+        self.restore_region(self._background)
+        self._drawLines()
+        self.blit(self.figure.bbox)
+
+        self._countFrame()
+
+    def _on_draw(self, event) -> None:
+        """
+        Description
+        -----------
+        Event handler called after every full redraw of the figure. Caches the
+        background without the line artists and draws the lines on top.
+
+        Parameters
+        ----------
+        `event` : DrawEvent
+            Draw event of matplotlib
+
+        """
+        # Limits changed without the canvas, user navigated in the plot
+        listLimits : list = self._getLimits()
+        if (len(self._listLimits) > 0 and listLimits != self._listLimits):
+            self._bAutoscale = False
+
+        self._listLimits = listLimits
+        self._tupleFigureBounds = tuple(self.figure.bbox.bounds)
+        self._background = self.copy_from_bbox(self.figure.bbox)
+
+        self._drawLines()
+        self.blit(self.figure.bbox)
+
+        self._countFrame()
+
+    def _checkBackground(self) -> bool:
+        """
+        Description
+        -----------
+        Check if the cached background can be used for the next frame. Lines
+        which are new since the last full redraw are marked as animated, so that
+        they are not part of the background.
+
+        Return
+        ------
+        `bValid` : bool
+            Flag indicating if the background is still valid
+
+        """
+        bValid : bool = self._background is not None
+
+        # New lines (e.g. next cycle) require a new legend
+        listLines : list = [(axes, line) for axes in self.figure.axes
+                            for line in axes.get_lines()]
+
+        if ([line for axes, line in listLines] !=
+            [line for axes, line in self._listLines]):
+            for axes, line in listLines:
+                line.set_animated(True)
+                axes.set_autoscale_on(False)
+
+            self._listLines = listLines
+            self._listBounds = [None] * len(listLines)
+            self._listSamples = [0] * len(listLines)
+            bValid = False
+
+        # Figure was resized or axes were changed
+        if (tuple(self.figure.bbox.bounds) != self._tupleFigureBounds or
+            self._getLimits() != self._listLimits):
+            bValid = False
+
+        return bValid
+
+    def _rescaleAxes(self) -> bool:
+        """
+        Description
+        -----------
+        Rescale the axes, if new data left the current limits. Only the samples
+        added since the last frame are evaluated.
+
+        Return
+        ------
+        `bRescaled` : bool
+            Flag indicating if the limits of at least one axes were changed
+
+        """
+        bRescaled : bool = False
+        dicBounds : dict = {}
+
+        # Update bounds of every line with the new samples
+        for iIndex, (axes, line) in enumerate(self._listLines):
+            fXData = np.asarray(line.get_xdata(), dtype= float)
+            fYData = np.asarray(line.get_ydata(), dtype= float)
+            iSamples : int = min(len(fXData), len(fYData))
+
+            # Line was reset, evaluate all samples again
+            if (iSamples < self._listSamples[iIndex]):
+                self._listSamples[iIndex] = 0
+                self._listBounds[iIndex] = None
+
+            if (iSamples > self._listSamples[iIndex]):
+                fXNew = fXData[self._listSamples[iIndex]:iSamples]
+                fYNew = fYData[self._listSamples[iIndex]:iSamples]
+                bFinite = np.isfinite(fXNew) & np.isfinite(fYNew)
+
+                if (np.any(bFinite)):
+                    listBounds : list = [np.min(fXNew[bFinite]),
+                                         np.max(fXNew[bFinite]),
+                                         np.min(fYNew[bFinite]),
+                                         np.max(fYNew[bFinite])]
+                    if (self._listBounds[iIndex] is not None):
+                        listBounds = [
+                            min(listBounds[0], self._listBounds[iIndex][0]),
+                            max(listBounds[1], self._listBounds[iIndex][1]),
+                            min(listBounds[2], self._listBounds[iIndex][2]),
+                            max(listBounds[3], self._listBounds[iIndex][3])]
+                    self._listBounds[iIndex] = listBounds
+
+                self._listSamples[iIndex] = iSamples
+
+            if (self._listBounds[iIndex] is None):
+                continue
+
+            # Combine bounds of all lines of one axes
+            if (axes in dicBounds):
+                listBounds = dicBounds[axes]
+                dicBounds[axes] = [
+                    min(listBounds[0], self._listBounds[iIndex][0]),
+                    max(listBounds[1], self._listBounds[iIndex][1]),
+                    min(listBounds[2], self._listBounds[iIndex][2]),
+                    max(listBounds[3], self._listBounds[iIndex][3])]
+            else :
+                dicBounds[axes] = list(self._listBounds[iIndex])
+
+        if (self._bAutoscale == False):
+            return False
+
+        for axes, listBounds in dicBounds.items():
+            fXMin, fXMax = axes.get_xlim()
+            fYMin, fYMax = axes.get_ylim()
+
+            # Only rescale if data leaves the current limits
+            if (listBounds[0] < fXMin or listBounds[1] > fXMax):
+                axes.set_xlim(self._addMargin(listBounds[0], listBounds[1]))
+                bRescaled = True
+
+            if (listBounds[2] < fYMin or listBounds[3] > fYMax):
+                axes.set_ylim(self._addMargin(listBounds[2], listBounds[3]))
+                bRescaled = True
+
+        # Limits set by the canvas itself are no user navigation
+        if (bRescaled == True):
+            self._listLimits = self._getLimits()
+
+        return bRescaled
+
+    def _addMargin(self, fMin : float, fMax : float) -> list:
+        """
+        Description
+        -----------
+        Helper method adding headroom to the limits, to prevent a rescale on
+        every new sample.
+
+        Parameters
+        ----------
+        `fMin` : float
+            Minimum of the data
+
+        `fMax` : float
+            Maximum of the data
+
+        Return
+        ------
+        `listLimits` : list
+            List containing the new lower and upper limit
+
+        """
+        fMargin : float = (fMax - fMin) * LIVE_PLOT_MARGIN
+
+        # Prevent singular limits for constant data
+        if (fMargin == 0):
+            fMargin = max(abs(fMax) * LIVE_PLOT_MARGIN, 1e-12)
+
+        return [fMin - fMargin, fMax + fMargin]
+
+    def _drawLines(self) -> None:
+        """
+        Description
+        -----------
+        Draw all line artists on top of the current canvas. Only the decimated
+        data is drawn, the full resolution data of the plotter is restored
+        afterwards.
+
+        """
+        for axes, line in self._listLines:
+            fXData = line.get_xdata()
+            fYData = line.get_ydata()
+
+            line.set_data(*_decimate_MinMax(fXData, fYData, axes.get_xlim(),
+                                            axes.bbox.width))
+            axes.draw_artist(line)
+            line.set_data(fXData, fYData)
+
+    def _getLimits(self) -> list:
+        """
+        Description
+        -----------
+        Helper method returning the current limits of all axes.
+
+        Return
+        ------
+        `listLimits` : list
+            List containing the x and y limits of every axes
+
+        """
+        return [(tuple(axes.get_xlim()), tuple(axes.get_ylim()))
+                for axes in self.figure.axes]
+
+    def _countFrame(self) -> None:
+        """
+        Description
+        -----------
+        Count the rendered frames and report the frame rate.
+
+        """
+        self._iFrames += 1
+
+        fTime : float = time.perf_counter()
+        fElapsed : float = fTime - self._fFrameTime
+
+        if (fElapsed >= LIVE_PLOT_FPS_INTERVAL):
+            if (self._strFPS is not None):
+                self._strFPS.set("{:.1f} FPS".format(self._iFrames / fElapsed))
+
+            self._iFrames = 0
+            self._fFrameTime = fTime
+
+class Toolbar(NavigationToolbar2Tk): 
+    """
+    Description
+    -----------
+    Custom class overwriting the default matplotlib plot toolbar.
+    
+    """
+    def __init__(self, plotCanvas, frame):
+        # Create the default toolbar
+        NavigationToolbar2Tk.__init__(self, plotCanvas, frame)
+
+        # Remove the button to reconfig the subplots
+        self.children['!button4'].pack_forget()
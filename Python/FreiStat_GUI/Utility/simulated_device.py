@@ -0,0 +1,501 @@
+"""
+Module implementing a simulated FreiStat device, which can replace the facades
+of the FreiStat library (`Run_CA`, ..., `Run_Sequence`) to run the interface
+without hardware, e.g. for load testing.
+
+The simulated device computes the applied potential of the chosen method from
+the experiment parameters and models the current of a reversible redox couple
+with additive noise. A separate process puts the samples into the data queue
+at the time they are due, optionally faster than the configured sampling rate.
+
+Records are put into the data queue in the same layout as the FreiStat library
+does: [time (s), potential (mV), current (uA), cycle] followed by the method
+index for sequences.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import multiprocessing
+import time
+import numpy as np
+from FreiStat.Data_storage.constants import *
+
+# Include internal dependencies
+from ..Data_Storage.constants import *
+
+class SimulatedDevice:
+    """
+    Description
+    -----------
+    Replacement of the facades of the FreiStat library providing the same
+    interface (`start`, `get_plotter`, `get_process`, `get_dataQueue`,
+    `_terminateExperiment` and the `add_*` methods of a sequence).
+
+    """
+
+    def __init__(self, strMethod : str, fRateFactor : float = 1.0,
+                 fNoise : float = 1.0, logger = None, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Constructor of class SimulatedDevice
+
+        Parameters
+        ----------
+        `strMethod` : string
+            Electrochemical method which is simulated (`SEQUENCE` for the
+            sequence mode)
+
+        `fRateFactor` : float
+            Factor by which the samples are sent faster than configured
+
+        `fNoise` : float
+            Standard deviation of the noise in % of `SIM_PEAK_CURRENT`
+
+        `logger` : Logger
+            Logger of the interface
+
+        `kwargs` : dict
+            Further arguments of the facades (e.g. communication mode), which
+            are ignored by the simulated device
+
+        """
+        # Initialize class variables
+        self._strMethod : str = strMethod
+        self._fRateFactor : float = max(float(fRateFactor), 1e-3)
+        self._fNoise : float = max(float(fNoise), 0.0)
+        self._logger = logger
+
+        self._listMethods : list = []
+        self._fDuration : float = 0.0
+        self._plotter = None
+        self._process : multiprocessing.Process = None
+        self._dataQueue = multiprocessing.Queue()
+        self._eventStop = multiprocessing.Event()
+
+    def start(self, SequenceCycles : int = 1, LowPerformanceMode : bool = False,
+              **kwargs) -> None:
+        """
+        Description
+        -----------
+        Compute the samples of the experiment and start the process sending
+        them. In the single mode the experiment parameters are given as keyword
+        arguments with the names of the facade, in the sequence mode the
+        methods are added beforehand with the `add_*` methods.
+
+        Parameters
+        ----------
+        `SequenceCycles` : int
+            Amount of times the sequence is repeated
+
+        `LowPerformanceMode` : bool
+            Flag indicating if the low performance mode is used
+
+        `kwargs` : dict
+            Experiment parameters of a single method
+
+        """
+        if (self._strMethod != SEQUENCE):
+            self._listMethods = [[self._strMethod, kwargs]]
+            SequenceCycles = 1
+
+        listSamples : list = [[], [], [], [], []]
+        fOffset : float = 0.0
+
+        # Concatenate the samples of every method in the sequence
+        for iSeqCycle in range(max(int(SequenceCycles), 1)):
+            for iMethodIndex, (strMethod, dicParameters) in \
+                enumerate(self._listMethods):
+                fTime, fPotential, iCycle, fDirection = _generate_Samples(
+                    strMethod, dicParameters)
+
+                listSamples[0].append(fTime + fOffset)
+                listSamples[1].append(fPotential)
+                listSamples[2].append(_model_Current(strMethod, fTime,
+                    fPotential, fDirection, dicParameters))
+                listSamples[3].append(iCycle)
+                listSamples[4].append(np.full(len(fTime), iMethodIndex))
+
+                if (len(fTime) > 0):
+                    fOffset += fTime[-1]
+
+        listArrays : list = [np.concatenate(listColumn) if
+            len(listColumn) > 0 else np.zeros(0) for listColumn in listSamples]
+
+        if (len(listArrays[0]) > SIM_MAX_SAMPLES):
+            raise ValueError("Simulated experiment exceeds " +
+                             str(SIM_MAX_SAMPLES) + " samples")
+
+        # Add noise and send the samples faster than configured
+        listArrays[0] = listArrays[0] / self._fRateFactor
+        listArrays[2] = listArrays[2] + np.random.default_rng().normal(0.0,
+            self._fNoise / 100.0 * SIM_PEAK_CURRENT, len(listArrays[2]))
+
+        if (self._strMethod != SEQUENCE):
+            listArrays[4] = None
+
+        if (len(listArrays[0]) > 0):
+            self._fDuration = float(listArrays[0][-1])
+
+        self._process = multiprocessing.Process(target= _run_Device,
+            args= (self._dataQueue, self._eventStop, *listArrays),
+            name= "SimulatedDevice", daemon= True)
+        self._process.start()
+
+        if (self._logger is not None):
+            self._logger.info("Simulated " + self._strMethod + " started (" +
+                str(len(listArrays[0])) + " samples)")
+
+    def add_CA(self, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Add a chronoamperometry to the simulated sequence.
+
+        """
+        self._listMethods.append([CA, kwargs])
+
+    def add_LSV(self, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Add a linear sweep voltammetry to the simulated sequence.
+
+        """
+        self._listMethods.append([LSV, kwargs])
+
+    def add_CV(self, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Add a cyclic voltammetry to the simulated sequence.
+
+        """
+        self._listMethods.append([CV, kwargs])
+
+    def add_NPV(self, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Add a normal pulse voltammetry to the simulated sequence.
+
+        """
+        self._listMethods.append([NPV, kwargs])
+
+    def add_DPV(self, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Add a differential pulse voltammetry to the simulated sequence.
+
+        """
+        self._listMethods.append([DPV, kwargs])
+
+    def add_SWV(self, **kwargs) -> None:
+        """
+        Description
+        -----------
+        Add a square wave voltammetry to the simulated sequence.
+
+        """
+        self._listMethods.append([SWV, kwargs])
+
+    def get_plotter(self):
+        """
+        Description
+        -----------
+        Get the plotter of the simulated experiment. The plotter is created on
+        first use, so that matplotlib is only loaded if the data is plotted.
+
+        Return
+        ------
+        `plotter` : SimulatedPlotter
+            Plotter displaying the simulated data
+
+        """
+        # Import on first use, the headless mode and the device process never
+        # load matplotlib
+        from .simulated_plotter import SimulatedPlotter
+
+        if (self._plotter is None):
+            self._plotter = SimulatedPlotter(
+                [strMethod for strMethod, dicParameters in self._listMethods],
+                self._fDuration, self._strMethod == SEQUENCE, self._logger)
+
+        return self._plotter
+
+    def get_process(self) -> multiprocessing.Process:
+        """
+        Description
+        -----------
+        Get the process sending the samples.
+
+        Return
+        ------
+        `process` : Process
+            Process of the simulated device
+
+        """
+        return self._process
+
+    def get_dataQueue(self):
+        """
+        Description
+        -----------
+        Get the data queue into which the samples are put.
+
+        Return
+        ------
+        `dataQueue` : Queue
+            Data queue of the simulated device
+
+        """
+        return self._dataQueue
+
+    def _terminateExperiment(self) -> None:
+        """
+        Description
+        -----------
+        Stop the process of the simulated device. The process is terminated, if
+        it does not stop within `SIM_STOP_TIMEOUT`.
+
+        """
+        self._eventStop.set()
+
+        if (self._process is None):
+            return
+
+        self._process.join(SIM_STOP_TIMEOUT)
+        if (self._process.is_alive() == True):
+            self._process.terminate()
+
+def _run_Device(dataQueue, eventStop, fTime : np.ndarray,
+                fPotential : np.ndarray, fCurrent : np.ndarray,
+                iCycle : np.ndarray, iMethodIndex : np.ndarray = None) -> None:
+    """
+    Description
+    -----------
+    Main function of the device process. Every `SIM_SEND_INTERVAL` the samples
+    which are due since the start are put into the data queue.
+
+    Parameters
+    ----------
+    `dataQueue` : Queue
+        Data queue into which the samples are put
+
+    `eventStop` : Event
+        Event requesting the process to stop
+
+    `fTime` : np.ndarray
+        Time stamps of the samples in s
+
+    `fPotential` : np.ndarray
+        Applied potential of the samples in mV
+
+    `fCurrent` : np.ndarray
+        Current of the samples in uA
+
+    `iCycle` : np.ndarray
+        Cycle of the samples
+
+    `iMethodIndex` : np.ndarray
+        Index of the method in the sequence, None in the single mode
+
+    """
+    iSent : int = 0
+    fStart : float = time.perf_counter()
+
+    while (iSent < len(fTime) and eventStop.is_set() == False):
+        iDue : int = int(np.searchsorted(fTime, time.perf_counter() - fStart,
+                                         side= "right"))
+
+        for iIndex in range(iSent, iDue):
+            listRecord : list = [float(fTime[iIndex]),
+                float(fPotential[iIndex]), float(fCurrent[iIndex]),
+                int(iCycle[iIndex])]
+
+            if (iMethodIndex is not None):
+                listRecord.append(int(iMethodIndex[iIndex]))
+
+            dataQueue.put(listRecord)
+
+        iSent = max(iSent, iDue)
+        time.sleep(SIM_SEND_INTERVAL)
+
+    # Make sure every record is handed over before the process ends
+    dataQueue.close()
+    dataQueue.join_thread()
+
+def _generate_Samples(strMethod : str, dicParameters : dict) -> tuple:
+    """
+    Description
+    -----------
+    Compute the time stamps and the applied potential of every sample of one
+    method from the experiment parameters of the facade (potentials in V,
+    times in s).
+
+    Parameters
+    ----------
+    `strMethod` : string
+        Electrochemical method
+
+    `dicParameters` : dict
+        Experiment parameters with the names of the facade
+
+    Return
+    ------
+    `tupleSamples` : tuple
+        Time stamps (s), potential (mV), cycle and sweep direction (+1 / -1)
+        of every sample. For CA the direction holds the time since the last
+        potential step instead.
+
+    """
+    iCycles : int = max(int(dicParameters.get("Cycle", 1)), 1)
+
+    if (strMethod == CA):
+        fSteps = np.atleast_1d(np.asarray(dicParameters["Potential_Steps"],
+                                          dtype= float))
+        fLengths = np.atleast_1d(np.asarray(dicParameters["Pulse_Lengths"],
+                                            dtype= float))
+        fPeriod : float = max(float(dicParameters["Sampling_Rate"]), 1e-6)
+
+        listTime : list = []
+        listPotential : list = []
+        listStepTime : list = []
+        for fStep, fLength in zip(fSteps, fLengths):
+            iSamples : int = max(int(round(fLength / fPeriod)), 1)
+            fStepTime = (np.arange(iSamples) + 1) * fPeriod
+            listTime.append(fStepTime)
+            listPotential.append(np.full(iSamples, fStep * 1000.0))
+            listStepTime.append(fStepTime)
+
+        # Steps are placed one after another
+        fOffsets = np.cumsum([0.0] + [float(fTime[-1]) for fTime in listTime])
+        fTime = np.concatenate([fStepTime + fOffset for fStepTime, fOffset in
+                                zip(listTime, fOffsets)])
+        fPotential = np.concatenate(listPotential)
+        fDirection = np.concatenate(listStepTime)
+        fCycleTime : float = fOffsets[-1]
+
+    elif (strMethod in (LSV, CV)):
+        fStepSize : float = max(abs(float(dicParameters["Stepsize"])), 1e-6)
+        fPeriod : float = fStepSize / max(abs(float(dicParameters["Scanrate"])),
+                                          1e-6)
+
+        if (strMethod == LSV):
+            listVertices : list = [float(dicParameters["StartVoltage"]),
+                                   float(dicParameters["StopVoltage"])]
+        else :
+            listVertices : list = [float(dicParameters["StartVoltage"]),
+                                   float(dicParameters["FirstVertex"]),
+                                   float(dicParameters["SecondVertex"]),
+                                   float(dicParameters["StartVoltage"])]
+
+        listPotential : list = []
+        listDirection : list = []
+        for fFrom, fTo in zip(listVertices[:-1], listVertices[1:]):
+            iSteps : int = max(int(round(abs(fTo - fFrom) / fStepSize)), 1)
+            listPotential.append(np.linspace(fFrom, fTo, iSteps + 1)[1:])
+            listDirection.append(np.full(iSteps, 1.0 if fTo >= fFrom else -1.0))
+
+        fPotential = np.concatenate(listPotential) * 1000.0
+        fDirection = np.concatenate(listDirection)
+        fTime = (np.arange(len(fPotential)) + 1) * fPeriod
+        fCycleTime : float = len(fPotential) * fPeriod
+
+    elif (strMethod in (NPV, DPV, SWV)):
+        fStart : float = float(dicParameters["StartVoltage"])
+        fStop : float = float(dicParameters["StopVoltage"])
+        fStepSize : float = max(abs(float(
+            dicParameters["DeltaV_Staircase"])), 1e-6)
+
+        if (strMethod == SWV):
+            fPeriod : float = float(dicParameters["DutyCycle"])
+        else :
+            fPeriod : float = float(np.sum(dicParameters["Pulse_Lengths"]))
+        fPeriod = max(fPeriod, 1e-6)
+
+        iSteps : int = max(int(round(abs(fStop - fStart) / fStepSize)), 1)
+        fPotential = np.linspace(fStart, fStop, iSteps + 1) * 1000.0
+        fDirection = np.full(len(fPotential), 1.0 if fStop >= fStart else -1.0)
+        fTime = (np.arange(len(fPotential)) + 1) * fPeriod
+        fCycleTime : float = len(fPotential) * fPeriod
+
+    else :
+        raise ValueError("Method " + str(strMethod) + " can not be simulated")
+
+    # Repeat the samples for every cycle
+    iSamples : int = len(fTime)
+    if (iSamples * iCycles > SIM_MAX_SAMPLES):
+        raise ValueError("Simulated experiment exceeds " +
+                         str(SIM_MAX_SAMPLES) + " samples")
+
+    fTime = np.concatenate([fTime + iCycle * fCycleTime
+                            for iCycle in range(iCycles)])
+
+    return (fTime, np.tile(fPotential, iCycles),
+            np.repeat(np.arange(1, iCycles + 1), iSamples),
+            np.tile(fDirection, iCycles))
+
+def _model_Current(strMethod : str, fTime : np.ndarray,
+                   fPotential : np.ndarray, fDirection : np.ndarray,
+                   dicParameters : dict) -> np.ndarray:
+    """
+    Description
+    -----------
+    Model the current of a reversible redox couple with the formal potential
+    `SIM_FORMAL_POTENTIAL` for the applied potential.
+
+    Parameters
+    ----------
+    `strMethod` : string
+        Electrochemical method
+
+    `fTime` : np.ndarray
+        Time stamps of the samples in s
+
+    `fPotential` : np.ndarray
+        Applied potential in mV
+
+    `fDirection` : np.ndarray
+        Sweep direction of the samples, time since the last step for CA
+
+    `dicParameters` : dict
+        Experiment parameters with the names of the facade
+
+    Return
+    ------
+    `fCurrent` : np.ndarray
+        Current in uA
+
+    """
+    if (strMethod == CA):
+        # Steady state current with a decay after every step
+        return (SIM_PEAK_CURRENT * np.tanh((fPotential - SIM_FORMAL_POTENTIAL)
+                / SIM_PEAK_WIDTH) * (1.0 + np.exp(-fDirection / SIM_DECAY_TIME)))
+
+    if (strMethod in (LSV, CV)):
+        # Peak shifted by the sweep direction on top of the capacitive current
+        fX = (fPotential - SIM_FORMAL_POTENTIAL - fDirection *
+              SIM_PEAK_SEPARATION / 2.0) / SIM_PEAK_WIDTH
+        return fDirection * (SIM_PEAK_CURRENT / np.cosh(fX) ** 2 +
+            0.3 * SIM_PEAK_CURRENT / (1.0 + np.exp(-fDirection * fX * 2.0)) +
+            SIM_CAPACITIVE_CURRENT)
+
+    if (strMethod == NPV):
+        # Limiting current reached after the formal potential
+        return SIM_PEAK_CURRENT / (1.0 + np.exp(-(fPotential -
+            SIM_FORMAL_POTENTIAL) / SIM_PEAK_WIDTH * 2.0))
+
+    # DPV and SWV: peak centred at the formal potential shifted by the pulse
+    fPeak : float = float(dicParameters.get("DeltaV_Peak", 0.0)) * 1000.0
+    return SIM_PEAK_CURRENT / np.cosh((fPotential + fPeak / 2.0 -
+        SIM_FORMAL_POTENTIAL) / SIM_PEAK_WIDTH) ** 2
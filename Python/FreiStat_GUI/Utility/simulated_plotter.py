@@ -0,0 +1,402 @@
+"""
+Module implementing the plotter of the simulated FreiStat device, which
+provides the interface of the plotter of the FreiStat library for the live
+feed.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Include dependencies
+import queue
+from matplotlib.animation import FuncAnimation
+from matplotlib.figure import Figure
+from FreiStat.Data_storage.constants import *
+
+# Include internal dependencies
+from ..Data_Storage.constants import *
+
+class SimulatedPlotter:
+    """
+    Description
+    -----------
+    Plotter of the simulated device. Every frame the records in the queue are
+    appended to one line per method and cycle. In the sequence mode every
+    method gets a small figure in addition and the main figure shows the
+    method which is currently running.
+
+    """
+
+    def __init__(self, listMethods : list, fDuration : float,
+                 bSequence : bool = False, logger = None) -> None:
+        """
+        Description
+        -----------
+        Constructor of class SimulatedPlotter
+
+        Parameters
+        ----------
+        `listMethods` : list
+            List containing the simulated methods in the order of execution
+
+        `fDuration` : float
+            Time stamp of the last sample sent by the simulated device. The
+            progress is measured by time, since the interface may drop records
+            if the plot doesn't keep up
+
+        `bSequence` : bool
+            Flag indicating if a sequence is simulated
+
+        `logger` : Logger
+            Logger of the interface
+
+        """
+        # Initialize class variables
+        self._listMethods : list = listMethods
+        self._fDuration : float = fDuration
+        self._fReceivedTime : float = 0.0
+        self._iMethodIndex : int = 0
+        self._logger = logger
+
+        self._listBox = None
+        self._progressBar = None
+        self._animate = None
+        self._dataQueue = None
+        self._iLatency : int = 1
+
+        # Line data of every method and cycle: [[x values], [y values], line of
+        # the method figure], lines of the main figure are kept separately
+        self._dicLines : dict = {}
+        self._dicMainLines : dict = {}
+
+        self._figure = Figure()
+        self._axes = self._figure.add_subplot(111)
+        self._setupAxes(self._axes, listMethods[0])
+
+        self._listFigures : list = []
+        self._listAxes : list = []
+        if (bSequence == True):
+            for strMethod in listMethods:
+                figure = Figure()
+                axes = figure.add_subplot(111)
+                axes.set_title(strMethod)
+                self._setupAxes(axes, strMethod)
+
+                self._listFigures.append(figure)
+                self._listAxes.append(axes)
+
+    def T_Animate(self, dataQueue) -> None:
+        """
+        Description
+        -----------
+        Start the animation of the live feed, which draws a frame every
+        `SIM_PLOT_INTERVAL`.
+
+        Parameters
+        ----------
+        `dataQueue` : Queue
+            Queue containing the records of the simulated device
+
+        """
+        self._dataQueue = dataQueue
+        self._animate = FuncAnimation(self._figure, self._drawFrame,
+            interval= SIM_PLOT_INTERVAL, cache_frame_data= False)
+
+    def T_Print(self, strLatency : str, dataQueue) -> None:
+        """
+        Description
+        -----------
+        Start printing the received records into the terminal instead of
+        plotting them (low performance mode).
+
+        Parameters
+        ----------
+        `strLatency` : string
+            Interval in ms in which the records are printed
+
+        `dataQueue` : Queue
+            Queue containing the records of the simulated device
+
+        """
+        self._dataQueue = dataQueue
+
+        try:
+            self._iLatency = max(int(strLatency), 1)
+        except ValueError:
+            self._iLatency = int(SET_GLPM_LATENCY_VALUE)
+
+        self._listBox.after(self._iLatency, self._printRecords)
+
+    def set_listBox(self, listBox) -> None:
+        """
+        Description
+        -----------
+        Set the terminal of the interface.
+
+        Parameters
+        ----------
+        `listBox` : Listbox
+            Terminal of the interface
+
+        """
+        self._listBox = listBox
+
+    def set_progressBar(self, progressBar) -> None:
+        """
+        Description
+        -----------
+        Set the progress bar of the interface.
+
+        Parameters
+        ----------
+        `progressBar` : Progressbar
+            Progress bar of the interface
+
+        """
+        self._progressBar = progressBar
+        self._updateProgress()
+
+    def get_figure(self) -> Figure:
+        """
+        Description
+        -----------
+        Get the main figure of the live feed.
+
+        Return
+        ------
+        `figure` : Figure
+            Main figure of the live feed
+
+        """
+        return self._figure
+
+    def get_listfigures(self) -> list:
+        """
+        Description
+        -----------
+        Get the figures of every method in the sequence.
+
+        Return
+        ------
+        `listFigures` : list
+            List containing one figure per method
+
+        """
+        return self._listFigures
+
+    def get_animate(self):
+        """
+        Description
+        -----------
+        Get the animation of the live feed.
+
+        Return
+        ------
+        `animate` : FuncAnimation
+            Animation of the live feed, None in the low performance mode
+
+        """
+        return self._animate
+
+    def _drawFrame(self, iFrame : int) -> list:
+        """
+        Description
+        -----------
+        Draw one frame of the live feed with the records received since the
+        last frame. The animation is stopped after the last sample.
+
+        Parameters
+        ----------
+        `iFrame` : int
+            Frame number of the animation
+
+        Return
+        ------
+        `listLines` : list
+            List containing the updated lines
+
+        """
+        listRecords : list = self._takeRecords()
+        setUpdated : set = set()
+
+        for record in listRecords:
+            iMethodIndex : int = 0
+            if (len(record) > DQ_METHOD_INDEX):
+                iMethodIndex = int(record[DQ_METHOD_INDEX])
+
+            # Main figure follows the method which is currently running
+            if (iMethodIndex != self._iMethodIndex):
+                self._switchMethod(iMethodIndex)
+
+            tupleKey : tuple = (iMethodIndex, int(record[DQ_CYCLE]))
+            if (tupleKey not in self._dicMainLines):
+                self._addLine(tupleKey)
+
+            if (self._listMethods[iMethodIndex] == CA):
+                self._dicLines[tupleKey][0].append(record[DQ_TIME])
+            else :
+                self._dicLines[tupleKey][0].append(record[DQ_POTENTIAL])
+            self._dicLines[tupleKey][1].append(record[DQ_CURRENT])
+            setUpdated.add(tupleKey)
+
+        listLines : list = []
+        for tupleKey in setUpdated:
+            for line in (self._dicMainLines.get(tupleKey),
+                         self._dicLines[tupleKey][2]):
+                if (line is not None):
+                    line.set_data(self._dicLines[tupleKey][0],
+                                  self._dicLines[tupleKey][1])
+                    listLines.append(line)
+
+        if (len(setUpdated) > 0):
+            self._axes.relim()
+            self._axes.autoscale_view()
+
+        # Figures of the sequence are not animated on their own
+        if (len(self._listAxes) > 0):
+            for iMethodIndex in {tupleKey[0] for tupleKey in setUpdated}:
+                self._listAxes[iMethodIndex].relim()
+                self._listAxes[iMethodIndex].autoscale_view()
+                self._listFigures[iMethodIndex].canvas.draw_idle()
+
+        self._updateProgress()
+
+        if (self._fReceivedTime >= self._fDuration):
+            self._animate.event_source.stop()
+
+        return listLines
+
+    def _printRecords(self) -> None:
+        """
+        Description
+        -----------
+        Print the last record received since the last call into the terminal
+        and schedule the next call, until the last sample is received.
+
+        """
+        listRecords : list = self._takeRecords()
+
+        if (len(listRecords) > 0 and self._logger is not None):
+            record = listRecords[-1]
+            self._logger.info(
+                "t: {:.3f} s | E: {:.1f} mV | I: {:.3f} uA | {} samples".format(
+                record[DQ_TIME], record[DQ_POTENTIAL], record[DQ_CURRENT],
+                len(listRecords)))
+
+        self._updateProgress()
+
+        if (self._fReceivedTime < self._fDuration):
+            self._listBox.after(self._iLatency, self._printRecords)
+
+    def _takeRecords(self) -> list:
+        """
+        Description
+        -----------
+        Take up to `SIM_PLOT_BATCH` records out of the queue without blocking.
+
+        Return
+        ------
+        `listRecords` : list
+            List containing the records
+
+        """
+        listRecords : list = []
+
+        try:
+            while (len(listRecords) < SIM_PLOT_BATCH):
+                listRecords.append(self._dataQueue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if (len(listRecords) > 0):
+            self._fReceivedTime = max(self._fReceivedTime, 
+                                      float(listRecords[-1][DQ_TIME]))
+
+        return listRecords
+
+    def _addLine(self, tupleKey : tuple) -> None:
+        """
+        Description
+        -----------
+        Add the lines of a method and cycle to the figures. Lines of the
+        method figures are kept, when a sequence is repeated.
+
+        Parameters
+        ----------
+        `tupleKey` : tuple
+            Method index and cycle of the line
+
+        """
+        strLabel : str = "Cycle " + str(tupleKey[1])
+
+        self._dicMainLines[tupleKey] = self._axes.plot([], [],
+            label= strLabel)[0]
+        self._axes.legend(loc= "upper left")
+
+        if (tupleKey not in self._dicLines):
+            line = None
+            if (len(self._listAxes) > 0):
+                line = self._listAxes[tupleKey[0]].plot([], [],
+                    label= strLabel)[0]
+
+            self._dicLines[tupleKey] = [[], [], line]
+
+    def _switchMethod(self, iMethodIndex : int) -> None:
+        """
+        Description
+        -----------
+        Clear the main figure and prepare it for the next method of the
+        sequence.
+
+        Parameters
+        ----------
+        `iMethodIndex` : int
+            Index of the method in the sequence
+
+        """
+        self._iMethodIndex = iMethodIndex
+
+        self._axes.clear()
+        self._setupAxes(self._axes, self._listMethods[iMethodIndex])
+        self._dicMainLines = {}
+
+    def _setupAxes(self, axes, strMethod : str) -> None:
+        """
+        Description
+        -----------
+        Label the axes of a figure according to the method.
+
+        Parameters
+        ----------
+        `axes` : Axes
+            Axes which should be labeled
+
+        `strMethod` : string
+            Electrochemical method shown in the axes
+
+        """
+        if (strMethod == CA):
+            axes.set_xlabel("Time (s)")
+        else :
+            axes.set_xlabel("Potential (mV)")
+        axes.set_ylabel("Current (uA)")
+        axes.grid(True)
+
+    def _updateProgress(self) -> None:
+        """
+        Description
+        -----------
+        Show the time of the last received sample in the progress bar.
+
+        """
+        if (self._progressBar is None):
+            return
+
+        self._progressBar.configure(maximum= max(self._fDuration, 1e-9),
+                                    value= self._fReceivedTime)
@@ -0,0 +1,262 @@
+"""
+Module implementing the strip of plots shown in the plot band in sequence mode.
+
+Instead of embedding an interactive canvas for every figure of the sequence,
+each figure is rendered once into a raster thumbnail, which is drawn as image
+item onto the canvas of the plot band. The scroll region of the canvas spans
+all thumbnails, but only the thumbnails in view are placed and rendered. A
+thumbnail is only rendered again, if the lines of its figure changed.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import base64
+import io
+import time
+from collections import OrderedDict
+from tkinter import *
+
+# Import internal dependencies
+from ..Data_Storage.constants import *
+
+class ThumbnailStrip:
+    """
+    Description
+    -----------
+    Horizontal strip of figure thumbnails drawn onto a canvas with a virtual
+    scroll width.
+
+    """
+
+    def __init__(self, canvas : Canvas, iHeight : int, funcClick) -> None:
+        """
+        Description
+        -----------
+        Constructor of class ThumbnailStrip
+
+        Parameters
+        ----------
+        `canvas` : Canvas
+            Canvas onto which the thumbnails are drawn
+
+        `iHeight` : int
+            Height of the thumbnails in px
+
+        `funcClick` : function
+            Function called with (event, index of the figure), when a
+            thumbnail is clicked
+
+        """
+        # Initialize class variables
+        self._canvas : Canvas = canvas
+        self._iHeight : int = iHeight
+        self._iWidth : int = int(iHeight * THUMBNAIL_ASPECT)
+        self._funcClick = funcClick
+
+        self._fLastRefresh : float = 0.0
+        self._listFigures : list = []
+        self._dicItems : dict = {}
+        self._dicThumbnails : OrderedDict = OrderedDict()
+
+        # Place thumbnails, which moved into view by resizing
+        self._canvas.bind("<Configure>", lambda event : self.update_View())
+
+    def set_Figures(self, listFigures : list) -> None:
+        """
+        Description
+        -----------
+        Show the figures of a new experiment in the strip.
+
+        Parameters
+        ----------
+        `listFigures` : list
+            List containing the matplotlib figures
+
+        """
+        self.clear()
+
+        self._listFigures = listFigures
+
+        # Thumbnails are rendered with the dpi of the figure
+        for figure in self._listFigures:
+            figure.set_size_inches(self._iWidth / figure.dpi,
+                                   self._iHeight / figure.dpi)
+
+        self._canvas.configure(scrollregion= (0, 0,
+            len(self._listFigures) * (self._iWidth + THUMBNAIL_PADDING) +
+            THUMBNAIL_PADDING, self._iHeight))
+        self._canvas.xview_moveto(0)
+
+        self.update_View()
+
+    def clear(self) -> None:
+        """
+        Description
+        -----------
+        Remove every thumbnail from the strip and the cache.
+
+        """
+        for iItem in self._dicItems.values():
+            self._canvas.delete(iItem)
+
+        self._listFigures = []
+        self._dicItems = {}
+        self._dicThumbnails.clear()
+
+        self._canvas.configure(scrollregion= (0, 0, 0, 0))
+
+    def refresh(self) -> None:
+        """
+        Description
+        -----------
+        Update the thumbnails in view to the current state of their figures,
+        at most once per `THUMBNAIL_REFRESH_INTERVAL`. Used while an
+        experiment is running.
+
+        """
+        if (time.monotonic() - self._fLastRefresh < THUMBNAIL_REFRESH_INTERVAL):
+            return
+
+        self.update_View()
+
+    def update_View(self) -> None:
+        """
+        Description
+        -----------
+        Place the thumbnails in view onto the canvas and remove the others.
+        Thumbnails which are not cached or whose figure changed are rendered.
+
+        """
+        self._fLastRefresh = time.monotonic()
+
+        # Nothing is rendered, while the plot band isn't shown
+        if (len(self._listFigures) == 0 or
+            self._canvas.winfo_ismapped() == False):
+            return
+
+        # Calculate the thumbnails in view
+        iStride : int = self._iWidth + THUMBNAIL_PADDING
+        fLeft : float = self._canvas.canvasx(0)
+        fRight : float = self._canvas.canvasx(self._canvas.winfo_width())
+
+        iFirst : int = max(int(fLeft // iStride), 0)
+        iLast : int = min(int(fRight // iStride), len(self._listFigures) - 1)
+
+        # Remove items which left the view
+        for iIndex in list(self._dicItems):
+            if (iIndex < iFirst or iIndex > iLast):
+                self._canvas.delete(self._dicItems.pop(iIndex))
+
+        for iIndex in range(iFirst, iLast + 1):
+            image : PhotoImage = self._get_Thumbnail(iIndex)
+
+            if (iIndex in self._dicItems):
+                self._canvas.itemconfigure(self._dicItems[iIndex], image= image)
+                continue
+
+            iItem : int = self._canvas.create_image(
+                iIndex * iStride + THUMBNAIL_PADDING, 0, image= image,
+                anchor= NW)
+            self._canvas.tag_bind(iItem, "<Button-1>", lambda event,
+                iPlotID = iIndex : self._funcClick(event, iPlotID))
+
+            self._dicItems[iIndex] = iItem
+
+    def _get_Thumbnail(self, iIndex : int) -> PhotoImage:
+        """
+        Description
+        -----------
+        Get the thumbnail of a figure from the cache and render it, if it
+        isn't cached or its figure changed. The least recently used
+        thumbnails are removed, if more than `THUMBNAIL_CACHE_SIZE` are
+        cached.
+
+        Parameters
+        ----------
+        `iIndex` : int
+            Index of the figure
+
+        Return
+        ------
+        `image` : PhotoImage
+            Thumbnail of the figure
+
+        """
+        figure = self._listFigures[iIndex]
+        tupleSignature : tuple = _get_FigureSignature(figure)
+
+        listThumbnail : list = self._dicThumbnails.get(iIndex)
+        if (listThumbnail is None or listThumbnail[0] != tupleSignature):
+            listThumbnail = [tupleSignature, self._render_Thumbnail(figure)]
+            self._dicThumbnails[iIndex] = listThumbnail
+
+        self._dicThumbnails.move_to_end(iIndex)
+
+        # Thumbnails of placed items are never removed
+        for iCachedIndex in list(self._dicThumbnails):
+            if (len(self._dicThumbnails) <= max(THUMBNAIL_CACHE_SIZE,
+                                                len(self._dicItems) + 1)):
+                break
+
+            if (iCachedIndex not in self._dicItems and
+                iCachedIndex != iIndex):
+                del self._dicThumbnails[iCachedIndex]
+
+        return listThumbnail[1]
+
+    def _render_Thumbnail(self, figure) -> PhotoImage:
+        """
+        Description
+        -----------
+        Render a figure into a raster image.
+
+        Parameters
+        ----------
+        `figure` : Figure
+            Matplotlib figure which should be rendered
+
+        Return
+        ------
+        `image` : PhotoImage
+            Rendered figure
+
+        """
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format= "png", dpi= figure.dpi)
+
+        return PhotoImage(master= self._canvas,
+                          data= base64.b64encode(buffer.getvalue()))
+
+def _get_FigureSignature(figure) -> tuple:
+    """
+    Description
+    -----------
+    Helper function returning a signature of the content of a figure, which
+    changes when lines are added, extended or the axes are rescaled.
+
+    Parameters
+    ----------
+    `figure` : Figure
+        Matplotlib figure
+
+    Return
+    ------
+    `tupleSignature` : tuple
+        Signature of the figure
+
+    """
+    listSignature : list = []
+
+    for axes in figure.axes:
+        listSignature.append(axes.get_xlim() + axes.get_ylim())
+        listSignature.extend(len(line.get_xdata()) for line in axes.lines)
+
+    return tuple(listSignature)
@@ -0,0 +1,356 @@
+"""
+Module implementing the headless mode of the FreiStat interface, which runs a
+template or sequence of a template file from the command line without Tk and
+matplotlib, e.g. for unattended overnight measurements.
+
+The experiment is started with the same facades as in the interface (see
+`experiment_facades`) and the measurement data is streamed into a recording
+(see `run_recording`), which can be opened in the interface afterwards.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import argparse
+import logging
+import os
+import sys
+import time
+from functools import partial
+from FreiStat.Data_storage.constants import *
+
+# Import internal dependencies
+from .Data_Storage.constants import *
+from .Data_Storage.data_drain import DataDrain
+from .Data_Storage.data_handling import DataHandling
+from .Data_Storage.run_recording import RunRecorder
+from .Data_Storage.run_recording import _recover_Recordings
+from .Utility.experiment_facades import _create_FacadeSettings
+from .Utility.experiment_facades import _start_SingleMethod
+from .Utility.experiment_facades import _start_Sequence
+
+def Main(listArguments : list = None) -> int:
+    """
+    Description
+    -----------
+    Entry point of the headless mode. Run `python Run_FreiStat_Headless.py -h`
+    for the available options.
+
+    Parameters
+    ----------
+    `listArguments` : list
+        Command line arguments, `sys.argv[1:]` if not given
+
+    Return
+    ------
+    `iExitCode` : int
+        0 if the experiment completed, 1 otherwise
+
+    """
+    arguments = _create_ArgumentParser().parse_args(listArguments)
+
+    # The facades must not require a display for their plotter
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    logger = logging.getLogger("FreiStat_Headless")
+    logger.setLevel(logging.INFO)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter(HEADLESS_LOG_FORMAT))
+    logger.addHandler(handler)
+
+    # Read the templates, experiment parameters are loaded on demand
+    dataHandling = DataHandling(os.getcwd())
+    listErrors : list = []
+    listTemplates : list = dataHandling.read_Templates(arguments.library,
+                                                       listErrors)
+
+    for strError in listErrors:
+        logger.error(strError)
+
+    if (arguments.list == True):
+        for dataStorage in listTemplates:
+            print(dataStorage.get_ExperimentType() + "\t" +
+                  dataStorage.get_TemplateName())
+        return 0 if len(listErrors) == 0 else 1
+
+    if (arguments.template is None):
+        logger.error("No template name given")
+        return 1
+
+    dataStorage = _find_Template(listTemplates, arguments.template,
+                                 arguments.type, logger)
+    if (dataStorage is None):
+        return 1
+
+    return _run_Template(dataStorage, arguments, dataHandling, logger)
+
+def _create_ArgumentParser() -> argparse.ArgumentParser:
+    """
+    Description
+    -----------
+    Create the parser of the command line arguments.
+
+    Return
+    ------
+    `parser` : ArgumentParser
+        Parser of the command line arguments
+
+    """
+    parser = argparse.ArgumentParser(
+        description= "Run a template or sequence of a FreiStat template file "
+                     "without the graphical interface and record the "
+                     "measurement data to disk.")
+    parser.add_argument("library",
+        help= "template file (.fst or .csv) containing the template")
+    parser.add_argument("template", nargs= "?",
+        help= "name of the template or sequence which should be run")
+    parser.add_argument("-t", "--type",
+        help= "experiment type of the template (e.g. CV or SEQ), required if "
+              "the name is not unique")
+    parser.add_argument("-o", "--output",
+        help= "path of the recording (default: recordings folder of the "
+              "interface)")
+    parser.add_argument("-l", "--list", action= "store_true",
+        help= "list the templates of the template file and exit")
+
+    groupCommunication = parser.add_mutually_exclusive_group()
+    groupCommunication.add_argument("--wlan", action= "store_true",
+        help= "connect via WLAN with the settings of the interface")
+    groupCommunication.add_argument("--serial", action= "store_true",
+        help= "connect via the serial port")
+    groupCommunication.add_argument("--simulate", action= "store_true",
+        help= "run the experiment on the simulated device")
+
+    parser.add_argument("--rate", type= float,
+        help= "sample rate factor of the simulated device")
+    parser.add_argument("--noise", type= float,
+        help= "noise of the simulated device in percent")
+
+    return parser
+
+def _find_Template(listTemplates : list, strTemplateName : str,
+                   strExperimentType : str, logger):
+    """
+    Description
+    -----------
+    Find a template by its name and, if given, its experiment type.
+
+    Parameters
+    ----------
+    `listTemplates` : list
+        List containing the DataStorage objects of the template file
+
+    `strTemplateName` : string
+        Name of the template
+
+    `strExperimentType` : string
+        Experiment type of the template, None if any type matches
+
+    `logger` : Logger
+        Logger to which errors are reported
+
+    Return
+    ------
+    `dataStorage` : DataStorage
+        Found template, None if no unique template matches
+
+    """
+    listMatches : list = [dataStorage for dataStorage in listTemplates if
+        dataStorage.get_TemplateName() == strTemplateName and
+        (strExperimentType is None or
+         dataStorage.get_ExperimentType() == strExperimentType)]
+
+    if (len(listMatches) == 0):
+        logger.error("Template " + strTemplateName + " not found")
+        return None
+
+    if (len(listMatches) > 1):
+        logger.error("Template " + strTemplateName + " exists for " +
+            ", ".join(dataStorage.get_ExperimentType() for dataStorage in
+                      listMatches) + ", choose one with --type")
+        return None
+
+    return listMatches[0]
+
+def _run_Template(dataStorage, arguments : argparse.Namespace,
+                  dataHandling : DataHandling, logger) -> int:
+    """
+    Description
+    -----------
+    Run a template until the experiment process ends and stream the
+    measurement data into a recording. An interrupt (Ctrl+C) terminates the
+    experiment, the data recorded so far is kept.
+
+    Parameters
+    ----------
+    `dataStorage` : DataStorage
+        Template which should be run
+
+    `arguments` : Namespace
+        Parsed command line arguments
+
+    `dataHandling` : DataHandling
+        Data handling used to read the preferences
+
+    `logger` : Logger
+        Logger used by the FreiStat library and the headless mode
+
+    Return
+    ------
+    `iExitCode` : int
+        0 if the experiment completed, 1 otherwise (e.g. invalid template)
+
+    """
+    strMethod : str = dataStorage.get_ExperimentType()
+
+    try:
+        listExperimentParameters : list = \
+            dataStorage.get_ExperimentParameters()
+    except (OSError, ValueError) as error:
+        # Template file was moved or can't be read anymore
+        logger.error(str(error))
+        return 1
+
+    dicPreferences : dict = _read_Preferences(dataHandling)
+
+    # Communication settings of the interface, unless set on the command line
+    bWLANMode : bool = bool(int(dicPreferences[SET_WLAN_MODE]))
+    if (arguments.wlan == True or arguments.serial == True):
+        bWLANMode = arguments.wlan
+
+    bSimulation : bool = arguments.simulate or \
+        (arguments.wlan == False and arguments.serial == False and
+         bool(int(dicPreferences[SET_SIMULATION])))
+
+    Facade = None
+    if (bSimulation == True):
+        # Import on first use
+        from .Utility.simulated_device import SimulatedDevice
+
+        fRateFactor : float = arguments.rate if arguments.rate is not None \
+            else float(dicPreferences[SET_SIMULATION_RATE])
+        fNoise : float = arguments.noise if arguments.noise is not None \
+            else float(dicPreferences[SET_SIMULATION_NOISE])
+
+        Facade = partial(SimulatedDevice, strMethod, fRateFactor, fNoise)
+
+    dicSettings : dict = _create_FacadeSettings(logger, bWLANMode,
+        [dicPreferences[SET_SERVER_IP], dicPreferences[SET_SERVER_PORT],
+         dicPreferences[SET_CLIENT_IP], dicPreferences[SET_CLIENT_PORT]])
+
+    # Recordings are written into the same folder as by the interface
+    strFilePath : str = arguments.output
+    if (strFilePath is None):
+        strFolderPath : str = os.path.join(os.path.dirname(
+            os.path.abspath(__file__)), "recordings")
+
+        for strRecovered in _recover_Recordings(strFolderPath):
+            logger.info("Recovered interrupted recording " + strRecovered)
+
+        strFilePath = os.path.join(strFolderPath,
+            time.strftime("%Y%m%d_%H%M%S_") + strMethod + RR_FILE_EXTENSION)
+
+    if (os.path.dirname(strFilePath) != ""):
+        os.makedirs(os.path.dirname(strFilePath), exist_ok= True)
+
+    # Start the experiment
+    try:
+        if (strMethod == SEQUENCE):
+            RunEcMethod = _start_Sequence(listExperimentParameters,
+                dataStorage.get_SequenceCycles(), dicSettings, Facade)
+        else :
+            RunEcMethod = _start_SingleMethod(strMethod, 
+                listExperimentParameters, dicSettings, Facade)
+    except (OSError, ValueError) as error:
+        # Parameters rejected by the FreiStat library
+        logger.error("Template " + dataStorage.get_TemplateName() +
+                     " can't be started: " + str(error))
+        return 1
+
+    runRecorder = RunRecorder(strFilePath, {
+        "ExperimentType" : strMethod,
+        "TemplateName" : dataStorage.get_TemplateName(),
+        "ExperimentParameters" : listExperimentParameters,
+        "Created" : time.strftime("%Y-%m-%d %H:%M:%S")})
+    runRecorder.start()
+
+    # Data only goes to disk, nothing is kept in memory or forwarded
+    dataDrain = DataDrain(RunEcMethod.get_dataQueue(), None, runRecorder,
+                          bForward= False, logger= logger)
+    dataDrain.start()
+
+    logger.info("Running " + strMethod + " " + dataStorage.get_TemplateName() +
+                ", recording to " + strFilePath)
+
+    iExitCode : int = 0
+    process = RunEcMethod.get_process()
+    fReportTime : float = time.monotonic()
+
+    try:
+        while (process.is_alive() == True):
+            process.join(HEADLESS_POLL_INTERVAL)
+
+            if (time.monotonic() - fReportTime >= HEADLESS_REPORT_INTERVAL):
+                fReportTime = time.monotonic()
+                logger.info(str(runRecorder.get_RecordCount()) +
+                            " records written")
+    except KeyboardInterrupt:
+        logger.warning("Interrupted, stopping the experiment")
+        RunEcMethod._terminateExperiment()
+        iExitCode = 1
+    finally:
+        # Store remaining records and complete the recording
+        dataDrain.stop()
+        runRecorder.stop()
+
+    if (dataDrain.get_SkippedRecords() > 0):
+        logger.warning(str(dataDrain.get_SkippedRecords()) +
+                       " records of the data queue were not stored")
+
+    logger.info("Measurement data saved in " + strFilePath + " (" +
+                str(runRecorder.get_RecordCount()) + " records)")
+
+    return iExitCode
+
+def _read_Preferences(dataHandling : DataHandling) -> dict:
+    """
+    Description
+    -----------
+    Read the preferences of the interface, missing entries (e.g. of older
+    preference files) are filled with the default values.
+
+    Parameters
+    ----------
+    `dataHandling` : DataHandling
+        Data handling reading the preferences
+
+    Return
+    ------
+    `dicPreferences` : dict
+        Dictionary containing the value of every preference
+
+    """
+    dicPreferences : dict = {
+        SET_WLAN_MODE : SET_WLAN_MODE_VALUE,
+        SET_SIMULATION : SET_SIMULATION_VALUE,
+        SET_SIMULATION_RATE : SET_SIMULATION_RATE_VALUE,
+        SET_SIMULATION_NOISE : SET_SIMULATION_NOISE_VALUE,
+        SET_SERVER_IP : SET_SERVER_IP_VALUE,
+        SET_SERVER_PORT : SET_SERVER_PORT_VALUE,
+        SET_CLIENT_IP : SET_CLIENT_IP_VALUE,
+        SET_CLIENT_PORT : SET_CLIENT_PORT_VALUE}
+
+    dataHandling.import_Settings()
+
+    for listPreference in dataHandling.get_Preferences():
+        if (listPreference[0] in dicPreferences):
+            dicPreferences[listPreference[0]] = listPreference[1]
+
+    return dicPreferences
@@ -0,0 +1,237 @@
+"""
+Module implementing a profile of the startup of the interface, which is enabled
+by the command line option `PROFILE_STARTUP_FLAG`.
+
+The profile measures the time of every imported module and of the phases of the
+startup (imports, creation of the window, first paint) and prints a breakdown.
+It has to be created before the interface is imported, therefore this module
+only depends on the standard library and the constants.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import sys
+import threading
+import time
+
+# Import internal dependencies
+from .Data_Storage.constants import *
+
+class StartupProfile:
+    """
+    Description
+    -----------
+    Finder hooked into `sys.meta_path`, which hands the module specs of the
+    other finders on with a loader measuring the import time. For every module
+    the self time (without the imports done by the module) and the cumulative
+    time are recorded.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Description
+        -----------
+        Constructor of class StartupProfile
+
+        """
+        # Initialize class variables
+        self._fStart : float = time.perf_counter()
+        self._fPhase : float = self._fStart
+        self._listPhases : list = []
+        self._listModules : list = []
+        self._lockModules = threading.Lock()
+        self._localStack = threading.local()
+
+    def start(self) -> None:
+        """
+        Description
+        -----------
+        Start measuring the imports.
+
+        """
+        if (self not in sys.meta_path):
+            sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        """
+        Description
+        -----------
+        Stop measuring the imports.
+
+        """
+        if (self in sys.meta_path):
+            sys.meta_path.remove(self)
+
+    def mark(self, strPhase : str) -> None:
+        """
+        Description
+        -----------
+        Mark the end of a phase of the startup.
+
+        Parameters
+        ----------
+        `strPhase` : string
+            Name of the phase, which ended
+
+        """
+        fTime : float = time.perf_counter()
+        self._listPhases.append([strPhase, fTime - self._fPhase,
+                                 fTime - self._fStart])
+        self._fPhase = fTime
+
+    def print_Report(self, strTitle : str) -> None:
+        """
+        Description
+        -----------
+        Print the phases and the slowest modules, which were marked or imported
+        since the last report.
+
+        Parameters
+        ----------
+        `strTitle` : string
+            Title of the report
+
+        """
+        with self._lockModules:
+            listModules : list = self._listModules
+            self._listModules = []
+
+        listPhases : list = self._listPhases
+        self._listPhases = []
+
+        listLines : list = ["", "---- " + strTitle + " " + "-" * 40]
+
+        for strPhase, fDuration, fTotal in listPhases:
+            listLines.append("{:<40}{:>10.1f} ms{:>10.1f} ms".format(
+                strPhase, fDuration * 1000, fTotal * 1000))
+
+        fImportTime : float = sum(module[1] for module in listModules)
+        listLines.append("{:<40}{:>10.1f} ms ({} modules)".format(
+            "Imports", fImportTime * 1000, len(listModules)))
+
+        listLines.append("")
+        listLines.append("{:<40}{:>13}{:>13}".format("Module", "Self",
+                                                     "Cumulative"))
+
+        listModules.sort(key= lambda module: module[1], reverse= True)
+        for strModule, fSelf, fCumulative in listModules[:PROFILE_TOP_MODULES]:
+            listLines.append("{:<40}{:>10.1f} ms{:>10.1f} ms".format(
+                strModule, fSelf * 1000, fCumulative * 1000))
+
+        print("\n".join(listLines), flush= True)
+
+    def find_spec(self, strName : str, path, target = None):
+        """
+        Description
+        -----------
+        Find the spec of a module with the other finders and replace its loader
+        with a measuring one.
+
+        """
+        for finder in sys.meta_path:
+            if (finder is self or hasattr(finder, "find_spec") == False):
+                continue
+
+            spec = finder.find_spec(strName, path, target)
+
+            if (spec is not None):
+                break
+        else:
+            return None
+
+        # Namespace packages and loaders without exec_module are not measured
+        if (hasattr(spec.loader, "exec_module") == False):
+            return spec
+
+        spec.loader = _MeasuringLoader(spec.loader, self)
+        return spec
+
+    def _measure(self, strName : str, fOffset : float, funcLoad, *args):
+        """
+        Description
+        -----------
+        Execute a module and record its time. The time of nested imports is
+        subtracted from the self time of the importing module.
+
+        Parameters
+        ----------
+        `strName` : string
+            Name of the module
+
+        `fOffset` : float
+            Time in s already spent on loading the module (e.g. creating it)
+
+        `funcLoad` : function
+            Function executing the module with the given arguments
+
+        """
+        listStack : list = getattr(self._localStack, "listStack", None)
+        if (listStack is None):
+            listStack = []
+            self._localStack.listStack = listStack
+
+        listStack.append(0.0)
+        fStart : float = time.perf_counter()
+
+        try:
+            return funcLoad(*args)
+        finally:
+            fCumulative : float = time.perf_counter() - fStart + fOffset
+            fNested : float = listStack.pop()
+
+            if (len(listStack) > 0):
+                listStack[-1] += fCumulative
+
+            with self._lockModules:
+                self._listModules.append([strName, fCumulative - fNested,
+                                          fCumulative])
+
+class _MeasuringLoader:
+    """
+    Description
+    -----------
+    Loader wrapping the loader of a module spec. Creating and executing the
+    module is measured, every other attribute is taken from the wrapped loader.
+    The wrapped loader is restored on the module after it is executed.
+
+    """
+
+    def __init__(self, loader, startupProfile : StartupProfile) -> None:
+        """
+        Description
+        -----------
+        Constructor of class _MeasuringLoader
+
+        """
+        self._loader = loader
+        self._startupProfile : StartupProfile = startupProfile
+        self._fCreate : float = 0.0
+
+    def __getattr__(self, strAttribute : str):
+        return getattr(self._loader, strAttribute)
+
+    def create_module(self, spec):
+        # Extension modules are loaded while creating the module
+        fStart : float = time.perf_counter()
+        module = self._loader.create_module(spec)
+        self._fCreate = time.perf_counter() - fStart
+
+        return module
+
+    def exec_module(self, module) -> None:
+        try:
+            self._startupProfile._measure(module.__name__, self._fCreate,
+                self._loader.exec_module, module)
+        finally:
+            module.__loader__ = self._loader
+            if (getattr(module, "__spec__", None) is not None):
+                module.__spec__.loader = self._loader
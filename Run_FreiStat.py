@@ -11,17 +11,34 @@ __version__ = "1.0.0"
 __maintainer__ = "Mark Jasper"
 __email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
 
+# Import dependencies
+import sys
+
 # Import internal dependencies
-from FreiStat_GUI.Main_Window import FreiStatInterface
+from FreiStat_GUI.Data_Storage.constants import PROFILE_STARTUP_FLAG
+from FreiStat_GUI.startup_profile import StartupProfile
 
 def Main():
     """
     Description
     -----------
-    Example implementation of the FreiStat interface.
+    Example implementation of the FreiStat interface. With the command line
+    option `--profile-startup` the import times of the startup are printed.
 
     """
-    FreiStatInterface()
+    startupProfile = None
+
+    if (PROFILE_STARTUP_FLAG in sys.argv[1:]):
+        startupProfile = StartupProfile()
+        startupProfile.start()
+
+    # The interface is imported after the profile is started
+    from FreiStat_GUI.Main_Window import FreiStatInterface
+
+    if (startupProfile is not None):
+        startupProfile.mark("Imports")
+
+    FreiStatInterface(startupProfile)
 
 # Run main interface
 if __name__ == '__main__':
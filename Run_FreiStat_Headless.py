@@ -0,0 +1,24 @@
+"""
+Module implementing the start of the FreiStat headless mode, which runs a
+template or sequence without the graphical user interface.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import sys
+
+# Import internal dependencies
+from FreiStat_GUI.headless import Main
+
+# Run headless mode, e.g.
+# python Run_FreiStat_Headless.py templates.fst "My sequence" --type SEQ
+if __name__ == '__main__':
+    sys.exit(Main())
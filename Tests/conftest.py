@@ -0,0 +1,23 @@
+"""
+Configuration of the tests. The tests run against the stub of the FreiStat
+framework in `Benchmarks/stub`, therefore neither the framework nor a
+potentiostat is required.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import sys
+
+strRootPath : str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, os.path.join(strRootPath, "Benchmarks", "stub"))
+sys.path.insert(0, os.path.join(strRootPath, "Python"))
@@ -0,0 +1,110 @@
+"""
+Tests of the template index of the data handling.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+from FreiStat.Data_storage.constants import *
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.data_handling import DataHandling
+from FreiStat_GUI.Data_Storage.data_storage import DataStorage
+
+def _create_DataHandling(tmp_path, listNames : list) -> DataHandling:
+    """
+    Description
+    -----------
+    Helper function creating a data handling containing CV templates.
+
+    """
+    dataHandling = DataHandling(str(tmp_path))
+
+    for strName in listNames:
+        dataStorage = DataStorage()
+        dataStorage.save_TemplateName(strName)
+        dataStorage.save_ExperimentType("CV")
+        dataHandling.import_DataObject(dataStorage)
+
+    return dataHandling
+
+def test_RenameTemplate(tmp_path):
+    dataHandling = _create_DataHandling(tmp_path, ["x", "y"])
+
+    # Rename like the template management does
+    dataStorage = dataHandling.get_DataStorages()[0]
+    dataHandling.rename_Template(dataStorage, "z")
+
+    assert dataHandling.find_Template("CV", "x") is None
+    assert dataHandling.find_Template("CV", "z") is dataStorage
+    assert dataHandling.get_UniqueTemplateName("CV", "z") != "z"
+
+def test_RenameForeignTemplate(tmp_path):
+    dataHandling = _create_DataHandling(tmp_path, ["x"])
+
+    # Templates which aren't imported yet must not be found
+    dataStorage = DataStorage()
+    dataStorage.save_ExperimentType("CV")
+    dataHandling.rename_Template(dataStorage, "y")
+
+    assert dataStorage.get_TemplateName() == "y"
+    assert dataHandling.find_Template("CV", "y") is None
+
+    dataHandling.import_DataObject(dataStorage)
+
+    assert dataHandling.find_Template("CV", "y") is dataStorage
+
+def _import_CSV(tmp_path, strContent : str) -> tuple:
+    """
+    Description
+    -----------
+    Helper function importing a .csv-file with the given content.
+
+    """
+    strFilePath : str = str(tmp_path / "templates.csv")
+
+    with open(strFilePath, "w", newline= "") as output:
+        output.write(strContent)
+
+    dataHandling = DataHandling(str(tmp_path))
+    listDataStorage : list = dataHandling.import_Configuration(strFilePath)
+
+    return listDataStorage, dataHandling.get_ImportErrors()
+
+def test_ImportCSV(tmp_path):
+    listDataStorage, listErrors = _import_CSV(tmp_path, 
+        "Method,CV\nStartPotential,200\nPulseLength,\"[10, 20]\"\n"
+        "MainsFilter,1\nCurrentRange,2\n")
+
+    assert listErrors == []
+    assert listDataStorage[0].get_ExperimentParameters()[:4] == [
+        [START_POTENTIAL, 0.2], [PULSE_LENGTH, [0.01, 0.02]],
+        [MAINS_FILTER, True], [LPTIA_RTIA_SIZE, 0.9 / 800]]
+
+def test_ImportCSVWrongType(tmp_path):
+    listDataStorage, listErrors = _import_CSV(tmp_path, 
+        "Method,CV\nStartPotential,True\nStopPotential,500\n"
+        "MainsFilter,\"[1,2]\"\nPulseLength,10\n")
+
+    # Only the invalid rows are skipped
+    assert len(listErrors) == 3
+    assert all(", row " in strError for strError in listErrors)
+    assert listDataStorage[0].get_ExperimentParameters()[0] == \
+        [STOP_POTENTIAL, 0.5]
+
+def test_ImportCSVInvalidTemplate(tmp_path):
+    listDataStorage, listErrors = _import_CSV(tmp_path, 
+        "Method,CV\nCurrentRange,100\nMethod,LSV\nStartPotential,200\n")
+
+    # A template which can't be decoded doesn't drop the others
+    assert len(listErrors) == 1
+    assert "template 1" in listErrors[0]
+    assert [dataStorage.get_ExperimentType() for dataStorage in 
+            listDataStorage] == ["LSV"]
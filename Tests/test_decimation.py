@@ -0,0 +1,45 @@
+"""
+Tests of the min/max decimation of plot data.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import numpy as np
+from matplotlib.figure import Figure
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.constants import *
+from FreiStat_GUI.Utility.decimation import DecimatedAxes
+from FreiStat_GUI.Utility.decimation import _stride_Data
+
+def test_LimitsOfUnsortedDataFromStridedSamples():
+    iSamples : int = 2 * DECIMATION_MAX_SAMPLES
+    fXData = np.sin(np.linspace(0, 20 * np.pi, iSamples)) * 500
+
+    # Sample skipped by the stride, only visible if all data is read
+    fXData[1] = 1e6
+
+    decimatedAxes = DecimatedAxes(Figure().add_subplot(111))
+    line = decimatedAxes.plot(fXData, fXData)
+
+    fXStrided = _stride_Data(fXData, fXData, 
+        decimatedAxes._getPixels())[0]
+    assert len(fXStrided) < iSamples
+    assert np.max(line.get_xdata()) <= 500
+    assert np.max(line.get_xdata()) == np.max(fXStrided)
+
+def test_SmallDataIsNotStrided():
+    fXData = np.arange(10.0)
+
+    fXStrided, fYStrided = _stride_Data(fXData, fXData, 100)
+
+    assert len(fXStrided) == 10
+    assert len(fYStrided) == 10
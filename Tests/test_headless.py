@@ -0,0 +1,70 @@
+"""
+Tests of the headless mode running templates without the graphical interface.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import logging
+import os
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.data_handling import DataHandling
+from FreiStat_GUI.Data_Storage.data_storage import DataStorage
+from FreiStat_GUI.Data_Storage.template_container import _read_Container
+from FreiStat_GUI.Data_Storage.template_container import _write_Container
+from FreiStat_GUI.headless import _create_ArgumentParser
+from FreiStat_GUI.headless import _run_Template
+
+def _create_Template(strName : str, strType : str, 
+                     listParameters : list) -> DataStorage:
+    """
+    Description
+    -----------
+    Helper function creating a template.
+
+    """
+    dataStorage = DataStorage()
+    dataStorage.save_TemplateName(strName)
+    dataStorage.save_ExperimentType(strType)
+    dataStorage.save_ExperimentParameters(listParameters)
+
+    return dataStorage
+
+def _run(tmp_path, dataStorage : DataStorage) -> int:
+    """
+    Description
+    -----------
+    Helper function running a template on the simulated device.
+
+    """
+    strFilePath : str = str(tmp_path / "lib.fst")
+    arguments = _create_ArgumentParser().parse_args([strFilePath,
+        dataStorage.get_TemplateName(), "--simulate", 
+        "-o", str(tmp_path / "run.fsr")])
+
+    return _run_Template(dataStorage, arguments, DataHandling(str(tmp_path)),
+                         logging.getLogger("FreiStat_Headless"))
+
+def test_MovedTemplateFileExitsWithError(tmp_path, caplog):
+    strFilePath : str = str(tmp_path / "lib.fst")
+
+    _write_Container(strFilePath, [
+        _create_Template("x", "CV", [["StartP", 1.0]])])
+    x, = _read_Container(strFilePath)
+    os.remove(strFilePath)
+
+    assert _run(tmp_path, x) == 1
+    assert "moved or deleted" in caplog.text
+
+def test_RejectedParametersExitWithError(tmp_path, caplog):
+    assert _run(tmp_path, _create_Template("x", "CV", [])) == 1
+    assert "can't be started" in caplog.text
+    assert os.path.exists(str(tmp_path / "run.fsr")) == False
@@ -0,0 +1,94 @@
+"""
+Tests of the columnar measurement storage and the thread draining the data
+queue into it.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import queue
+
+import numpy as np
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.constants import *
+from FreiStat_GUI.Data_Storage.data_drain import DataDrain
+from FreiStat_GUI.Data_Storage.measurement_storage import MeasurementStorage
+
+def _create_Record(fTime : float, iCycle : int, iMethodIndex : int) -> list:
+    """
+    Description
+    -----------
+    Helper function creating a record of the data queue.
+
+    """
+    record : list = [0] * (DQ_METHOD_INDEX + 1)
+    record[DQ_TIME] = fTime
+    record[DQ_POTENTIAL] = fTime * 10
+    record[DQ_CURRENT] = fTime * 100
+    record[DQ_CYCLE] = iCycle
+    record[DQ_METHOD_INDEX] = iMethodIndex
+
+    return record
+
+def test_Grow():
+    measurementStorage = MeasurementStorage(2)
+
+    for iIndex in range(5):
+        measurementStorage.append(iIndex, 0, 0, 1)
+    measurementStorage.extend(np.arange(5, 10), 0, 0, 2)
+
+    assert measurementStorage.get_Length() == 10
+    assert list(measurementStorage.get_Column(MS_TIME)) == list(range(10))
+
+def test_MethodColumns():
+    measurementStorage = MeasurementStorage()
+    measurementStorage.extend([0, 1, 2, 3], [0, 0, 0, 0], [5, 6, 7, 8],
+                              [1, 1, 2, 1], [0, 1, 1, 0])
+
+    dicColumns : dict = measurementStorage.get_MethodColumns(1)
+
+    assert list(dicColumns[MS_CURRENT]) == [6, 7]
+    assert list(dicColumns[MS_CYCLE]) == [1, 2]
+
+    # The returned data is a copy
+    dicColumns[MS_CURRENT][0] = -1
+    assert measurementStorage.get_Column(MS_CURRENT)[1] == 6
+
+def test_DrainSnapshot():
+    dataQueue = queue.Queue()
+    for iIndex in range(6):
+        dataQueue.put(_create_Record(iIndex, 1, iIndex % 2))
+
+    dataDrain = DataDrain(dataQueue, MeasurementStorage())
+    dataDrain.start()
+    dataDrain.stop()
+
+    assert list(dataDrain.get_Snapshot(1)[MS_TIME]) == [1, 3, 5]
+    assert len(dataDrain.get_Snapshot()[MS_TIME]) == 6
+
+def test_DrainDropsOldestForwardedRecords(monkeypatch):
+    monkeypatch.setattr("FreiStat_GUI.Data_Storage.data_drain." + 
+                        "DRAIN_FORWARD_SIZE", 3)
+
+    dataQueue = queue.Queue()
+    for iIndex in range(5):
+        dataQueue.put(_create_Record(iIndex, 1, 0))
+
+    dataDrain = DataDrain(dataQueue, MeasurementStorage())
+    dataDrain.start()
+    dataDrain.stop()
+
+    # The live feed gets the latest records, the storage keeps every record
+    forwardQueue = dataDrain.get_ForwardQueue()
+    assert [forwardQueue.get_nowait()[DQ_TIME] for iIndex in range(3)] == \
+        [2, 3, 4]
+    assert dataDrain.get_DroppedRecords() == 2
+    assert len(dataDrain.get_Snapshot()[MS_TIME]) == 5
@@ -0,0 +1,81 @@
+"""
+Tests of the streaming recording of measurement data and the recovery of
+recordings, which were not completed.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import time
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.constants import *
+from FreiStat_GUI.Data_Storage.run_recording import RunReader
+from FreiStat_GUI.Data_Storage.run_recording import RunRecorder
+from FreiStat_GUI.Data_Storage.run_recording import _recover_Recordings
+from FreiStat_GUI.Data_Storage.run_recording import dtype_record
+
+def _write_Batch(runRecorder : RunRecorder) -> None:
+    """
+    Description
+    -----------
+    Helper function handing over a batch of two cycles to a recorder.
+
+    """
+    runRecorder.write([0.0, 0.1, 0.2, 0.3], [10, 20, 30, 40],
+                      [1.0, 2.0, 3.0, 4.0], [1, 1, 2, 2], [0, 0, 0, 0])
+
+def test_RecoverySkipsRecordingInProgress(tmp_path):
+    strFilePath : str = str(tmp_path / ("Run" + RR_FILE_EXTENSION))
+
+    runRecorder = RunRecorder(strFilePath, {"ExperimentType" : "CV"})
+    iHeaderSize : int = os.path.getsize(strFilePath)
+    runRecorder.start()
+    _write_Batch(runRecorder)
+
+    # Wait until the batch is synced, the file doesn't change afterwards
+    while (os.path.getsize(strFilePath) <
+           iHeaderSize + 4 * dtype_record.itemsize):
+        time.sleep(0.01)
+
+    with open(strFilePath, "rb") as file:
+        byteContent : bytes = file.read()
+
+    assert _recover_Recordings(str(tmp_path)) == []
+    with open(strFilePath, "rb") as file:
+        assert file.read() == byteContent
+
+    runRecorder.stop()
+
+    assert os.path.exists(strFilePath + RR_LOCK_EXTENSION) == False
+    assert _recover_Recordings(str(tmp_path)) == []
+
+    runReader = RunReader(strFilePath)
+    assert runReader.get_Length() == 4
+    assert len(runReader.get_Segments()) == 2
+
+def test_RecoveryOfInterruptedRecording(tmp_path):
+    strFilePath : str = str(tmp_path / ("Run" + RR_FILE_EXTENSION))
+
+    # Writer which crashed: footer missing, lock file left but not locked
+    runRecorder = RunRecorder(strFilePath, {"ExperimentType" : "CV"})
+    _write_Batch(runRecorder)
+    runRecorder._writeBatch(runRecorder._queueBatches.get_nowait())
+    runRecorder._file.write(b"\x00" * 5)
+    runRecorder._file.close()
+    runRecorder._lockFile.close()
+
+    assert os.path.exists(strFilePath + RR_LOCK_EXTENSION) == True
+    assert _recover_Recordings(str(tmp_path)) == [strFilePath]
+    assert os.path.exists(strFilePath + RR_LOCK_EXTENSION) == False
+
+    runReader = RunReader(strFilePath)
+    assert runReader.get_Length() == 4
@@ -0,0 +1,198 @@
+"""
+Tests of the template container: round trip of the format, reading of legacy
+template files and lazy loading of the experiment parameters.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import os
+import pickle
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.data_handling import DataHandling
+from FreiStat_GUI.Data_Storage.data_storage import DataStorage
+from FreiStat_GUI.Data_Storage.template_container import LazyDataStorage
+from FreiStat_GUI.Data_Storage.template_container import _is_Container
+from FreiStat_GUI.Data_Storage.template_container import _read_Container
+from FreiStat_GUI.Data_Storage.template_container import _write_Container
+
+def _create_Template(strName : str, strType : str, listParameters : list,
+                     iSeqCycle : int = None) -> DataStorage:
+    """
+    Description
+    -----------
+    Helper function creating a template.
+
+    """
+    dataStorage = DataStorage()
+    dataStorage.save_TemplateName(strName)
+    dataStorage.save_ExperimentType(strType)
+    dataStorage.save_ExperimentParameters(listParameters)
+
+    if (iSeqCycle is not None):
+        dataStorage.save_SequenceCycles(iSeqCycle)
+
+    return dataStorage
+
+def test_RoundTrip(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+    listParameters : list = [["StartP", 1.0], ["Cycle", 3], 
+                             ["LPTIA", [1, 2]], ["MainsFilter", False]]
+
+    _write_Container(strFilePath, [
+        _create_Template("x", "CV", listParameters),
+        _create_Template("s", "SEQ", [["CV", "x", listParameters]], 4)])
+
+    assert _is_Container(strFilePath) == True
+
+    listDataStorage : list = _read_Container(strFilePath)
+
+    assert [[dataStorage.get_TemplateName(), dataStorage.get_ExperimentType()]
+            for dataStorage in listDataStorage] == [["x", "CV"], ["s", "SEQ"]]
+    assert listDataStorage[0].is_Loaded() == False
+    assert listDataStorage[0].get_ExperimentParameters() == listParameters
+    assert listDataStorage[1].get_ExperimentParameters() == \
+        [["CV", "x", listParameters]]
+    assert listDataStorage[1].get_SequenceCycles() == 4
+
+def test_LazyTemplateAfterRewrite(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+
+    _write_Container(strFilePath, [
+        _create_Template("x", "CV", [["StartP", 1.0]]),
+        _create_Template("y", "CV", [["StartP", 2.0]])])
+
+    x, y = _read_Container(strFilePath)
+
+    # Rewriting the file without x must not hand y's parameters to x
+    _write_Container(strFilePath, [y])
+
+    with pytest.raises(ValueError):
+        x.get_ExperimentParameters()
+
+    # y keeps its key and can be read from the rewritten file again
+    assert _read_Container(strFilePath)[0].get_ExperimentParameters() == \
+        [["StartP", 2.0]]
+
+def test_LazyTemplatesOfDataHandlingAreLoadedBeforeRewrite(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+
+    _write_Container(strFilePath, [
+        _create_Template("x", "CV", [["StartP", 1.0]]),
+        _create_Template("y", "CV", [["StartP", 2.0]])])
+
+    dataHandling = DataHandling(str(tmp_path))
+    x, y = dataHandling.import_Configuration(strFilePath)
+    dataHandling.import_DataObject(x)
+
+    dataHandling.export_Templates(strFilePath, [y])
+
+    assert x.get_ExperimentParameters() == [["StartP", 1.0]]
+
+def test_MovedTemplateFile(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+
+    _write_Container(strFilePath, [
+        _create_Template("x", "CV", [["StartP", 1.0]])])
+
+    x, = _read_Container(strFilePath)
+    os.remove(strFilePath)
+
+    with pytest.raises(FileNotFoundError):
+        x.get_ExperimentParameters()
+
+    # Loading must not create an empty file at the old location
+    assert os.path.exists(strFilePath) == False
+
+def test_BackupSkipsMissingTemplates(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+    strBackupPath : str = str(tmp_path / "backup.fst")
+
+    _write_Container(strFilePath, [
+        _create_Template("x", "CV", [["StartP", 1.0]])])
+
+    dataHandling = DataHandling(str(tmp_path))
+    x, = dataHandling.import_Configuration(strFilePath)
+    dataHandling.import_DataObject(x)
+    dataHandling.import_DataObject(
+        _create_Template("y", "CV", [["StartP", 2.0]]))
+
+    os.remove(strFilePath)
+    dataHandling.export_Configuration(strBackupPath)
+
+    assert len(dataHandling.get_ExportErrors()) == 1
+    assert [dataStorage.get_TemplateName() for dataStorage in 
+            _read_Container(strBackupPath)] == ["y"]
+
+def test_UnsupportedFormatVersion(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+
+    # Template file without keys
+    with closing(sqlite3.connect(strFilePath)) as connection:
+        with connection:
+            connection.execute(
+                "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            connection.execute(
+                "CREATE TABLE templates (id INTEGER PRIMARY KEY, "
+                "position INTEGER, name TEXT, type TEXT, "
+                "sequence_cycles INTEGER, parameters TEXT)")
+            connection.execute("INSERT INTO meta VALUES ('format_version', '1')")
+
+    with pytest.raises(ValueError):
+        _read_Container(strFilePath)
+
+def test_UnencodableParametersAreReported(tmp_path):
+    strFilePath : str = str(tmp_path / "lib.fst")
+
+    dataHandling = DataHandling(str(tmp_path))
+    dataHandling.export_Templates(strFilePath, [
+        _create_Template("x", "CV", [["StartP", object()]]),
+        _create_Template("y", "CV", [["StartP", 2.0]])])
+
+    assert len(dataHandling.get_ExportErrors()) == 1
+    assert dataHandling.get_ExportErrors()[0].startswith("x: ")
+    assert [dataStorage.get_TemplateName() for dataStorage in 
+            _read_Container(strFilePath)] == ["y"]
+
+    with pytest.raises(TypeError):
+        _write_Container(strFilePath, [
+            _create_Template("x", "CV", [["StartP", object()]])])
+
+def test_LegacyFileIsNotRewritten(tmp_path):
+    strFilePath : str = str(tmp_path / "legacy.fst")
+
+    with open(strFilePath, "wb") as output:
+        pickle.dump([_create_Template("x", "CV", [["StartP", 1.0]])], output,
+                    pickle.HIGHEST_PROTOCOL)
+
+    with open(strFilePath, "rb") as input:
+        bytesLegacy : bytes = input.read()
+
+    dataHandling = DataHandling(str(tmp_path))
+    listDataStorage : list = dataHandling.import_Configuration(strFilePath)
+
+    assert dataHandling.get_ImportErrors() == []
+    assert dataHandling.list_Templates(strFilePath) == [["x", "CV"]]
+    assert listDataStorage[0].get_ExperimentParameters() == [["StartP", 1.0]]
+
+    # The file is left untouched until it is saved explicitly
+    with open(strFilePath, "rb") as input:
+        assert input.read() == bytesLegacy
+    assert os.listdir(str(tmp_path)) == ["legacy.fst"]
+
+    dataHandling.export_Templates(strFilePath, listDataStorage)
+
+    assert _is_Container(strFilePath) == True
+    assert isinstance(_read_Container(strFilePath)[0], LazyDataStorage)
@@ -0,0 +1,52 @@
+"""
+Tests of the conversion of the experiment parameters between hardware and
+display units.
+
+"""
+
+__author__ = "Mark Jasper"
+__contact__ = "University of Freiburg, IMTEK, Jochen Kieninger"
+__credits__ = "Mark Jasper"
+
+__version__ = "1.0.0"
+__maintainer__ = "Mark Jasper"
+__email__ = "mark.jasper@imtek.uni-freiburg.de, kieninger@imtek.uni-freiburg.de"
+
+# Import dependencies
+import pytest
+
+# Import internal dependencies
+from FreiStat_GUI.Data_Storage.constants import RTIA_REGISTERS
+from FreiStat_GUI.Utility import conv_Milli
+from FreiStat_GUI.Utility import conv_RTIA
+from FreiStat_GUI.Utility import conv_Sinc2
+from FreiStat_GUI.Utility import conv_Sinc3
+
+@pytest.mark.parametrize("tupleConversion", [conv_RTIA, conv_Sinc2, conv_Sinc3])
+def test_EncodeWithoutDecoding(tupleConversion):
+    # The encoders don't rely on values decoded before
+    funcDecode, funcEncode = tupleConversion
+
+    for iRegister in range(3):
+        assert funcEncode(funcDecode(iRegister)) == iRegister
+
+def test_EncodeRTIA():
+    assert conv_RTIA[1](0.9 / 200) == 0
+
+@pytest.mark.parametrize("value", [RTIA_REGISTERS, -1, True, "1"])
+def test_DecodeInvalidRTIA(value):
+    with pytest.raises(ValueError):
+        conv_RTIA[0](value)
+
+def test_EncodeInvalidSinc2():
+    with pytest.raises(ValueError):
+        conv_Sinc2[1](23)
+
+@pytest.mark.parametrize("value", [1.5, -250, 0.001])
+def test_MilliRoundTrip(value):
+    assert conv_Milli[1](conv_Milli[0](value)) == value
+
+@pytest.mark.parametrize("value", [True, "abc", "1,2"])
+def test_DecodeInvalidMilli(value):
+    with pytest.raises(ValueError):
+        conv_Milli[0](value)
@@ -32,7 +32,8 @@ setup(
     url="https://github.com/IMTEK-FreiStat/FreiStat-GUI",
     package_dir={"": "Python"},
     packages=find_packages(where="Python"),
-    package_data={"": ['assets/icons/*','assets/logo/*','backup/*']},
+    package_data={"": ['assets/icons/*','assets/logo/*','backup/*',
+                      'recordings/*']},
     include_package_data= True,
     install_requires=requirements,
     classifiers=[